@@ -110,6 +110,12 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down LLM Portfolio Journal API...")
+    try:
+        from src.db import close_async_engine
+
+        await close_async_engine()
+    except Exception as e:
+        logger.error(f"Error closing async database engine: {e}")
 
 
 # Create FastAPI app
@@ -129,8 +129,8 @@ async def get_activities(
             params["activity_type"] = activity_type
 
         if symbol:
-            conditions.append("UPPER(a.symbol) = UPPER(:symbol)")
-            params["symbol"] = symbol
+            conditions.append("UPPER(a.symbol) = :symbol")
+            params["symbol"] = symbol.upper()
 
         if bucket:
             conditions.append("acc.bucket = :bucket")
@@ -88,7 +88,7 @@ async def chat_about_stock(
                 dm.created_at,
                 dm.author
             FROM discord_parsed_ideas dpi
-            LEFT JOIN discord_messages dm ON dpi.message_id::text = dm.message_id
+            LEFT JOIN discord_messages dm ON dpi.message_id = dm.message_id
             WHERE UPPER(dpi.primary_symbol) = :symbol
             ORDER BY dm.created_at DESC
             LIMIT 5
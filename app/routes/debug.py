@@ -1,5 +1,5 @@
 """
-Debug API routes -- symbol trace and data lineage audit.
+Debug API routes -- symbol trace, data lineage audit and cache counters.
 
 These endpoints are DISABLED by default and require DEBUG_ENDPOINTS=1 env var.
 When enabled, they require the same API key auth as other endpoints.
@@ -11,13 +11,14 @@ from typing import Any, Optional
 from fastapi import APIRouter, Query
 from pydantic import BaseModel
 
+from src.analysis.orchestrator import get_analysis_cache_stats, get_singleflight_stats
 from src.db import execute_sql
 from src.market_data_service import (
     _CRYPTO_SYMBOLS,
     CRYPTO_IDENTITY,
     get_realtime_quotes_batch,
 )
-from src.price_service import get_latest_closes_batch
+from src.price_service import get_latest_closes_batch, get_ohlcv_cache_stats
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -66,7 +67,7 @@ async def symbol_trace(
     identity = CRYPTO_IDENTITY.get(symbol)
 
     # 1. Positions rows
-    pos_query = "SELECT * FROM positions WHERE UPPER(symbol) = UPPER(:symbol)"
+    pos_query = "SELECT * FROM positions WHERE UPPER(symbol) = :symbol"
     pos_params: dict = {"symbol": symbol}
     if account_id:
         pos_query += " AND account_id = :account_id"
@@ -76,7 +77,7 @@ async def symbol_trace(
 
     # 2. Symbols table row
     sym_data = execute_sql(
-        "SELECT * FROM symbols WHERE UPPER(ticker) = UPPER(:symbol) LIMIT 1",
+        "SELECT * FROM symbols WHERE UPPER(ticker) = :symbol LIMIT 1",
         params={"symbol": symbol},
         fetch_results=True,
     )
@@ -85,7 +86,7 @@ async def symbol_trace(
     # 3. Recent activities (respect account_id filter)
     act_query = (
         "SELECT id, activity_type, trade_date, amount, price, units, symbol "
-        "FROM activities WHERE UPPER(symbol) = UPPER(:symbol) "
+        "FROM activities WHERE UPPER(symbol) = :symbol "
     )
     act_params: dict = {"symbol": symbol}
     if account_id:
@@ -98,7 +99,7 @@ async def symbol_trace(
     # 4. Recent orders (respect account_id filter)
     ord_query = (
         "SELECT brokerage_order_id, symbol, action, status, execution_price "
-        "FROM orders WHERE UPPER(symbol) = UPPER(:symbol) "
+        "FROM orders WHERE UPPER(symbol) = :symbol "
     )
     ord_params: dict = {"symbol": symbol}
     if account_id:
@@ -156,3 +157,18 @@ async def symbol_trace(
             selected_price=selected_price,
         ),
     )
+
+
+@router.get("/cache-stats")
+async def cache_stats() -> dict[str, Any]:
+    """In-process cache counters (hits, misses, evictions, memory use).
+
+    ``analysis`` is the memory tier in front of stock_analysis_cache and
+    portfolio_risk_cache. ``singleflight`` counts analysis/risk refreshes
+    started vs. coalesced onto an already in-flight computation.
+    """
+    return {
+        "ohlcv": get_ohlcv_cache_stats(),
+        "analysis": get_analysis_cache_stats(),
+        "singleflight": get_singleflight_stats(),
+    }
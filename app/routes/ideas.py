@@ -22,7 +22,7 @@ from openai import OpenAI
 from pydantic import BaseModel, Field
 from sqlalchemy import text
 
-from src.db import execute_sql, transaction
+from src.db import async_execute_sql, execute_sql, transaction
 from src.discord_ingest import compute_content_hash
 from src.retry_utils import hardened_retry
 
@@ -363,7 +363,7 @@ async def list_ideas(
         # Count total
         count_sql = f"SELECT COUNT(*) as cnt FROM user_ideas{where_clause}"
         count_params = {k: v for k, v in params.items() if k not in ("limit", "offset")}
-        count_rows = execute_sql(count_sql, params=count_params, fetch_results=True)
+        count_rows = await async_execute_sql(count_sql, params=count_params, fetch_results=True)
         total = 0
         if count_rows:
             rd = dict(count_rows[0]._mapping) if hasattr(count_rows[0], "_mapping") else dict(count_rows[0])
@@ -376,7 +376,7 @@ async def list_ideas(
             ORDER BY COALESCE(source_created_at, created_at) DESC
             LIMIT :limit OFFSET :offset
         """
-        rows = execute_sql(data_sql, params=params, fetch_results=True)
+        rows = await async_execute_sql(data_sql, params=params, fetch_results=True)
 
         ideas_list = [_row_to_idea(row) for row in (rows or [])[:limit]]
         has_more = len(rows or []) > limit
@@ -413,11 +413,11 @@ async def ideas_timeline(
         conditions.append("author ILIKE :author")
         params["author"] = author
     if symbol:
-        conditions.append("(UPPER(symbol) = :symbol OR :symbol = ANY(symbols))")
+        conditions.append("(UPPER(symbol) = :symbol OR symbols @> ARRAY[CAST(:symbol AS text)])")
         params["symbol"] = symbol.upper()
     where_clause = (" WHERE " + " AND ".join(conditions)) if conditions else ""
 
-    rows = execute_sql(
+    rows = await async_execute_sql(
         f"""
         SELECT {_idea_select_columns()}
         FROM user_ideas{where_clause}
@@ -515,7 +515,7 @@ async def list_discord_parsed_ideas(
         conditions.append("dpi.review_status = :review_status")
         params["review_status"] = review_status
     if symbol:
-        conditions.append("(UPPER(dpi.primary_symbol) = :symbol OR :symbol = ANY(dpi.symbols))")
+        conditions.append("(UPPER(dpi.primary_symbol) = :symbol OR dpi.symbols @> ARRAY[CAST(:symbol AS text)])")
         params["symbol"] = symbol.upper()
     if label:
         conditions.append(":label = ANY(dpi.labels)")
@@ -526,14 +526,14 @@ async def list_discord_parsed_ideas(
     where_clause = (" WHERE " + " AND ".join(conditions)) if conditions else ""
 
     try:
-        count_rows = execute_sql(
+        count_rows = await async_execute_sql(
             f"SELECT COUNT(*) FROM discord_parsed_ideas dpi{where_clause}",
             params={k: v for k, v in params.items() if k not in ("limit", "offset")},
             fetch_results=True,
         )
         total = int(count_rows[0][0]) if count_rows else 0
 
-        rows = execute_sql(
+        rows = await async_execute_sql(
             f"""
             SELECT dpi.id, dpi.message_id, dpi.idea_text, dpi.idea_summary,
                    dpi.primary_symbol, dpi.symbols, dpi.labels, dpi.direction,
@@ -1091,7 +1091,7 @@ async def get_idea_context(
 ):
     """Get idea with parent Discord message and surrounding context."""
     # 1. Fetch the idea
-    idea_rows = execute_sql(
+    idea_rows = await async_execute_sql(
         "SELECT * FROM user_ideas WHERE id = :id",
         params={"id": idea_id}, fetch_results=True,
     )
@@ -1105,7 +1105,7 @@ async def get_idea_context(
     context_msgs: list[ContextMessage] = []
 
     if idea.originMessageId:
-        msg_rows = execute_sql(
+        msg_rows = await async_execute_sql(
             "SELECT message_id, content, author, timestamp, channel "
             "FROM discord_messages WHERE message_id = :msg_id",
             params={"msg_id": idea.originMessageId}, fetch_results=True,
@@ -1122,7 +1122,7 @@ async def get_idea_context(
             )
 
             # 3. Fetch surrounding messages from same channel
-            ctx_rows = execute_sql(
+            ctx_rows = await async_execute_sql(
                 """
                 (SELECT message_id, content, author, timestamp, channel
                  FROM discord_messages
@@ -117,8 +117,8 @@ async def get_orders(
             params["status"] = status
 
         if ticker:
-            conditions.append("UPPER(o.symbol) = UPPER(:ticker)")
-            params["ticker"] = ticker
+            conditions.append("UPPER(o.symbol) = :ticker")
+            params["ticker"] = ticker.upper()
 
         if not include_drip:
             conditions.append("UPPER(o.action) IN (:act_0, :act_1, :act_2, :act_3, :act_4, :act_5)")
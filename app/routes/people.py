@@ -434,7 +434,7 @@ async def list_unmatched_identities():
         """
         SELECT DISTINCT dm.author_id::text AS platform_user_id, dm.author AS handle
         FROM discord_parsed_ideas dpi
-        JOIN discord_messages dm ON dpi.message_id::text = dm.message_id
+        JOIN discord_messages dm ON dpi.message_id = dm.message_id
         WHERE dm.author_id IS NOT NULL
           AND dm.created_at > NOW() - INTERVAL '30 days'
           AND NOT EXISTS (
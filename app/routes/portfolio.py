@@ -18,7 +18,7 @@ from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 
 from src.bucket import BucketQuery, bucket_filter_sql, validate_bucket
-from src.db import execute_sql
+from src.db import async_execute_sql
 from src.market_data_service import (
     _CRYPTO_SYMBOLS,
     CRYPTO_IDENTITY,
@@ -27,7 +27,7 @@ from src.market_data_service import (
     get_return_metrics,
 )
 from src.portfolio_returns import compute_return_series, period_window
-from src.price_service import get_latest_closes_batch, get_ohlcv, get_previous_closes_batch
+from src.price_service import get_latest_closes_batch, get_previous_closes_batch, get_price_panel
 from src.snaptrade_collector import SnapTradeCollector
 
 logger = logging.getLogger(__name__)
@@ -204,7 +204,7 @@ async def get_portfolio(
             )
             pos_params["bucket"] = bucket
 
-        positions_data = execute_sql(
+        positions_data = await async_execute_sql(
             f"""
             SELECT
                 p.symbol,
@@ -248,7 +248,7 @@ async def get_portfolio(
             )
             bal_params["bucket"] = bucket
 
-        balances_data = execute_sql(
+        balances_data = await async_execute_sql(
             f"""
             SELECT
                 SUM(cash) as total_cash,
@@ -571,7 +571,7 @@ async def get_portfolio(
         )
 
         # Get last update time
-        last_updated = execute_sql(
+        last_updated = await async_execute_sql(
             "SELECT MAX(sync_timestamp) as last_update FROM positions",
             fetch_results=True,
         )
@@ -587,7 +587,7 @@ async def get_portfolio(
         # Get connection status (worst status across non-deleted accounts)
         connection_status = None
         try:
-            conn_rows = execute_sql(
+            conn_rows = await async_execute_sql(
                 "SELECT COALESCE(connection_status, 'connected') as status "
                 "FROM accounts WHERE connection_status != 'deleted'",
                 fetch_results=True,
@@ -602,7 +602,7 @@ async def get_portfolio(
                 connection_status = min(statuses, key=lambda s: priority.get(s, 2))
             else:
                 # No non-deleted accounts — check if all accounts are deleted
-                all_rows = execute_sql(
+                all_rows = await async_execute_sql(
                     "SELECT COUNT(*) as cnt FROM accounts WHERE connection_status = 'deleted'",
                     fetch_results=True,
                 )
@@ -787,7 +787,7 @@ async def get_movers(
             )
             movers_params["bucket"] = bucket
 
-        positions_data = execute_sql(
+        positions_data = await async_execute_sql(
             f"""
             SELECT p.symbol, p.quantity, p.average_buy_price as average_cost,
                    p.price as snaptrade_price
@@ -992,7 +992,7 @@ async def get_sparklines(
             )
             held_params["bucket"] = bucket
 
-        held = execute_sql(
+        held = await async_execute_sql(
             f"SELECT DISTINCT symbol FROM positions WHERE quantity > 0"
             f" AND NOT EXISTS ("
             f"   SELECT 1 FROM accounts a"
@@ -1016,7 +1016,7 @@ async def get_sparklines(
             return SparklineResponse(sparklines=[], period=period.upper())
 
         # Single query for equity symbols' close prices
-        rows = execute_sql(
+        rows = await async_execute_sql(
             """
             SELECT symbol, date, close
             FROM ohlcv_daily
@@ -1025,7 +1025,7 @@ async def get_sparklines(
               AND date <= :end_date
             ORDER BY symbol, date ASC
             """,
-            params={"symbols": equity_symbols, "start_date": str(start_date), "end_date": str(end_date)},
+            params={"symbols": equity_symbols, "start_date": start_date, "end_date": end_date},
             fetch_results=True,
         )
 
@@ -1107,7 +1107,7 @@ async def get_return_series(
     start = period_window(period, today)
 
     clause, bp = bucket_filter_sql(bucket, alias="acc")
-    rows = execute_sql(
+    rows = await async_execute_sql(
         f"""
         SELECT p.symbol AS symbol,
                SUM(p.quantity) AS quantity
@@ -1132,14 +1132,14 @@ async def get_return_series(
             continue
         quantities[sym] = qty
 
+    # All equity closes in one query; crypto still priced per symbol.
+    equity_symbols = [s for s in quantities if s not in _CRYPTO_SYMBOLS]
+    panel = get_price_panel(equity_symbols, start, today) if equity_symbols else None
+    for sym in quantities:
         if sym in _CRYPTO_SYMBOLS:
             series = get_crypto_price_series(sym, start, today)
         else:
-            df = get_ohlcv(sym, start, today)
-            series = {}
-            if not df.empty:
-                for idx, row in df.iterrows():
-                    series[idx.date().isoformat()] = float(row["Close"])
+            series = panel.close_series(sym) if panel is not None else {}
         if series:
             price_series[sym] = series
 
@@ -1172,7 +1172,7 @@ async def get_equity_curve(
       leave gaps as preferred.
     """
     bucket = validate_bucket(bucket)
-    cutoff_date = (date.today() - timedelta(days=days)).isoformat()
+    cutoff_date = date.today() - timedelta(days=days)
 
     bucket_clause = ""
     params: dict[str, Any] = {"cutoff": cutoff_date}
@@ -1181,7 +1181,7 @@ async def get_equity_curve(
         params["bucket"] = bucket
 
     try:
-        rows = execute_sql(
+        rows = await async_execute_sql(
             f"""
             SELECT
                 ps.snapshot_date AS date,
@@ -324,7 +324,7 @@ def _ideas_digest(symbol: str) -> list[dict]:
         """
         SELECT dpi.direction, dpi.labels, dpi.idea_text, dm.created_at, dm.author
         FROM discord_parsed_ideas dpi
-        LEFT JOIN discord_messages dm ON dpi.message_id::text = dm.message_id
+        LEFT JOIN discord_messages dm ON dpi.message_id = dm.message_id
         WHERE UPPER(dpi.primary_symbol) = :symbol
         ORDER BY dm.created_at DESC NULLS LAST
         LIMIT 10
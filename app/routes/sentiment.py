@@ -13,7 +13,7 @@ from typing import Any, Optional
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 
-from src.db import execute_sql
+from src.db import async_execute_sql, execute_sql
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -125,7 +125,7 @@ async def get_sentiment_summary(
         )
 
     try:
-        rows = execute_sql(
+        rows = await async_execute_sql(
             """
             SELECT
                 COUNT(*)                                               AS total,
@@ -135,14 +135,14 @@ async def get_sentiment_summary(
                 MIN(dm.created_at)                                    AS first_at,
                 MAX(dm.created_at)                                    AS last_at
             FROM discord_parsed_ideas dpi
-            LEFT JOIN discord_messages dm ON dpi.message_id::text = dm.message_id
+            LEFT JOIN discord_messages dm ON dpi.message_id = dm.message_id
             WHERE UPPER(dpi.primary_symbol) = :symbol
               AND (
                   dm.created_at IS NULL
                   OR dm.created_at >= NOW() - (:days || ' days')::interval
               )
             """,
-            params={"symbol": symbol, "days": days},
+            params={"symbol": symbol, "days": str(days)},
             fetch_results=True,
         )
 
@@ -189,7 +189,7 @@ async def get_sentiment_messages(
     symbol = ticker.strip().upper()
 
     try:
-        rows = execute_sql(
+        rows = await async_execute_sql(
             """
             SELECT
                 dpi.id,
@@ -202,7 +202,7 @@ async def get_sentiment_messages(
                 dm.channel,
                 dm.created_at
             FROM discord_parsed_ideas dpi
-            LEFT JOIN discord_messages dm ON dpi.message_id::text = dm.message_id
+            LEFT JOIN discord_messages dm ON dpi.message_id = dm.message_id
             WHERE UPPER(dpi.primary_symbol) = :symbol
             ORDER BY dm.created_at DESC NULLS LAST
             LIMIT :limit OFFSET :offset
@@ -211,7 +211,7 @@ async def get_sentiment_messages(
             fetch_results=True,
         )
 
-        count_rows = execute_sql(
+        count_rows = await async_execute_sql(
             "SELECT COUNT(*) AS total FROM discord_parsed_ideas WHERE UPPER(primary_symbol) = :symbol",
             params={"symbol": symbol},
             fetch_results=True,
@@ -367,7 +367,7 @@ async def get_sentiment_feed(
     where_sql = "\n          AND ".join(where_clauses)
 
     try:
-        rows = execute_sql(
+        rows = await async_execute_sql(
             f"""
             SELECT
                 dm.message_id,
@@ -390,7 +390,7 @@ async def get_sentiment_feed(
                 dpi.levels          AS parsed_levels
             FROM discord_messages dm
             LEFT JOIN discord_parsed_ideas dpi
-              ON dpi.message_id::text = dm.message_id
+              ON dpi.message_id = dm.message_id
              AND dpi.is_noise IS NOT TRUE
             WHERE {where_sql}
             ORDER BY dm.created_at DESC NULLS LAST
@@ -572,7 +572,7 @@ async def get_sentiment_status():
     running and surfaces unparsed backlog before it gets bad.
     """
     try:
-        rows = execute_sql(
+        rows = await async_execute_sql(
             """
             SELECT
                 COUNT(*) FILTER (WHERE parse_status = 'pending')                 AS pending,
@@ -588,7 +588,7 @@ async def get_sentiment_status():
         ) or []
         d = dict(rows[0]._mapping) if rows and hasattr(rows[0], "_mapping") else (dict(rows[0]) if rows else {})
 
-        parsed_rows = execute_sql(
+        parsed_rows = await async_execute_sql(
             "SELECT COUNT(*) AS n, MAX(created_at) AS last_at FROM discord_parsed_ideas",
             fetch_results=True,
         ) or []
@@ -659,8 +659,8 @@ async def reparse_messages(req: ReparseRequest):
         # (reviewStatus='unreviewed') if a reparse is really wanted.
         reviewed_rows = execute_sql(
             """
-            SELECT DISTINCT message_id::text FROM discord_parsed_ideas
-            WHERE message_id::text = ANY(:ids)
+            SELECT DISTINCT message_id FROM discord_parsed_ideas
+            WHERE message_id = ANY(:ids)
               AND review_status <> 'unreviewed'
             """,
             params={"ids": ids},
@@ -678,7 +678,7 @@ async def reparse_messages(req: ReparseRequest):
 
         # Drop any parsed ideas for these messages so the reparse starts clean
         del_rows = execute_sql(
-            "DELETE FROM discord_parsed_ideas WHERE message_id::text = ANY(:ids) RETURNING id",
+            "DELETE FROM discord_parsed_ideas WHERE message_id = ANY(:ids) RETURNING id",
             params={"ids": ids},
             fetch_results=True,
         ) or []
@@ -744,7 +744,7 @@ async def reparse_messages(req: ReparseRequest):
     del_rows = execute_sql(
         f"""
         DELETE FROM discord_parsed_ideas
-        WHERE message_id::text IN (
+        WHERE message_id IN (
             SELECT message_id FROM discord_messages
              WHERE parse_status = ANY(:statuses){where_extra}{not_reviewed}
         )
@@ -12,17 +12,23 @@ Response models match frontend TypeScript interfaces in types/api.ts.
 import logging
 import math
 import re
-from datetime import date, datetime, timedelta
-from typing import Any, Optional
+from datetime import UTC, date, datetime, time, timedelta
+from typing import Any, Literal, Optional
 
 from fastapi import APIRouter, HTTPException, Path, Query
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 
 from src.bucket import BucketQuery, bucket_filter_sql, validate_bucket
-from src.db import execute_sql
+from src.db import async_execute_sql
 from src.market_data_service import _CRYPTO_SYMBOLS
-from src.price_service import get_latest_close, get_ohlcv, get_previous_close
+from src.price_service import (
+    get_latest_close,
+    get_ohlcv,
+    get_previous_close,
+    ohlcv_to_columns,
+    ohlcv_to_records,
+)
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -221,6 +227,20 @@ class OHLCVSeries(BaseModel):
     orders: list[ChartOrder]
 
 
+class OHLCVCompactSeries(BaseModel):
+    """Parallel-array OHLCV series (``?format=compact``); index i is one bar."""
+
+    ticker: str
+    period: str
+    dates: list[str]  # YYYY-MM-DD, ascending
+    open: list[float]
+    high: list[float]
+    low: list[float]
+    close: list[float]
+    volume: list[int]
+    orders: list[ChartOrder]
+
+
 # ---------------------------------------------------------------------------
 # Stock activity models  (matches api.ts StockActivity)
 # ---------------------------------------------------------------------------
@@ -272,7 +292,7 @@ async def get_stock_profile(
         # If absolutely no data exists, 404
         if current_price is None:
             # Check if symbol exists at all
-            sym_row = execute_sql(
+            sym_row = await async_execute_sql(
                 "SELECT 1 FROM symbols WHERE UPPER(ticker) = :s LIMIT 1",
                 params={"s": symbol},
                 fetch_results=True,
@@ -297,7 +317,7 @@ async def get_stock_profile(
         if symbol in _CRYPTO_SYMBOLS:
             stats_dict = {}
         else:
-            stats = execute_sql(
+            stats = await async_execute_sql(
                 """
                 SELECT
                     MAX(high)  AS year_high,
@@ -319,7 +339,7 @@ async def get_stock_profile(
         # Aggregate across all accounts (or across bucket-scoped accounts) so
         # quantity and average cost reflect the whole position, not a single
         # account row.
-        pos = execute_sql(
+        pos = await async_execute_sql(
             f"""
             SELECT
                 SUM(p.quantity) AS quantity,
@@ -351,7 +371,7 @@ async def get_stock_profile(
                 pos_qty = None  # No actual position; null out so the UI shows "not held"
 
         # ---- 4. Order counts -----------------------------------------------
-        ord_stats = execute_sql(
+        ord_stats = await async_execute_sql(
             f"""
             SELECT
                 COUNT(*)                                  AS total,
@@ -377,7 +397,7 @@ async def get_stock_profile(
         )
 
         # ---- 5. Sentiment / mention metrics --------------------------------
-        sent = execute_sql(
+        sent = await async_execute_sql(
             """
             SELECT
                 COUNT(*)                                                  AS total_mentions,
@@ -392,7 +412,7 @@ async def get_stock_profile(
                 MIN(dm.created_at) AS first_at,
                 MAX(dm.created_at) AS last_at
             FROM discord_parsed_ideas dpi
-            LEFT JOIN discord_messages dm ON dpi.message_id::text = dm.message_id
+            LEFT JOIN discord_messages dm ON dpi.message_id = dm.message_id
             WHERE UPPER(dpi.primary_symbol) = :s
             """,
             params={"s": symbol},
@@ -409,7 +429,7 @@ async def get_stock_profile(
             return round(n / total_ment * 100, 1) if total_ment else None
 
         # ---- 6. Label counts -----------------------------------------------
-        label_counts = execute_sql(
+        label_counts = await async_execute_sql(
             """
             SELECT
                 COUNT(*) FILTER (WHERE 'TRADE_EXECUTION'     = ANY(labels)) AS exec,
@@ -536,7 +556,7 @@ async def get_stock_ideas(
 
     try:
         # Build query — search both primary_symbol and symbols[] array
-        conditions = ["(UPPER(dpi.primary_symbol) = :symbol OR :symbol = ANY(dpi.symbols))"]
+        conditions = ["(UPPER(dpi.primary_symbol) = :symbol OR dpi.symbols @> ARRAY[CAST(:symbol AS text)])"]
         params: dict = {"symbol": symbol, "limit": limit}
 
         if direction:
@@ -561,13 +581,13 @@ async def get_stock_ideas(
                 dm.created_at,
                 dm.channel
             FROM discord_parsed_ideas dpi
-            LEFT JOIN discord_messages dm ON dpi.message_id::text = dm.message_id
+            LEFT JOIN discord_messages dm ON dpi.message_id = dm.message_id
             WHERE {where_clause}
             ORDER BY dm.created_at DESC NULLS LAST
             LIMIT :limit
         """
 
-        ideas_data = execute_sql(query, params=params, fetch_results=True)
+        ideas_data = await async_execute_sql(query, params=params, fetch_results=True)
 
         ideas = []
         for row in ideas_data or []:
@@ -622,11 +642,11 @@ async def get_stock_ideas(
         # Get total count (may be more than returned due to limit)
         count_q = """
             SELECT COUNT(*) as cnt FROM discord_parsed_ideas dpi
-            WHERE (UPPER(dpi.primary_symbol) = :symbol OR :symbol = ANY(dpi.symbols))
+            WHERE (UPPER(dpi.primary_symbol) = :symbol OR dpi.symbols @> ARRAY[CAST(:symbol AS text)])
         """
         if direction:
             count_q += " AND dpi.direction = :direction"
-        count_rows = execute_sql(count_q, params=params, fetch_results=True)
+        count_rows = await async_execute_sql(count_q, params=params, fetch_results=True)
         total = int(count_rows[0]["cnt"]) if count_rows else len(ideas)
 
         return IdeasResponse(
@@ -655,7 +675,7 @@ async def get_stock_idea_context(
     _validate_ticker(ticker)  # validate + normalize ticker (consistent with all sibling endpoints)
 
     # 1. Fetch the parent message
-    msg_rows = execute_sql(
+    msg_rows = await async_execute_sql(
         "SELECT message_id, content, author, timestamp, channel "
         "FROM discord_messages WHERE message_id = :msg_id",
         params={"msg_id": message_id},
@@ -676,7 +696,7 @@ async def get_stock_idea_context(
         " AND content NOT LIKE '/%'"
         " AND LENGTH(COALESCE(content, '')) >= 5"
     )
-    ctx_rows = execute_sql(
+    ctx_rows = await async_execute_sql(
         f"""
         (SELECT message_id, content, author, timestamp, channel
          FROM discord_messages
@@ -730,7 +750,7 @@ async def get_stock_idea_context(
     return StockIdeaContextResponse(messageId=message_id, contextMessages=context_msgs)
 
 
-@router.get("/{ticker}/ohlcv", response_model=OHLCVSeries)
+@router.get("/{ticker}/ohlcv", response_model=OHLCVSeries | OHLCVCompactSeries)
 async def get_stock_ohlcv(
     ticker: str = Path(..., description="Stock ticker symbol"),
     period: str = Query(
@@ -738,6 +758,10 @@ async def get_stock_ohlcv(
         description="Time period: 1W, 2W, 1M, 3M, 6M, 1Y, 2Y, YTD, MAX",
     ),
     bucket: str | None = BucketQuery,
+    format: Literal["bars", "compact"] = Query(
+        "bars",
+        description="bars: list of OHLCVBar objects; compact: parallel arrays",
+    ),
 ):
     """
     Get OHLCV chart data for a stock.
@@ -749,6 +773,8 @@ async def get_stock_ohlcv(
     strategy bucket. The price bars themselves are stock-wide.
 
     Response shape matches frontend ``types/api.ts`` ``OHLCVSeries``.
+    ``?format=compact`` returns ``OHLCVCompactSeries`` (parallel ``dates`` /
+    ``open`` / ``high`` / ``low`` / ``close`` / ``volume`` arrays) instead.
     """
     symbol = _validate_ticker(ticker)
     bucket = validate_bucket(bucket)
@@ -783,27 +809,16 @@ async def get_stock_ohlcv(
         # get_ohlcv expects date objects, returns mplfinance-compatible DataFrame
         ohlcv_df = get_ohlcv(symbol, start_date, today)
 
-        bars: list[OHLCVBar] = []
-        if ohlcv_df is not None and not ohlcv_df.empty:
-            for idx, row in ohlcv_df.iterrows():
-                # Index is DatetimeIndex from price_service
-                bar_date = str(idx.date()) if hasattr(idx, "date") else str(idx)
-                bars.append(
-                    OHLCVBar(
-                        date=bar_date[:10],  # Ensure YYYY-MM-DD
-                        open=round(float(row.get("Open", row.get("open", 0))), 2),
-                        high=round(float(row.get("High", row.get("high", 0))), 2),
-                        low=round(float(row.get("Low", row.get("low", 0))), 2),
-                        close=round(float(row.get("Close", row.get("close", 0))), 2),
-                        volume=int(row.get("Volume", row.get("volume", 0))),
-                    )
-                )
-
-        # Guarantee ascending date order
-        bars.sort(key=lambda b: b.date)
+        # Columnar conversion (date-ascending, prices rounded to cents); the
+        # bars are already typed, so they go straight into the JSON payload
+        # without a per-bar OHLCVBar validation.
+        if format == "compact":
+            price_payload: dict[str, Any] = ohlcv_to_columns(ohlcv_df, decimals=2)
+        else:
+            price_payload = {"data": ohlcv_to_records(ohlcv_df, decimals=2)}
 
         # Get orders for chart overlay (bucket-filtered when requested).
-        orders_data = execute_sql(
+        orders_data = await async_execute_sql(
             f"""
             SELECT
                 DATE(o.time_executed) as date,
@@ -819,7 +834,11 @@ async def get_stock_ohlcv(
               {bucket_clause}
             ORDER BY o.time_executed
             """,
-            params={"symbol": symbol, "start_date": start_date.isoformat(), **bucket_params},
+            params={
+                "symbol": symbol,
+                "start_date": datetime.combine(start_date, time.min, tzinfo=UTC),
+                **bucket_params,
+            },
             fetch_results=True,
         )
 
@@ -841,16 +860,16 @@ async def get_stock_ohlcv(
                 )
             )
 
-        payload = OHLCVSeries(
-            ticker=symbol,
-            period=period_upper,
-            data=bars,
-            orders=orders,
-        )
+        content = {
+            "ticker": symbol,
+            "period": period_upper,
+            **price_payload,
+            "orders": [o.model_dump() for o in orders],
+        }
 
         # Return with Cache-Control header for frontend revalidation
         return JSONResponse(
-            content=payload.model_dump(),
+            content=content,
             headers={"Cache-Control": "public, max-age=300, stale-while-revalidate=60"},
         )
 
@@ -883,11 +902,11 @@ async def get_stock_activities(
             SELECT COUNT(*) as cnt
             FROM activities a
             LEFT JOIN accounts acc ON acc.id = a.account_id
-            WHERE UPPER(a.symbol) = UPPER(:ticker)
+            WHERE UPPER(a.symbol) = :ticker
               AND COALESCE(acc.connection_status, 'connected') != 'deleted'
               {bucket_clause}
         """
-        count_rows = execute_sql(
+        count_rows = await async_execute_sql(
             count_q, params={"ticker": clean, **bucket_params}, fetch_results=True
         )
         total = int(count_rows[0]["cnt"]) if count_rows else 0
@@ -896,13 +915,13 @@ async def get_stock_activities(
             SELECT a.id, a.activity_type, a.trade_date, a.price, a.units, a.amount, a.fee, a.description
             FROM activities a
             LEFT JOIN accounts acc ON acc.id = a.account_id
-            WHERE UPPER(a.symbol) = UPPER(:ticker)
+            WHERE UPPER(a.symbol) = :ticker
               AND COALESCE(acc.connection_status, 'connected') != 'deleted'
               {bucket_clause}
             ORDER BY a.trade_date DESC, a.created_at DESC
             LIMIT :limit OFFSET :offset
         """
-        rows = execute_sql(
+        rows = await async_execute_sql(
             query,
             params={"ticker": clean, "limit": limit, "offset": offset, **bucket_params},
             fetch_results=True,
@@ -20,7 +20,7 @@ from fastapi import APIRouter, Path, Query
 from pydantic import BaseModel, Field
 
 from src.bucket import BucketQuery, bucket_filter_sql, validate_bucket
-from src.db import execute_sql
+from src.db import async_execute_sql
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -475,7 +475,7 @@ async def get_stock_trades(
 
     try:
         # 1. Fetch activities for this symbol (exclude deleted accounts)
-        activities_rows = execute_sql(
+        activities_rows = await async_execute_sql(
             f"""
             SELECT
                 a.id,
@@ -506,7 +506,7 @@ async def get_stock_trades(
             activities.append(rd)
 
         # 2. Fetch orders for this symbol (exclude deleted accounts)
-        orders_rows = execute_sql(
+        orders_rows = await async_execute_sql(
             f"""
             SELECT
                 o.brokerage_order_id AS id,
@@ -553,7 +553,7 @@ async def get_stock_trades(
         page = merged[offset: offset + limit]
 
         # 5. Fetch position data for enrichment (bucket-scoped if requested)
-        position_rows = execute_sql(
+        position_rows = await async_execute_sql(
             f"""
             SELECT p.symbol, p.quantity, p.average_buy_price,
                    COALESCE(p.current_price, p.price) AS current_price
@@ -572,7 +572,7 @@ async def get_stock_trades(
 
         # Get total portfolio value for portfolioPct — also bucket-scoped so
         # the percentage stays meaningful in a bucket-filtered view.
-        all_positions = execute_sql(
+        all_positions = await async_execute_sql(
             f"""
             SELECT p.symbol, p.quantity, p.average_buy_price,
                    COALESCE(p.current_price, p.price) AS current_price
@@ -626,7 +626,10 @@ async def get_recent_trades(
     dividends, fees, splits etc. — useful for the dedicated Activity page.
     """
     try:
-        cutoff = (datetime.now(UTC) - timedelta(days=days)).strftime("%Y-%m-%d")
+        # Midnight UTC as a datetime — asyncpg binds timestamptz params strictly
+        cutoff = (datetime.now(UTC) - timedelta(days=days)).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
         bucket = validate_bucket(bucket)
         bucket_clause, bucket_params = bucket_filter_sql(bucket, alias="acc")
 
@@ -670,7 +673,7 @@ async def get_recent_trades(
                     order_type_filter_sql = " AND FALSE"
 
         # 1. Fetch recent activities (exclude deleted accounts)
-        activities_rows = execute_sql(
+        activities_rows = await async_execute_sql(
             f"""
             SELECT
                 a.id,
@@ -705,7 +708,7 @@ async def get_recent_trades(
         # 2. Fetch recent orders (exclude deleted accounts). Orders are
         #    always BUY/SELL semantically; the `types` filter only excludes
         #    them when the caller specifically asked for non-trade types.
-        orders_rows = execute_sql(
+        orders_rows = await async_execute_sql(
             f"""
             SELECT
                 o.brokerage_order_id AS id,
@@ -759,7 +762,7 @@ async def get_recent_trades(
         if symbols_in_page:
             placeholders = ",".join(f":sym_{i}" for i in range(len(symbols_in_page)))
             sym_params = {f"sym_{i}": s for i, s in enumerate(symbols_in_page)}
-            older_rows = execute_sql(
+            older_rows = await async_execute_sql(
                 f"""
                 SELECT
                     a.id,
@@ -800,7 +803,7 @@ async def get_recent_trades(
 
         # 5. Fetch position data for enrichment — bucket-scoped so
         # portfolio % stays accurate inside a filtered view.
-        position_rows = execute_sql(
+        position_rows = await async_execute_sql(
             f"""
             SELECT p.symbol, p.quantity, p.average_buy_price,
                    COALESCE(p.current_price, p.price) AS current_price
@@ -12,7 +12,7 @@ from typing import Optional
 from fastapi import APIRouter, Query
 from pydantic import BaseModel
 
-from src.db import execute_sql
+from src.db import async_execute_sql
 from src.market_data_service import _CRYPTO_SYMBOLS
 from src.price_service import (
     get_latest_close,
@@ -83,7 +83,7 @@ async def get_watchlist_prices(
     prev_map = get_previous_closes_batch(ticker_list)
 
     # Batch fetch volume + latest date in one query
-    vol_date_map = _batch_fetch_volume_and_date(ticker_list)
+    vol_date_map = await _batch_fetch_volume_and_date(ticker_list)
 
     # yfinance fallback for symbols not in Databento
     yf_quotes: dict[str, dict] = {}
@@ -131,7 +131,7 @@ async def get_watchlist_prices(
     return WatchlistResponse(items=items)
 
 
-def _batch_fetch_volume_and_date(symbols: list[str]) -> dict[str, dict]:
+async def _batch_fetch_volume_and_date(symbols: list[str]) -> dict[str, dict]:
     """Fetch latest volume and date for *symbols* in a single query."""
     if not symbols:
         return {}
@@ -140,7 +140,7 @@ def _batch_fetch_volume_and_date(symbols: list[str]) -> dict[str, dict]:
     if not equity_symbols:
         return {}
     try:
-        rows = execute_sql(
+        rows = await async_execute_sql(
             """
             SELECT DISTINCT ON (symbol)
                 symbol,
@@ -181,7 +181,7 @@ async def validate_ticker(request: ValidationRequest):
 
     try:
         # Check if symbol exists in symbols table
-        result = execute_sql(
+        result = await async_execute_sql(
             """
             SELECT ticker, description
             FROM symbols
@@ -200,7 +200,7 @@ async def validate_ticker(request: ValidationRequest):
             )
 
         # Also check symbol_aliases table
-        alias_result = execute_sql(
+        alias_result = await async_execute_sql(
             """
             SELECT canonical_symbol
             FROM symbol_aliases
@@ -33,6 +33,7 @@ from typing import Any
 from fastapi import APIRouter, BackgroundTasks, HTTPException, Request
 from pydantic import BaseModel
 
+from src.analysis.orchestrator import invalidate_analysis_cache, invalidate_portfolio_risk_cache
 from src.config import settings
 from src.db import execute_sql
 from src.snaptrade_collector import SnapTradeCollector
@@ -295,6 +296,21 @@ async def handle_snaptrade_webhook(
         )
 
 
+def _held_symbols(account_id: str | None) -> set[str] | None:
+    """Symbols the DB holds for an account (all accounts when None); None if unreadable."""
+    account_clause = " AND account_id = :acct" if account_id else ""
+    try:
+        rows = execute_sql(
+            f"SELECT DISTINCT symbol FROM positions WHERE quantity > 0{account_clause}",
+            params={"acct": account_id} if account_id else None,
+            fetch_results=True,
+        )
+    except Exception as e:
+        logger.warning("Could not read held symbols before sync: %s", e)
+        return None
+    return {str(r[0]).strip() for r in rows or [] if r[0]}
+
+
 def _handle_event(event_type: str, account_id: str | None, payload: dict) -> str:
     """Dispatch webhook event to the appropriate handler. Returns a message."""
 
@@ -304,6 +320,9 @@ def _handle_event(event_type: str, account_id: str | None, payload: dict) -> str
         collector = SnapTradeCollector()
 
         try:
+            # Read before the sync: positions zeroed by reconciliation below
+            # are no longer in positions_df but their analyses are stale too
+            held_before = _held_symbols(account_id)
             positions_df = collector.get_positions(account_id)
             if not positions_df.empty:
                 positions_for_db = positions_df.drop(
@@ -314,6 +333,19 @@ def _handle_event(event_type: str, account_id: str | None, payload: dict) -> str
                 )
                 collector._reconcile_stale_positions(positions_df, account_id)
             logger.info("Positions synced from SnapTrade")
+            # Position context and portfolio value feed the cached analyses
+            # and portfolio risk — expire them so the next view recomputes.
+            # Covers symbols held before and after the sync; everything when
+            # the pre-sync holdings couldn't be read.
+            held_after = (
+                set(positions_df["symbol"].dropna().astype(str).str.strip())
+                if "symbol" in positions_df
+                else set()
+            )
+            invalidate_analysis_cache(
+                None if held_before is None else sorted(held_before | held_after)
+            )
+            invalidate_portfolio_risk_cache()
         except Exception as e:
             logger.error("Failed to sync positions: %s", e)
 
@@ -0,0 +1,38 @@
+-- =======================================================================
+-- Migration 080: Content-hash keyed LLM parse cache
+-- =======================================================================
+-- Reparses (parse_messages.py, /sentiment/reparse, batch backfills) used to
+-- re-send byte-identical text to OpenAI. Reposted alerts and copy-pasted
+-- calls are common, so structured outputs are now cached by
+-- (call_type, content_hash, prompt_version, model) — see src/nlp/parse_cache.py.
+--
+--  - content_hash: SHA-256 of the exact, unmodified text sent (no normalisation)
+--  - call_type:    'triage' (TriageResult) or 'parse' (MessageParseResult)
+--  - model:        model requested for the call (the key)
+--  - model_used:   model that produced the result (differs after escalation)
+--
+-- Bumping CURRENT_PROMPT_VERSION invalidates every entry by construction.
+-- Eviction is age + row-cap based (prune_parse_cache), keyed on last_hit_at.
+-- Additive only. RLS enabled (no explicit policy — service role, mirrors 074).
+
+CREATE TABLE IF NOT EXISTS public.llm_parse_cache (
+    call_type       TEXT NOT NULL CHECK (call_type IN ('triage', 'parse')),
+    content_hash    TEXT NOT NULL,
+    prompt_version  TEXT NOT NULL,
+    model           TEXT NOT NULL,
+    model_used      TEXT NOT NULL,
+    result          JSONB NOT NULL,
+    hit_count       INTEGER NOT NULL DEFAULT 0,
+    created_at      TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    last_hit_at     TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (call_type, content_hash, prompt_version, model)
+);
+
+CREATE INDEX IF NOT EXISTS idx_llm_parse_cache_last_hit
+    ON public.llm_parse_cache (last_hit_at);
+
+ALTER TABLE public.llm_parse_cache ENABLE ROW LEVEL SECURITY;
+
+INSERT INTO public.schema_migrations (version, description)
+VALUES ('080_llm_parse_cache', 'Content-hash keyed cache of LLM triage/parse structured outputs')
+ON CONFLICT (version) DO NOTHING;
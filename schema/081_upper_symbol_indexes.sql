@@ -0,0 +1,49 @@
+-- =======================================================================
+-- Migration 081: Expression indexes for case-insensitive symbol lookups
+-- =======================================================================
+-- Hot per-stock queries (chat, sentiment summary, orchestrator ideas, stocks
+-- OHLCV overlay, track record, positions) filter with function-wrapped
+-- predicates such as UPPER(dpi.primary_symbol) = :symbol. The plain btree
+-- indexes from the 060 baseline (idx_orders_symbol, idx_activities_symbol, ...)
+-- cannot serve those predicates, so every stock page sequentially scanned.
+--
+-- Normalised keys are expression indexes on UPPER(<col>) (same approach as
+-- idx_video_quotes_ticker in 074) rather than generated columns, so writers
+-- are untouched and the existing UPPER(col) = :symbol query text matches the
+-- index as-is. Query sites pass an already upper-cased parameter.
+--
+--  - symbols.ticker uses text_pattern_ops so /search prefix matches
+--    (UPPER(ticker) LIKE 'AB%') can use it as well as equality.
+--  - discord_parsed_ideas.symbols gets a GIN index; the secondary-symbol
+--    branch of idea filters is written as symbols @> ARRAY[:symbol].
+--
+-- scripts/verify_database.py --performance EXPLAINs the hot queries and fails
+-- if any still plans a sequential scan on these tables.
+-- Additive only.
+
+CREATE INDEX IF NOT EXISTS idx_discord_parsed_ideas_primary_symbol_upper
+    ON public.discord_parsed_ideas (UPPER(primary_symbol));
+CREATE INDEX IF NOT EXISTS idx_discord_parsed_ideas_symbols_gin
+    ON public.discord_parsed_ideas USING GIN (symbols);
+
+CREATE INDEX IF NOT EXISTS idx_orders_symbol_upper
+    ON public.orders (UPPER(symbol));
+CREATE INDEX IF NOT EXISTS idx_activities_symbol_upper
+    ON public.activities (UPPER(symbol));
+CREATE INDEX IF NOT EXISTS idx_positions_symbol_upper
+    ON public.positions (UPPER(symbol));
+CREATE INDEX IF NOT EXISTS idx_symbols_ticker_upper
+    ON public.symbols (UPPER(ticker) text_pattern_ops);
+
+-- Expression indexes get their own statistics; collect them now so the
+-- planner picks the new indexes before the next autovacuum analyze.
+ANALYZE public.discord_parsed_ideas;
+ANALYZE public.orders;
+ANALYZE public.activities;
+ANALYZE public.positions;
+ANALYZE public.symbols;
+
+INSERT INTO public.schema_migrations (version, description)
+VALUES ('081_upper_symbol_indexes',
+        'UPPER(symbol) expression indexes for case-insensitive hot symbol lookups')
+ON CONFLICT (version) DO NOTHING;
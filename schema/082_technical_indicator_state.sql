@@ -0,0 +1,28 @@
+-- =======================================================================
+-- Migration 082: Incremental technical indicator state
+-- =======================================================================
+-- technical.run used to recompute EMA, RSI, MACD, ATR and ADX over ~400 bars
+-- on every analysis although only one daily bar is new. Those indicators are
+-- recursive, so their smoothed values are now stored per symbol and advanced
+-- one bar at a time — see src/analysis/indicator_state.py.
+--
+--  - as_of:  trade date of the last bar folded into the state
+--  - state:  IndicatorState.to_dict() (versioned; other versions are ignored
+--            and reseeded)
+--
+-- Written by the nightly pipeline after the OHLCV backfill
+-- (refresh_indicator_states); read by the analysis orchestrator.
+-- Additive only. RLS enabled (no explicit policy — service role, mirrors 080).
+
+CREATE TABLE IF NOT EXISTS public.technical_indicator_state (
+    symbol      TEXT PRIMARY KEY,
+    as_of       DATE NOT NULL,
+    state       JSONB NOT NULL,
+    updated_at  TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+ALTER TABLE public.technical_indicator_state ENABLE ROW LEVEL SECURITY;
+
+INSERT INTO public.schema_migrations (version, description)
+VALUES ('082_technical_indicator_state', 'Per-symbol recursive indicator state for incremental technical analysis')
+ON CONFLICT (version) DO NOTHING;
@@ -0,0 +1,24 @@
+-- =======================================================================
+-- Migration 083: Track when cached analyses are actually viewed
+-- =======================================================================
+-- The nightly warmup (src/analysis/warmup.py) re-warms analyses viewed in
+-- the last ANALYSIS_WARMUP_RECENT_DAYS. It used computed_at for that, but
+-- the warmup itself rewrites computed_at every night, so a ticker viewed
+-- once was re-warmed forever and the set only grew.
+--
+--  - last_viewed_at: bumped when the read path loads the row from the DB
+--                    and when a user-triggered computation writes it; the
+--                    warmup leaves it untouched. NULL = never viewed.
+--
+-- Additive only.
+
+ALTER TABLE public.stock_analysis_cache
+    ADD COLUMN IF NOT EXISTS last_viewed_at TIMESTAMPTZ;
+
+CREATE INDEX IF NOT EXISTS idx_analysis_cache_last_viewed
+    ON public.stock_analysis_cache (last_viewed_at)
+    WHERE last_viewed_at IS NOT NULL;
+
+INSERT INTO public.schema_migrations (version, description)
+VALUES ('083_analysis_cache_last_viewed', 'Record views of cached stock analyses for the nightly warmup')
+ON CONFLICT (version) DO NOTHING;
@@ -0,0 +1,23 @@
+-- =======================================================================
+-- Migration 084: Separate Batch API results in the LLM parse cache
+-- =======================================================================
+-- Interactive parses now key llm_parse_cache on the exact user content sent
+-- (alias-mapped text plus the candidate-ticker hint). Batch API requests send
+-- different content (no alias mapping, no hint), so ingest_batch.py stores
+-- their results under their own call_type, 'batch_parse', instead of sharing
+-- 'parse' keys with interactive results.
+--
+-- Existing 'parse' rows were keyed on the raw chunk text; they no longer
+-- match any lookup and age out through prune_parse_cache.
+-- Additive only.
+
+ALTER TABLE public.llm_parse_cache
+    DROP CONSTRAINT IF EXISTS llm_parse_cache_call_type_check;
+
+ALTER TABLE public.llm_parse_cache
+    ADD CONSTRAINT llm_parse_cache_call_type_check
+    CHECK (call_type IN ('triage', 'parse', 'batch_parse'));
+
+INSERT INTO public.schema_migrations (version, description)
+VALUES ('084_parse_cache_batch_call_type', 'Allow batch_parse call_type in llm_parse_cache')
+ON CONFLICT (version) DO NOTHING;
@@ -111,6 +111,12 @@ def main():
         default=5,
         help="Lookback days for daily update (default: 5)",
     )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=None,
+        help="Rows per bulk upsert transaction (default: OHLCV_UPSERT_CHUNK_SIZE or 5000)",
+    )
 
     args = parser.parse_args()
     setup_logging(args.verbose)
@@ -129,7 +135,7 @@ def main():
 
     # Initialize collector
     try:
-        collector = DatabentoCollector()
+        collector = DatabentoCollector(upsert_chunk_size=args.chunk_size)
         logger.info("DatabentoCollector initialized")
     except ValueError as e:
         logger.error(f"Configuration error: {e}")
@@ -13,6 +13,7 @@ Usage:
     python scripts/backfill_stock_profiles.py --full             # Both current + history
     python scripts/backfill_stock_profiles.py --ticker AAPL      # Single ticker
     python scripts/backfill_stock_profiles.py --dry-run          # Preview without writing
+    python scripts/backfill_stock_profiles.py --force            # Ignore unchanged-input skipping
 
 Environment:
     Requires Supabase credentials configured.
@@ -38,7 +39,7 @@ from src.env_bootstrap import bootstrap_env  # noqa: E402
 bootstrap_env()
 
 from src.db import execute_sql, get_connection
-from src.price_service import get_ohlcv, is_available as ohlcv_available
+from src.price_service import get_ohlcv, get_ohlcv_long, is_available as ohlcv_available
 from src.retry_utils import hardened_retry
 
 logging.basicConfig(
@@ -70,14 +71,8 @@ def get_all_tracked_tickers() -> list[str]:
     return [row[0] for row in rows if row[0]]
 
 
-def get_position_metrics(ticker: str) -> dict[str, Any]:
-    """Get position metrics for a ticker from positions table."""
-    # NOTE: `positions` has no percent column — unrealized_pnl_pct is computed
-    # as total P&L over total cost basis (SUM(open_pnl) / SUM(qty*avg_cost)).
-    # The old query referenced a non-existent `open_pnl_percent` column, so this
-    # whole refresh failed on every ticker and stock_profile_current stayed empty.
-    query = """
-    SELECT
+# Aggregate SELECT lists shared by the per-ticker and bulk (GROUP BY) queries.
+_POSITION_METRICS_SELECT = """
         SUM(quantity) AS current_qty,
         SUM(equity) AS current_value,
         AVG(average_buy_price) AS avg_buy_price,
@@ -87,40 +82,83 @@ def get_position_metrics(ticker: str) -> dict[str, Any]:
             THEN SUM(open_pnl) / SUM(quantity * average_buy_price) * 100.0
             ELSE NULL
         END AS unrealized_pnl_pct
+"""
+
+_ORDER_METRICS_SELECT = """
+        COUNT(*) AS total_orders,
+        COUNT(*) FILTER (WHERE action = 'BUY') AS buy_orders,
+        COUNT(*) FILTER (WHERE action = 'SELL') AS sell_orders,
+        AVG(total_quantity) AS avg_order_size,
+        MIN(DATE(time_executed)) AS first_trade,
+        MAX(DATE(time_executed)) AS last_trade
+"""
+
+_SENTIMENT_METRICS_SELECT = """
+        COUNT(*) AS total_mentions,
+        COUNT(*) FILTER (WHERE source_created_at >= :days_30) AS mentions_30d,
+        COUNT(*) FILTER (WHERE source_created_at >= :days_7) AS mentions_7d,
+        AVG(confidence) AS avg_confidence,
+        
+        -- Direction breakdown
+        COUNT(*) FILTER (WHERE direction = 'bullish') AS bullish_count,
+        COUNT(*) FILTER (WHERE direction = 'bearish') AS bearish_count,
+        COUNT(*) FILTER (WHERE direction = 'neutral') AS neutral_count,
+        
+        -- First and last mention
+        MIN(source_created_at) AS first_mentioned,
+        MAX(source_created_at) AS last_mentioned,
+        
+        -- Label counts (using JSONB containment)
+        COUNT(*) FILTER (WHERE 'TRADE_EXECUTION' = ANY(labels)) AS label_trade_exec,
+        COUNT(*) FILTER (WHERE 'TRADE_PLAN' = ANY(labels)) AS label_trade_plan,
+        COUNT(*) FILTER (WHERE 'TECHNICAL_ANALYSIS' = ANY(labels)) AS label_ta,
+        COUNT(*) FILTER (WHERE 'OPTIONS' = ANY(labels)) AS label_options,
+        COUNT(*) FILTER (WHERE 'CATALYST_NEWS' = ANY(labels)) AS label_catalyst
+"""
+
+
+def get_position_metrics(ticker: str) -> dict[str, Any]:
+    """Get position metrics for a ticker from positions table."""
+    # NOTE: `positions` has no percent column — unrealized_pnl_pct is computed
+    # as total P&L over total cost basis (SUM(open_pnl) / SUM(qty*avg_cost)).
+    # The old query referenced a non-existent `open_pnl_percent` column, so this
+    # whole refresh failed on every ticker and stock_profile_current stayed empty.
+    query = f"""
+    SELECT {_POSITION_METRICS_SELECT}
     FROM positions
     WHERE symbol = :ticker
     """
     rows = execute_sql(query, params={"ticker": ticker}, fetch_results=True)
+    return _position_metrics_from_row(rows[0]) if rows else {}
 
-    if rows and rows[0][0] is not None:
-        row = rows[0]
-        return {
-            "current_position_qty": float(row[0]) if row[0] else None,
-            "current_position_value": float(row[1]) if row[1] else None,
-            "avg_buy_price": float(row[2]) if row[2] else None,
-            "unrealized_pnl": float(row[3]) if row[3] else None,
-            "unrealized_pnl_pct": float(row[4]) if row[4] else None,
-        }
-    return {}
+
+def _position_metrics_from_row(row) -> dict[str, Any]:
+    """Map a _POSITION_METRICS_SELECT row to profile fields."""
+    if row[0] is None:
+        return {}
+    return {
+        "current_position_qty": float(row[0]) if row[0] else None,
+        "current_position_value": float(row[1]) if row[1] else None,
+        "avg_buy_price": float(row[2]) if row[2] else None,
+        "unrealized_pnl": float(row[3]) if row[3] else None,
+        "unrealized_pnl_pct": float(row[4]) if row[4] else None,
+    }
 
 
 def get_order_metrics(ticker: str) -> dict[str, Any]:
     """Get order/trading activity metrics for a ticker."""
-    query = """
-    SELECT 
-        COUNT(*) AS total_orders,
-        COUNT(*) FILTER (WHERE action = 'BUY') AS buy_orders,
-        COUNT(*) FILTER (WHERE action = 'SELL') AS sell_orders,
-        AVG(total_quantity) AS avg_order_size,
-        MIN(DATE(time_executed)) AS first_trade,
-        MAX(DATE(time_executed)) AS last_trade
+    query = f"""
+    SELECT {_ORDER_METRICS_SELECT}
     FROM orders
     WHERE symbol = :ticker AND status = 'executed'
     """
     rows = execute_sql(query, params={"ticker": ticker}, fetch_results=True)
+    return _order_metrics_from_row(rows[0] if rows else None)
 
-    if rows and rows[0][0]:
-        row = rows[0]
+
+def _order_metrics_from_row(row) -> dict[str, Any]:
+    """Map an _ORDER_METRICS_SELECT row (or None) to profile fields."""
+    if row is not None and row[0]:
         return {
             "total_orders_count": int(row[0]) if row[0] else 0,
             "buy_orders_count": int(row[1]) if row[1] else 0,
@@ -142,29 +180,8 @@ def get_sentiment_metrics(ticker: str) -> dict[str, Any]:
     days_30_ago = now - timedelta(days=30)
     days_7_ago = now - timedelta(days=7)
 
-    query = """
-    SELECT 
-        COUNT(*) AS total_mentions,
-        COUNT(*) FILTER (WHERE source_created_at >= :days_30) AS mentions_30d,
-        COUNT(*) FILTER (WHERE source_created_at >= :days_7) AS mentions_7d,
-        AVG(confidence) AS avg_confidence,
-        
-        -- Direction breakdown
-        COUNT(*) FILTER (WHERE direction = 'bullish') AS bullish_count,
-        COUNT(*) FILTER (WHERE direction = 'bearish') AS bearish_count,
-        COUNT(*) FILTER (WHERE direction = 'neutral') AS neutral_count,
-        
-        -- First and last mention
-        MIN(source_created_at) AS first_mentioned,
-        MAX(source_created_at) AS last_mentioned,
-        
-        -- Label counts (using JSONB containment)
-        COUNT(*) FILTER (WHERE 'TRADE_EXECUTION' = ANY(labels)) AS label_trade_exec,
-        COUNT(*) FILTER (WHERE 'TRADE_PLAN' = ANY(labels)) AS label_trade_plan,
-        COUNT(*) FILTER (WHERE 'TECHNICAL_ANALYSIS' = ANY(labels)) AS label_ta,
-        COUNT(*) FILTER (WHERE 'OPTIONS' = ANY(labels)) AS label_options,
-        COUNT(*) FILTER (WHERE 'CATALYST_NEWS' = ANY(labels)) AS label_catalyst
-        
+    query = f"""
+    SELECT {_SENTIMENT_METRICS_SELECT}
     FROM discord_parsed_ideas
     WHERE primary_symbol = :ticker
     """
@@ -178,9 +195,12 @@ def get_sentiment_metrics(ticker: str) -> dict[str, Any]:
         },
         fetch_results=True,
     )
+    return _sentiment_metrics_from_row(rows[0] if rows else None)
 
-    if rows and rows[0][0]:
-        row = rows[0]
+
+def _sentiment_metrics_from_row(row) -> dict[str, Any]:
+    """Map a _SENTIMENT_METRICS_SELECT row (or None) to profile fields."""
+    if row is not None and row[0]:
         total = int(row[0]) if row[0] else 0
         bullish = int(row[4]) if row[4] else 0
         bearish = int(row[5]) if row[5] else 0
@@ -221,19 +241,34 @@ def get_sentiment_metrics(ticker: str) -> dict[str, Any]:
     }
 
 
+PRICE_HISTORY_DAYS = 365
+
+# Trailing return windows in trading bars
+RETURN_PERIODS = {
+    "return_1w_pct": 5,
+    "return_1m_pct": 21,
+    "return_3m_pct": 63,
+    "return_1y_pct": 252,
+}
+
+
 @hardened_retry(max_retries=2, delay=1)
-def get_price_metrics(ticker: str) -> dict[str, Any]:
-    """Get price metrics from Supabase ohlcv_daily."""
-    if not ohlcv_available():
+def get_price_metrics(ticker: str, df: Optional[pd.DataFrame] = None) -> dict[str, Any]:
+    """Get price metrics from Supabase ohlcv_daily.
+
+    Pass ``df`` (a get_ohlcv() frame) to skip the per-ticker fetch.
+    """
+    if df is None and not ohlcv_available():
         logger.warning("OHLCV data not available, skipping price metrics")
         return {}
 
     # Get 1 year of data for calculations
     end_date = date.today()
-    start_date = end_date - timedelta(days=365)
+    start_date = end_date - timedelta(days=PRICE_HISTORY_DAYS)
 
     try:
-        df = get_ohlcv(ticker, start_date, end_date)
+        if df is None:
+            df = get_ohlcv(ticker, start_date, end_date)
 
         if df.empty:
             logger.debug(f"No OHLCV data for {ticker}")
@@ -255,14 +290,7 @@ def get_price_metrics(ticker: str) -> dict[str, Any]:
 
         # Calculate returns (using available data)
         returns = {}
-        return_periods = {
-            "return_1w_pct": 5,
-            "return_1m_pct": 21,
-            "return_3m_pct": 63,
-            "return_1y_pct": 252,
-        }
-
-        for key, days in return_periods.items():
+        for key, days in RETURN_PERIODS.items():
             if len(df) > days:
                 start_price = float(df["Close"].iloc[-(days + 1)])
                 returns[key] = ((latest_close - start_price) / start_price) * 100
@@ -312,12 +340,14 @@ def get_price_metrics(ticker: str) -> dict[str, Any]:
 # ============================================================================
 
 
-def build_stock_profile(ticker: str) -> dict[str, Any]:
+def build_stock_profile(
+    ticker: str, ohlcv: Optional[pd.DataFrame] = None
+) -> dict[str, Any]:
     """Build complete stock profile by aggregating all metrics."""
     profile = {"ticker": ticker, "last_updated": datetime.now(timezone.utc)}
 
     # Aggregate all metrics
-    profile.update(get_price_metrics(ticker))
+    profile.update(get_price_metrics(ticker, df=ohlcv))
     profile.update(get_position_metrics(ticker))
     profile.update(get_order_metrics(ticker))
     profile.update(get_sentiment_metrics(ticker))
@@ -359,21 +389,10 @@ def upsert_stock_profile_current(
         return False
 
 
-def append_stock_profile_history(
-    profile: dict[str, Any], as_of_date: date, dry_run: bool = False
-) -> bool:
-    """Append a profile snapshot to stock_profile_history."""
-    ticker = profile.get("ticker")
-    if not ticker:
-        return False
-
-    if dry_run:
-        logger.info(f"[DRY-RUN] Would append history for {ticker} as of {as_of_date}")
-        return True
-
-    # Map current profile fields to history columns
-    history_record = {
-        "ticker": ticker,
+def _history_record(profile: dict[str, Any], as_of_date: date) -> dict[str, Any]:
+    """Map current profile fields to stock_profile_history columns."""
+    return {
+        "ticker": profile.get("ticker"),
         "as_of_date": as_of_date,
         "close_price": profile.get("latest_close_price"),
         "daily_change_pct": profile.get("daily_change_pct"),
@@ -398,6 +417,21 @@ def append_stock_profile_history(
         "bullish_mention_pct": profile.get("bullish_mention_pct"),
     }
 
+
+def append_stock_profile_history(
+    profile: dict[str, Any], as_of_date: date, dry_run: bool = False
+) -> bool:
+    """Append a profile snapshot to stock_profile_history."""
+    ticker = profile.get("ticker")
+    if not ticker:
+        return False
+
+    if dry_run:
+        logger.info(f"[DRY-RUN] Would append history for {ticker} as of {as_of_date}")
+        return True
+
+    history_record = _history_record(profile, as_of_date)
+
     columns = list(history_record.keys())
     placeholders = [f":{col}" for col in columns]
 
@@ -416,6 +450,326 @@ def append_stock_profile_history(
         return False
 
 
+# ============================================================================
+# BULK ENGINE
+# ============================================================================
+# One OHLCV pull + one grouped query per metric family for the whole ticker
+# set, then one executemany upsert per table. Replaces ~5 round trips per
+# ticker in the build_stock_profile() path.
+
+# Inputs newer than stock_profile_current.last_updated mark a ticker stale.
+# Mentions that aged out of the 30d/7d windows since the last refresh also
+# count, as do positions that have since been closed.
+_STALE_TICKERS_QUERY = """
+SELECT t.ticker
+FROM unnest(CAST(:tickers AS text[])) AS t(ticker)
+LEFT JOIN stock_profile_current sp ON sp.ticker = t.ticker
+WHERE sp.ticker IS NULL
+   OR EXISTS (
+        SELECT 1 FROM ohlcv_daily o
+        WHERE o.symbol = t.ticker AND o.updated_at > sp.last_updated
+   )
+   OR EXISTS (
+        SELECT 1 FROM positions p
+        WHERE p.symbol = t.ticker AND p.sync_timestamp > sp.last_updated
+   )
+   OR (
+        sp.current_position_qty IS NOT NULL
+        AND NOT EXISTS (SELECT 1 FROM positions p WHERE p.symbol = t.ticker)
+   )
+   OR EXISTS (
+        SELECT 1 FROM orders o
+        WHERE o.symbol = t.ticker AND o.updated_at > sp.last_updated
+   )
+   OR EXISTS (
+        SELECT 1 FROM discord_parsed_ideas d
+        WHERE d.primary_symbol = t.ticker
+          AND (
+              d.parsed_at > sp.last_updated
+              OR (d.source_created_at >= sp.last_updated - INTERVAL '30 days'
+                  AND d.source_created_at < :days_30)
+              OR (d.source_created_at >= sp.last_updated - INTERVAL '7 days'
+                  AND d.source_created_at < :days_7)
+          )
+   )
+"""
+
+# stock_profile_history columns sourced from differently-named current columns
+_HISTORY_FROM_CURRENT = {
+    "close_price": "latest_close_price",
+    "position_qty": "current_position_qty",
+    "position_value": "current_position_value",
+}
+
+
+def get_stale_tickers(tickers: list[str]) -> list[str]:
+    """Return the tickers whose profile inputs changed since last_updated.
+
+    Falls back to all tickers if the check itself fails.
+    """
+    if not tickers:
+        return []
+
+    now = datetime.now(timezone.utc)
+    try:
+        rows = execute_sql(
+            _STALE_TICKERS_QUERY,
+            params={
+                "tickers": tickers,
+                "days_30": now - timedelta(days=30),
+                "days_7": now - timedelta(days=7),
+            },
+            fetch_results=True,
+        )
+    except Exception as e:
+        logger.warning(f"Staleness check failed, refreshing all tickers: {e}")
+        return list(tickers)
+
+    stale = {row[0] for row in rows or []}
+    return [t for t in tickers if t in stale]
+
+
+def _price_metrics_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Vectorized get_price_metrics() over a long (Symbol, Date, ...) frame.
+
+    Returns one row per symbol with the same fields and windowing rules as
+    the per-ticker path (NaN where a window has too few bars).
+    """
+    df = df.sort_values(["Symbol", "Date"], kind="stable").reset_index(drop=True)
+    symbol = df["Symbol"]
+    g = df.groupby(symbol, sort=False)
+    n_bars = g.size()
+    bars_back = g.cumcount(ascending=False)  # 0 = latest bar
+
+    def close_back(k: int) -> pd.Series:
+        return df.loc[bars_back == k].set_index("Symbol")["Close"].reindex(n_bars.index)
+
+    latest = close_back(0)
+    out = pd.DataFrame(index=n_bars.index)
+    out["latest_close_price"] = latest
+    out["previous_close_price"] = close_back(1)
+    out["daily_change_pct"] = (latest - out["previous_close_price"]) / out["previous_close_price"] * 100
+    for key, days in RETURN_PERIODS.items():
+        base = close_back(days)
+        out[key] = (latest - base) / base * 100
+
+    # Annualized std dev of the trailing N daily returns (needs N returns)
+    daily_returns = g["Close"].pct_change()
+    for key, window in (("volatility_30d", 30), ("volatility_90d", 90)):
+        vol = daily_returns.where(bars_back < window).groupby(symbol).std() * np.sqrt(252) * 100
+        out[key] = vol.where(n_bars - 1 >= window)
+
+    out["year_high"] = g["High"].max()
+    out["year_low"] = g["Low"].min()
+    avg_volume = df["Volume"].where(bars_back < 30).groupby(symbol).mean()
+    out["avg_volume_30d"] = avg_volume.where(n_bars >= 30)
+    return out
+
+
+def compute_price_metrics_bulk(tickers: list[str]) -> Optional[dict[str, dict[str, Any]]]:
+    """Price metrics for all tickers from a single OHLCV pull.
+
+    Returns None when OHLCV is unavailable or the pull fails, so callers can
+    leave existing price columns untouched. Tickers without bars are omitted.
+    """
+    if not tickers or not ohlcv_available():
+        logger.warning("OHLCV data not available, skipping price metrics")
+        return None
+
+    end_date = date.today()
+    start_date = end_date - timedelta(days=PRICE_HISTORY_DAYS)
+    try:
+        df = get_ohlcv_long(tickers, start_date, end_date)
+    except Exception as e:
+        logger.error(f"Bulk OHLCV pull failed: {e}")
+        return None
+    if df.empty:
+        return {}
+
+    frame = _price_metrics_frame(df).astype(object)
+    frame = frame.where(frame.notna(), None)
+    metrics = frame.to_dict("index")
+    for values in metrics.values():
+        if values["avg_volume_30d"] is not None:
+            values["avg_volume_30d"] = int(values["avg_volume_30d"])
+    return metrics
+
+
+def get_position_metrics_bulk(tickers: list[str]) -> dict[str, dict[str, Any]]:
+    """Position metrics for all tickers in one GROUP BY query."""
+    rows = execute_sql(
+        f"""
+        SELECT symbol, {_POSITION_METRICS_SELECT}
+        FROM positions
+        WHERE symbol = ANY(:tickers)
+        GROUP BY symbol
+        """,
+        params={"tickers": tickers},
+        fetch_results=True,
+    )
+    return {row[0]: _position_metrics_from_row(row[1:]) for row in rows or []}
+
+
+def get_order_metrics_bulk(tickers: list[str]) -> dict[str, dict[str, Any]]:
+    """Order metrics for all tickers in one GROUP BY query."""
+    rows = execute_sql(
+        f"""
+        SELECT symbol, {_ORDER_METRICS_SELECT}
+        FROM orders
+        WHERE symbol = ANY(:tickers) AND status = 'executed'
+        GROUP BY symbol
+        """,
+        params={"tickers": tickers},
+        fetch_results=True,
+    )
+    return {row[0]: _order_metrics_from_row(row[1:]) for row in rows or []}
+
+
+def get_sentiment_metrics_bulk(tickers: list[str]) -> dict[str, dict[str, Any]]:
+    """Sentiment and mention metrics for all tickers in one GROUP BY query."""
+    now = datetime.now(timezone.utc)
+    rows = execute_sql(
+        f"""
+        SELECT primary_symbol, {_SENTIMENT_METRICS_SELECT}
+        FROM discord_parsed_ideas
+        WHERE primary_symbol = ANY(:tickers)
+        GROUP BY primary_symbol
+        """,
+        params={
+            "tickers": tickers,
+            "days_30": now - timedelta(days=30),
+            "days_7": now - timedelta(days=7),
+        },
+        fetch_results=True,
+    )
+    return {row[0]: _sentiment_metrics_from_row(row[1:]) for row in rows or []}
+
+
+def build_stock_profiles_bulk(tickers: list[str]) -> list[dict[str, Any]]:
+    """Build profiles for many tickers with one query per metric family."""
+    if not tickers:
+        return []
+
+    now = datetime.now(timezone.utc)
+    price = compute_price_metrics_bulk(tickers)
+    positions = get_position_metrics_bulk(tickers)
+    orders = get_order_metrics_bulk(tickers)
+    sentiment = get_sentiment_metrics_bulk(tickers)
+
+    profiles = []
+    for ticker in tickers:
+        profile: dict[str, Any] = {"ticker": ticker, "last_updated": now}
+        if price is not None:
+            profile.update(price.get(ticker.upper().strip(), {}))
+        profile.update(positions.get(ticker, {}))
+        profile.update(orders.get(ticker) or _order_metrics_from_row(None))
+        profile.update(sentiment.get(ticker) or _sentiment_metrics_from_row(None))
+        profiles.append(profile)
+    return profiles
+
+
+def _uniform_rows(records: list[dict[str, Any]]) -> tuple[list[str], list[dict[str, Any]]]:
+    """Give every record the same keys (missing -> None) for executemany."""
+    columns = list(dict.fromkeys(key for record in records for key in record))
+    return columns, [{col: record.get(col) for col in columns} for record in records]
+
+
+def upsert_stock_profiles_current_bulk(
+    profiles: list[dict[str, Any]], dry_run: bool = False
+) -> int:
+    """Upsert many profiles in one batch per column set; returns the number written.
+
+    Tickers without OHLCV bars have no price fields and are written in their
+    own batch without the price columns, so their existing prices are kept
+    rather than nulled. If a batch fails, falls back to per-profile upserts
+    so one bad row cannot sink the rest.
+    """
+    if not profiles:
+        return 0
+
+    if dry_run:
+        logger.info(f"[DRY-RUN] Would upsert {len(profiles)} profiles")
+        return len(profiles)
+
+    priced = [p for p in profiles if "latest_close_price" in p]
+    unpriced = [p for p in profiles if "latest_close_price" not in p]
+    return sum(_upsert_current_batch(batch) for batch in (priced, unpriced) if batch)
+
+
+def _upsert_current_batch(profiles: list[dict[str, Any]]) -> int:
+    columns, rows = _uniform_rows(profiles)
+    updates = [f"{col} = EXCLUDED.{col}" for col in columns if col != "ticker"]
+    query = f"""
+    INSERT INTO stock_profile_current ({', '.join(columns)})
+    VALUES ({', '.join(f':{col}' for col in columns)})
+    ON CONFLICT (ticker) DO UPDATE SET
+        {', '.join(updates)},
+        updated_at = NOW()
+    """
+
+    try:
+        execute_sql(query, params=rows)
+        logger.info(f"Upserted {len(rows)} profiles")
+        return len(rows)
+    except Exception as e:
+        logger.warning(f"Bulk profile upsert failed, retrying per ticker: {e}")
+        return sum(upsert_stock_profile_current(p) for p in profiles)
+
+
+def append_stock_profile_history_bulk(
+    profiles: list[dict[str, Any]], as_of_date: date, dry_run: bool = False
+) -> int:
+    """Append history snapshots for many profiles in one batch."""
+    if not profiles:
+        return 0
+
+    if dry_run:
+        logger.info(f"[DRY-RUN] Would append {len(profiles)} history rows as of {as_of_date}")
+        return len(profiles)
+
+    rows = [_history_record(p, as_of_date) for p in profiles]
+    columns = list(rows[0])
+    query = f"""
+    INSERT INTO stock_profile_history ({', '.join(columns)})
+    VALUES ({', '.join(f':{col}' for col in columns)})
+    ON CONFLICT (ticker, as_of_date) DO NOTHING
+    """
+
+    try:
+        execute_sql(query, params=rows)
+        logger.info(f"Appended {len(rows)} history rows as of {as_of_date}")
+        return len(rows)
+    except Exception as e:
+        logger.warning(f"Bulk history append failed, retrying per ticker: {e}")
+        return sum(append_stock_profile_history(p, as_of_date) for p in profiles)
+
+
+def copy_current_to_history(
+    tickers: list[str], as_of_date: date, dry_run: bool = False
+) -> int:
+    """Snapshot unchanged tickers' current profiles into history (one statement)."""
+    if not tickers:
+        return 0
+
+    if dry_run:
+        logger.info(f"[DRY-RUN] Would copy {len(tickers)} unchanged profiles to history")
+        return len(tickers)
+
+    columns = [c for c in _history_record({}, as_of_date) if c not in ("ticker", "as_of_date")]
+    sources = [f"sp.{_HISTORY_FROM_CURRENT.get(c, c)}" for c in columns]
+    execute_sql(
+        f"""
+        INSERT INTO stock_profile_history (ticker, as_of_date, {', '.join(columns)})
+        SELECT sp.ticker, :as_of_date, {', '.join(sources)}
+        FROM stock_profile_current sp
+        WHERE sp.ticker = ANY(:tickers)
+        ON CONFLICT (ticker, as_of_date) DO NOTHING
+        """,
+        params={"tickers": tickers, "as_of_date": as_of_date},
+    )
+    return len(tickers)
+
+
 # ============================================================================
 # MAIN ORCHESTRATION
 # ============================================================================
@@ -426,18 +780,24 @@ def refresh_stock_profiles(
     update_current: bool = True,
     update_history: bool = True,
     dry_run: bool = False,
+    force: bool = False,
 ) -> dict[str, int]:
     """
     Refresh stock profiles for given tickers (or all tracked tickers).
 
+    Uses the bulk engine: tickers whose inputs are unchanged since their
+    last refresh are skipped (history still gets today's snapshot, copied
+    from stock_profile_current).
+
     Args:
         tickers: List of tickers to refresh (None = all tracked)
         update_current: Whether to update stock_profile_current
         update_history: Whether to append to stock_profile_history
         dry_run: If True, don't write to database
+        force: Recompute every ticker, ignoring the staleness check
 
     Returns:
-        Dict with counts of successful/failed updates
+        Dict with counts of successful/failed updates and skipped tickers
     """
     if tickers is None:
         tickers = get_all_tracked_tickers()
@@ -448,32 +808,42 @@ def refresh_stock_profiles(
         "current_failed": 0,
         "history_success": 0,
         "history_failed": 0,
+        "skipped": 0,
     }
+    if not tickers:
+        return results
 
     today = date.today()
+    stale = list(tickers) if force else get_stale_tickers(tickers)
+    stale_set = set(stale)
+    unchanged = [t for t in tickers if t not in stale_set]
+    results["skipped"] = len(unchanged)
+    logger.info(f"{len(stale)} tickers to refresh, {len(unchanged)} unchanged")
 
-    for ticker in tickers:
-        logger.info(f"Processing {ticker}...")
-
+    try:
+        profiles = build_stock_profiles_bulk(stale)
+    except Exception as e:
+        logger.error(f"Failed to build profiles: {e}")
+        results["current_failed"] += len(stale) if update_current else 0
+        results["history_failed"] += len(stale) if update_history else 0
+        return results
+
+    if update_current:
+        written = upsert_stock_profiles_current_bulk(profiles, dry_run=dry_run)
+        results["current_success"] += written
+        results["current_failed"] += len(profiles) - written
+
+    if update_history:
+        written = append_stock_profile_history_bulk(profiles, today, dry_run=dry_run)
+        results["history_success"] += written
+        results["history_failed"] += len(profiles) - written
         try:
-            profile = build_stock_profile(ticker)
-
-            if update_current:
-                if upsert_stock_profile_current(profile, dry_run=dry_run):
-                    results["current_success"] += 1
-                else:
-                    results["current_failed"] += 1
-
-            if update_history:
-                if append_stock_profile_history(profile, today, dry_run=dry_run):
-                    results["history_success"] += 1
-                else:
-                    results["history_failed"] += 1
-
+            results["history_success"] += copy_current_to_history(
+                unchanged, today, dry_run=dry_run
+            )
         except Exception as e:
-            logger.error(f"Error processing {ticker}: {e}")
-            results["current_failed"] += 1 if update_current else 0
-            results["history_failed"] += 1 if update_history else 0
+            logger.error(f"Failed to copy unchanged profiles to history: {e}")
+            results["history_failed"] += len(unchanged)
 
     return results
 
@@ -509,6 +879,11 @@ def main():
         action="store_true",
         help="Preview changes without writing to database",
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Recompute every ticker even if its inputs are unchanged",
+    )
     parser.add_argument(
         "--verbose",
         "-v",
@@ -546,6 +921,7 @@ def main():
         update_current=update_current,
         update_history=update_history,
         dry_run=args.dry_run,
+        force=args.force,
     )
 
     logger.info("=" * 60)
@@ -556,6 +932,7 @@ def main():
     logger.info(
         f"  History - Success: {results['history_success']}, Failed: {results['history_failed']}"
     )
+    logger.info(f"  Unchanged (skipped): {results['skipped']}")
     logger.info("=" * 60)
 
 
@@ -110,6 +110,7 @@ def run_daily_refresh(dry_run: bool = False) -> bool:
         logger.info(
             f"  History records: {results['history_success']} success, {results['history_failed']} failed"
         )
+        logger.info(f"  Unchanged (skipped): {results.get('skipped', 0)}")
         logger.info("=" * 60)
 
         # Return success if no failures
@@ -5,6 +5,8 @@ Nightly Pipeline Orchestrator
 Runs after market close (1 AM ET) to:
 1. SnapTrade sync (accounts, positions, orders, balances)
 2. Backfill OHLCV data from Databento
+   (then expire cached analyses, advance indicator state and precompute
+   analyses / portfolio risk for held and watched tickers)
 3. Discord incremental ingestion (catch up on missed messages)
 4. Run NLP batch processing on pending Discord messages
 5. Refresh stock profile data
@@ -16,6 +18,9 @@ Environment Variables:
     REQUIRE_DATABENTO: If "1", abort pipeline on Databento OHLCV failure. Default "1" (critical).
     REQUIRE_DISCORD_INGEST: If "1", abort pipeline on Discord ingestion failure. Default "0".
     STOCK_REFRESH_TIMEOUT: Timeout in seconds for stock refresh. Default "600".
+    ANALYSIS_WARMUP: If "0", skip the analysis cache warmup. Default "1".
+        Tuning (concurrency, LLM budget, TTL, extra tickers) is documented in
+        src/analysis/warmup.py.
 
 This is the CANONICAL pipeline.
 Use: sudo systemctl start nightly-pipeline.service
@@ -51,6 +56,7 @@ REQUIRE_DATABENTO = (
     os.environ.get("REQUIRE_DATABENTO", "1") == "1"
 )  # Critical by default
 REQUIRE_DISCORD_INGEST = os.environ.get("REQUIRE_DISCORD_INGEST", "0") == "1"
+ANALYSIS_WARMUP = os.environ.get("ANALYSIS_WARMUP", "1") == "1"
 STOCK_REFRESH_TIMEOUT = int(
     os.environ.get("STOCK_REFRESH_TIMEOUT", "600")
 )  # 10 min default
@@ -155,6 +161,59 @@ def snapshot_positions() -> bool:
         return False
 
 
+def expire_analysis_caches() -> bool:
+    """Expire cached stock analyses and portfolio risk after fresh OHLCV.
+
+    Cached reports were computed from yesterday's bars; marking them expired
+    makes the API serve them stale and refresh on the next view.
+    """
+    try:
+        from src.analysis.orchestrator import (
+            invalidate_analysis_cache,
+            invalidate_portfolio_risk_cache,
+        )
+
+        invalidate_analysis_cache()
+        invalidate_portfolio_risk_cache()
+        logger.info("Expired cached stock analyses and portfolio risk")
+        return True
+    except Exception as e:
+        logger.warning(f"Failed to expire analysis caches: {e}")
+        return False
+
+
+def refresh_indicator_states() -> bool:
+    """Advance per-symbol technical indicator state through the new bars."""
+    try:
+        from src.analysis.indicator_state import refresh_indicator_states as refresh
+
+        written = refresh()
+        logger.info(f"Refreshed {written} technical indicator states")
+        return True
+    except Exception as e:
+        logger.warning(f"Indicator state refresh failed (non-critical): {e}")
+        return False
+
+
+def warm_analysis_cache() -> bool:
+    """Precompute analyses and portfolio risk so morning loads hit the cache."""
+    try:
+        import asyncio
+
+        from src.analysis.warmup import warm_analysis_cache as warm
+
+        stats = asyncio.run(warm())
+        logger.info(
+            f"Warmed {stats['analyses']}/{stats['targets']} analyses "
+            f"({stats['llm_calls']} LLM, {stats['failed']} failed) "
+            f"and {stats['risk']} portfolio risk reports in {stats['seconds']}s"
+        )
+        return stats["failed"] == 0 and stats["risk_failed"] == 0
+    except Exception as e:
+        logger.warning(f"Analysis cache warmup failed (non-critical): {e}")
+        return False
+
+
 def run_script(script_path: str, args: list[str] = None, timeout: int = 600) -> bool:
     """Run a Python script with optional arguments.
 
@@ -245,8 +304,20 @@ def main():
         logger.warning(f"New symbol backfill exception (non-critical): {e}")
         results["new_symbols"] = False
 
-    # Step 1c: Discord Incremental Ingestion (catch up on missed messages)
-    logger.info("\n💬 Step 1c: Discord Incremental Ingestion")
+    # Fresh bars (and the Step 0 position sync) invalidate cached analyses
+    if results.get("ohlcv") or results.get("new_symbols"):
+        results["analysis_cache_expired"] = expire_analysis_caches()
+        results["indicator_state"] = refresh_indicator_states()
+
+    # Step 1c: Precompute analyses / portfolio risk for held and watched tickers
+    if ANALYSIS_WARMUP:
+        logger.info("\n🔥 Step 1c: Analysis Cache Warmup")
+        results["analysis_warmup"] = warm_analysis_cache()
+    else:
+        results["analysis_warmup"] = None
+
+    # Step 1d: Discord Incremental Ingestion (catch up on missed messages)
+    logger.info("\n💬 Step 1d: Discord Incremental Ingestion")
     try:
         results["discord_ingest"] = run_script(
             "scripts/ingest_discord.py",
@@ -284,15 +284,12 @@ def run_ingestion(
     """
     logger.info(f"Ingesting results from: {output_path}")
 
-    from scripts.nlp.ingest_batch import load_batch_output, process_batch_output
+    from scripts.nlp.ingest_batch import ingest_batch_file
 
-    responses = load_batch_output(output_path)
-    logger.info(f"Loaded {len(responses)} responses")
-
-    if not responses:
-        return {"total_responses": 0, "ideas_extracted": 0}
-
-    stats = process_batch_output(responses, dry_run=dry_run)
+    # Validation stays in-process (workers=1): this script has no --workers
+    # option; re-run ingest_batch.py --workers N on the output for large files
+    stats = ingest_batch_file(output_path, dry_run=dry_run)
+    logger.info(f"Ingested {stats['total_responses']} responses")
 
     return stats
 
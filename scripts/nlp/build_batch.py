@@ -19,6 +19,19 @@ Usage:
     # Show stats only
     python scripts/nlp/build_batch.py --stats-only
 
+    # Smaller shards, 8 prefilter/split workers
+    python scripts/nlp/build_batch.py --max-requests-per-shard 10000 --workers 8
+
+Sharding:
+    Pending rows are streamed from a server-side cursor, prefiltered and
+    soft-split in a process pool, and written to size-capped shards next to
+    --output (batch_requests.jsonl -> batch_requests-000.jsonl, -001, ...).
+    Each shard gets its own <shard>.manifest.json, and batch_requests.manifest.json
+    indexes them, so run_batch.py can submit shards independently. All
+    chunks of a message land in the same shard, so any shard can be ingested
+    on its own. Caps default below the Batch API limits (50,000 requests,
+    200 MB per input file).
+
 Batch API Notes:
     - Each line must be a valid JSON object
     - custom_id format: "msg-{message_id}-chunk-{chunk_index}"
@@ -40,10 +53,14 @@ Endpoint Decision:
 import argparse
 import json
 import logging
+import os
 import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
 
 # Add project root to path
 sys.path.insert(0, str(__file__).rsplit("scripts", 1)[0].rstrip("/\\"))
@@ -52,21 +69,67 @@ from src.env_bootstrap import bootstrap_env  # noqa: E402
 
 bootstrap_env()
 
-from src.db import execute_sql  # noqa: E402
+from sqlalchemy import text  # noqa: E402
+
+from src.db import execute_sql, get_connection  # noqa: E402
 from src.nlp.soft_splitter import prepare_for_parsing, summarize_splits
 from src.nlp.openai_parser import (
-    build_batch_request,
+    build_batch_request_line,
     _build_parser_system_prompt,
     MODEL_MAIN,
 )
 from src.nlp.schemas import CURRENT_PROMPT_VERSION
-from src.nlp.preclean import should_skip_message  # SSOT prefilter
+from src.nlp.preclean import load_symbol_aliases, should_skip_message  # SSOT prefilter
 
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
 )
 logger = logging.getLogger(__name__)
 
+# Batch API input limits are 50,000 requests and 200 MB per file; stay under
+MAX_REQUESTS_PER_SHARD = 50_000
+MAX_SHARD_BYTES = 190 * 1024 * 1024
+
+# Rows fetched per server-side cursor round trip / messages per pool task
+CURSOR_FETCH_SIZE = 2000
+PREPARE_CHUNK_SIZE = 500
+
+# Skipped message IDs are marked in the DB every this many while streaming
+SKIP_FLUSH_SIZE = 1000
+
+PENDING_MESSAGES_QUERY = """
+    SELECT
+        message_id,
+        content,
+        author,
+        channel,
+        created_at
+    FROM discord_messages
+    WHERE parse_status = 'pending'
+    AND content IS NOT NULL
+    AND LENGTH(content) > :min_length
+    ORDER BY created_at DESC
+"""
+
+# should_skip_message reason -> stats counter
+SKIP_REASON_STATS = {
+    "bot_command": "bot_commands_skipped",
+    "url_only": "url_only_skipped",
+    "bot_response": "bot_response_skipped",
+    "empty": "empty_after_clean_skipped",
+    "empty_after_clean": "empty_after_clean_skipped",
+}
+
+
+def _message_from_row(row) -> Dict[str, Any]:
+    return {
+        "message_id": row[0],
+        "content": row[1],
+        "author": row[2],
+        "channel_id": str(row[3]) if row[3] else None,  # column is 'channel'
+        "created_at": row[4].isoformat() if row[4] else None,
+    }
+
 
 def get_pending_messages(
     limit: Optional[int] = None,
@@ -82,19 +145,7 @@ def get_pending_messages(
     Returns:
         List of message dicts
     """
-    query = """
-        SELECT 
-            message_id,
-            content,
-            author,
-            channel,
-            created_at
-        FROM discord_messages
-        WHERE parse_status = 'pending'
-        AND content IS NOT NULL
-        AND LENGTH(content) > :min_length
-        ORDER BY created_at DESC
-    """
+    query = PENDING_MESSAGES_QUERY
     if limit:
         query += f" LIMIT {limit}"
 
@@ -104,37 +155,112 @@ def get_pending_messages(
     if not result:
         return []
 
-    return [
-        {
-            "message_id": row[0],
-            "content": row[1],
-            "author": row[2],
-            "channel_id": str(row[3]) if row[3] else None,  # column is 'channel'
-            "created_at": row[4].isoformat() if row[4] else None,
-        }
-        for row in result
-    ]
+    return [_message_from_row(row) for row in result]
 
 
-def build_batch_file(
-    messages: List[Dict[str, Any]],
-    output_path: Path,
-    skip_triage: bool = False,
-    mark_skipped_in_db: bool = False,
-) -> Dict[str, Any]:
+def iter_pending_messages(
+    limit: Optional[int] = None,
+    min_length: int = 10,
+    fetch_size: int = CURSOR_FETCH_SIZE,
+) -> Iterator[Dict[str, Any]]:
     """
-    Build JSONL batch file from messages.
+    Stream pending messages through a server-side cursor.
+
+    Same rows as get_pending_messages(), but only ``fetch_size`` rows are held
+    in memory at a time. The connection stays open until the iterator is
+    exhausted or closed.
 
     Args:
-        messages: List of message dicts
-        output_path: Path to write JSONL file
-        skip_triage: If True, include all chunks without triage
-        mark_skipped_in_db: If True, update parse_status for skipped messages
+        limit: Maximum number of messages to fetch
+        min_length: Minimum content length
+        fetch_size: Rows per cursor round trip
+
+    Yields:
+        Message dicts
+    """
+    query = PENDING_MESSAGES_QUERY
+    if limit:
+        query += f" LIMIT {int(limit)}"
+
+    with get_connection() as conn:
+        result = conn.execution_options(stream_results=True, yield_per=fetch_size).execute(
+            text(query), {"min_length": min_length}
+        )
+        for row in result:
+            yield _message_from_row(row)
+
+
+def _prepare_message(message: Dict[str, Any]) -> Tuple[Optional[str], List[str]]:
+    """
+    Prefilter, preclean and soft-split one message.
 
     Returns:
-        Stats dict with lists of skipped message IDs
+        (skip_reason, chunk_texts): skip_reason is None for messages to parse,
+        a should_skip_message reason, or "empty_after_clean"
+    """
+    # PREFILTERS - SINGLE SOURCE OF TRUTH (from preclean.should_skip_message)
+    message_meta = {
+        "author": message.get("author"),
+        "is_bot": message.get("is_bot", False),
+    }
+    should_skip, skip_reason = should_skip_message(message["content"], message_meta)
+    if should_skip:
+        return skip_reason or "empty", []
+
+    chunks = prepare_for_parsing(message["content"])
+    if not chunks:
+        return "empty_after_clean", []
+    return None, [chunk.text for chunk in chunks]
+
+
+def _prepare_messages(messages: List[Dict[str, Any]]) -> List[Tuple[Optional[str], List[str]]]:
+    """Process-pool task: _prepare_message over a slice of messages."""
+    return [_prepare_message(message) for message in messages]
+
+
+def iter_prepared_messages(
+    messages: Iterable[Dict[str, Any]],
+    workers: int = 1,
+    chunk_size: int = PREPARE_CHUNK_SIZE,
+) -> Iterator[Tuple[Dict[str, Any], Optional[str], List[str]]]:
     """
-    stats = {
+    Run _prepare_message over a (streaming) message iterable.
+
+    With ``workers > 1`` slices of ``chunk_size`` messages go to a process
+    pool (prefiltering and splitting are pure-Python regex work). At most
+    ``2 * workers`` slices are in flight, so a streaming source is never read
+    far ahead. Results come back in input order. The pool is forked after
+    load_symbol_aliases(), so workers see the same alias table.
+
+    Yields:
+        (message, skip_reason, chunk_texts)
+    """
+    iter_messages = iter(messages)
+    slices = iter(lambda: list(islice(iter_messages, chunk_size)), [])
+
+    if workers <= 1:
+        for batch in slices:
+            for message, (skip_reason, texts) in zip(batch, _prepare_messages(batch), strict=True):
+                yield message, skip_reason, texts
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        in_flight: deque = deque()
+        for batch in slices:
+            in_flight.append((batch, pool.submit(_prepare_messages, batch)))
+            if len(in_flight) < workers * 2:
+                continue
+            batch, future = in_flight.popleft()
+            for message, (skip_reason, texts) in zip(batch, future.result(), strict=True):
+                yield message, skip_reason, texts
+        while in_flight:
+            batch, future = in_flight.popleft()
+            for message, (skip_reason, texts) in zip(batch, future.result(), strict=True):
+                yield message, skip_reason, texts
+
+
+def _new_build_stats() -> Dict[str, Any]:
+    return {
         "messages_processed": 0,
         "messages_skipped": 0,
         "chunks_generated": 0,
@@ -154,73 +280,65 @@ def build_batch_file(
         "empty_after_clean_samples": [],  # First 5 samples with original content
     }
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        for message in messages:
-            message_id = message["message_id"]
-            content = message["content"]
-
-            # =================================================================
-            # PREFILTERS - SINGLE SOURCE OF TRUTH (from preclean.should_skip_message)
-            # =================================================================
-            # Build message_meta from the message dict for bot detection
-            message_meta = {
-                "author": message.get("author"),
-                "is_bot": message.get("is_bot", False),
+
+def _record_skip(stats: Dict[str, Any], message: Dict[str, Any], skip_reason: str) -> None:
+    stat_key = SKIP_REASON_STATS.get(skip_reason, "empty_after_clean_skipped")
+    stats[stat_key] = stats.get(stat_key, 0) + 1
+    stats["messages_skipped"] += 1
+
+    # Track ID by reason for database marking
+    if skip_reason in stats["skipped_ids_by_reason"]:
+        stats["skipped_ids_by_reason"][skip_reason].append(message["message_id"])
+
+    # Store samples for debugging (first 5)
+    if skip_reason == "empty_after_clean" and len(stats["empty_after_clean_samples"]) < 5:
+        stats["empty_after_clean_samples"].append(
+            {
+                "message_id": message["message_id"],
+                "original_content": message["content"][:500],  # Truncate for display
             }
+        )
 
-            should_skip, skip_reason = should_skip_message(content, message_meta)
-            if should_skip:
-                # Map skip reasons to stats keys (handle None case)
-                reason_to_stat = {
-                    "bot_command": "bot_commands_skipped",
-                    "url_only": "url_only_skipped",
-                    "bot_response": "bot_response_skipped",
-                    "empty": "empty_after_clean_skipped",
-                }
-                stat_key = reason_to_stat.get(
-                    skip_reason or "empty", "empty_after_clean_skipped"
-                )
-                stats[stat_key] = stats.get(stat_key, 0) + 1
-                stats["messages_skipped"] += 1
 
-                # Track ID by reason for database marking (use "empty" if None)
-                reason_key = skip_reason or "empty"
-                if reason_key in stats["skipped_ids_by_reason"]:
-                    stats["skipped_ids_by_reason"][reason_key].append(message_id)
-                continue
+def _request_lines(message_id: Any, texts: List[str]) -> List[bytes]:
+    return [
+        build_batch_request_line(message_id=message_id, text=chunk_text, chunk_index=chunk_idx)
+        for chunk_idx, chunk_text in enumerate(texts)
+    ]
 
-            # Preclean and soft split
-            chunks = prepare_for_parsing(content)
-
-            if not chunks:
-                stats["empty_after_clean_skipped"] += 1
-                stats["skipped_ids_by_reason"]["empty_after_clean"].append(message_id)
-                stats["messages_skipped"] += 1
-                # Store samples for debugging (first 5)
-                if len(stats["empty_after_clean_samples"]) < 5:
-                    stats["empty_after_clean_samples"].append(
-                        {
-                            "message_id": message_id,
-                            "original_content": content[:500],  # Truncate for display
-                        }
-                    )
-                continue
 
-            stats["messages_processed"] += 1
+def build_batch_file(
+    messages: List[Dict[str, Any]],
+    output_path: Path,
+    skip_triage: bool = False,
+    mark_skipped_in_db: bool = False,
+) -> Dict[str, Any]:
+    """
+    Build JSONL batch file from messages.
 
-            # Build request for each chunk
-            for chunk_idx, chunk in enumerate(chunks):
-                request = build_batch_request(
-                    message_id=message_id,
-                    text=chunk.text,
-                    chunk_index=chunk_idx,
-                )
+    Args:
+        messages: List of message dicts
+        output_path: Path to write JSONL file
+        skip_triage: If True, include all chunks without triage
+        mark_skipped_in_db: If True, update parse_status for skipped messages
 
-                # Write JSONL line
-                f.write(json.dumps(request) + "\n")
+    Returns:
+        Stats dict with lists of skipped message IDs
+    """
+    stats = _new_build_stats()
+
+    with open(output_path, "wb") as f:
+        for message, skip_reason, texts in iter_prepared_messages(messages):
+            if skip_reason:
+                _record_skip(stats, message, skip_reason)
+                continue
+
+            stats["messages_processed"] += 1
 
-                stats["chunks_generated"] += 1
-                stats["total_chars"] += len(chunk.text)
+            # One JSONL line per chunk
+            f.writelines(_request_lines(message["message_id"], texts))
+            stats["chunks_generated"] += len(texts)
+            stats["total_chars"] += sum(len(t) for t in texts)
 
     # Mark skipped messages in database if requested
     if mark_skipped_in_db:
@@ -229,6 +347,145 @@ def build_batch_file(
     return stats
 
 
+class ShardWriter:
+    """
+    Writes batch request lines into size-capped JSONL shards.
+
+    Shards are ``<stem>-NNN.jsonl`` next to ``output_path``. A shard is closed
+    (and its ``<stem>-NNN.manifest.json`` written) before a message whose
+    lines would push it past ``max_requests`` or ``max_bytes``, so a
+    message's chunks never straddle two shards. A single message larger than
+    the caps still gets a shard of its own.
+    """
+
+    def __init__(
+        self,
+        output_path: Path,
+        max_requests: int = MAX_REQUESTS_PER_SHARD,
+        max_bytes: int = MAX_SHARD_BYTES,
+    ):
+        self.output_path = output_path
+        self.max_requests = max_requests
+        self.max_bytes = max_bytes
+        self.shards: List[Dict[str, Any]] = []
+        self._file = None
+        self._current: Dict[str, Any] = {}
+
+    def shard_path(self, index: int) -> Path:
+        return self.output_path.with_name(f"{self.output_path.stem}-{index:03d}.jsonl")
+
+    def write_message(self, lines: List[bytes], chars: int = 0) -> None:
+        size = sum(len(line) for line in lines)
+        if self._file is not None and (
+            self._current["requests"] + len(lines) > self.max_requests
+            or self._current["bytes"] + size > self.max_bytes
+        ):
+            self._close_shard()
+        if self._file is None:
+            self._open_shard()
+
+        self._file.writelines(lines)
+        self._current["messages"] += 1
+        self._current["requests"] += len(lines)
+        self._current["bytes"] += size
+        self._current["total_chars"] += chars
+
+    def close(self) -> List[Dict[str, Any]]:
+        """Close the open shard; returns one summary per shard written."""
+        if self._file is not None:
+            self._close_shard()
+        return self.shards
+
+    def _open_shard(self) -> None:
+        path = self.shard_path(len(self.shards))
+        self._file = open(path, "wb")
+        self._current = {
+            "shard": len(self.shards),
+            "jsonl_file": path.name,
+            "messages": 0,
+            "requests": 0,
+            "bytes": 0,
+            "total_chars": 0,
+        }
+
+    def _close_shard(self) -> None:
+        self._file.close()
+        self._file = None
+        path = self.shard_path(self._current["shard"])
+        manifest_path = path.with_suffix(".manifest.json")
+        manifest = {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            **self._current,
+            "model": MODEL_MAIN,
+            "prompt_version": CURRENT_PROMPT_VERSION,
+            "endpoint": "/v1/chat/completions",
+        }
+        with open(manifest_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+        self.shards.append({**self._current, "manifest": manifest_path.name})
+        logger.info(
+            f"Wrote shard {path.name}: {self._current['requests']} requests, "
+            f"{self._current['bytes'] / 1024 / 1024:.1f} MB"
+        )
+
+
+def build_batch_shards(
+    messages: Iterable[Dict[str, Any]],
+    output_path: Path,
+    max_requests: int = MAX_REQUESTS_PER_SHARD,
+    max_bytes: int = MAX_SHARD_BYTES,
+    workers: int = 1,
+    mark_skipped_in_db: bool = False,
+) -> Dict[str, Any]:
+    """
+    Streaming build: messages -> prefilter/split (process pool) -> JSONL shards.
+
+    Memory stays bounded by the pool's in-flight slices and one message's
+    request lines; skipped IDs are marked (or dropped) every SKIP_FLUSH_SIZE
+    messages instead of being collected for the whole run.
+
+    Args:
+        messages: Message dicts, typically iter_pending_messages()
+        output_path: Base path; shards are written as <stem>-NNN.jsonl
+        max_requests: Max request lines per shard
+        max_bytes: Max bytes per shard file
+        workers: Process pool size for prefilter + prepare_for_parsing
+        mark_skipped_in_db: If True, update parse_status for skipped messages
+
+    Returns:
+        Stats dict as build_batch_file(), plus "shards" (one summary per shard)
+        and "messages_marked_skipped"
+    """
+    stats = _new_build_stats()
+    stats["messages_marked_skipped"] = 0
+    writer = ShardWriter(output_path, max_requests=max_requests, max_bytes=max_bytes)
+
+    def flush_skipped() -> None:
+        if mark_skipped_in_db:
+            stats["messages_marked_skipped"] += _mark_skipped_messages(stats)
+        for message_ids in stats["skipped_ids_by_reason"].values():
+            message_ids.clear()
+
+    try:
+        for message, skip_reason, texts in iter_prepared_messages(messages, workers=workers):
+            if skip_reason:
+                _record_skip(stats, message, skip_reason)
+                if sum(map(len, stats["skipped_ids_by_reason"].values())) >= SKIP_FLUSH_SIZE:
+                    flush_skipped()
+                continue
+
+            chars = sum(len(t) for t in texts)
+            writer.write_message(_request_lines(message["message_id"], texts), chars=chars)
+            stats["messages_processed"] += 1
+            stats["chunks_generated"] += len(texts)
+            stats["total_chars"] += chars
+    finally:
+        stats["shards"] = writer.close()
+
+    flush_skipped()
+    return stats
+
+
 def _mark_skipped_messages(stats: Dict[str, Any]) -> int:
     """
     Update parse_status in database for skipped messages.
@@ -246,26 +503,24 @@ def _mark_skipped_messages(stats: Dict[str, Any]) -> int:
     # Get the new unified structure
     skipped_by_reason = stats.get("skipped_ids_by_reason", {})
 
-    # Mark all skipped messages with their reason
+    # One UPDATE per reason and SKIP_FLUSH_SIZE IDs
     for reason, message_ids in skipped_by_reason.items():
-        if not message_ids:
-            continue
-
-        for msg_id in message_ids:
+        for start in range(0, len(message_ids), SKIP_FLUSH_SIZE):
+            batch = [str(msg_id) for msg_id in message_ids[start : start + SKIP_FLUSH_SIZE]]
             try:
                 execute_sql(
                     """
                     UPDATE discord_messages
                     SET parse_status = 'skipped',
                         error_reason = :error_reason
-                    WHERE message_id = CAST(:message_id AS text)
+                    WHERE message_id = ANY(CAST(:message_ids AS text[]))
                     """,
-                    params={"message_id": str(msg_id), "error_reason": reason},
+                    params={"message_ids": batch, "error_reason": reason},
                 )
-                total_marked += 1
+                total_marked += len(batch)
             except Exception as e:
                 logger.warning(
-                    f"Failed to mark message {msg_id} as skipped ({reason}): {e}"
+                    f"Failed to mark {len(batch)} messages as skipped ({reason}): {e}"
                 )
 
     logger.info(f"Marked {total_marked} messages as skipped in database")
@@ -319,8 +574,11 @@ def create_manifest(
     """
     Create a manifest file alongside the batch JSONL.
 
+    For a sharded build (stats from build_batch_shards) this is the index:
+    ``shards`` lists each shard's file, manifest and counts.
+
     Args:
-        output_path: Path to JSONL file
+        output_path: Path to JSONL file (base path for a sharded build)
         stats: Build stats
         cost_estimate: Cost estimates
 
@@ -328,10 +586,12 @@ def create_manifest(
         Path to manifest file
     """
     manifest_path = output_path.with_suffix(".manifest.json")
+    shards = stats.get("shards")
 
     manifest = {
         "created_at": datetime.now(timezone.utc).isoformat(),
-        "jsonl_file": output_path.name,
+        "jsonl_file": None if shards is not None else output_path.name,
+        "shards": shards,
         "model": MODEL_MAIN,
         "prompt_version": CURRENT_PROMPT_VERSION,
         "stats": stats,
@@ -383,6 +643,24 @@ def main():
         action="store_true",
         help="Show samples of empty-after-clean messages for debugging",
     )
+    parser.add_argument(
+        "--max-requests-per-shard",
+        type=int,
+        default=MAX_REQUESTS_PER_SHARD,
+        help=f"Max requests per JSONL shard (default: {MAX_REQUESTS_PER_SHARD})",
+    )
+    parser.add_argument(
+        "--max-shard-mb",
+        type=float,
+        default=MAX_SHARD_BYTES / 1024 / 1024,
+        help=f"Max shard file size in MB (default: {MAX_SHARD_BYTES // 1024 // 1024})",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Processes for prefilter + soft split (default: CPU count)",
+    )
     parser.add_argument(
         "--verbose", "-v", action="store_true", help="Enable verbose logging"
     )
@@ -394,30 +672,30 @@ def main():
 
     output_path = Path(args.output)
 
-    # Fetch messages
-    logger.info("Fetching pending messages...")
-    messages = get_pending_messages(limit=args.limit)
-
-    if not messages:
-        logger.info("No pending messages found")
-        return
-
-    logger.info(f"Found {len(messages)} messages")
+    # Pick up manual aliases added since the code's ALIAS_MAP was written
+    load_symbol_aliases()
 
     # Stats-only mode
     if args.stats_only:
         # Quick estimate without building file
+        total_messages = 0
         total_chunks = 0
         total_chars = 0
-        for msg in messages:
-            chunks = prepare_for_parsing(msg["content"])
-            total_chunks += len(chunks)
-            total_chars += sum(len(c.text) for c in chunks)
+        for _, _, texts in iter_prepared_messages(
+            iter_pending_messages(limit=args.limit), workers=args.workers
+        ):
+            total_messages += 1
+            total_chunks += len(texts)
+            total_chars += sum(len(t) for t in texts)
+
+        if not total_messages:
+            logger.info("No pending messages found")
+            return
 
         logger.info(f"\nEstimated batch stats:")
-        logger.info(f"  Messages: {len(messages)}")
+        logger.info(f"  Messages: {total_messages}")
         logger.info(f"  Chunks: {total_chunks}")
-        logger.info(f"  Avg chunks/message: {total_chunks / len(messages):.1f}")
+        logger.info(f"  Avg chunks/message: {total_chunks / total_messages:.1f}")
         logger.info(f"  Total chars: {total_chars:,}")
 
         stats = {"chunks_generated": total_chunks, "total_chars": total_chars}
@@ -428,16 +706,22 @@ def main():
         logger.info(f"  Savings: ${cost['savings_usd']:.4f}")
         return
 
-    # Build batch file
-    logger.info(f"Building batch file: {output_path}")
+    # Stream pending messages into shards
+    logger.info(f"Building batch shards: {output_path.stem}-NNN.jsonl ({args.workers} workers)")
 
-    stats = build_batch_file(
-        messages=messages,
+    stats = build_batch_shards(
+        messages=iter_pending_messages(limit=args.limit),
         output_path=output_path,
-        skip_triage=args.skip_triage,
+        max_requests=args.max_requests_per_shard,
+        max_bytes=int(args.max_shard_mb * 1024 * 1024),
+        workers=args.workers,
         mark_skipped_in_db=args.mark_skipped,
     )
 
+    if not stats["shards"]:
+        logger.info("No batch requests generated")
+        return
+
     # Cost estimate
     cost = estimate_batch_cost(stats)
 
@@ -446,9 +730,13 @@ def main():
 
     # Summary
     logger.info("\n" + "=" * 50)
-    logger.info("BATCH FILE CREATED")
+    logger.info("BATCH SHARDS CREATED")
     logger.info("=" * 50)
-    logger.info(f"Output: {output_path}")
+    for shard in stats["shards"]:
+        logger.info(
+            f"Shard: {shard['jsonl_file']} ({shard['requests']} requests, "
+            f"{shard['bytes'] / 1024 / 1024:.1f} MB)"
+        )
     logger.info(f"Manifest: {manifest_path}")
     logger.info(f"\nStats:")
     logger.info(f"  Messages processed: {stats['messages_processed']}")
@@ -475,7 +763,9 @@ def main():
         + stats["empty_after_clean_skipped"]
     )
     if args.mark_skipped:
-        logger.info(f"\n✅ Marked {total_skipped} messages as 'skipped' in database")
+        logger.info(
+            f"\n✅ Marked {stats['messages_marked_skipped']}/{total_skipped} messages as 'skipped' in database"
+        )
 
     logger.info(f"\nCost estimate:")
     logger.info(f"  Batch API: ${cost['batch_cost_usd']:.4f}")
@@ -483,7 +773,7 @@ def main():
     logger.info(f"  Savings: ${cost['savings_usd']:.4f} (50%)")
     logger.info(f"\nNext steps:")
     logger.info(
-        f"  1. Submit: openai api batches create -f {output_path} --endpoint /v1/chat/completions"
+        f"  1. Submit each shard: python scripts/nlp/run_batch.py --input {output_path.stem}-NNN.jsonl"
     )
     logger.info(f"  2. Check: openai api batches list")
     logger.info(f"  3. Download results when complete")
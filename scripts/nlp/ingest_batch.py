@@ -16,16 +16,33 @@ Usage:
 
     # Show detailed parsing for each response
     python scripts/nlp/ingest_batch.py --input batch_output.jsonl --verbose
+
+    # Bigger write windows, 4 validation processes
+    python scripts/nlp/ingest_batch.py --input batch_output.jsonl --window 5000 --workers 4
+
+Streaming:
+    ingest_batch_file() never holds the whole output in memory. A first pass
+    counts output lines per message (custom_id only); the second pass streams
+    the file and buffers a message's chunks only until all of them have been
+    seen, so chunks may arrive in any order. Complete messages are processed
+    in windows of --window messages: MessageParseResult validation runs in a
+    process pool, then ideas and statuses are written in one transaction per
+    window (advisory locks, DELETE, COPY of the idea rows, one UPDATE for all
+    statuses). A window that fails to write is retried message by message.
 """
 
 import argparse
+import io
 import json
 import logging
+import os
+import re
 import sys
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Iterator, Optional, List, Tuple
 
 # Add project root to path
 sys.path.insert(0, str(__file__).rsplit("scripts", 1)[0].rstrip("/\\"))
@@ -42,13 +59,32 @@ from src.nlp.schemas import (
     parsed_idea_to_db_row,
     CURRENT_PROMPT_VERSION,
 )
-from src.nlp.openai_parser import parse_batch_response, MODEL_MAIN
+from src.nlp.openai_parser import parse_batch_response, batch_user_content, MODEL_MAIN
+from src.nlp.parse_cache import get_parse_cache, prune_parse_cache
+from src.nlp.soft_splitter import prepare_for_parsing
 
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
 )
 logger = logging.getLogger(__name__)
 
+# Messages per validation + write window (one transaction each)
+INGEST_WINDOW_MESSAGES = 2000
+
+# discord_parsed_ideas columns written by the ingesters, in COPY order
+IDEA_COLUMNS = (
+    "message_id", "idea_index", "soft_chunk_index", "local_idea_index",
+    "idea_text", "idea_summary", "context_summary",
+    "primary_symbol", "symbols", "instrument", "direction",
+    "action", "time_horizon", "trigger_condition",
+    "levels", "option_type", "strike", "expiry", "premium",
+    "labels", "label_scores", "is_noise",
+    "author_id", "channel_id", "model", "prompt_version", "confidence",
+    "raw_json", "source_created_at",
+)  # fmt: skip
+
+_CUSTOM_ID_RE = re.compile(r'"custom_id"\s*:\s*"([^"]*)"')
+
 
 def parse_custom_id(custom_id: str) -> Tuple[str, int]:
     """
@@ -72,18 +108,16 @@ def parse_custom_id(custom_id: str) -> Tuple[str, int]:
     raise ValueError(f"Invalid custom_id format: {custom_id}")
 
 
-def load_batch_output(input_path: Path) -> List[Dict[str, Any]]:
+def iter_batch_output(input_path: Path) -> Iterator[Dict[str, Any]]:
     """
-    Load and parse the batch output JSONL file.
+    Lazily parse the batch output JSONL file, one response at a time.
 
     Args:
         input_path: Path to the batch output JSONL
 
-    Returns:
-        List of response dicts
+    Yields:
+        Response dicts (invalid lines are logged and skipped)
     """
-    responses = []
-
     with open(input_path, "r", encoding="utf-8") as f:
         for line_num, line in enumerate(f, 1):
             line = line.strip()
@@ -91,12 +125,152 @@ def load_batch_output(input_path: Path) -> List[Dict[str, Any]]:
                 continue
 
             try:
-                response = json.loads(line)
-                responses.append(response)
+                yield json.loads(line)
             except json.JSONDecodeError as e:
                 logger.error(f"Line {line_num}: Invalid JSON - {e}")
 
-    return responses
+
+def load_batch_output(input_path: Path) -> List[Dict[str, Any]]:
+    """
+    Load and parse the batch output JSONL file.
+
+    Args:
+        input_path: Path to the batch output JSONL
+
+    Returns:
+        List of response dicts
+    """
+    return list(iter_batch_output(input_path))
+
+
+def count_message_chunks(input_path: Path) -> Dict[str, int]:
+    """
+    First pass of the streaming ingester: output lines per message_id.
+
+    Only the custom_id is extracted (regex, no full JSON decode). Lines
+    without a valid custom_id are left to the second pass to report.
+    """
+    counts: Dict[str, int] = defaultdict(int)
+    with open(input_path, "r", encoding="utf-8") as f:
+        for line in f:
+            match = _CUSTOM_ID_RE.search(line)
+            if not match:
+                continue
+            try:
+                message_id, _ = parse_custom_id(match.group(1))
+            except ValueError:
+                continue
+            counts[message_id] += 1
+    return dict(counts)
+
+
+def iter_message_responses(
+    input_path: Path,
+    stats: Optional[Dict[str, Any]] = None,
+) -> Iterator[Tuple[str, List[Tuple[int, Dict[str, Any]]]]]:
+    """
+    Stream complete messages from a batch output file, in completion order.
+
+    A message's responses are buffered only until as many have been seen as
+    count_message_chunks() found, so the buffer holds just the messages whose
+    chunks are interleaved with others (the peak is recorded in
+    ``stats["max_buffered_messages"]``). Responses with an unparseable
+    custom_id are counted in ``stats["failed"]``.
+
+    Yields:
+        (message_id, [(chunk_index, response)])
+    """
+    stats = stats if stats is not None else {}
+    stats.setdefault("failed", 0)
+    stats.setdefault("max_buffered_messages", 0)
+
+    expected = count_message_chunks(input_path)
+    buffered: Dict[str, List[Tuple[int, Dict[str, Any]]]] = {}
+
+    for response in iter_batch_output(input_path):
+        stats["total_responses"] = stats.get("total_responses", 0) + 1
+        try:
+            message_id, chunk_index = parse_custom_id(response.get("custom_id", ""))
+        except ValueError as e:
+            logger.error(str(e))
+            stats["failed"] += 1
+            continue
+
+        chunks = buffered.setdefault(message_id, [])
+        chunks.append((chunk_index, response))
+        if len(chunks) >= expected.get(message_id, 1):
+            del buffered[message_id]
+            yield message_id, chunks
+        else:
+            stats["max_buffered_messages"] = max(stats["max_buffered_messages"], len(buffered))
+
+    # Only reachable if the file changed between the two passes
+    for message_id, chunks in buffered.items():
+        yield message_id, chunks
+
+
+def _response_content(custom_id: str, response: Dict[str, Any]) -> Optional[str]:
+    """Assistant message content of a batch response, None on API errors."""
+    if response.get("error"):
+        logger.error(f"{custom_id}: API error - {response['error']}")
+        return None
+    choices = response.get("response", {}).get("body", {}).get("choices", [])
+    if not choices:
+        logger.warning(f"{custom_id}: No choices in response")
+        return None
+    return choices[0].get("message", {}).get("content", "")
+
+
+def _validate_contents(items: List[Tuple[str, Optional[str]]]) -> List[Optional[MessageParseResult]]:
+    """Process-pool task: validate (custom_id, content) pairs as MessageParseResult."""
+    results: List[Optional[MessageParseResult]] = []
+    for custom_id, content in items:
+        if content is None:
+            results.append(None)
+            continue
+        try:
+            results.append(MessageParseResult.model_validate_json(content))
+        except Exception as e:
+            logger.error(f"{custom_id}: Parse error - {e}")
+            results.append(None)
+    return results
+
+
+def validate_message_chunks(
+    messages: List[Tuple[str, List[Tuple[int, Dict[str, Any]]]]],
+    pool: Optional[ProcessPoolExecutor] = None,
+    workers: int = 1,
+) -> Dict[str, List[Tuple[int, Optional[MessageParseResult]]]]:
+    """
+    Validate one window of grouped responses.
+
+    Args:
+        messages: (message_id, [(chunk_index, response)]) pairs
+        pool: Process pool to spread validation over (serial when None)
+        workers: Pool size, used to size the slices
+
+    Returns:
+        message_id -> [(chunk_index, result or None)], like process_batch_output
+    """
+    keys = []
+    items = []
+    for message_id, responses in messages:
+        for chunk_index, response in responses:
+            custom_id = response.get("custom_id", "")
+            keys.append((message_id, chunk_index))
+            items.append((custom_id, _response_content(custom_id, response)))
+
+    if pool is not None and len(items) > 1:
+        size = max(1, -(-len(items) // (workers * 4)))
+        slices = [items[i : i + size] for i in range(0, len(items), size)]
+        results = [result for part in pool.map(_validate_contents, slices) for result in part]
+    else:
+        results = _validate_contents(items)
+
+    message_chunks: Dict[str, List[Tuple[int, Optional[MessageParseResult]]]] = defaultdict(list)
+    for (message_id, chunk_index), result in zip(keys, results, strict=True):
+        message_chunks[message_id].append((chunk_index, result))
+    return message_chunks
 
 
 def get_message_metadata(message_ids: List[int]) -> Dict[int, Dict[str, Any]]:
@@ -112,20 +286,21 @@ def get_message_metadata(message_ids: List[int]) -> Dict[int, Dict[str, Any]]:
     if not message_ids:
         return {}
 
-    # Build query with IN clause - message_id is TEXT type, so quote values
-    placeholders = ", ".join(f"'{mid}'" for mid in message_ids)
     # Note: discord_messages uses 'channel' column, but discord_parsed_ideas uses 'channel_id'
-    query = f"""
-        SELECT 
+    query = """
+        SELECT
             message_id,
             author,
             channel,
-            created_at
+            created_at,
+            content
         FROM discord_messages
-        WHERE message_id IN ({placeholders})
+        WHERE message_id = ANY(CAST(:message_ids AS text[]))
     """
 
-    result = execute_sql(query, fetch_results=True)
+    result = execute_sql(
+        query, params={"message_ids": [str(mid) for mid in message_ids]}, fetch_results=True
+    )
 
     if not result:
         return {}
@@ -137,11 +312,108 @@ def get_message_metadata(message_ids: List[int]) -> Dict[int, Dict[str, Any]]:
                 str(row[2]) if row[2] else None
             ),  # Stored as channel_id in parsed_ideas
             "created_at": row[3].isoformat() if row[3] else None,
+            "content": row[4],
         }
         for row in result
     }
 
 
+def sync_parse_cache(
+    message_chunks: Dict[Any, List[Tuple[int, Optional[MessageParseResult]]]],
+    metadata: Dict[Any, Dict[str, Any]],
+    write: bool = True,
+) -> Dict[str, int]:
+    """
+    Reconcile batch results with the content-hash parse cache (in place).
+
+    Chunk texts are rebuilt with prepare_for_parsing() (deterministic, same as
+    build_batch.py) and keyed as call_type "batch_parse" on the user content
+    the batch request sent (batch_user_content(): no alias mapping or ticker
+    hint, always MODEL_MAIN), kept apart from interactive "parse" entries:
+    - successful chunk results are written through so a rebuilt batch with
+      the same chunk is free
+    - failed chunks are recovered when an identical batch request succeeded
+      before under the current prompt version
+
+    Args:
+        message_chunks: message_id -> [(chunk_index, result or None)]
+        metadata: From get_message_metadata() (needs "content")
+        write: Write successful results to the cache (False for dry runs)
+
+    Returns:
+        Dict with "cached" and "recovered" counts
+    """
+    counts = {"cached": 0, "recovered": 0}
+    cache = get_parse_cache()
+    if cache is None:
+        return counts
+
+    for message_id, chunks in message_chunks.items():
+        content = metadata.get(message_id, {}).get("content")
+        if not content:
+            continue
+        chunk_texts = [chunk.text for chunk in prepare_for_parsing(content)]
+
+        for pos, (chunk_index, result) in enumerate(chunks):
+            if chunk_index >= len(chunk_texts):
+                continue  # Content changed since the batch was built
+            sent = batch_user_content(chunk_texts[chunk_index])
+
+            if result is not None:
+                if write:
+                    cache.put(
+                        "batch_parse",
+                        sent,
+                        CURRENT_PROMPT_VERSION,
+                        MODEL_MAIN,
+                        result.model_dump(mode="json"),
+                    )
+                    counts["cached"] += 1
+                continue
+
+            hit = cache.get("batch_parse", sent, CURRENT_PROMPT_VERSION, MODEL_MAIN)
+            if hit is not None:
+                chunks[pos] = (chunk_index, MessageParseResult.model_validate(hit.payload))
+                counts["recovered"] += 1
+
+    return counts
+
+
+def _idea_params(idea: Dict[str, Any]) -> Dict[str, Any]:
+    """Idea dict -> discord_parsed_ideas column values (IDEA_COLUMNS keys)."""
+    return {
+        "message_id": str(idea["message_id"]),
+        "idea_index": idea["idea_index"],
+        "soft_chunk_index": idea.get("soft_chunk_index", 0),
+        "local_idea_index": idea.get("local_idea_index", idea["idea_index"]),
+        "idea_text": idea["idea_text"],
+        "idea_summary": idea.get("idea_summary"),
+        "context_summary": idea.get("context_summary"),
+        "primary_symbol": idea.get("primary_symbol"),
+        "symbols": idea.get("symbols", []),
+        "instrument": idea.get("instrument"),
+        "direction": idea.get("direction"),
+        "action": idea.get("action"),
+        "time_horizon": idea.get("time_horizon"),
+        "trigger_condition": idea.get("trigger_condition"),
+        "levels": json.dumps(idea.get("levels", [])),
+        "option_type": idea.get("option_type"),
+        "strike": idea.get("strike"),
+        "expiry": idea.get("expiry"),
+        "premium": idea.get("premium"),
+        "labels": idea.get("labels", []),
+        "label_scores": json.dumps(idea.get("label_scores", {})),
+        "is_noise": idea.get("is_noise", False),
+        "author_id": idea.get("author_id"),
+        "channel_id": idea.get("channel_id"),
+        "model": idea["model"],
+        "prompt_version": idea["prompt_version"],
+        "confidence": idea.get("confidence"),
+        "raw_json": json.dumps(idea.get("raw_json", {})),
+        "source_created_at": idea.get("source_created_at"),
+    }
+
+
 def save_parsed_ideas(ideas: List[Dict[str, Any]], conn=None) -> int:
     """
     Save parsed ideas to discord_parsed_ideas table.
@@ -159,64 +431,14 @@ def save_parsed_ideas(ideas: List[Dict[str, Any]], conn=None) -> int:
     if not ideas:
         return 0
 
+    columns = ", ".join(IDEA_COLUMNS)
+    values = ", ".join(f":{column}" for column in IDEA_COLUMNS)
+    query = f"INSERT INTO discord_parsed_ideas ({columns}) VALUES ({values})"
+
     inserted = 0
     for idea in ideas:
         try:
-            query = """
-                INSERT INTO discord_parsed_ideas (
-                    message_id, idea_index, soft_chunk_index, local_idea_index,
-                    idea_text, idea_summary, context_summary,
-                    primary_symbol, symbols, instrument, direction,
-                    action, time_horizon, trigger_condition,
-                    levels, option_type, strike, expiry, premium,
-                    labels, label_scores, is_noise,
-                    author_id, channel_id, model, prompt_version, confidence,
-                    raw_json, source_created_at
-                ) VALUES (
-                    :message_id, :idea_index, :soft_chunk_index, :local_idea_index,
-                    :idea_text, :idea_summary, :context_summary,
-                    :primary_symbol, :symbols, :instrument, :direction,
-                    :action, :time_horizon, :trigger_condition,
-                    :levels, :option_type, :strike, :expiry, :premium,
-                    :labels, :label_scores, :is_noise,
-                    :author_id, :channel_id, :model, :prompt_version, :confidence,
-                    :raw_json, :source_created_at
-                )
-            """
-
-            # Convert Python types to PostgreSQL types
-            params = {
-                "message_id": str(idea["message_id"]),
-                "idea_index": idea["idea_index"],
-                "soft_chunk_index": idea.get("soft_chunk_index", 0),
-                "local_idea_index": idea.get("local_idea_index", idea["idea_index"]),
-                "idea_text": idea["idea_text"],
-                "idea_summary": idea.get("idea_summary"),
-                "context_summary": idea.get("context_summary"),
-                "primary_symbol": idea.get("primary_symbol"),
-                "symbols": idea.get("symbols", []),
-                "instrument": idea.get("instrument"),
-                "direction": idea.get("direction"),
-                "action": idea.get("action"),
-                "time_horizon": idea.get("time_horizon"),
-                "trigger_condition": idea.get("trigger_condition"),
-                "levels": json.dumps(idea.get("levels", [])),
-                "option_type": idea.get("option_type"),
-                "strike": idea.get("strike"),
-                "expiry": idea.get("expiry"),
-                "premium": idea.get("premium"),
-                "labels": idea.get("labels", []),
-                "label_scores": json.dumps(idea.get("label_scores", {})),
-                "is_noise": idea.get("is_noise", False),
-                "author_id": idea.get("author_id"),
-                "channel_id": idea.get("channel_id"),
-                "model": idea["model"],
-                "prompt_version": idea["prompt_version"],
-                "confidence": idea.get("confidence"),
-                "raw_json": json.dumps(idea.get("raw_json", {})),
-                "source_created_at": idea.get("source_created_at"),
-            }
-
+            params = _idea_params(idea)
             if conn is not None:
                 # Use provided connection (within transaction)
                 conn.execute(text(query), params)
@@ -231,82 +453,160 @@ def save_parsed_ideas(ideas: List[Dict[str, Any]], conn=None) -> int:
     return inserted
 
 
+def _copy_text(value: Any) -> str:
+    """One value in COPY text format (\\N for NULL, arrays as {..} literals)."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (list, tuple)):
+        elements = []
+        for element in value:
+            if element is None:
+                elements.append("NULL")
+            else:
+                escaped = str(element).replace("\\", "\\\\").replace('"', '\\"')
+                elements.append(f'"{escaped}"')
+        value = "{" + ",".join(elements) + "}"
+    elif isinstance(value, datetime):
+        value = value.isoformat()
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def copy_ideas(conn, ideas: List[Dict[str, Any]]) -> int:
+    """
+    Insert ideas with a single COPY on the transaction's connection.
+
+    Args:
+        conn: SQLAlchemy connection inside transaction()
+        ideas: Idea dicts (as for save_parsed_ideas)
+
+    Returns:
+        Number of ideas inserted
+    """
+    if not ideas:
+        return 0
+
+    buf = io.StringIO()
+    for idea in ideas:
+        params = _idea_params(idea)
+        buf.write("\t".join(_copy_text(params[column]) for column in IDEA_COLUMNS) + "\n")
+    buf.seek(0)
+
+    cursor = conn.connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY discord_parsed_ideas ({', '.join(IDEA_COLUMNS)}) FROM STDIN",
+            buf,
+        )
+    finally:
+        cursor.close()
+    return len(ideas)
+
+
+def _advisory_lock_key(message_id: Any) -> int:
+    try:
+        return int(message_id)
+    except (ValueError, TypeError):
+        return hash(str(message_id)) & 0x7FFFFFFFFFFFFFFF
+
+
 def delete_and_insert_ideas_atomic(
-    message_ids: List[int], ideas: List[Dict[str, Any]]
+    message_ids: List[int],
+    ideas: List[Dict[str, Any]],
+    message_statuses: Optional[Dict[Any, Tuple[str, Optional[str]]]] = None,
 ) -> Tuple[int, int]:
     """
     Atomically delete existing ideas and insert new ones in a single transaction.
 
     Uses advisory locks to prevent concurrent workers from interleaving:
-    - Lock all message_ids
-    - Delete existing ideas for those messages
-    - Insert new ideas
+    - Lock all message_ids (one statement, ascending key order)
+    - Delete existing ideas for those messages (one statement)
+    - Insert new ideas (one COPY)
+    - Apply message_statuses, if given (one UPDATE)
     - Release locks (automatic on commit)
 
+    Messages with human-reviewed ideas are frozen: excluded from the delete
+    and insert, and (like save_parsed_ideas_atomic) marked 'ok'.
+
     Args:
-        message_ids: List of message IDs to process
+        message_ids: List of message IDs whose ideas are replaced
         ideas: List of idea dicts to insert
+        message_statuses: Optional message_id -> (status, error_reason) to
+            write in the same transaction (may include messages without
+            ideas to replace, e.g. all chunks failed)
 
     Returns:
         Tuple of (deleted_count, inserted_count)
     """
-    if not message_ids:
+    message_statuses = dict(message_statuses or {})
+    if not message_ids and not message_statuses:
         return 0, 0
 
     deleted = 0
     inserted = 0
+    mids = [str(m) for m in message_ids]
 
     with transaction() as conn:
         # Step 1: Acquire advisory locks for all message IDs
-        for mid in message_ids:
-            try:
-                lock_key = int(mid)
-            except (ValueError, TypeError):
-                lock_key = hash(str(mid)) & 0x7FFFFFFFFFFFFFFF
-
-            conn.execute(
-                text("SELECT pg_advisory_xact_lock(:lock_key)"), {"lock_key": lock_key}
-            )
+        lock_keys = sorted({_advisory_lock_key(m) for m in [*message_ids, *message_statuses]})
+        conn.execute(
+            text(
+                "SELECT pg_advisory_xact_lock(k) FROM unnest(CAST(:keys AS bigint[])) AS k ORDER BY k"
+            ),
+            {"keys": lock_keys},
+        ).fetchall()
 
-        logger.debug(f"Acquired advisory locks for {len(message_ids)} messages")
+        logger.debug(f"Acquired advisory locks for {len(lock_keys)} messages")
 
         # Step 1.5: Human curation wins — messages with any reviewed idea row
         # are frozen: excluded from both the delete and the insert so curated
         # rows survive batch reparses.
-        reviewed_rows = conn.execute(
-            text(
-                """
-                SELECT DISTINCT message_id FROM discord_parsed_ideas
-                WHERE message_id = ANY(:mids)
-                  AND review_status <> 'unreviewed'
-                """
-            ),
-            {"mids": [str(m) for m in message_ids]},
-        ).fetchall()
-        reviewed_ids = {str(r[0]) for r in reviewed_rows}
+        reviewed_ids = set()
+        if mids:
+            reviewed_rows = conn.execute(
+                text(
+                    """
+                    SELECT DISTINCT message_id FROM discord_parsed_ideas
+                    WHERE message_id = ANY(:mids)
+                      AND review_status <> 'unreviewed'
+                    """
+                ),
+                {"mids": mids},
+            ).fetchall()
+            reviewed_ids = {str(r[0]) for r in reviewed_rows}
         if reviewed_ids:
             logger.info(
                 f"Skipping reparse of {len(reviewed_ids)} message(s) with "
                 f"human-reviewed ideas: {sorted(reviewed_ids)[:10]}"
             )
-            message_ids = [m for m in message_ids if str(m) not in reviewed_ids]
+            mids = [m for m in mids if m not in reviewed_ids]
             ideas = [i for i in ideas if str(i.get("message_id")) not in reviewed_ids]
+            for mid in list(message_statuses):
+                if str(mid) in reviewed_ids:
+                    message_statuses[mid] = ("ok", None)
+
+        if mids:
+            # Step 2: Delete existing ideas
+            result = conn.execute(
+                text("DELETE FROM discord_parsed_ideas WHERE message_id = ANY(:mids)"),
+                {"mids": mids},
+            )
+            deleted = result.rowcount if result.rowcount else len(mids)
+            logger.debug(f"Deleted existing ideas for {len(mids)} messages")
 
-        if not message_ids:
-            return 0, 0
-
-        # Step 2: Delete existing ideas
-        placeholders = ", ".join(f"'{mid}'" for mid in message_ids)
-        delete_query = f"""
-            DELETE FROM discord_parsed_ideas
-            WHERE message_id IN ({placeholders})
-        """
-        result = conn.execute(text(delete_query))
-        deleted = result.rowcount if result.rowcount else len(message_ids)
-        logger.debug(f"Deleted existing ideas for {len(message_ids)} messages")
+            # Step 3: Insert new ideas (using same connection)
+            inserted = copy_ideas(conn, ideas)
 
-        # Step 3: Insert new ideas (using same connection)
-        inserted = save_parsed_ideas(ideas, conn=conn)
+        # Step 4: Message statuses (same transaction)
+        if message_statuses:
+            _update_statuses(conn, message_statuses)
 
         # Transaction commits and locks release on context exit
 
@@ -358,11 +658,38 @@ def delete_existing_ideas_for_messages(message_ids: List[int]) -> int:
     return len(message_ids)
 
 
+_UPDATE_STATUSES = """
+    UPDATE discord_messages AS m
+    SET parse_status = v.status,
+        prompt_version = :prompt_version,
+        error_reason = v.error_reason
+    FROM unnest(
+        CAST(:message_ids AS text[]),
+        CAST(:statuses AS text[]),
+        CAST(:error_reasons AS text[])
+    ) AS v(message_id, status, error_reason)
+    WHERE m.message_id = v.message_id
+"""
+
+
+def _status_params(message_statuses: Dict[Any, Tuple[str, Optional[str]]]) -> Dict[str, Any]:
+    return {
+        "message_ids": [str(mid) for mid in message_statuses],
+        "statuses": [status for status, _ in message_statuses.values()],
+        "error_reasons": [reason for _, reason in message_statuses.values()],
+        "prompt_version": CURRENT_PROMPT_VERSION,
+    }
+
+
+def _update_statuses(conn, message_statuses: Dict[Any, Tuple[str, Optional[str]]]) -> None:
+    conn.execute(text(_UPDATE_STATUSES), _status_params(message_statuses))
+
+
 def update_message_statuses(
     message_statuses: Dict[int, Tuple[str, Optional[str]]],
 ) -> int:
     """
-    Batch update parse_status on discord_messages.
+    Batch update parse_status on discord_messages (one statement).
 
     Args:
         message_statuses: Dict mapping message_id to (status, error_reason)
@@ -370,112 +697,47 @@ def update_message_statuses(
     Returns:
         Number of messages updated
     """
-    updated = 0
-    for message_id, (status, error_reason) in message_statuses.items():
-        try:
-            query = """
-                UPDATE discord_messages
-                SET parse_status = :status,
-                    prompt_version = :prompt_version,
-                    error_reason = :error_reason
-                WHERE message_id = CAST(:message_id AS text)
-            """
-            params = {
-                "message_id": str(message_id),
-                "status": status,
-                "prompt_version": CURRENT_PROMPT_VERSION,
-                "error_reason": error_reason,
-            }
-            execute_sql(query, params=params)
-            updated += 1
-        except Exception as e:
-            logger.error(f"Failed to update message {message_id}: {e}")
-
-    return updated
-
-
-def process_batch_output(
-    responses: List[Dict[str, Any]],
-    dry_run: bool = False,
-) -> Dict[str, Any]:
-    """
-    Process batch output and save to database.
+    if not message_statuses:
+        return 0
+    try:
+        execute_sql(_UPDATE_STATUSES, params=_status_params(message_statuses))
+    except Exception as e:
+        logger.error(f"Failed to update {len(message_statuses)} message statuses: {e}")
+        return 0
+    return len(message_statuses)
 
-    Args:
-        responses: List of batch response dicts
-        dry_run: Don't save to database
 
-    Returns:
-        Processing stats
-    """
-    stats = {
-        "total_responses": len(responses),
+def _new_ingest_stats() -> Dict[str, Any]:
+    return {
+        "total_responses": 0,
         "successful": 0,
         "failed": 0,
         "ideas_extracted": 0,
         "messages_updated": 0,
+        "cache_writes": 0,
+        "recovered_from_cache": 0,
     }
 
-    # Group responses by message_id (a message may have multiple chunks)
-    message_chunks: Dict[int, List[Tuple[int, Optional[MessageParseResult]]]] = (
-        defaultdict(list)
-    )
 
-    # Collect all message IDs for metadata lookup
-    all_message_ids = set()
-
-    for response in responses:
-        custom_id = response.get("custom_id", "")
-
-        try:
-            message_id, chunk_index = parse_custom_id(custom_id)
-            all_message_ids.add(message_id)
-        except ValueError as e:
-            logger.error(str(e))
-            stats["failed"] += 1
-            continue
-
-        # Check for API error
-        if response.get("error"):
-            logger.error(f"{custom_id}: API error - {response['error']}")
-            message_chunks[message_id].append((chunk_index, None))
-            stats["failed"] += 1
-            continue
-
-        # Parse response
-        try:
-            body = response.get("response", {}).get("body", {})
-            choices = body.get("choices", [])
-
-            if choices:
-                content = choices[0].get("message", {}).get("content", "")
-                result = MessageParseResult.model_validate_json(content)
-                message_chunks[message_id].append((chunk_index, result))
-                stats["successful"] += 1
-            else:
-                logger.warning(f"{custom_id}: No choices in response")
-                message_chunks[message_id].append((chunk_index, None))
-                stats["failed"] += 1
-
-        except Exception as e:
-            logger.error(f"{custom_id}: Parse error - {e}")
-            message_chunks[message_id].append((chunk_index, None))
-            stats["failed"] += 1
-
-    # Get message metadata
-    logger.info(f"Fetching metadata for {len(all_message_ids)} messages...")
-    metadata = get_message_metadata(list(all_message_ids))
+def build_idea_rows(
+    message_chunks: Dict[Any, List[Tuple[int, Optional[MessageParseResult]]]],
+    metadata: Dict[Any, Dict[str, Any]],
+) -> Tuple[List[Dict[str, Any]], Dict[Any, Tuple[str, Optional[str]]]]:
+    """
+    Turn validated chunks into idea rows and per-message statuses.
 
-    # Build ideas and status updates
+    Returns:
+        (ideas, message_statuses) where message_statuses maps message_id to
+        (status, error_reason)
+    """
     all_ideas = []
-    message_statuses: Dict[int, Tuple[str, Optional[str]]] = {}
+    message_statuses: Dict[Any, Tuple[str, Optional[str]]] = {}
 
     for message_id, chunks in message_chunks.items():
         # Sort chunks by index (deterministic ordering)
         chunks.sort(key=lambda x: x[0])
 
-        # Check if all chunks succeeded
-        all_success = all(result is not None for _, result in chunks)
+        # Check if any chunk succeeded
         any_success = any(result is not None for _, result in chunks)
 
         if not any_success:
@@ -521,53 +783,178 @@ def process_batch_output(
                     global_idea_index += 1
                     has_ideas = True
 
-        # Determine status
+        # Determine status (still ok if only some chunks produced ideas)
         if has_ideas:
-            status = "ok" if all_success else "ok"  # Still ok if we got ideas
-            message_statuses[message_id] = (status, None)
+            message_statuses[message_id] = ("ok", None)
         else:
             # All ideas were noise
             message_statuses[message_id] = ("noise", "All extracted ideas were noise")
 
-    stats["ideas_extracted"] = len(all_ideas)
+    return all_ideas, message_statuses
 
-    # Save to database with reparse safety (atomic delete+insert in single transaction)
-    if not dry_run:
-        # Use atomic function for delete+insert to ensure advisory locks persist
-        successful_message_ids = [
-            mid
-            for mid, (status, _) in message_statuses.items()
-            if status in ("ok", "noise")
-        ]
-        if successful_message_ids or all_ideas:
-            logger.info(
-                f"Atomic delete+insert for {len(successful_message_ids)} messages, {len(all_ideas)} ideas..."
-            )
-            deleted, inserted = delete_and_insert_ideas_atomic(
-                successful_message_ids, all_ideas
+
+def _write_window(
+    ideas: List[Dict[str, Any]],
+    message_statuses: Dict[Any, Tuple[str, Optional[str]]],
+) -> int:
+    """
+    Write one window in a single transaction; on failure retry per message.
+
+    Returns:
+        Number of ideas inserted
+    """
+    replaced = [mid for mid, (status, _) in message_statuses.items() if status in ("ok", "noise")]
+    try:
+        _, inserted = delete_and_insert_ideas_atomic(replaced, ideas, message_statuses)
+        return inserted
+    except Exception as e:
+        logger.warning(f"Window write failed ({len(message_statuses)} messages), retrying per message: {e}")
+
+    ideas_by_message: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for idea in ideas:
+        ideas_by_message[str(idea["message_id"])].append(idea)
+
+    inserted = 0
+    for mid, status in message_statuses.items():
+        try:
+            _, count = delete_and_insert_ideas_atomic(
+                [mid] if mid in replaced else [],
+                ideas_by_message.get(str(mid), []),
+                {mid: status},
             )
-            logger.info(f"Deleted existing, inserted {inserted} ideas")
+            inserted += count
+        except Exception as e:
+            logger.error(f"Failed to write message {mid}: {e}")
+            update_message_statuses({mid: ("error", f"Ingest failed: {e}"[:500])})
+    return inserted
 
-        # Update message statuses (separate transaction is OK - no race condition here)
-        logger.info(f"Updating {len(message_statuses)} message statuses...")
-        updated = update_message_statuses(message_statuses)
-        stats["messages_updated"] = updated
-    else:
-        logger.info(f"[DRY RUN] Would insert {len(all_ideas)} ideas")
-        logger.info(f"[DRY RUN] Would update {len(message_statuses)} message statuses")
-
-        # Show sample ideas
-        if all_ideas:
-            logger.info("\nSample ideas:")
-            for idea in all_ideas[:5]:
-                symbol = idea.get("primary_symbol", "N/A")
-                text = (
-                    idea["idea_text"][:60] + "..."
-                    if len(idea["idea_text"]) > 60
-                    else idea["idea_text"]
+
+def _ingest_window(
+    messages: List[Tuple[str, List[Tuple[int, Dict[str, Any]]]]],
+    stats: Dict[str, Any],
+    dry_run: bool,
+    pool: Optional[ProcessPoolExecutor] = None,
+    workers: int = 1,
+) -> None:
+    """Validate, reconcile with the parse cache, and write one window."""
+    message_chunks = validate_message_chunks(messages, pool=pool, workers=workers)
+    for chunks in message_chunks.values():
+        ok = sum(result is not None for _, result in chunks)
+        stats["successful"] += ok
+        stats["failed"] += len(chunks) - ok
+
+    # Get message metadata
+    metadata = get_message_metadata(list(message_chunks))
+
+    # Parse cache: write through successes, recover failed chunks
+    cache_counts = sync_parse_cache(message_chunks, metadata, write=not dry_run)
+    stats["cache_writes"] += cache_counts["cached"]
+    stats["recovered_from_cache"] += cache_counts["recovered"]
+
+    ideas, message_statuses = build_idea_rows(message_chunks, metadata)
+    stats["ideas_extracted"] += len(ideas)
+
+    if not dry_run:
+        stats["ideas_inserted"] = stats.get("ideas_inserted", 0) + _write_window(ideas, message_statuses)
+        stats["messages_updated"] += len(message_statuses)
+        return
+
+    logger.info(f"[DRY RUN] Would insert {len(ideas)} ideas")
+    logger.info(f"[DRY RUN] Would update {len(message_statuses)} message statuses")
+
+    # Show sample ideas (first window only)
+    if ideas and not stats.get("windows"):
+        logger.info("\nSample ideas:")
+        for idea in ideas[:5]:
+            symbol = idea.get("primary_symbol", "N/A")
+            text = idea["idea_text"][:60] + "..." if len(idea["idea_text"]) > 60 else idea["idea_text"]
+            labels = ", ".join(idea.get("labels", [])[:2])
+            logger.info(f"  [{symbol}] {text} ({labels})")
+
+
+def ingest_batch_file(
+    input_path: Path,
+    dry_run: bool = False,
+    window: int = INGEST_WINDOW_MESSAGES,
+    workers: int = 1,
+) -> Dict[str, Any]:
+    """
+    Stream a batch output file into the database (see "Streaming" above).
+
+    Memory is bounded by one window of messages plus the chunks still
+    waiting for their siblings, whatever the file size.
+
+    Args:
+        input_path: Batch output JSONL
+        dry_run: Don't save to database
+        window: Messages per validation + write transaction
+        workers: Processes for MessageParseResult validation (1 = in-process).
+            Only use >1 from a single-threaded process (the CLI): the pool forks.
+
+    Returns:
+        Processing stats (process_batch_output keys plus windows,
+        ideas_inserted and max_buffered_messages)
+    """
+    stats = _new_ingest_stats()
+    stats["windows"] = 0
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+
+    try:
+        pending: List[Tuple[str, List[Tuple[int, Dict[str, Any]]]]] = []
+        for message in iter_message_responses(input_path, stats):
+            pending.append(message)
+            if len(pending) >= window:
+                _ingest_window(pending, stats, dry_run, pool=pool, workers=workers)
+                stats["windows"] += 1
+                logger.info(
+                    f"Window {stats['windows']}: {stats['total_responses']} responses read, "
+                    f"{stats['ideas_extracted']} ideas so far"
                 )
-                labels = ", ".join(idea.get("labels", [])[:2])
-                logger.info(f"  [{symbol}] {text} ({labels})")
+                pending = []
+        if pending:
+            _ingest_window(pending, stats, dry_run, pool=pool, workers=workers)
+            stats["windows"] += 1
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    return stats
+
+
+def process_batch_output(
+    responses: List[Dict[str, Any]],
+    dry_run: bool = False,
+) -> Dict[str, Any]:
+    """
+    Process already-loaded batch output and save to database.
+
+    In-memory counterpart of ingest_batch_file(): all responses form a
+    single window (one metadata query, one write transaction).
+
+    Args:
+        responses: List of batch response dicts
+        dry_run: Don't save to database
+
+    Returns:
+        Processing stats
+    """
+    stats = _new_ingest_stats()
+    stats["total_responses"] = len(responses)
+
+    # Group responses by message_id (a message may have multiple chunks)
+    grouped: Dict[str, List[Tuple[int, Dict[str, Any]]]] = defaultdict(list)
+    for response in responses:
+        try:
+            message_id, chunk_index = parse_custom_id(response.get("custom_id", ""))
+        except ValueError as e:
+            logger.error(str(e))
+            stats["failed"] += 1
+            continue
+        grouped[message_id].append((chunk_index, response))
+
+    if grouped:
+        logger.info(f"Processing {len(grouped)} messages...")
+        _ingest_window(list(grouped.items()), stats, dry_run)
 
     return stats
 
@@ -584,6 +971,18 @@ def main():
         "--input", "-i", type=str, required=True, help="Path to batch output JSONL file"
     )
     parser.add_argument("--dry-run", action="store_true", help="Don't save to database")
+    parser.add_argument(
+        "--window",
+        type=int,
+        default=INGEST_WINDOW_MESSAGES,
+        help=f"Messages per write transaction (default: {INGEST_WINDOW_MESSAGES})",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Processes for response validation (default: CPU count)",
+    )
     parser.add_argument(
         "--verbose", "-v", action="store_true", help="Enable verbose logging"
     )
@@ -599,18 +998,14 @@ def main():
         logger.error(f"Input file not found: {input_path}")
         sys.exit(1)
 
-    # Load batch output
-    logger.info(f"Loading batch output: {input_path}")
-    responses = load_batch_output(input_path)
-    logger.info(f"Loaded {len(responses)} responses")
+    # Stream and process
+    logger.info(f"Ingesting batch output: {input_path}")
+    stats = ingest_batch_file(input_path, dry_run=args.dry_run, window=args.window, workers=args.workers)
 
-    if not responses:
+    if not stats["total_responses"]:
         logger.info("No responses to process")
         return
 
-    # Process
-    stats = process_batch_output(responses, dry_run=args.dry_run)
-
     # Summary
     logger.info("\n" + "=" * 50)
     logger.info("INGESTION COMPLETE")
@@ -619,8 +1014,13 @@ def main():
     logger.info(f"  Successful: {stats['successful']}")
     logger.info(f"  Failed: {stats['failed']}")
     logger.info(f"Ideas extracted: {stats['ideas_extracted']}")
+    logger.info(
+        f"Parse cache: {stats['cache_writes']} written, "
+        f"{stats['recovered_from_cache']} failed chunks recovered"
+    )
     if not args.dry_run:
         logger.info(f"Messages updated: {stats['messages_updated']}")
+        prune_parse_cache()
 
 
 if __name__ == "__main__":
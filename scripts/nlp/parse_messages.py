@@ -26,13 +26,18 @@ Usage:
 
     # Use context window for continuation messages
     python scripts/nlp/parse_messages.py --context-window 5 --context-minutes 30
+
+    # Parse with 8 concurrent workers under a shared 500 RPM / 200k TPM budget
+    python scripts/nlp/parse_messages.py --workers 8 --rpm 500 --tpm 200000
 """
 
 import argparse
 import json
 import logging
 import re
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone, timedelta
 from typing import List, Dict, Any, Optional, Tuple
 
@@ -52,11 +57,19 @@ from src.nlp.openai_parser import (
     set_debug_openai,
     CURRENT_PROMPT_VERSION,
 )
+from src.nlp.local_triage import set_local_triage
+from src.nlp.parse_cache import get_parse_cache, prune_parse_cache, set_parse_cache
+from src.nlp.rate_limiter import (
+    OPENAI_RPM_LIMIT,
+    OPENAI_TPM_LIMIT,
+    configure_rate_limits,
+)
 from src.nlp.schemas import CURRENT_PROMPT_VERSION
 from src.nlp.preclean import (
     merge_short_ideas,
     is_valid_short_action,
     MIN_IDEA_LENGTH,
+    load_symbol_aliases,
     should_skip_message,  # SSOT prefilter
 )
 
@@ -65,6 +78,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Concurrent mode (--workers > 1): messages per batched DB flush
+WRITE_BATCH_SIZE = int(os.getenv("PARSE_WRITE_BATCH_SIZE", "25"))
+
 # =============================================================================
 # CONTINUATION DETECTION
 # =============================================================================
@@ -545,6 +561,171 @@ def print_candidate_messages():
     print("\n" + "=" * 60)
 
 
+def _message_lock_key(message_id: str) -> int:
+    """Advisory lock key for a message_id (hash for non-numeric IDs)."""
+    try:
+        return int(message_id)
+    except ValueError:
+        # Hash string message_id to int64 range
+        return hash(message_id) & 0x7FFFFFFFFFFFFFFF
+
+
+def _write_message_ideas(
+    conn,
+    message_id: str,
+    ideas: List[Dict[str, Any]],
+    status: str,
+    error_reason: Optional[str] = None,
+) -> int:
+    """
+    Lock, delete, insert and mark one message on an open transaction.
+
+    Shared by save_parsed_ideas_with_cleanup() (own transaction) and
+    save_parsed_ideas_batch() (one savepoint per message). The advisory lock is
+    transaction-scoped, so it is held until the caller's transaction ends.
+
+    Returns:
+        Number of ideas inserted
+    """
+    lock_key = _message_lock_key(message_id)
+    inserted = 0
+
+    # Step 0: Acquire advisory lock (held until transaction ends)
+    conn.execute(
+        text("SELECT pg_advisory_xact_lock(:lock_key)"), {"lock_key": lock_key}
+    )
+    logger.debug(f"Acquired advisory lock for message {message_id}")
+
+    # Step 0.5: Human curation wins — a message with any reviewed idea
+    # row is frozen. Keep the curated rows, discard this parse, and
+    # mark the message 'ok' so it doesn't loop as pending.
+    reviewed = conn.execute(
+        text(
+            """
+            SELECT 1 FROM discord_parsed_ideas
+            WHERE message_id = CAST(:message_id AS text)
+              AND review_status <> 'unreviewed'
+            LIMIT 1
+            """
+        ),
+        {"message_id": str(message_id)},
+    ).fetchone()
+    if reviewed:
+        logger.info(
+            f"Skipping reparse of message {message_id}: has human-reviewed ideas"
+        )
+        conn.execute(
+            text(
+                """
+                UPDATE discord_messages
+                SET parse_status = 'ok', error_reason = NULL
+                WHERE message_id = CAST(:message_id AS text)
+                """
+            ),
+            {"message_id": str(message_id)},
+        )
+        return 0
+
+    # Step 1: Delete existing ideas for this message
+    conn.execute(
+        text(
+            "DELETE FROM discord_parsed_ideas WHERE message_id = CAST(:message_id AS text)"
+        ),
+        {"message_id": str(message_id)},
+    )
+    logger.debug(f"Deleted existing ideas for message {message_id}")
+
+    # Step 2: Insert fresh ideas (if any)
+    for idea in ideas:
+        try:
+            insert_query = text(
+                """
+                INSERT INTO discord_parsed_ideas (
+                    message_id, idea_index, soft_chunk_index, local_idea_index,
+                    idea_text, idea_summary, context_summary,
+                    primary_symbol, symbols, instrument, direction,
+                    action, time_horizon, trigger_condition,
+                    levels, option_type, strike, expiry, premium,
+                    labels, label_scores, is_noise,
+                    author_id, channel_id, model, prompt_version, confidence,
+                    raw_json, source_created_at
+                ) VALUES (
+                    :message_id, :idea_index, :soft_chunk_index, :local_idea_index,
+                    :idea_text, :idea_summary, :context_summary,
+                    :primary_symbol, :symbols, :instrument, :direction,
+                    :action, :time_horizon, :trigger_condition,
+                    :levels, :option_type, :strike, :expiry, :premium,
+                    :labels, :label_scores, :is_noise,
+                    :author_id, :channel_id, :model, :prompt_version, :confidence,
+                    :raw_json, :source_created_at
+                )
+            """
+            )
+
+            # For live parsing, soft_chunk_index=0, local_idea_index=idea_index
+            params = {
+                "message_id": str(idea["message_id"]),
+                "idea_index": idea["idea_index"],
+                "soft_chunk_index": idea.get("soft_chunk_index", 0),
+                "local_idea_index": idea.get(
+                    "local_idea_index", idea["idea_index"]
+                ),
+                "idea_text": idea["idea_text"],
+                "idea_summary": idea.get("idea_summary"),
+                "context_summary": idea.get("context_summary"),
+                "primary_symbol": idea.get("primary_symbol"),
+                "symbols": idea.get("symbols", []),
+                "instrument": idea.get("instrument"),
+                "direction": idea.get("direction"),
+                "action": idea.get("action"),
+                "time_horizon": idea.get("time_horizon"),
+                "trigger_condition": idea.get("trigger_condition"),
+                "levels": json.dumps(idea.get("levels", [])),
+                "option_type": idea.get("option_type"),
+                "strike": idea.get("strike"),
+                "expiry": idea.get("expiry"),
+                "premium": idea.get("premium"),
+                "labels": idea.get("labels", []),
+                "label_scores": json.dumps(idea.get("label_scores", {})),
+                "is_noise": idea.get("is_noise", False),
+                "author_id": idea.get("author_id"),
+                "channel_id": idea.get("channel_id"),
+                "model": idea["model"],
+                "prompt_version": idea["prompt_version"],
+                "confidence": idea.get("confidence"),
+                "raw_json": json.dumps(idea.get("raw_json", {})),
+                "source_created_at": idea.get("source_created_at"),
+            }
+
+            conn.execute(insert_query, params)
+            inserted += 1
+
+        except Exception as e:
+            logger.error(f"Failed to insert idea: {e}")
+            raise  # Re-raise to rollback entire transaction
+
+    # Step 3: Update message status (inside same transaction)
+    conn.execute(
+        text(
+            """
+            UPDATE discord_messages
+            SET parse_status = :status,
+                prompt_version = :prompt_version,
+                error_reason = :error_reason
+            WHERE message_id = CAST(:message_id AS text)
+        """
+        ),
+        {
+            "message_id": str(message_id),
+            "status": status,
+            "prompt_version": CURRENT_PROMPT_VERSION,
+            "error_reason": error_reason,
+        },
+    )
+
+    return inserted
+
+
 def save_parsed_ideas_with_cleanup(
     message_id: str,
     ideas: List[Dict[str, Any]],
@@ -578,149 +759,11 @@ def save_parsed_ideas_with_cleanup(
     if not message_id:
         return 0
 
-    # Convert message_id to a numeric lock key (hash for non-numeric IDs)
-    try:
-        lock_key = int(message_id)
-    except ValueError:
-        # Hash string message_id to int64 range
-        lock_key = hash(message_id) & 0x7FFFFFFFFFFFFFFF
-
-    inserted = 0
-
     try:
         # Use transaction context to ensure atomicity
         with transaction() as conn:
-            # Step 0: Acquire advisory lock (held until transaction ends)
-            conn.execute(
-                text("SELECT pg_advisory_xact_lock(:lock_key)"), {"lock_key": lock_key}
-            )
-            logger.debug(f"Acquired advisory lock for message {message_id}")
-
-            # Step 0.5: Human curation wins — a message with any reviewed idea
-            # row is frozen. Keep the curated rows, discard this parse, and
-            # mark the message 'ok' so it doesn't loop as pending.
-            reviewed = conn.execute(
-                text(
-                    """
-                    SELECT 1 FROM discord_parsed_ideas
-                    WHERE message_id = CAST(:message_id AS text)
-                      AND review_status <> 'unreviewed'
-                    LIMIT 1
-                    """
-                ),
-                {"message_id": str(message_id)},
-            ).fetchone()
-            if reviewed:
-                logger.info(
-                    f"Skipping reparse of message {message_id}: has human-reviewed ideas"
-                )
-                conn.execute(
-                    text(
-                        """
-                        UPDATE discord_messages
-                        SET parse_status = 'ok', error_reason = NULL
-                        WHERE message_id = CAST(:message_id AS text)
-                        """
-                    ),
-                    {"message_id": str(message_id)},
-                )
-                return 0
-
-            # Step 1: Delete existing ideas for this message
-            conn.execute(
-                text(
-                    "DELETE FROM discord_parsed_ideas WHERE message_id = CAST(:message_id AS text)"
-                ),
-                {"message_id": str(message_id)},
-            )
-            logger.debug(f"Deleted existing ideas for message {message_id}")
-
-            # Step 2: Insert fresh ideas (if any)
-            for idea in ideas:
-                try:
-                    insert_query = text(
-                        """
-                        INSERT INTO discord_parsed_ideas (
-                            message_id, idea_index, soft_chunk_index, local_idea_index,
-                            idea_text, idea_summary, context_summary,
-                            primary_symbol, symbols, instrument, direction,
-                            action, time_horizon, trigger_condition,
-                            levels, option_type, strike, expiry, premium,
-                            labels, label_scores, is_noise,
-                            author_id, channel_id, model, prompt_version, confidence,
-                            raw_json, source_created_at
-                        ) VALUES (
-                            :message_id, :idea_index, :soft_chunk_index, :local_idea_index,
-                            :idea_text, :idea_summary, :context_summary,
-                            :primary_symbol, :symbols, :instrument, :direction,
-                            :action, :time_horizon, :trigger_condition,
-                            :levels, :option_type, :strike, :expiry, :premium,
-                            :labels, :label_scores, :is_noise,
-                            :author_id, :channel_id, :model, :prompt_version, :confidence,
-                            :raw_json, :source_created_at
-                        )
-                    """
-                    )
-
-                    # For live parsing, soft_chunk_index=0, local_idea_index=idea_index
-                    params = {
-                        "message_id": str(idea["message_id"]),
-                        "idea_index": idea["idea_index"],
-                        "soft_chunk_index": idea.get("soft_chunk_index", 0),
-                        "local_idea_index": idea.get(
-                            "local_idea_index", idea["idea_index"]
-                        ),
-                        "idea_text": idea["idea_text"],
-                        "idea_summary": idea.get("idea_summary"),
-                        "context_summary": idea.get("context_summary"),
-                        "primary_symbol": idea.get("primary_symbol"),
-                        "symbols": idea.get("symbols", []),
-                        "instrument": idea.get("instrument"),
-                        "direction": idea.get("direction"),
-                        "action": idea.get("action"),
-                        "time_horizon": idea.get("time_horizon"),
-                        "trigger_condition": idea.get("trigger_condition"),
-                        "levels": json.dumps(idea.get("levels", [])),
-                        "option_type": idea.get("option_type"),
-                        "strike": idea.get("strike"),
-                        "expiry": idea.get("expiry"),
-                        "premium": idea.get("premium"),
-                        "labels": idea.get("labels", []),
-                        "label_scores": json.dumps(idea.get("label_scores", {})),
-                        "is_noise": idea.get("is_noise", False),
-                        "author_id": idea.get("author_id"),
-                        "channel_id": idea.get("channel_id"),
-                        "model": idea["model"],
-                        "prompt_version": idea["prompt_version"],
-                        "confidence": idea.get("confidence"),
-                        "raw_json": json.dumps(idea.get("raw_json", {})),
-                        "source_created_at": idea.get("source_created_at"),
-                    }
-
-                    conn.execute(insert_query, params)
-                    inserted += 1
-
-                except Exception as e:
-                    logger.error(f"Failed to insert idea: {e}")
-                    raise  # Re-raise to rollback entire transaction
-
-            # Step 3: Update message status (inside same transaction)
-            conn.execute(
-                text(
-                    """
-                    UPDATE discord_messages
-                    SET parse_status = :status,
-                        prompt_version = :prompt_version,
-                        error_reason = :error_reason
-                    WHERE message_id = CAST(:message_id AS text)
-                """
-                ),
-                {
-                    "message_id": str(message_id),
-                    "status": status,
-                    "prompt_version": CURRENT_PROMPT_VERSION,
-                    "error_reason": error_reason,
-                },
+            inserted = _write_message_ideas(
+                conn, message_id, ideas, status, error_reason
             )
 
         # Transaction committed, lock released
@@ -731,6 +774,61 @@ def save_parsed_ideas_with_cleanup(
         raise
 
 
+def save_parsed_ideas_batch(writes: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Flush several messages' parse results in ONE transaction.
+
+    Used by the concurrent pipeline (--workers > 1) to cut per-message commit
+    round-trips. Reparse safety is unchanged: each message still takes its own
+    pg_advisory_xact_lock and runs the same curation check / delete / insert /
+    status update as save_parsed_ideas_with_cleanup(), inside a SAVEPOINT so a
+    failing message rolls back alone without discarding the rest of the batch.
+    Locks are taken in message_id order to avoid deadlocks between concurrent
+    batch writers, and all are released when the batch commits.
+
+    Args:
+        writes: Pending writes from parse_single_message(defer_writes=True).
+            kind='ideas' -> reparse-safe save (message_id, ideas, status, error_reason)
+            kind='status' -> status-only update (message_id, status, error_reason)
+
+    Returns:
+        Dict with "inserted" (total ideas) and "failed" ({message_id: error})
+    """
+    inserted = 0
+    failed: Dict[str, str] = {}
+    if not writes:
+        return {"inserted": 0, "failed": failed}
+
+    ordered = sorted(writes, key=lambda w: _message_lock_key(str(w["message_id"])))
+
+    with transaction() as conn:
+        for write in ordered:
+            message_id = str(write["message_id"])
+            try:
+                with conn.begin_nested():
+                    if write["kind"] == "ideas":
+                        inserted += _write_message_ideas(
+                            conn,
+                            message_id,
+                            write["ideas"],
+                            write["status"],
+                            write.get("error_reason"),
+                        )
+                    else:
+                        _write_message_status(
+                            conn,
+                            message_id,
+                            write["status"],
+                            write.get("error_reason"),
+                            stamp_prompt_version=write.get("stamp_prompt_version", True),
+                        )
+            except Exception as e:
+                logger.error(f"Failed to save ideas for message {message_id}: {e}")
+                failed[message_id] = str(e)
+
+    return {"inserted": inserted, "failed": failed}
+
+
 def save_parsed_ideas(ideas: List[Dict[str, Any]]) -> int:
     """
     Save parsed ideas to discord_parsed_ideas table.
@@ -867,6 +965,41 @@ def update_message_status(
     execute_sql(query, params=params)
 
 
+def _write_message_status(
+    conn,
+    message_id: str,
+    status: str,
+    error_reason: Optional[str] = None,
+    stamp_prompt_version: bool = True,
+) -> None:
+    """Status-only update on an open transaction (skipped / error messages)."""
+    if stamp_prompt_version:
+        conn.execute(
+            text(
+                """
+                UPDATE discord_messages
+                SET parse_status = :status,
+                    prompt_version = :prompt_version,
+                    error_reason = :error_reason
+                WHERE message_id = CAST(:message_id AS text)
+                """
+            ),
+            {
+                "message_id": str(message_id),
+                "status": status,
+                "prompt_version": CURRENT_PROMPT_VERSION,
+                "error_reason": error_reason,
+            },
+        )
+    else:
+        conn.execute(
+            text(
+                "UPDATE discord_messages SET parse_status = :status, error_reason = :reason WHERE message_id = :mid"
+            ),
+            {"mid": str(message_id), "status": status, "reason": error_reason},
+        )
+
+
 def parse_single_message(
     message: Dict[str, Any],
     skip_triage: bool = False,
@@ -874,6 +1007,7 @@ def parse_single_message(
     dry_run: bool = False,
     context_window: int = 0,
     context_minutes: int = 30,
+    defer_writes: bool = False,
 ) -> Dict[str, Any]:
     """
     Parse a single message and optionally save results.
@@ -885,6 +1019,8 @@ def parse_single_message(
         dry_run: Don't save to database
         context_window: Number of previous messages to include (0=disabled)
         context_minutes: Maximum age of context messages in minutes
+        defer_writes: Don't write; return the write as result["pending_write"]
+            for save_parsed_ideas_batch() (used by the worker pool)
 
     Returns:
         Result dict with status, ideas count, etc.
@@ -906,6 +1042,19 @@ def parse_single_message(
     should_skip, skip_reason = should_skip_message(content, message_meta)
     if should_skip:
         logger.info(f"Skipping message {message_id}: {skip_reason}")
+        if defer_writes and not dry_run:
+            return {
+                "status": "skipped",
+                "ideas_count": 0,
+                "reason": skip_reason,
+                "pending_write": {
+                    "kind": "status",
+                    "message_id": message_id,
+                    "status": "skipped",
+                    "error_reason": skip_reason,
+                    "stamp_prompt_version": False,
+                },
+            }
         if not dry_run:
             execute_sql(
                 "UPDATE discord_messages SET parse_status = 'skipped', error_reason = :reason WHERE message_id = :mid",
@@ -972,6 +1121,22 @@ def parse_single_message(
 
         logger.info(f"  Status: {status}, Ideas: {len(ideas)}, Model: {model}")
 
+        if defer_writes and not dry_run:
+            return {
+                "message_id": message_id,
+                "status": status,
+                "ideas_count": len(ideas),
+                "model": model,
+                "error_reason": error_reason,
+                "pending_write": {
+                    "kind": "ideas",
+                    "message_id": message_id,
+                    "ideas": ideas,
+                    "status": status,
+                    "error_reason": error_reason,
+                },
+            }
+
         if not dry_run:
             # Use the reparse-safe cleanup function (delete + insert + status update)
             inserted = save_parsed_ideas_with_cleanup(
@@ -1001,15 +1166,148 @@ def parse_single_message(
 
     except Exception as e:
         logger.error(f"  Error: {e}")
-        if not dry_run:
-            update_message_status(message_id, "error", str(e))
-        return {
+        result = {
             "message_id": message_id,
             "status": "error",
             "ideas_count": 0,
             "model": None,
             "error_reason": str(e),
         }
+        if defer_writes and not dry_run:
+            result["pending_write"] = {
+                "kind": "status",
+                "message_id": message_id,
+                "status": "error",
+                "error_reason": str(e),
+            }
+        elif not dry_run:
+            update_message_status(message_id, "error", str(e))
+        return result
+
+
+# =============================================================================
+# CONCURRENT PIPELINE
+# =============================================================================
+
+
+def _flush_pending_writes(
+    writes: List[Dict[str, Any]], results_by_id: Dict[str, Dict[str, Any]]
+) -> int:
+    """
+    Write a batch of deferred results; fall back to per-message saves if the
+    batch transaction itself fails. Messages whose write failed are marked
+    'error' (in the DB when possible, and in results_by_id).
+
+    Returns:
+        Number of ideas inserted
+    """
+    if not writes:
+        return 0
+
+    try:
+        outcome = save_parsed_ideas_batch(writes)
+        inserted, failed = outcome["inserted"], outcome["failed"]
+    except Exception as e:
+        logger.warning(f"Batch write of {len(writes)} messages failed ({e}); saving individually")
+        inserted, failed = 0, {}
+        for write in writes:
+            message_id = str(write["message_id"])
+            try:
+                if write["kind"] == "ideas":
+                    inserted += save_parsed_ideas_with_cleanup(
+                        message_id=message_id,
+                        ideas=write["ideas"],
+                        status=write["status"],
+                        error_reason=write.get("error_reason"),
+                    )
+                else:
+                    update_message_status(message_id, write["status"], write.get("error_reason"))
+            except Exception as e2:
+                failed[message_id] = str(e2)
+
+    for message_id, reason in failed.items():
+        result = results_by_id.get(message_id)
+        if result is not None:
+            result.update(status="error", ideas_count=0, error_reason=reason)
+        try:
+            update_message_status(message_id, "error", f"save failed: {reason}")
+        except Exception as e:
+            logger.error(f"Could not mark message {message_id} as error: {e}")
+
+    logger.info(f"  Flushed {len(writes)} messages ({inserted} ideas, {len(failed)} failed)")
+    return inserted
+
+
+def parse_messages_concurrently(
+    messages: List[Dict[str, Any]],
+    workers: int,
+    write_batch_size: int = WRITE_BATCH_SIZE,
+    dry_run: bool = False,
+    **parse_kwargs: Any,
+) -> List[Dict[str, Any]]:
+    """
+    Parse messages on a bounded thread pool and batch the DB writes.
+
+    Worker threads only do the LLM work (process_message, which is I/O-bound
+    and shares the process-wide rate limiter). All writes happen on the calling
+    thread via save_parsed_ideas_batch(), flushed every `write_batch_size`
+    completed messages, so per-message advisory locking is unchanged and the
+    DB connection pool never sees more than one writer.
+
+    Returns:
+        One result dict per message (completion order).
+    """
+    results: List[Dict[str, Any]] = []
+    results_by_id: Dict[str, Dict[str, Any]] = {}
+    pending: List[Dict[str, Any]] = []
+    total = len(messages)
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="parse") as pool:
+        futures = {
+            pool.submit(
+                parse_single_message,
+                message,
+                dry_run=dry_run,
+                defer_writes=True,
+                **parse_kwargs,
+            ): message
+            for message in messages
+        }
+        for done, future in enumerate(as_completed(futures), 1):
+            message = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                # parse_single_message handles its own errors; this is a safety net
+                logger.error(f"Worker failed on message {message['message_id']}: {e}")
+                result = {
+                    "message_id": message["message_id"],
+                    "status": "error",
+                    "ideas_count": 0,
+                    "model": None,
+                    "error_reason": str(e),
+                    "pending_write": {
+                        "kind": "status",
+                        "message_id": message["message_id"],
+                        "status": "error",
+                        "error_reason": str(e),
+                    },
+                }
+
+            write = result.pop("pending_write", None)
+            results.append(result)
+            results_by_id[str(message["message_id"])] = result
+            if write is not None:
+                pending.append(write)
+
+            logger.info(f"[{done}/{total}] {message['message_id']}: {result['status']}")
+
+            if len(pending) >= write_batch_size:
+                _flush_pending_writes(pending, results_by_id)
+                pending = []
+
+    _flush_pending_writes(pending, results_by_id)
+    return results
 
 
 def main():
@@ -1058,8 +1356,50 @@ def main():
         help="Maximum age of context messages in minutes (default: 30)",
     )
 
+    # Concurrency arguments
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Parallel LLM workers (default: 1 = serial)",
+    )
+    parser.add_argument(
+        "--rpm",
+        type=int,
+        default=OPENAI_RPM_LIMIT,
+        help="OpenAI requests/minute budget shared by all workers (0=unlimited, env OPENAI_RPM_LIMIT)",
+    )
+    parser.add_argument(
+        "--tpm",
+        type=int,
+        default=OPENAI_TPM_LIMIT,
+        help="OpenAI tokens/minute budget shared by all workers (0=unlimited, env OPENAI_TPM_LIMIT)",
+    )
+    parser.add_argument(
+        "--write-batch-size",
+        type=int,
+        default=WRITE_BATCH_SIZE,
+        help=f"Messages per batched DB write in concurrent mode (default: {WRITE_BATCH_SIZE})",
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the content-hash parse cache (always call OpenAI)",
+    )
+    parser.add_argument(
+        "--no-local-triage",
+        action="store_true",
+        help="Send every chunk to LLM triage (disable the local triage classifier)",
+    )
+
     args = parser.parse_args()
 
+    if args.workers < 1:
+        parser.error("--workers must be >= 1")
+    if args.write_batch_size < 1:
+        parser.error("--write-batch-size must be >= 1")
+
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
@@ -1067,12 +1407,23 @@ def main():
         set_debug_openai(True)
         logger.info("OpenAI debug mode enabled")
 
+    if args.no_cache:
+        set_parse_cache(None)
+        logger.info("Parse cache disabled")
+
+    if args.no_local_triage:
+        set_local_triage(None)
+        logger.info("Local triage disabled")
+
     # Log context window settings if enabled
     if args.context_window > 0:
         logger.info(
             f"Context window enabled: {args.context_window} messages within {args.context_minutes} minutes"
         )
 
+    # Pick up manual aliases added since the code's ALIAS_MAP was written
+    load_symbol_aliases()
+
     # Fetch messages
     logger.info("Fetching messages...")
     messages = get_pending_messages(
@@ -1109,20 +1460,36 @@ def main():
     }
     total_ideas = 0
 
-    for i, message in enumerate(messages, 1):
-        logger.info(f"\n[{i}/{len(messages)}]")
+    configure_rate_limits(rpm=args.rpm, tpm=args.tpm)
+    parse_kwargs = dict(
+        skip_triage=args.skip_triage,
+        force_long_context=args.long_context,
+        context_window=args.context_window,
+        context_minutes=args.context_minutes,
+    )
 
-        result = parse_single_message(
-            message,
-            skip_triage=args.skip_triage,
-            force_long_context=args.long_context,
-            dry_run=args.dry_run,
-            context_window=args.context_window,
-            context_minutes=args.context_minutes,
+    if args.workers > 1:
+        logger.info(
+            f"Concurrent mode: {args.workers} workers, "
+            f"write batch {args.write_batch_size}"
         )
+        for result in parse_messages_concurrently(
+            messages,
+            workers=args.workers,
+            write_batch_size=args.write_batch_size,
+            dry_run=args.dry_run,
+            **parse_kwargs,
+        ):
+            results[result["status"]] += 1
+            total_ideas += result["ideas_count"]
+    else:
+        for i, message in enumerate(messages, 1):
+            logger.info(f"\n[{i}/{len(messages)}]")
+
+            result = parse_single_message(message, dry_run=args.dry_run, **parse_kwargs)
 
-        results[result["status"]] += 1
-        total_ideas += result["ideas_count"]
+            results[result["status"]] += 1
+            total_ideas += result["ideas_count"]
 
     # Summary
     logger.info("\n" + "=" * 50)
@@ -1137,6 +1504,16 @@ def main():
     if results["ok"] > 0:
         logger.info(f"Avg ideas per message: {total_ideas / results['ok']:.1f}")
 
+    cache = get_parse_cache()
+    if cache is not None:
+        cache_stats = cache.stats()
+        logger.info(
+            f"Parse cache: {cache_stats['hits']} hits / {cache_stats['misses']} misses "
+            f"(hit rate {cache_stats['hit_rate']:.1%})"
+        )
+        if not args.dry_run:
+            prune_parse_cache()
+
 
 if __name__ == "__main__":
     main()
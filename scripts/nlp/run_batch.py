@@ -25,21 +25,42 @@ Usage:
     # Verbose output
     python scripts/nlp/run_batch.py --input batch.jsonl --verbose
 
+    # Submit every shard from build_batch.py, 4 batches at a time; each shard
+    # is ingested as soon as its batch finishes. Re-run the same command to
+    # resume after an interruption (state: <output-dir>/<name>.state.json).
+    python scripts/nlp/run_batch.py --manifest batch_requests.manifest.json --max-concurrent 4
+
+    # Same, for an explicit list of shard files
+    python scripts/nlp/run_batch.py --inputs batch-000.jsonl batch-001.jsonl
+
 Batch API Notes:
     - Batch jobs complete within 24 hours (usually faster)
     - 50% cost discount vs synchronous API
     - Terminal states: completed, failed, cancelled, expired
     - Output files auto-deleted after 24 hours
+
+Shard mode (--manifest / --inputs):
+    Shards are uploaded, submitted and polled concurrently with asyncio (at
+    most --max-concurrent batches in flight). When a shard's batch reaches a
+    terminal state its output is downloaded and ingested right away, one
+    ingestion at a time, while the other shards keep running. Expired or
+    cancelled batches still ingest the requests that completed; messages
+    without a result stay pending for the next build. Per-shard progress
+    (file/batch IDs, status, outputs, ingested) is saved to the state file
+    after every step, so a re-run skips ingested shards and resumes polling
+    batches that were already created.
 """
 
 import argparse
+import asyncio
 import json
 import logging
+import os
 import sys
 import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 # Add project root to path
 sys.path.insert(0, str(__file__).rsplit("scripts", 1)[0].rstrip("/\\"))
@@ -162,27 +183,33 @@ def poll_batch_status(
 
         if status in TERMINAL_STATUSES:
             logger.info(f"Batch reached terminal status: {status}")
-            return {
-                "id": batch.id,
-                "status": batch.status,
-                "input_file_id": batch.input_file_id,
-                "output_file_id": batch.output_file_id,
-                "error_file_id": batch.error_file_id,
-                "request_counts": {
-                    "total": counts.total,
-                    "completed": counts.completed,
-                    "failed": counts.failed,
-                },
-                "created_at": batch.created_at,
-                "completed_at": getattr(batch, "completed_at", None),
-                "failed_at": getattr(batch, "failed_at", None),
-                "cancelled_at": getattr(batch, "cancelled_at", None),
-                "expired_at": getattr(batch, "expired_at", None),
-            }
+            return _batch_result(batch)
 
         time.sleep(poll_seconds)
 
 
+def _batch_result(batch) -> dict:
+    """Terminal batch object as a plain dict."""
+    counts = batch.request_counts
+    return {
+        "id": batch.id,
+        "status": batch.status,
+        "input_file_id": batch.input_file_id,
+        "output_file_id": batch.output_file_id,
+        "error_file_id": batch.error_file_id,
+        "request_counts": {
+            "total": counts.total,
+            "completed": counts.completed,
+            "failed": counts.failed,
+        },
+        "created_at": batch.created_at,
+        "completed_at": getattr(batch, "completed_at", None),
+        "failed_at": getattr(batch, "failed_at", None),
+        "cancelled_at": getattr(batch, "cancelled_at", None),
+        "expired_at": getattr(batch, "expired_at", None),
+    }
+
+
 def download_batch_output(
     client: OpenAI,
     file_id: str,
@@ -229,26 +256,15 @@ def run_ingest(
         Ingestion statistics
     """
     # Import here to avoid circular imports
-    from scripts.nlp.ingest_batch import (
-        load_batch_output,
-        process_batch_responses,
-    )
+    from scripts.nlp.ingest_batch import ingest_batch_file
 
     logger.info(f"Ingesting batch output from {output_path}...")
 
-    # Load responses
-    responses = load_batch_output(output_path)
-    logger.info(f"Loaded {len(responses)} responses")
-
-    if not responses:
-        return {"success": True, "ideas_inserted": 0, "messages_updated": 0}
-
-    # Process responses
-    stats = process_batch_responses(
-        responses=responses,
-        dry_run=dry_run,
-        verbose=verbose,
-    )
+    # Streams the file: memory stays flat however large the output is
+    # In-process validation (workers=1): shard ingest runs in a worker thread
+    # alongside the polling threads, where forking a process pool can deadlock
+    stats = ingest_batch_file(output_path, dry_run=dry_run)
+    logger.info(f"Ingested {stats['total_responses']} responses")
 
     # Report errors if present
     if error_path and error_path.exists():
@@ -261,6 +277,177 @@ def run_ingest(
     return stats
 
 
+# ---------------------------------------------------------------------------
+# Shard mode: concurrent submit/poll, progressive ingest, resumable state
+# ---------------------------------------------------------------------------
+
+
+def shard_inputs_from_manifest(manifest_path: Path) -> List[Path]:
+    """Shard JSONL paths listed in a build_batch.py index manifest."""
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    names = [shard["jsonl_file"] for shard in manifest.get("shards") or []]
+    if not names and manifest.get("jsonl_file"):
+        names = [manifest["jsonl_file"]]
+    return [manifest_path.parent / name for name in names]
+
+
+def load_run_state(state_path: Path) -> Dict[str, Any]:
+    """Saved shard-run state, or an empty one."""
+    if state_path.exists():
+        with open(state_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return {"shards": {}}
+
+
+def save_run_state(state_path: Path, state: Dict[str, Any]) -> None:
+    """Write state atomically (a crash never leaves a truncated file)."""
+    state["updated_at"] = datetime.now(timezone.utc).isoformat()
+    tmp_path = state_path.with_name(state_path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2, default=str)
+    os.replace(tmp_path, state_path)
+
+
+async def poll_batch_status_async(
+    client: OpenAI,
+    batch_id: str,
+    poll_seconds: int = 30,
+) -> dict:
+    """poll_batch_status() for the event loop: sleeps without blocking other shards."""
+    while True:
+        batch = await asyncio.to_thread(client.batches.retrieve, batch_id)
+        counts = batch.request_counts
+        if counts.total > 0:
+            pct = (counts.completed + counts.failed) / counts.total * 100
+            logger.info(f"Batch {batch_id}: {batch.status} ({pct:.1f}% done)")
+        else:
+            logger.info(f"Batch {batch_id}: {batch.status}")
+
+        if batch.status in TERMINAL_STATUSES:
+            return _batch_result(batch)
+        await asyncio.sleep(poll_seconds)
+
+
+async def run_shard(
+    client: OpenAI,
+    input_path: Path,
+    state: Dict[str, Any],
+    state_path: Path,
+    output_dir: Path,
+    poll_seconds: int,
+    slots: asyncio.Semaphore,
+    ingest_lock: asyncio.Lock,
+    dry_run: bool = False,
+    skip_ingest: bool = False,
+) -> Dict[str, Any]:
+    """
+    Drive one shard from upload to ingestion, resuming from its saved state.
+
+    Returns:
+        The shard's state entry
+    """
+    shard = state["shards"].setdefault(input_path.name, {"input": str(input_path)})
+    shard.pop("error", None)
+    if shard.get("ingested") or (skip_ingest and shard.get("output_path")):
+        logger.info(f"Shard {input_path.name}: already done, skipping")
+        return shard
+
+    def checkpoint(**updates) -> None:
+        shard.update(updates)
+        save_run_state(state_path, state)
+
+    async with slots:
+        if not shard.get("batch_id"):
+            if not shard.get("input_file_id"):
+                file_id = await asyncio.to_thread(upload_batch_file, client, input_path)
+                checkpoint(input_file_id=file_id)
+            batch_id = await asyncio.to_thread(
+                create_batch,
+                client,
+                shard["input_file_id"],
+                description=f"Parse {input_path.name}",
+            )
+            checkpoint(batch_id=batch_id, status="submitted")
+
+        if shard.get("status") not in TERMINAL_STATUSES:
+            result = await poll_batch_status_async(client, shard["batch_id"], poll_seconds)
+            checkpoint(status=result["status"], result=result)
+
+    result = shard["result"]
+    if result["status"] != "completed":
+        logger.warning(f"Shard {input_path.name}: batch {shard['batch_id']} ended {result['status']}")
+
+    # Expired/cancelled batches still carry the requests that finished
+    for key, file_key in (("output_path", "output_file_id"), ("error_path", "error_file_id")):
+        if result.get(file_key) and not shard.get(key):
+            kind = "output" if key == "output_path" else "errors"
+            path = output_dir / f"{input_path.stem}.{kind}.jsonl"
+            await asyncio.to_thread(download_batch_output, client, result[file_key], path)
+            checkpoint(**{key: str(path)})
+
+    if skip_ingest or not shard.get("output_path"):
+        return shard
+
+    # One ingestion at a time; the other shards keep polling meanwhile
+    async with ingest_lock:
+        stats = await asyncio.to_thread(
+            run_ingest,
+            Path(shard["output_path"]),
+            Path(shard["error_path"]) if shard.get("error_path") else None,
+            dry_run,
+        )
+    checkpoint(ingested=not dry_run, ingest_stats=stats)
+    logger.info(f"Shard {input_path.name}: ingested {stats.get('ideas_extracted', 0)} ideas")
+    return shard
+
+
+async def run_shards(
+    client: OpenAI,
+    input_paths: List[Path],
+    output_dir: Path,
+    state_path: Path,
+    max_concurrent: int = 4,
+    poll_seconds: int = 30,
+    dry_run: bool = False,
+    skip_ingest: bool = False,
+) -> Dict[str, Any]:
+    """
+    Submit, poll and ingest shards concurrently (see "Shard mode" above).
+
+    A failing shard is recorded in the state (``error``) without stopping
+    the others.
+
+    Returns:
+        Final run state
+    """
+    state = load_run_state(state_path)
+    slots = asyncio.Semaphore(max(1, max_concurrent))
+    ingest_lock = asyncio.Lock()
+
+    async def guarded(input_path: Path) -> None:
+        try:
+            await run_shard(
+                client,
+                input_path,
+                state,
+                state_path,
+                output_dir,
+                poll_seconds,
+                slots,
+                ingest_lock,
+                dry_run=dry_run,
+                skip_ingest=skip_ingest,
+            )
+        except Exception as e:
+            logger.error(f"Shard {input_path.name} failed: {e}")
+            state["shards"].setdefault(input_path.name, {"input": str(input_path)})["error"] = str(e)
+            save_run_state(state_path, state)
+
+    await asyncio.gather(*(guarded(path) for path in input_paths))
+    return state
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="End-to-end OpenAI Batch API orchestration",
@@ -272,6 +459,28 @@ def main():
         type=Path,
         help="Path to input JSONL file (from build_batch.py)",
     )
+    parser.add_argument(
+        "--manifest",
+        type=Path,
+        help="build_batch.py index manifest; submit all of its shards",
+    )
+    parser.add_argument(
+        "--inputs",
+        type=Path,
+        nargs="+",
+        help="Shard JSONL files to submit concurrently",
+    )
+    parser.add_argument(
+        "--max-concurrent",
+        type=int,
+        default=4,
+        help="Shard batches in flight at once (default: 4)",
+    )
+    parser.add_argument(
+        "--state-file",
+        type=Path,
+        help="Shard-run state file (default: <output-dir>/<name>.state.json)",
+    )
     parser.add_argument(
         "--resume-batch-id",
         type=str,
@@ -309,8 +518,8 @@ def main():
     args = parser.parse_args()
 
     # Validate args
-    if not args.resume_batch_id and not args.input:
-        parser.error("Either --input or --resume-batch-id is required")
+    if not (args.resume_batch_id or args.input or args.manifest or args.inputs):
+        parser.error("One of --input, --manifest, --inputs or --resume-batch-id is required")
 
     if args.input and not args.input.exists():
         parser.error(f"Input file not found: {args.input}")
@@ -321,6 +530,43 @@ def main():
     # Initialize client
     client = OpenAI()
 
+    if args.manifest or args.inputs:
+        input_paths = shard_inputs_from_manifest(args.manifest) if args.manifest else args.inputs
+        missing = [str(path) for path in input_paths if not path.exists()]
+        if not input_paths or missing:
+            parser.error(f"Shard files not found: {', '.join(missing) or 'none listed'}")
+
+        name = args.manifest.name.split(".")[0] if args.manifest else input_paths[0].stem
+        state_path = args.state_file or args.output_dir / f"{name}.state.json"
+        logger.info(f"Running {len(input_paths)} shards (state: {state_path})")
+
+        state = asyncio.run(
+            run_shards(
+                client,
+                input_paths,
+                args.output_dir,
+                state_path,
+                max_concurrent=args.max_concurrent,
+                poll_seconds=args.poll_seconds,
+                dry_run=args.dry_run,
+                skip_ingest=args.skip_ingest,
+            )
+        )
+
+        logger.info("=== Shard Run Complete ===")
+        failed = False
+        for shard_name, shard in state["shards"].items():
+            failed |= bool(shard.get("error")) or shard.get("status") not in TERMINAL_STATUSES
+            logger.info(
+                f"{shard_name}: {shard.get('status', 'not submitted')}"
+                f"{' - ' + shard['error'] if shard.get('error') else ''}"
+                f" | ideas: {shard.get('ingest_stats', {}).get('ideas_extracted', 0)}"
+            )
+        if failed:
+            logger.info("Re-run the same command to resume incomplete shards")
+            sys.exit(1)
+        return
+
     try:
         # Step 1 & 2: Upload and create batch (or resume)
         if args.resume_batch_id:
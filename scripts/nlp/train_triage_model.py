@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Train the local triage model (src/nlp/local_triage.py) from past outcomes.
+
+Labels come from what the pipeline already decided:
+- actionable (1): parse_status='ok' messages with at least one parsed idea
+- noise (0):      parse_status='noise' messages
+
+Messages the SSOT prefilter skips never reach triage and are excluded.
+The accept/reject band is calibrated on a held-out split so that local
+decisions keep --target-precision; everything in between still goes to
+the LLM.
+
+Usage:
+    # Train on the most recent 50k labelled messages and write the default model
+    python scripts/nlp/train_triage_model.py
+
+    # Stricter band, custom output path
+    python scripts/nlp/train_triage_model.py --target-precision 0.99 --output /tmp/triage.json
+
+    # Report metrics only
+    python scripts/nlp/train_triage_model.py --dry-run
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+from typing import List, Tuple
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+# Bootstrap AWS secrets FIRST, before any other src imports
+from src.env_bootstrap import bootstrap_env
+
+bootstrap_env()
+
+from src.db import execute_sql  # noqa: E402
+from src.nlp.local_triage import LOCAL_TRIAGE_MODEL_PATH, train_linear_model  # noqa: E402
+from src.nlp.preclean import should_skip_message  # noqa: E402
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+DEFAULT_LIMIT = 50_000
+# Whole-message triage only looks at the first 2000 chars (process_message)
+MAX_TEXT_CHARS = 2000
+
+LABELLED_MESSAGES_QUERY = """
+    SELECT m.content, 1 AS label
+    FROM discord_messages m
+    WHERE m.parse_status = 'ok'
+      AND EXISTS (SELECT 1 FROM discord_parsed_ideas i WHERE i.message_id = m.message_id)
+    ORDER BY m.created_at DESC
+    LIMIT :limit
+"""
+
+NOISE_MESSAGES_QUERY = """
+    SELECT m.content, 0 AS label
+    FROM discord_messages m
+    WHERE m.parse_status = 'noise'
+    ORDER BY m.created_at DESC
+    LIMIT :limit
+"""
+
+
+def load_training_data(limit: int = DEFAULT_LIMIT) -> Tuple[List[str], List[int]]:
+    """Labelled (text, label) pairs, at most `limit` of each class."""
+    texts: List[str] = []
+    labels: List[int] = []
+    for query in (LABELLED_MESSAGES_QUERY, NOISE_MESSAGES_QUERY):
+        for content, label in execute_sql(query, params={"limit": limit}, fetch_results=True) or []:
+            if not content or should_skip_message(content)[0]:
+                continue
+            texts.append(content[:MAX_TEXT_CHARS])
+            labels.append(int(label))
+    return texts, labels
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train the local triage model")
+    parser.add_argument(
+        "--limit", type=int, default=DEFAULT_LIMIT, help=f"Max messages per class (default: {DEFAULT_LIMIT})"
+    )
+    parser.add_argument(
+        "--target-precision",
+        type=float,
+        default=0.98,
+        help="Precision required for local accept/reject decisions (default: 0.98)",
+    )
+    parser.add_argument("--min-count", type=int, default=2, help="Minimum texts per word feature (default: 2)")
+    parser.add_argument(
+        "--output", type=Path, default=LOCAL_TRIAGE_MODEL_PATH, help=f"Model path (default: {LOCAL_TRIAGE_MODEL_PATH})"
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Train and report, don't write the model")
+    args = parser.parse_args()
+
+    texts, labels = load_training_data(args.limit)
+    positives = sum(labels)
+    logger.info(f"Loaded {len(texts)} labelled messages ({positives} actionable, {len(texts) - positives} noise)")
+    if positives == 0 or positives == len(texts):
+        logger.error("Need both actionable and noise examples to train")
+        sys.exit(1)
+
+    model = train_linear_model(
+        texts, labels, min_count=args.min_count, target_precision=args.target_precision
+    )
+    logger.info(
+        f"Trained on {model.trained_on} messages, {len(model.weights)} features: "
+        f"band=[{model.lower:.3f}, {model.upper:.3f}] "
+        f"holdout decided={model.metrics['holdout_decided']:.1%} "
+        f"accuracy={model.metrics['holdout_accuracy']:.1%} (n={model.metrics['holdout']})"
+    )
+
+    if args.dry_run:
+        logger.info("Dry run - model not written")
+        return
+    model.save(args.output)
+    logger.info(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
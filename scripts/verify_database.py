@@ -25,7 +25,7 @@ Examples:
     python scripts/verify_database.py --table orders           # Specific table
     python scripts/verify_database.py --mode basic             # Basic checks only
     python scripts/verify_database.py --verbose --json         # Detailed JSON output
-    python scripts/verify_database.py --performance            # Include index checks
+    python scripts/verify_database.py --performance            # Index + hot query plan checks
 """
 
 import sys
@@ -72,6 +72,49 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Hot per-symbol queries (mirroring chat, sentiment, orchestrator, stocks,
+# track record and positions) that must be index-served. EXPLAINed with
+# enable_seqscan off: a Seq Scan on a listed table in that plan means no usable
+# index exists for the predicate (see schema/081_upper_symbol_indexes.sql).
+HOT_SYMBOL_QUERIES: Dict[str, str] = {
+    "ideas_by_primary_symbol": (
+        "SELECT dpi.id FROM discord_parsed_ideas dpi "
+        "WHERE UPPER(dpi.primary_symbol) = :symbol"
+    ),
+    "ideas_by_any_symbol": (
+        "SELECT dpi.id FROM discord_parsed_ideas dpi "
+        "WHERE (UPPER(dpi.primary_symbol) = :symbol "
+        "OR dpi.symbols @> ARRAY[CAST(:symbol AS text)])"
+    ),
+    "ideas_with_messages_by_symbol": (
+        "SELECT dpi.id, dm.author FROM discord_parsed_ideas dpi "
+        "LEFT JOIN discord_messages dm ON dpi.message_id = dm.message_id "
+        "WHERE UPPER(dpi.primary_symbol) = :symbol"
+    ),
+    "orders_by_symbol": "SELECT o.brokerage_order_id FROM orders o WHERE UPPER(o.symbol) = :symbol",
+    "activities_by_symbol": "SELECT a.id FROM activities a WHERE UPPER(a.symbol) = :symbol",
+    "positions_by_symbol": "SELECT p.symbol FROM positions p WHERE UPPER(p.symbol) = :symbol",
+    "symbols_by_ticker": "SELECT ticker FROM symbols WHERE UPPER(ticker) = :symbol",
+}
+HOT_QUERY_TABLES = {
+    "discord_parsed_ideas",
+    "discord_messages",
+    "orders",
+    "activities",
+    "positions",
+    "symbols",
+}
+
+
+def find_seq_scans(plan: Dict[str, Any], tables: Set[str]) -> List[str]:
+    """Return the relations in `tables` that an EXPLAIN (FORMAT JSON) plan seq-scans."""
+    found = []
+    if plan.get("Node Type") == "Seq Scan" and plan.get("Relation Name") in tables:
+        found.append(plan["Relation Name"])
+    for child in plan.get("Plans", []):
+        found.extend(find_seq_scans(child, tables))
+    return found
+
 
 class DatabaseSchemaVerifier:
     """Comprehensive database schema verification using generated schemas."""
@@ -744,14 +787,58 @@ class DatabaseSchemaVerifier:
             }
 
         results["index_verification"] = index_results
+        results["query_plans"] = self.verify_query_plans()
+        seq_scan_queries = [
+            name for name, plan in results["query_plans"].items() if plan.get("seq_scans")
+        ]
+        failed_plan_queries = [
+            name for name, plan in results["query_plans"].items() if plan.get("failed")
+        ]
+
+        if seq_scan_queries or failed_plan_queries:
+            status = "failed"
+        elif missing_indexes:
+            status = "warning"
+        else:
+            status = "success"
         results["summary"] = {
-            "status": "success" if len(missing_indexes) == 0 else "warning",
+            "status": status,
             "missing_critical_indexes": missing_indexes,
+            "seq_scan_queries": seq_scan_queries,
+            "failed_plan_queries": failed_plan_queries,
             "tables_checked": len(index_results),
         }
 
         return results
 
+    def verify_query_plans(self, symbol: str = "AAPL") -> Dict[str, Any]:
+        """EXPLAIN each HOT_SYMBOL_QUERIES entry and report sequential scans."""
+        plans: Dict[str, Any] = {}
+        actual_tables = set(self.get_actual_tables())
+
+        for name, query in HOT_SYMBOL_QUERIES.items():
+            try:
+                with self.engine.begin() as conn:
+                    # Transaction-local; makes any remaining Seq Scan mean "no index"
+                    conn.execute(text("SET LOCAL enable_seqscan = off"))
+                    row = conn.execute(
+                        text(f"EXPLAIN (FORMAT JSON) {query}"), {"symbol": symbol}
+                    ).scalar()
+                plan_doc = json.loads(row) if isinstance(row, str) else row
+                seq_scans = find_seq_scans(
+                    plan_doc[0]["Plan"], HOT_QUERY_TABLES & actual_tables
+                )
+                plans[name] = {"seq_scans": seq_scans}
+                if self.verbose:
+                    status_symbol = "❌" if seq_scans else "✅"
+                    logger.info(f"  {status_symbol} {name}: seq scans={seq_scans or 'none'}")
+            except Exception as e:
+                logger.error(f"Error explaining {name}: {e}")
+                # A query that can't be explained (missing table/index/column) fails
+                plans[name] = {"seq_scans": [], "failed": True, "error": str(e)}
+
+        return plans
+
 
 def print_results(
     results: Dict[str, Any], verbose: bool = False, json_output: bool = False
@@ -919,6 +1006,20 @@ def print_performance_results(results: Dict[str, Any], verbose: bool):
     else:
         print(f"   ✅ All critical indexes found")
 
+    seq_scan_queries = summary.get("seq_scan_queries", [])
+    if seq_scan_queries:
+        print(f"   ❌ Hot Queries With Sequential Scans: {len(seq_scan_queries)}")
+        for name in seq_scan_queries:
+            tables = results["query_plans"][name]["seq_scans"]
+            print(f"      • {name} ({', '.join(tables)})")
+    failed_plan_queries = summary.get("failed_plan_queries", [])
+    if failed_plan_queries:
+        print(f"   ❌ Hot Queries That Failed To EXPLAIN: {len(failed_plan_queries)}")
+        for name in failed_plan_queries:
+            print(f"      • {name}: {results['query_plans'][name]['error']}")
+    if not seq_scan_queries and not failed_plan_queries and results.get("query_plans"):
+        print("   ✅ All hot symbol queries are index-served")
+
     if verbose:
         print(f"\n📊 DETAILED INDEX COVERAGE:")
         for table, idx_info in index_verification.items():
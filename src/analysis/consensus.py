@@ -8,6 +8,7 @@ Cost: ~$0.001-0.003 per analysis (one gpt-5-mini call).
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import datetime, timezone
 
@@ -105,6 +106,22 @@ def _should_escalate(signals: list[AnalystSignal]) -> bool:
     return max_spread > 0.6 and unique_signals >= 3
 
 
+def _deterministic_narrative(ticker: str, signals: list[AnalystSignal], verdict: str) -> str:
+    """Template summary used when the LLM is skipped or fails."""
+    bull_agents = [s.agent_id for s in signals if s.signal == "bullish"]
+    bear_agents = [s.agent_id for s in signals if s.signal == "bearish"]
+
+    parts = []
+    if bull_agents:
+        parts.append(f"Bullish signals from {', '.join(bull_agents)}.")
+    if bear_agents:
+        parts.append(f"Bearish signals from {', '.join(bear_agents)}.")
+    if not parts:
+        parts.append("Mixed signals across all agents.")
+
+    return (f"{ticker} consensus: {verdict}. " + " ".join(parts))[:500]
+
+
 def _generate_narrative(
     ticker: str,
     signals: list[AnalystSignal],
@@ -158,25 +175,14 @@ def _generate_narrative(
     except Exception:
         logger.warning("OpenAI narrative generation failed for %s, using fallback", ticker, exc_info=True)
         # Fallback: deterministic summary
-        bull_agents = [s.agent_id for s in signals if s.signal == "bullish"]
-        bear_agents = [s.agent_id for s in signals if s.signal == "bearish"]
-
-        parts = []
-        if bull_agents:
-            parts.append(f"Bullish signals from {', '.join(bull_agents)}.")
-        if bear_agents:
-            parts.append(f"Bearish signals from {', '.join(bear_agents)}.")
-        if not parts:
-            parts.append("Mixed signals across all agents.")
-
-        fallback_summary = f"{ticker} consensus: {verdict}. " + " ".join(parts)
-        return fallback_summary[:500], f"{model}-fallback"
+        return _deterministic_narrative(ticker, signals, verdict), f"{model}-fallback"
 
 
 async def run(
     ticker: str,
     signals: list[AnalystSignal],
     data_sources: list[str],
+    use_llm: bool = True,
 ) -> ConsensusReport:
     """Run consensus aggregation: deterministic scoring + LLM narrative.
 
@@ -184,12 +190,22 @@ async def run(
         ticker: Stock ticker symbol
         signals: List of AnalystSignal from all agents
         data_sources: List of data sources used
+        use_llm: False skips the OpenAI call and uses the template narrative
+            (model_used="deterministic"), e.g. once a batch job's LLM budget
+            is spent
 
     Returns:
         ConsensusReport with overall signal, score, and narrative
     """
     score, verdict = compute_deterministic_score(signals)
-    summary, model_used = _generate_narrative(ticker, signals, score, verdict)
+    if use_llm:
+        # Blocking OpenAI call: keep it off the event loop so concurrent
+        # analyses (e.g. the nightly warmup) actually overlap
+        summary, model_used = await asyncio.to_thread(
+            _generate_narrative, ticker, signals, score, verdict
+        )
+    else:
+        summary, model_used = _deterministic_narrative(ticker, signals, verdict), "deterministic"
 
     # Overall confidence: average of agent confidences weighted by agent weights
     total_conf_weighted = 0.0
@@ -0,0 +1,488 @@
+"""Incremental state for the technical agent's recursive indicators.
+
+EMA, Wilder RSI, MACD, ATR and ADX are all exponential recursions, so one new
+daily bar only needs the previous smoothed values — not the whole ~400-bar
+history. This module keeps that recursive state per symbol:
+
+- IndicatorPanel holds the state for N symbols and folds in one date row of
+  a date x symbol matrix per vectorised step (O(1) per indicator per bar,
+  whatever N). Each smoothing replays pandas' ``ewm(adjust=False)`` recursion
+  step for step (including min_periods and NaN handling), so every column
+  matches src/analysis/indicators.py run over that symbol's bars to float
+  rounding. compute_indicator_panel() adds Hurst for a full panel read-out.
+- IndicatorState is the single-symbol view used by technical.run.
+- technical_indicator_state (migration 082) persists one state per symbol.
+  refresh_indicator_states() advances the whole tracked universe as one panel
+  after the nightly OHLCV update; the orchestrator loads the state alongside
+  the bars and technical.run uses it when it lines up with the last bar,
+  falling back to a full recompute otherwise.
+
+Windowed statistics (SMA, Bollinger bands, rolling vol, Hurst) are not
+recursive and are still computed from the bars.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Bump when the indicator set or parameters change; stored states with another
+# version are ignored (full recompute) and reseeded by the next refresh.
+STATE_VERSION = 1
+
+EMA_PERIODS = (8, 21, 55)
+MACD_FAST, MACD_SLOW, MACD_SIGNAL = 12, 26, 9
+RSI_PERIODS = (14, 28)
+ATR_PERIOD = 14  # also the ADX period
+
+# Seed window for symbols without a state — matches the orchestrator's
+# OHLCV lookback so a fresh state equals what technical.run would recompute.
+SEED_LOOKBACK_DAYS = 400
+
+
+@dataclass
+class _Ewm:
+    """pandas ``ewm(alpha=..., adjust=False).mean()`` advanced one row at a time.
+
+    Holds the recursion for N columns at once; each column behaves exactly
+    like the pandas kernel (adjust=False, ignore_na=False) run on that
+    column's own series.
+    """
+
+    alpha: float
+    min_periods: int
+    weighted: np.ndarray
+    old_wt: np.ndarray
+    nobs: np.ndarray
+
+    @classmethod
+    def empty(cls, alpha: float, min_periods: int, n: int) -> _Ewm:
+        return cls(alpha, min_periods, np.full(n, np.nan), np.ones(n), np.zeros(n, dtype=np.int64))
+
+    def update(self, values: np.ndarray, rows: np.ndarray) -> None:
+        """Feed ``values`` to the columns in ``rows`` (others are untouched)."""
+        is_observation = rows & ~np.isnan(values)
+        started = rows & ~np.isnan(self.weighted)
+        old_wt = np.where(started, self.old_wt * (1.0 - self.alpha), self.old_wt)
+        blend = started & is_observation
+        with np.errstate(invalid="ignore"):
+            mixed = (old_wt * self.weighted + self.alpha * values) / (old_wt + self.alpha)
+        # pandas skips the blend when the value equals the average (exactness)
+        weighted = np.where(blend & (self.weighted != values), mixed, self.weighted)
+        weighted = np.where(is_observation & ~started, values, weighted)
+
+        self.weighted = weighted
+        self.old_wt = np.where(blend, 1.0, old_wt)
+        self.nobs = self.nobs + is_observation
+
+    @property
+    def value(self) -> np.ndarray:
+        return np.where(self.nobs >= max(self.min_periods, 1), self.weighted, np.nan)
+
+    def take(self, columns) -> _Ewm:
+        return _Ewm(
+            self.alpha,
+            self.min_periods,
+            self.weighted[columns],
+            self.old_wt[columns],
+            self.nobs[columns],
+        )
+
+
+def _new_smoothings(n: int) -> dict[str, _Ewm]:
+    wilder = 1.0 / ATR_PERIOD
+    smoothings = {
+        f"ema_{p}": _Ewm.empty(2.0 / (p + 1), 0, n) for p in (*EMA_PERIODS, MACD_FAST, MACD_SLOW)
+    }
+    smoothings["macd_signal"] = _Ewm.empty(2.0 / (MACD_SIGNAL + 1), 0, n)
+    for p in RSI_PERIODS:
+        smoothings[f"rsi_{p}_gain"] = _Ewm.empty(1.0 / p, p, n)
+        smoothings[f"rsi_{p}_loss"] = _Ewm.empty(1.0 / p, p, n)
+    for name in ("atr", "plus_dm", "minus_dm", "adx"):
+        smoothings[name] = _Ewm.empty(wilder, ATR_PERIOD, n)
+    return smoothings
+
+
+class IndicatorPanel:
+    """Recursive indicator state for N symbols, advanced one date row at a time.
+
+    The panel API behind both the per-symbol IndicatorState and the nightly
+    refresh: feeding a date x symbol matrix costs one vectorised step per
+    date, whatever the number of symbols. A NaN close means "no bar for this
+    symbol on this date" and leaves that column untouched, so every column
+    ends up identical to folding in its own bars alone.
+    """
+
+    def __init__(self, symbols: list[str]):
+        n = len(symbols)
+        self.symbols = list(symbols)
+        self.as_of = np.full(n, np.datetime64("NaT"), dtype="datetime64[D]")
+        self.bars = np.zeros(n, dtype=np.int64)
+        self.high = np.full(n, np.nan)
+        self.low = np.full(n, np.nan)
+        self.close = np.full(n, np.nan)
+        self.smoothings = _new_smoothings(n)
+
+    def update(self, bar_date, high: np.ndarray, low: np.ndarray, close: np.ndarray) -> None:
+        """Fold in one date's bars; columns with no bar, or already past
+        ``bar_date``, are skipped."""
+        day = np.datetime64(str(bar_date)[:10], "D")
+        rows = ~np.isnan(close) & ~(self.as_of >= day)
+        if not rows.any():
+            return
+        s = self.smoothings
+        first = self.bars == 0
+
+        for p in (*EMA_PERIODS, MACD_FAST, MACD_SLOW):
+            s[f"ema_{p}"].update(close, rows)
+        s["macd_signal"].update(s[f"ema_{MACD_FAST}"].value - s[f"ema_{MACD_SLOW}"].value, rows)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            # First bar: diff() is NaN, which the indicators map to a 0 gain/loss/DM
+            delta = np.where(first, np.nan, close - self.close)
+            gain = np.where(delta > 0, delta, 0.0)
+            loss = np.where(delta < 0, -delta, 0.0)
+            for p in RSI_PERIODS:
+                s[f"rsi_{p}_gain"].update(gain, rows)
+                s[f"rsi_{p}_loss"].update(loss, rows)
+
+            true_range = np.where(
+                first,
+                high - low,
+                np.maximum.reduce([high - low, np.abs(high - self.close), np.abs(low - self.close)]),
+            )
+            s["atr"].update(true_range, rows)
+
+            up_move = np.where(first, np.nan, high - self.high)
+            down_move = np.where(first, np.nan, self.low - low)
+            s["plus_dm"].update(np.where((up_move > down_move) & (up_move > 0), up_move, 0.0), rows)
+            s["minus_dm"].update(np.where((down_move > up_move) & (down_move > 0), down_move, 0.0), rows)
+            di_plus = 100.0 * s["plus_dm"].value / s["atr"].value
+            di_minus = 100.0 * s["minus_dm"].value / s["atr"].value
+            di_sum = di_plus + di_minus
+            s["adx"].update(np.abs(di_plus - di_minus) / np.where(di_sum == 0, np.nan, di_sum) * 100.0, rows)
+
+        self.as_of = np.where(rows, day, self.as_of)
+        self.bars = self.bars + rows
+        self.high = np.where(rows, high, self.high)
+        self.low = np.where(rows, low, self.low)
+        self.close = np.where(rows, close, self.close)
+
+    def advance(self, dates, high: np.ndarray, low: np.ndarray, close: np.ndarray) -> IndicatorPanel:
+        """Fold in ``(T, N)`` bar matrices over ascending ``dates`` (in place)."""
+        for t, bar_date in enumerate(dates):
+            self.update(bar_date, high[t], low[t], close[t])
+        return self
+
+    def indicators(self) -> dict[str, np.ndarray]:
+        """Latest values per column, NaN where an indicator has no value yet."""
+        s = self.smoothings
+        macd = s[f"ema_{MACD_FAST}"].value - s[f"ema_{MACD_SLOW}"].value
+        values = {f"ema_{p}": s[f"ema_{p}"].value for p in EMA_PERIODS}
+        with np.errstate(invalid="ignore", divide="ignore"):
+            for p in RSI_PERIODS:
+                rs = s[f"rsi_{p}_gain"].value / s[f"rsi_{p}_loss"].value
+                values[f"rsi_{p}"] = np.clip(100.0 - 100.0 / (1.0 + rs), 0.0, 100.0)
+        values.update(
+            {
+                "macd": macd,
+                "macd_signal": s["macd_signal"].value,
+                "macd_histogram": macd - s["macd_signal"].value,
+                "atr": s["atr"].value,
+                "adx": np.clip(s["adx"].value, 0.0, 100.0),
+            }
+        )
+        return values
+
+    # -- per-symbol views ---------------------------------------------------
+
+    def take(self, columns, symbols: list[str]) -> IndicatorPanel:
+        panel = IndicatorPanel.__new__(IndicatorPanel)
+        panel.symbols = list(symbols)
+        panel.as_of = self.as_of[columns]
+        panel.bars = self.bars[columns]
+        panel.high, panel.low, panel.close = self.high[columns], self.low[columns], self.close[columns]
+        panel.smoothings = {name: ewm.take(columns) for name, ewm in self.smoothings.items()}
+        return panel
+
+    def states(self) -> dict[str, IndicatorState]:
+        """One IndicatorState per symbol that has seen at least one bar."""
+        return {
+            symbol: IndicatorState(self.take([j], [symbol]))
+            for j, symbol in enumerate(self.symbols)
+            if self.bars[j] > 0
+        }
+
+    @classmethod
+    def from_states(cls, states: dict[str, IndicatorState]) -> IndicatorPanel:
+        """Stack per-symbol states into one panel (columns in dict order)."""
+        panel = cls(list(states))
+        if not states:
+            return panel
+        parts = [state._panel for state in states.values()]
+        panel.as_of = np.concatenate([p.as_of for p in parts])
+        panel.bars = np.concatenate([p.bars for p in parts])
+        panel.high = np.concatenate([p.high for p in parts])
+        panel.low = np.concatenate([p.low for p in parts])
+        panel.close = np.concatenate([p.close for p in parts])
+        for name, ewm in panel.smoothings.items():
+            ewm.weighted = np.concatenate([p.smoothings[name].weighted for p in parts])
+            ewm.old_wt = np.concatenate([p.smoothings[name].old_wt for p in parts])
+            ewm.nobs = np.concatenate([p.smoothings[name].nobs for p in parts])
+        return panel
+
+
+class IndicatorState:
+    """Recursive indicator state of one symbol after every bar up to ``as_of``."""
+
+    def __init__(self, panel: IndicatorPanel | None = None):
+        self._panel = panel if panel is not None else IndicatorPanel([""])
+
+    @property
+    def as_of(self) -> str | None:
+        as_of = self._panel.as_of[0]
+        return None if np.isnat(as_of) else str(as_of)
+
+    @property
+    def bars(self) -> int:
+        return int(self._panel.bars[0])
+
+    @property
+    def close(self) -> float:
+        return float(self._panel.close[0])
+
+    def update(self, bar_date: str, high: float, low: float, close: float) -> None:
+        """Fold in the next daily bar."""
+        self._panel.update(bar_date, np.array([high]), np.array([low]), np.array([close]))
+
+    def indicators(self) -> dict[str, float]:
+        """Latest values, NaN where the indicator has no value yet."""
+        return {name: float(values[0]) for name, values in self._panel.indicators().items()}
+
+    # -- serialisation (technical_indicator_state.state / AnalysisInput) ------
+
+    def to_dict(self) -> dict[str, Any]:
+        p = self._panel
+        return {
+            "version": STATE_VERSION,
+            "as_of": self.as_of,
+            "bars": self.bars,
+            "last": [float(p.high[0]), float(p.low[0]), float(p.close[0])],
+            "smoothings": {
+                name: [float(ewm.weighted[0]), float(ewm.old_wt[0]), int(ewm.nobs[0])]
+                for name, ewm in p.smoothings.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> IndicatorState | None:
+        """Rebuild a stored state; None if it is from another STATE_VERSION."""
+        if not data or data.get("version") != STATE_VERSION:
+            return None
+        panel = IndicatorPanel([""])
+        if data["as_of"]:
+            panel.as_of[0] = np.datetime64(data["as_of"], "D")
+        panel.bars[0] = int(data["bars"])
+        panel.high[0], panel.low[0], panel.close[0] = (_float(v) for v in data["last"])
+        for name, (weighted, old_wt, nobs) in data["smoothings"].items():
+            ewm = panel.smoothings[name]
+            ewm.weighted[0], ewm.old_wt[0], ewm.nobs[0] = _float(weighted), float(old_wt), int(nobs)
+        return cls(panel)
+
+
+def _float(value) -> float:
+    # json.dumps writes NaN; Postgres jsonb can't store it, so it is saved as null
+    return math.nan if value is None else float(value)
+
+
+def seed_state(dates, highs, lows, closes) -> IndicatorState:
+    """Fold a full bar history (ascending) into a fresh state."""
+    state = IndicatorState()
+    advance_state(state, dates, highs, lows, closes)
+    return state
+
+
+def advance_state(state: IndicatorState, dates, highs, lows, closes) -> IndicatorState:
+    """Fold bars dated after ``state.as_of`` into ``state`` (in place)."""
+    as_column = lambda values: np.asarray(values, dtype=float)[:, None]  # noqa: E731
+    state._panel.advance(list(dates), as_column(highs), as_column(lows), as_column(closes))
+    return state
+
+
+def compute_indicator_panel(price_panel, max_lag: int = 20) -> dict[str, np.ndarray]:
+    """Latest RSI, EMA, MACD, ATR, ADX and Hurst for every symbol of a PricePanel.
+
+    One vectorised pass over the date x symbol matrices; each column equals
+    running the single-series indicators in indicators.py on that symbol's
+    own bars. Returns ``{indicator: (N,) array}`` in ``price_panel.symbols``
+    order.
+    """
+    from src.analysis.indicators import calculate_hurst_exponent_panel
+
+    panel = IndicatorPanel(price_panel.symbols).advance(
+        price_panel.dates, price_panel.high, price_panel.low, price_panel.close
+    )
+    values = panel.indicators()
+    values["hurst_exponent"] = calculate_hurst_exponent_panel(
+        price_panel.to_frame("close"), max_lag=max_lag
+    ).to_numpy()
+    return values
+
+
+# ---------------------------------------------------------------------------
+# Persistence
+# ---------------------------------------------------------------------------
+
+
+def _json_safe(state: IndicatorState) -> str:
+    data = state.to_dict()
+    data["last"] = [None if math.isnan(v) else v for v in data["last"]]
+    data["smoothings"] = {
+        name: [None if math.isnan(w) else w, old_wt, nobs]
+        for name, (w, old_wt, nobs) in data["smoothings"].items()
+    }
+    return json.dumps(data)
+
+
+def load_indicator_states(symbols: list[str]) -> dict[str, dict[str, Any]]:
+    """Stored state dicts for ``symbols`` in one query (missing symbols omitted)."""
+    from src.db import execute_sql
+
+    symbols = sorted({s.upper().strip() for s in symbols if s})
+    if not symbols:
+        return {}
+    rows = execute_sql(
+        """
+        SELECT symbol, state
+        FROM technical_indicator_state
+        WHERE symbol = ANY(:symbols)
+        """,
+        params={"symbols": symbols},
+        fetch_results=True,
+    )
+    states: dict[str, dict[str, Any]] = {}
+    for row in rows or []:
+        m = row._mapping if hasattr(row, "_mapping") else row
+        state = m["state"]
+        states[m["symbol"]] = json.loads(state) if isinstance(state, str) else state
+    return states
+
+
+def save_indicator_states(states: dict[str, IndicatorState]) -> int:
+    """Upsert states (one executemany round trip). Returns rows written."""
+    from src.db import execute_sql
+
+    rows = [
+        {"symbol": symbol, "as_of": state.as_of, "state": _json_safe(state)}
+        for symbol, state in states.items()
+        if state.as_of is not None
+    ]
+    if not rows:
+        return 0
+    execute_sql(
+        """
+        INSERT INTO technical_indicator_state (symbol, as_of, state, updated_at)
+        VALUES (:symbol, CAST(:as_of AS date), CAST(:state AS jsonb), NOW())
+        ON CONFLICT (symbol) DO UPDATE SET
+            as_of = EXCLUDED.as_of,
+            state = EXCLUDED.state,
+            updated_at = NOW()
+        """,
+        params=rows,
+    )
+    return len(rows)
+
+
+def _tracked_symbols() -> list[str]:
+    """Symbols worth keeping warm: holdings, analysed tickers, existing states."""
+    from src.db import execute_sql
+
+    rows = execute_sql(
+        """
+        SELECT UPPER(symbol) AS symbol FROM positions WHERE quantity > 0
+        UNION
+        SELECT UPPER(ticker) FROM stock_analysis_cache
+        UNION
+        SELECT symbol FROM technical_indicator_state
+        """,
+        fetch_results=True,
+    )
+    return sorted({(r._mapping if hasattr(r, "_mapping") else r)["symbol"] for r in rows or []})
+
+
+def _price_matrices(prices, symbols: list[str]):
+    """(dates, high, low, close) from a PricePanel, columns in ``symbols`` order."""
+    columns = {symbol: j for j, symbol in enumerate(prices.symbols)}
+    index = np.array([columns.get(symbol, -1) for symbol in symbols], dtype=np.int64)
+    present = index >= 0
+
+    def pick(matrix: np.ndarray) -> np.ndarray:
+        out = np.full((len(prices.dates), len(symbols)), np.nan)
+        out[:, present] = matrix[:, index[present]]
+        return out
+
+    return prices.dates, pick(prices.high), pick(prices.low), pick(prices.close)
+
+
+def refresh_indicator_states(symbols: list[str] | None = None) -> int:
+    """Advance stored states through the latest OHLCV bars (nightly).
+
+    One vectorised job for the whole tracked universe: symbols with a usable
+    state are stacked into an IndicatorPanel, fed one price panel starting at
+    their oldest ``as_of`` and advanced together. Symbols without a state —
+    or whose ``as_of`` bar no longer matches the stored close (backfill
+    restatement) — are reseeded together from SEED_LOOKBACK_DAYS of history.
+
+    Returns:
+        Number of states written.
+    """
+    from src.price_service import get_price_panel
+
+    symbols = sorted({s.upper().strip() for s in (symbols or _tracked_symbols()) if s})
+    if not symbols:
+        return 0
+
+    stored = {
+        symbol: state
+        for symbol, data in load_indicator_states(symbols).items()
+        if (state := IndicatorState.from_dict(data)) is not None and state.as_of
+    }
+    today = date.today()
+    updated: dict[str, IndicatorState] = {}
+
+    if stored:
+        panel = IndicatorPanel.from_states(stored)
+        dates, high, low, close = _price_matrices(
+            get_price_panel(panel.symbols, panel.as_of.min().astype(date), today), panel.symbols
+        )
+        if len(dates):
+            # The bar each state ends on must still be there, unchanged
+            row = np.minimum(np.searchsorted(dates, panel.as_of), len(dates) - 1)
+            anchor_close = close[row, np.arange(len(panel.symbols))]
+            usable = (dates[row] == panel.as_of) & np.isclose(anchor_close, panel.close)
+            panel.advance(dates, high, low, close)
+            keep = np.flatnonzero(usable)
+            updated = panel.take(keep, [panel.symbols[j] for j in keep]).states()
+
+    advanced = len(updated)
+    reseed = [s for s in symbols if s not in updated]
+    if reseed:
+        prices = get_price_panel(reseed, today - timedelta(days=SEED_LOOKBACK_DAYS), today)
+        updated.update(IndicatorPanel(reseed).advance(*_price_matrices(prices, reseed)).states())
+
+    written = save_indicator_states(updated)
+    logger.info(
+        "Indicator states: %d advanced, %d reseeded, %d written",
+        advanced,
+        len(updated) - advanced,
+        written,
+    )
+    return written
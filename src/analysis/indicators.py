@@ -182,6 +182,48 @@ def calculate_adx(
 # ---------------------------------------------------------------------------
 
 
+def _hurst_slopes(values: np.ndarray, max_lag: int) -> np.ndarray:
+    """R/S Hurst estimate for each column of an ``(n, k)`` gap-free matrix.
+
+    For every lag the first ``n // lag * lag`` rows are reshaped into
+    ``(chunks, lag, k)`` blocks, so each lag is a handful of array ops instead
+    of a Python loop over chunks.
+    """
+    n, k = values.shape
+    lags = np.arange(2, max_lag + 1)
+    log_rs = np.full((len(lags), k), np.nan)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for i, lag in enumerate(lags):
+            # Non-overlapping chunks of length `lag`
+            chunks = values[: n // lag * lag].reshape(-1, lag, k)
+            deviations = chunks - chunks.mean(axis=1, keepdims=True)
+            cumulative = np.cumsum(deviations, axis=1)
+            r = cumulative.max(axis=1) - cumulative.min(axis=1)
+            s = chunks.std(axis=1, ddof=1)
+            rs = np.where(s > 0, r / s, np.nan)
+            # Mean R/S over chunks with non-zero dispersion (NaN if none)
+            counts = (s > 0).sum(axis=0)
+            log_rs[i] = np.log(np.where(counts > 0, np.nansum(rs, axis=0) / counts, np.nan))
+
+    # Log-log OLS slope of log(R/S) on log(lag), over finite points per column
+    log_lags = np.log(lags.astype(float))[:, None]
+    valid = np.isfinite(log_rs)
+    m = valid.sum(axis=0)
+    x = np.where(valid, log_lags, 0.0)
+    y = np.where(valid, log_rs, 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_mean = x.sum(axis=0) / m
+        y_mean = y.sum(axis=0) / m
+        sxx = (np.where(valid, x - x_mean, 0.0) ** 2).sum(axis=0)
+        sxy = (np.where(valid, (x - x_mean) * (y - y_mean), 0.0)).sum(axis=0)
+        slope = sxy / sxx
+
+    slope = np.where((m >= 2) & np.isfinite(slope), slope, 0.5)
+    # Clamp to [0, 1]
+    return np.clip(slope, 0.0, 1.0)
+
+
 def calculate_hurst_exponent(series: pd.Series, max_lag: int = 20) -> float:
     """Hurst exponent via the Rescaled Range (R/S) method.
 
@@ -191,48 +233,30 @@ def calculate_hurst_exponent(series: pd.Series, max_lag: int = 20) -> float:
 
     Returns 0.5 if the series has insufficient data for a meaningful estimate.
     """
-    vals = series.dropna().values
-    n = len(vals)
+    vals = series.dropna().to_numpy(dtype=float)
 
-    if n < max_lag + 2:
+    if len(vals) < max_lag + 2:
         return 0.5
 
-    lags = range(2, max_lag + 1)
-    rs_values = []
-
-    for lag in lags:
-        # Partition into non-overlapping chunks of length `lag`
-        chunks = [vals[i : i + lag] for i in range(0, n - lag + 1, lag)]
-        rs_chunk = []
-        for chunk in chunks:
-            if len(chunk) < 2:
-                continue
-            mean_c = np.mean(chunk)
-            deviations = chunk - mean_c
-            cumulative = np.cumsum(deviations)
-            r = np.max(cumulative) - np.min(cumulative)
-            s = np.std(chunk, ddof=1)
-            if s > 0:
-                rs_chunk.append(r / s)
-        if rs_chunk:
-            rs_values.append(np.mean(rs_chunk))
-        else:
-            rs_values.append(np.nan)
-
-    # Log-log regression: log(R/S) vs log(lag)
-    log_lags = np.log(np.array(list(lags), dtype=float))
-    log_rs = np.log(np.array(rs_values, dtype=float))
-
-    # Filter out NaN / inf
-    valid = np.isfinite(log_lags) & np.isfinite(log_rs)
-    if valid.sum() < 2:
-        return 0.5
+    return float(_hurst_slopes(vals[:, None], max_lag)[0])
 
-    log_lags = log_lags[valid]
-    log_rs = log_rs[valid]
 
-    # OLS slope
-    slope, _ = np.polyfit(log_lags, log_rs, 1)
+def calculate_hurst_exponent_panel(frame: pd.DataFrame, max_lag: int = 20) -> pd.Series:
+    """Hurst exponent for every column of a date x symbol frame.
 
-    # Clamp to [0, 1]
-    return float(np.clip(slope, 0.0, 1.0))
+    Each column is treated like ``calculate_hurst_exponent(frame[col])``:
+    missing cells are dropped first, and columns with too little data get
+    0.5. Columns with the same number of observations are estimated together.
+    """
+    values = frame.to_numpy(dtype=float)
+    present = ~np.isnan(values)
+    counts = present.sum(axis=0)
+    # Stable sort moves each column's observations to the top, in date order
+    order = np.argsort(~present, axis=0, kind="stable")
+    compact = np.take_along_axis(values, order, axis=0)
+
+    result = np.full(values.shape[1], 0.5)
+    for n in np.unique(counts[counts >= max_lag + 2]):
+        cols = np.flatnonzero(counts == n)
+        result[cols] = _hurst_slopes(compact[:n, cols], max_lag)
+    return pd.Series(result, index=frame.columns)
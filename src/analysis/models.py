@@ -71,6 +71,8 @@ class AnalysisInput(BaseModel):
     ideas: list[IdeaData] = Field(default_factory=list)
     news: list[NewsItem] = Field(default_factory=list)
     portfolio_value: float = 0.0
+    # Stored IndicatorState.to_dict() for the ticker (technical agent fast path)
+    indicator_state: dict[str, Any] | None = None
 
 
 # ---------------------------------------------------------------------------
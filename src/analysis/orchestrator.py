@@ -1,8 +1,8 @@
 """Analysis orchestrator — data assembly, caching, and agent dispatch.
 
 Coordinates the multi-agent analysis pipeline:
-1. Check cache -> return if fresh
-2. Assemble AnalysisInput from multiple data sources
+1. Check cache (in-process tier, then Postgres) -> return if fresh
+2. Assemble AnalysisInput from multiple data sources (fetched concurrently)
 3. Run 5 agents in parallel via asyncio.gather
 4. Run consensus aggregator
 5. Cache and return result
@@ -16,7 +16,12 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import math
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from functools import partial
 
 from src.analysis import technical, fundamental, valuation, sentiment, risk
 from src.analysis.consensus import run as consensus_run
@@ -29,7 +34,9 @@ from src.analysis.models import (
     PortfolioRiskReport,
     PositionData,
 )
-from src.analysis.risk import compute_portfolio_risk
+from src.analysis.indicator_state import load_indicator_states
+from src.analysis.result_cache import ResultMemoryCache
+from src.analysis.risk import compute_portfolio_risk, compute_portfolio_risk_from_panel
 from src.db import execute_sql
 
 logger = logging.getLogger(__name__)
@@ -40,6 +47,122 @@ CRYPTO_TTL_HOURS = 1
 PORTFOLIO_RISK_TTL_HOURS = 2
 
 
+class _SingleFlight:
+    """Keyed registry of in-flight asyncio tasks.
+
+    The first caller for a key starts the task; concurrent callers for the
+    same key get that task back instead of starting a duplicate. Entries are
+    dropped when the task finishes, so the next stale read starts a fresh run.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._tasks: dict[tuple, asyncio.Task] = {}
+        self.started = 0
+        self.coalesced = 0
+
+    def run(self, key: tuple, factory) -> asyncio.Task:
+        task = self._tasks.get(key)
+        if task is not None and not task.done():
+            self.coalesced += 1
+            logger.debug("Coalesced %s request for %s", self.name, key)
+            return task
+
+        task = asyncio.create_task(factory())
+        self._tasks[key] = task
+        self.started += 1
+
+        def _forget(done: asyncio.Task, key: tuple = key) -> None:
+            if self._tasks.get(key) is done:
+                del self._tasks[key]
+            # Awaiters re-raise the error; mark it retrieved for the
+            # fire-and-forget case so asyncio doesn't warn.
+            if not done.cancelled():
+                done.exception()
+
+        task.add_done_callback(_forget)
+        return task
+
+    async def await_(self, key: tuple, factory):
+        # shield: a caller that is cancelled (client went away) must not
+        # cancel the computation other callers are waiting on.
+        return await asyncio.shield(self.run(key, factory))
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "in_flight": sum(1 for task in self._tasks.values() if not task.done()),
+            "started": self.started,
+            "coalesced": self.coalesced,
+        }
+
+
+_analysis_flights = _SingleFlight("stock analysis")
+_portfolio_risk_flights = _SingleFlight("portfolio risk")
+
+
+# In-process tier in front of stock_analysis_cache / portfolio_risk_cache.
+# Keys mirror the table keys: (TICKER, analysis_type, bucket) and (bucket,).
+_analysis_memory = ResultMemoryCache()
+_portfolio_risk_memory = ResultMemoryCache()
+
+
+def get_analysis_cache_stats() -> dict[str, dict]:
+    """Hit/miss/eviction counters of the in-process analysis and risk tiers."""
+    return {
+        "stock_analysis": _analysis_memory.stats(),
+        "portfolio_risk": _portfolio_risk_memory.stats(),
+    }
+
+
+def invalidate_analysis_cache(tickers: list[str] | None = None) -> int:
+    """Expire cached stock analyses for ``tickers`` (all when None).
+
+    Called when inputs change: positions via the SnapTrade webhook, OHLCV via
+    the nightly pipeline. Drops the in-process entries and marks the matching
+    stock_analysis_cache rows expired, so every process serves them stale and
+    refreshes (other processes re-read the DB within their memory-tier TTL).
+    Returns the number of in-memory entries dropped.
+    """
+    symbols = sorted({t.upper() for t in tickers}) if tickers is not None else None
+    if symbols == []:
+        return 0
+    dropped = _analysis_memory.invalidate(
+        None if symbols is None else (lambda key: key[0] in symbols)
+    )
+    try:
+        ticker_clause = " AND ticker = ANY(:tickers)" if symbols is not None else ""
+        execute_sql(
+            f"""
+            UPDATE stock_analysis_cache SET expires_at = NOW()
+            WHERE expires_at > NOW(){ticker_clause}
+            """,
+            params={"tickers": symbols} if symbols is not None else None,
+        )
+    except Exception:
+        logger.warning("Failed to expire stock_analysis_cache rows", exc_info=True)
+    return dropped
+
+
+def invalidate_portfolio_risk_cache() -> int:
+    """Expire cached portfolio risk for every bucket (see invalidate_analysis_cache)."""
+    dropped = _portfolio_risk_memory.invalidate()
+    try:
+        execute_sql(
+            "UPDATE portfolio_risk_cache SET expires_at = NOW() WHERE expires_at > NOW()"
+        )
+    except Exception:
+        logger.warning("Failed to expire portfolio_risk_cache rows", exc_info=True)
+    return dropped
+
+
+def get_singleflight_stats() -> dict[str, dict[str, int]]:
+    """Started / coalesced / in-flight counters for the refresh registries."""
+    return {
+        "stock_analysis": _analysis_flights.stats(),
+        "portfolio_risk": _portfolio_risk_flights.stats(),
+    }
+
+
 def _assemble_ideas(idea_rows) -> list[IdeaData]:
     """Build IdeaData objects from idea query rows (carrying stable author_id)."""
     ideas: list[IdeaData] = []
@@ -79,18 +202,23 @@ def _check_cache(
     Returns dict with keys ``result`` (parsed) and ``is_fresh`` (bool),
     or *None* if no cache row exists for (ticker, analysis_type, bucket).
     Bucket defaults to 'all' to match the cache row that get_stock_analysis
-    writes when no filter is active.
+    writes when no filter is active. A DB read also stamps last_viewed_at,
+    which the nightly warmup uses to pick recently viewed analyses.
     """
     cache_bucket = bucket if bucket else "all"
+    memory_key = (ticker.upper(), analysis_type, cache_bucket)
+    cached = _analysis_memory.get(memory_key)
+    if cached is not None:
+        return cached
+
     rows = execute_sql(
         """
-        SELECT result, agent_signals, expires_at
-        FROM stock_analysis_cache
+        UPDATE stock_analysis_cache
+        SET last_viewed_at = NOW()
         WHERE ticker = :ticker
           AND analysis_type = :analysis_type
           AND bucket = :bucket
-        ORDER BY computed_at DESC
-        LIMIT 1
+        RETURNING result, agent_signals, expires_at
         """,
         params={
             "ticker": ticker.upper(),
@@ -117,210 +245,500 @@ def _check_cache(
     if isinstance(result, str):
         result = json.loads(result)
 
+    _analysis_memory.put(memory_key, result, expires_at)
     return {"result": result, "is_fresh": is_fresh}
 
 
-def _assemble_input(
-    ticker: str,
-    bucket: str | None = None,
-) -> tuple[AnalysisInput, list[str]]:
-    """Assemble AnalysisInput from multiple data sources.
+# ---------------------------------------------------------------------------
+# Input assembly
+# ---------------------------------------------------------------------------
+
+# ~400 calendar days gives enough trading bars for a 200-day SMA and the
+# other indicators.
+OHLCV_LOOKBACK_DAYS = 400
+# Thread pool cap for per-ticker fundamentals/news calls in batch assembly
+ASSEMBLY_MAX_WORKERS = 8
+# Per-source deadline for a single analysis. A source that misses it is
+# dropped from the input (the agents already handle missing data) instead of
+# holding up the whole analysis. External APIs get longer than DB reads.
+ANALYSIS_SOURCE_TIMEOUT = float(os.getenv("ANALYSIS_SOURCE_TIMEOUT", "10"))
+ANALYSIS_EXTERNAL_TIMEOUT = float(os.getenv("ANALYSIS_EXTERNAL_TIMEOUT", "20"))
+# Dedicated pool for _assemble_input fetches. Threads can't be cancelled, so a
+# timed-out fetch keeps its worker until it returns; keeping these off the
+# default executor means hung upstreams can't starve asyncio.to_thread users.
+ANALYSIS_FETCH_MAX_WORKERS = int(os.getenv("ANALYSIS_FETCH_MAX_WORKERS", "16"))
+_fetch_executor = ThreadPoolExecutor(
+    max_workers=ANALYSIS_FETCH_MAX_WORKERS, thread_name_prefix="analysis-fetch"
+)
 
-    Stock-wide data (OHLCV, fundamentals, news, ideas) ignores bucket.
-    Bucket-scoped data (current position, portfolio value) filters by the
-    accounts.bucket column when a bucket is provided — so e.g. running
-    analysis on AAPL under bucket=day sees only the position you hold in
-    day-trading accounts, not your long-term holdings.
+_IDEA_COLUMNS = """
+    dpi.direction, dpi.confidence, dpi.labels, dpi.idea_text,
+    dm.created_at, dm.author, dm.author_id
+"""
 
-    Returns ``(AnalysisInput, data_sources_list)``.
-    """
-    data_sources: list[str] = []
-    ohlcv_bars: list[OHLCVBar] = []
-    fundamentals_data: dict | None = None
-    position_data: PositionData | None = None
-    ideas_list: list[IdeaData] = []
-    news_list: list[NewsItem] = []
-    portfolio_value = 0.0
+_POSITION_AGGREGATES = """
+    SUM(p.quantity)                                            AS quantity,
+    CASE WHEN SUM(p.quantity) > 0
+        THEN SUM(p.quantity * p.average_buy_price) / SUM(p.quantity)
+        ELSE 0
+    END                                                         AS avg_cost,
+    AVG(COALESCE(p.current_price, p.price))                     AS current_price,
+    SUM(p.quantity * COALESCE(p.current_price, p.price))        AS market_value
+"""
 
-    ticker_upper = ticker.upper()
 
-    # 1. OHLCV data
-    # get_ohlcv REQUIRES (ticker, start, end) and returns a DataFrame with
-    # capitalized OHLCV columns and the trade date as a DatetimeIndex. The old
-    # code called get_ohlcv(ticker) with no dates (-> TypeError, swallowed) and
-    # read lowercase columns, so EVERY analysis got zero bars and technical /
-    # risk always reported "insufficient OHLCV data". ~400 calendar days gives
-    # enough trading bars for a 200-day SMA and the other indicators.
-    if not _is_crypto(ticker_upper):
-        try:
-            from datetime import date, timedelta
+def _row_mapping(row):
+    return row._mapping if hasattr(row, "_mapping") else row
 
-            from src.price_service import get_ohlcv
-
-            df = get_ohlcv(ticker_upper, date.today() - timedelta(days=400), date.today())
-            if df is not None and not df.empty:
-                for idx, row in df.iterrows():
-                    ohlcv_bars.append(
-                        OHLCVBar(
-                            date=idx.date().isoformat(),
-                            open=float(row["Open"]),
-                            high=float(row["High"]),
-                            low=float(row["Low"]),
-                            close=float(row["Close"]),
-                            volume=float(row["Volume"]),
-                        )
-                    )
-                data_sources.append(f"Databento OHLCV ({len(ohlcv_bars)} days)")
-        except Exception:
-            logger.warning("Failed to fetch OHLCV for %s", ticker_upper, exc_info=True)
 
-    # 2. Fundamentals
+def _bucket_clause(bucket: str | None) -> str:
+    return " AND acc.bucket = :bucket" if bucket else ""
+
+
+def _ohlcv_bars(df) -> list[OHLCVBar]:
+    """OHLCVBar list from a get_ohlcv()-shaped DataFrame (empty if no data)."""
+    if df is None or df.empty:
+        return []
+    from src.price_service import ohlcv_to_records
+
+    # Records are already typed (str date, float prices, int volume), so skip
+    # per-bar validation; NULL prices arrive as NaN and are dropped here
+    # instead of reaching the agents.
+    return [
+        OHLCVBar.model_construct(**bar)
+        for bar in ohlcv_to_records(df)
+        if all(math.isfinite(bar[k]) for k in ("open", "high", "low", "close"))
+    ]
+
+
+def _fetch_fundamentals(ticker: str) -> dict | None:
     try:
         from src.openbb_service import get_fundamentals
 
-        fundamentals_data = get_fundamentals(ticker_upper)
-        if fundamentals_data:
-            data_sources.append("OpenBB/FMP fundamentals")
+        return get_fundamentals(ticker)
     except Exception:
-        logger.warning("Failed to fetch fundamentals for %s", ticker_upper, exc_info=True)
+        logger.warning("Failed to fetch fundamentals for %s", ticker, exc_info=True)
+        return None
+
 
-    # 3. News
+def _fetch_news(ticker: str) -> list[NewsItem]:
     try:
         from src.openbb_service import get_company_news
 
-        raw_news = get_company_news(ticker_upper, limit=20)
-        for item in raw_news:
-            news_list.append(
-                NewsItem(
-                    title=item.get("title", ""),
-                    date=item.get("date", ""),
-                    text=item.get("text", ""),
-                    source=item.get("source", ""),
-                    sentiment_score=item.get("sentiment_score"),
-                )
+        return [
+            NewsItem(
+                title=item.get("title", ""),
+                date=item.get("date", ""),
+                text=item.get("text", ""),
+                source=item.get("source", ""),
+                sentiment_score=item.get("sentiment_score"),
+            )
+            for item in get_company_news(ticker, limit=20)
+        ]
+    except Exception:
+        logger.warning("Failed to fetch news for %s", ticker, exc_info=True)
+        return []
+
+
+def _position_from_row(row) -> PositionData | None:
+    """PositionData from an aggregated positions row (None when flat)."""
+    m = _row_mapping(row)
+    qty = float(m.get("quantity") or 0)
+    if qty <= 0:
+        return None
+    avg_cost = float(m.get("avg_cost") or 0)
+    current_price = float(m.get("current_price") or 0)
+    market_value = float(m.get("market_value") or 0)
+    cost_basis = qty * avg_cost
+    unrealized_pnl = market_value - cost_basis
+    unrealized_pnl_pct = (unrealized_pnl / cost_basis * 100) if cost_basis > 0 else 0.0
+    return PositionData(
+        quantity=qty,
+        avg_cost=avg_cost,
+        current_price=current_price,
+        market_value=market_value,
+        unrealized_pnl=unrealized_pnl,
+        unrealized_pnl_pct=unrealized_pnl_pct,
+    )
+
+
+def _fetch_portfolio_value(bucket: str | None) -> float:
+    """Positions equity, bucket-scoped when a filter is active.
+
+    The risk agent's position-sizing math compares a ticker to this
+    denominator (e.g., 50% concentration in day-bucket is very different from
+    50% of total net worth). account_balances has no total_value column —
+    only cash/buying_power — so it comes from positions.
+    """
+    try:
+        bal_rows = execute_sql(
+            f"""
+            SELECT COALESCE(SUM(p.quantity * COALESCE(p.current_price, p.price)), 0) AS total
+            FROM positions p
+            LEFT JOIN accounts acc ON acc.id = p.account_id
+            WHERE p.quantity > 0
+              AND COALESCE(acc.connection_status, 'connected') != 'deleted'
+              {_bucket_clause(bucket)}
+            """,
+            params={"bucket": bucket} if bucket else None,
+            fetch_results=True,
+        )
+        if bal_rows:
+            return float(_row_mapping(bal_rows[0]).get("total", 0) or 0)
+    except Exception:
+        logger.warning("Failed to fetch portfolio value", exc_info=True)
+    return 0.0
+
+
+def _build_input(
+    ticker: str,
+    bucket: str | None,
+    ohlcv_bars: list[OHLCVBar],
+    fundamentals_data: dict | None,
+    news_list: list[NewsItem],
+    ideas_list: list[IdeaData],
+    position_data: PositionData | None,
+    portfolio_value: float,
+    indicator_state: dict | None = None,
+) -> tuple[AnalysisInput, list[str]]:
+    """AnalysisInput plus the human-readable data_sources list."""
+    data_sources: list[str] = []
+    if ohlcv_bars:
+        data_sources.append(f"Databento OHLCV ({len(ohlcv_bars)} days)")
+    if fundamentals_data:
+        data_sources.append("OpenBB/FMP fundamentals")
+    if news_list:
+        data_sources.append(f"OpenBB/FMP news ({len(news_list)} articles)")
+    if ideas_list:
+        data_sources.append(f"Discord NLP ({len(ideas_list)} ideas)")
+    if position_data:
+        scope = f"bucket={bucket}" if bucket else "all buckets"
+        data_sources.append(
+            f"Portfolio positions ({position_data.quantity:g} shares, {scope})"
+        )
+
+    analysis_input = AnalysisInput(
+        ticker=ticker,
+        ohlcv=ohlcv_bars,
+        fundamentals=fundamentals_data,
+        position=position_data,
+        ideas=ideas_list,
+        news=news_list,
+        portfolio_value=portfolio_value,
+        indicator_state=indicator_state,
+    )
+    return analysis_input, data_sources
+
+
+def _fetch_ohlcv(ticker: str) -> list[OHLCVBar]:
+    # get_ohlcv REQUIRES (ticker, start, end) and returns a DataFrame with
+    # capitalized OHLCV columns and the trade date as a DatetimeIndex. The old
+    # code called get_ohlcv(ticker) with no dates (-> TypeError, swallowed) and
+    # read lowercase columns, so EVERY analysis got zero bars and technical /
+    # risk always reported "insufficient OHLCV data".
+    if _is_crypto(ticker):
+        return []
+    try:
+        from datetime import date, timedelta
+
+        from src.price_service import get_ohlcv
+
+        return _ohlcv_bars(
+            get_ohlcv(
+                ticker,
+                date.today() - timedelta(days=OHLCV_LOOKBACK_DAYS),
+                date.today(),
             )
-        if news_list:
-            data_sources.append(f"OpenBB/FMP news ({len(news_list)} articles)")
+        )
     except Exception:
-        logger.warning("Failed to fetch news for %s", ticker_upper, exc_info=True)
+        logger.warning("Failed to fetch OHLCV for %s", ticker, exc_info=True)
+        return []
+
 
-    # 4. Discord parsed ideas (primary_symbol + join — discord_parsed_ideas has
-    #    no ticker/created_at/author columns; author/created_at live on
-    #    discord_messages, matching the working chat.py query).
+def _fetch_ideas(ticker: str) -> list[IdeaData]:
+    # primary_symbol + join — discord_parsed_ideas has no ticker/created_at/
+    # author columns; author/created_at live on discord_messages, matching the
+    # working chat.py query.
     try:
         idea_rows = execute_sql(
-            """
-            SELECT dpi.direction, dpi.confidence, dpi.labels, dpi.idea_text,
-                   dm.created_at, dm.author, dm.author_id
+            f"""
+            SELECT {_IDEA_COLUMNS}
             FROM discord_parsed_ideas dpi
-            LEFT JOIN discord_messages dm ON dpi.message_id::text = dm.message_id
+            LEFT JOIN discord_messages dm ON dpi.message_id = dm.message_id
             WHERE UPPER(dpi.primary_symbol) = :ticker
               AND dm.created_at > NOW() - INTERVAL '30 days'
             ORDER BY dm.created_at DESC
             LIMIT 50
             """,
-            params={"ticker": ticker_upper},
+            params={"ticker": ticker},
             fetch_results=True,
         )
-        ideas_list = _assemble_ideas(idea_rows)
-        if ideas_list:
-            data_sources.append(f"Discord NLP ({len(ideas_list)} ideas)")
+        return _assemble_ideas(idea_rows)
     except Exception:
-        logger.warning("Failed to fetch ideas for %s", ticker_upper, exc_info=True)
+        logger.warning("Failed to fetch ideas for %s", ticker, exc_info=True)
+        return []
 
-    # 5. Position data — aggregated across (bucket-scoped) accounts. The
-    #    previous LIMIT 1 was picking an arbitrary single row when a stock
-    #    was held in multiple accounts; the aggregation is correct.
+
+def _fetch_position(ticker: str, bucket: str | None) -> PositionData | None:
+    # Aggregated across (bucket-scoped) accounts. The previous LIMIT 1 was
+    # picking an arbitrary single row when a stock was held in multiple
+    # accounts; the aggregation is correct.
     try:
-        bucket_clause = ""
-        pos_params: dict[str, str] = {"ticker": ticker_upper}
+        pos_params: dict[str, str] = {"ticker": ticker}
         if bucket:
-            bucket_clause = " AND acc.bucket = :bucket"
             pos_params["bucket"] = bucket
         pos_rows = execute_sql(
             f"""
-            SELECT
-                SUM(p.quantity)                                            AS quantity,
-                CASE WHEN SUM(p.quantity) > 0
-                    THEN SUM(p.quantity * p.average_buy_price) / SUM(p.quantity)
-                    ELSE 0
-                END                                                         AS avg_cost,
-                AVG(COALESCE(p.current_price, p.price))                     AS current_price,
-                SUM(p.quantity * COALESCE(p.current_price, p.price))        AS market_value
+            SELECT {_POSITION_AGGREGATES}
             FROM positions p
             LEFT JOIN accounts acc ON acc.id = p.account_id
             WHERE UPPER(p.symbol) = :ticker
               AND p.quantity > 0
               AND COALESCE(acc.connection_status, 'connected') != 'deleted'
-              {bucket_clause}
+              {_bucket_clause(bucket)}
             """,
             params=pos_params,
             fetch_results=True,
         )
-        if pos_rows:
-            m = pos_rows[0]._mapping if hasattr(pos_rows[0], "_mapping") else pos_rows[0]
-            qty = float(m.get("quantity") or 0)
-            if qty > 0:
-                avg_cost = float(m.get("avg_cost") or 0)
-                current_price = float(m.get("current_price") or 0)
-                market_value = float(m.get("market_value") or 0)
-                cost_basis = qty * avg_cost
-                unrealized_pnl = market_value - cost_basis
-                unrealized_pnl_pct = (
-                    (unrealized_pnl / cost_basis * 100) if cost_basis > 0 else 0.0
-                )
-                position_data = PositionData(
-                    quantity=qty,
-                    avg_cost=avg_cost,
-                    current_price=current_price,
-                    market_value=market_value,
-                    unrealized_pnl=unrealized_pnl,
-                    unrealized_pnl_pct=unrealized_pnl_pct,
-                )
-                scope = f"bucket={bucket}" if bucket else "all buckets"
-                data_sources.append(f"Portfolio positions ({qty:g} shares, {scope})")
+        return _position_from_row(pos_rows[0]) if pos_rows else None
     except Exception:
-        logger.warning("Failed to fetch position for %s", ticker_upper, exc_info=True)
+        logger.warning("Failed to fetch position for %s", ticker, exc_info=True)
+        return None
 
-    # 6. Portfolio value — bucket-scoped when a filter is active so the
-    #    risk agent's position-sizing math compares this ticker to the
-    #    correct denominator (e.g., 50% concentration in day-bucket is
-    #    very different from 50% of total net worth).
+
+def _fetch_indicator_state(ticker: str) -> dict | None:
+    # Optional fast path for the technical agent; it recomputes without it.
     try:
-        # Portfolio value = positions equity (account_balances has no
-        # total_value column — only cash/buying_power). Bucket-scoped via
-        # the accounts join when a filter is active.
-        bucket_clause = " AND acc.bucket = :bucket " if bucket else ""
-        params = {"bucket": bucket} if bucket else None
-        bal_rows = execute_sql(
-            f"""
-            SELECT COALESCE(SUM(p.quantity * COALESCE(p.current_price, p.price)), 0) AS total
-            FROM positions p
-            LEFT JOIN accounts acc ON acc.id = p.account_id
-            WHERE p.quantity > 0
-              AND COALESCE(acc.connection_status, 'connected') != 'deleted'
-              {bucket_clause}
-            """,
-            params=params,
-            fetch_results=True,
-        )
-        if bal_rows:
-            m = bal_rows[0]._mapping if hasattr(bal_rows[0], "_mapping") else bal_rows[0]
-            portfolio_value = float(m.get("total", 0) or 0)
+        return load_indicator_states([ticker]).get(ticker)
     except Exception:
-        logger.warning("Failed to fetch portfolio value", exc_info=True)
+        logger.warning("Failed to fetch indicator state for %s", ticker, exc_info=True)
+        return None
 
-    analysis_input = AnalysisInput(
-        ticker=ticker_upper,
-        ohlcv=ohlcv_bars,
-        fundamentals=fundamentals_data,
-        position=position_data,
-        ideas=ideas_list,
-        news=news_list,
-        portfolio_value=portfolio_value,
+
+async def _fetch_with_timeout(name: str, ticker: str, timeout: float, default, fn, *args):
+    """Run a blocking fetch on the analysis fetch pool, returning `default` on timeout.
+
+    The fetchers already swallow their own errors; this only bounds latency.
+    A timed-out thread is left to finish in the background (threads can't be
+    cancelled) and its result is discarded.
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        return await asyncio.wait_for(
+            loop.run_in_executor(_fetch_executor, partial(fn, *args)), timeout
+        )
+    except TimeoutError:
+        logger.warning("%s fetch for %s timed out after %.0fs", name, ticker, timeout)
+        return default
+
+
+async def _assemble_input(
+    ticker: str,
+    bucket: str | None = None,
+) -> tuple[AnalysisInput, list[str]]:
+    """Assemble AnalysisInput from multiple data sources.
+
+    All sources (OHLCV, fundamentals, news, ideas, position, portfolio value,
+    stored indicator state) are fetched concurrently in worker threads, so a cold analysis
+    waits for the slowest source rather than their sum. Each source has its
+    own timeout; a slow or failing source is left out of the input.
+
+    Stock-wide data (OHLCV, fundamentals, news, ideas) ignores bucket.
+    Bucket-scoped data (current position, portfolio value) filters by the
+    accounts.bucket column when a bucket is provided — so e.g. running
+    analysis on AAPL under bucket=day sees only the position you hold in
+    day-trading accounts, not your long-term holdings.
+
+    Returns ``(AnalysisInput, data_sources_list)``.
+    """
+    ticker_upper = ticker.upper()
+    db_timeout = ANALYSIS_SOURCE_TIMEOUT
+    api_timeout = ANALYSIS_EXTERNAL_TIMEOUT
+
+    (
+        ohlcv_bars,
+        fundamentals_data,
+        news_list,
+        ideas_list,
+        position_data,
+        portfolio_value,
+        indicator_state,
+    ) = await asyncio.gather(
+        _fetch_with_timeout("OHLCV", ticker_upper, db_timeout, [], _fetch_ohlcv, ticker_upper),
+        _fetch_with_timeout(
+            "Fundamentals", ticker_upper, api_timeout, None, _fetch_fundamentals, ticker_upper
+        ),
+        _fetch_with_timeout("News", ticker_upper, api_timeout, [], _fetch_news, ticker_upper),
+        _fetch_with_timeout("Ideas", ticker_upper, db_timeout, [], _fetch_ideas, ticker_upper),
+        _fetch_with_timeout(
+            "Position", ticker_upper, db_timeout, None, _fetch_position, ticker_upper, bucket
+        ),
+        _fetch_with_timeout(
+            "Portfolio value", ticker_upper, db_timeout, 0.0, _fetch_portfolio_value, bucket
+        ),
+        _fetch_with_timeout(
+            "Indicator state", ticker_upper, db_timeout, None, _fetch_indicator_state, ticker_upper
+        ),
     )
 
-    return analysis_input, data_sources
+    return _build_input(
+        ticker_upper,
+        bucket,
+        ohlcv_bars,
+        fundamentals_data,
+        news_list,
+        ideas_list,
+        position_data,
+        portfolio_value,
+        indicator_state,
+    )
+
+
+def _assemble_inputs_many(
+    tickers: list[str],
+    bucket: str | None = None,
+) -> list[tuple[AnalysisInput, list[str]]]:
+    """Batch version of _assemble_input for a set of tickers.
+
+    One grouped query each for OHLCV, ideas, positions and indicator states,
+    a single portfolio-value query, and fundamentals/news fetched concurrently in a
+    thread pool. Each source fails soft exactly like the single-ticker path.
+    Returns one ``(AnalysisInput, data_sources)`` per unique ticker, in input
+    order.
+    """
+    symbols = list(dict.fromkeys(t.upper() for t in tickers if t))
+    if not symbols:
+        return []
+
+    # 1. OHLCV — one round trip for every equity
+    ohlcv_by_symbol: dict[str, list[OHLCVBar]] = {}
+    equities = [s for s in symbols if not _is_crypto(s)]
+    if equities:
+        try:
+            from datetime import date, timedelta
+
+            from src.price_service import get_ohlcv_batch
+
+            frames = get_ohlcv_batch(
+                equities,
+                date.today() - timedelta(days=OHLCV_LOOKBACK_DAYS),
+                date.today(),
+            )
+            ohlcv_by_symbol = {sym: _ohlcv_bars(df) for sym, df in frames.items()}
+        except Exception:
+            logger.warning("Failed to fetch batch OHLCV for %d tickers", len(equities), exc_info=True)
+
+    # 2-3. Fundamentals and news — external APIs, so overlap them
+    workers = max(1, min(ASSEMBLY_MAX_WORKERS, len(symbols) * 2))
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="assemble")
+    try:
+        fundamentals_futures = {s: pool.submit(_fetch_fundamentals, s) for s in symbols}
+        news_futures = {s: pool.submit(_fetch_news, s) for s in symbols}
+        # Every fetch gets ANALYSIS_EXTERNAL_TIMEOUT once it can start: the
+        # pool runs `workers` at a time, so allow one timeout per wave
+        external_deadline = time.monotonic() + ANALYSIS_EXTERNAL_TIMEOUT * math.ceil(
+            2 * len(symbols) / workers
+        )
+
+        def external_result(name: str, symbol: str, future, default):
+            try:
+                return future.result(timeout=max(0.0, external_deadline - time.monotonic()))
+            except TimeoutError:
+                logger.warning("%s fetch for %s timed out in batch assembly", name, symbol)
+                return default
+
+        # 4. Ideas — latest 50 per ticker from the last 30 days
+        ideas_by_symbol: dict[str, list] = {}
+        try:
+            idea_rows = execute_sql(
+                f"""
+                SELECT * FROM (
+                    SELECT UPPER(dpi.primary_symbol) AS ticker, {_IDEA_COLUMNS},
+                           ROW_NUMBER() OVER (
+                               PARTITION BY UPPER(dpi.primary_symbol)
+                               ORDER BY dm.created_at DESC
+                           ) AS rn
+                    FROM discord_parsed_ideas dpi
+                    LEFT JOIN discord_messages dm ON dpi.message_id = dm.message_id
+                    WHERE UPPER(dpi.primary_symbol) = ANY(:tickers)
+                      AND dm.created_at > NOW() - INTERVAL '30 days'
+                ) ranked
+                WHERE rn <= 50
+                ORDER BY ticker, created_at DESC
+                """,
+                params={"tickers": symbols},
+                fetch_results=True,
+            )
+            for row in idea_rows or []:
+                ideas_by_symbol.setdefault(_row_mapping(row)["ticker"], []).append(row)
+        except Exception:
+            logger.warning("Failed to fetch ideas for %d tickers", len(symbols), exc_info=True)
+
+        # 5. Positions — aggregated per ticker across (bucket-scoped) accounts
+        positions_by_symbol: dict[str, PositionData | None] = {}
+        try:
+            pos_params: dict = {"tickers": symbols}
+            if bucket:
+                pos_params["bucket"] = bucket
+            pos_rows = execute_sql(
+                f"""
+                SELECT UPPER(p.symbol) AS ticker, {_POSITION_AGGREGATES}
+                FROM positions p
+                LEFT JOIN accounts acc ON acc.id = p.account_id
+                WHERE UPPER(p.symbol) = ANY(:tickers)
+                  AND p.quantity > 0
+                  AND COALESCE(acc.connection_status, 'connected') != 'deleted'
+                  {_bucket_clause(bucket)}
+                GROUP BY UPPER(p.symbol)
+                """,
+                params=pos_params,
+                fetch_results=True,
+            )
+            for row in pos_rows or []:
+                positions_by_symbol[_row_mapping(row)["ticker"]] = _position_from_row(row)
+        except Exception:
+            logger.warning("Failed to fetch positions for %d tickers", len(symbols), exc_info=True)
+
+        # 6. Portfolio value — identical for every ticker
+        portfolio_value = _fetch_portfolio_value(bucket)
+
+        # 7. Stored indicator states — one query, optional
+        try:
+            states_by_symbol = load_indicator_states(equities)
+        except Exception:
+            logger.warning("Failed to fetch indicator states for %d tickers", len(equities), exc_info=True)
+            states_by_symbol = {}
+
+        return [
+            _build_input(
+                symbol,
+                bucket,
+                ohlcv_by_symbol.get(symbol, []),
+                external_result("Fundamentals", symbol, fundamentals_futures[symbol], None),
+                external_result("News", symbol, news_futures[symbol], []),
+                _assemble_ideas(ideas_by_symbol.get(symbol, [])),
+                positions_by_symbol.get(symbol),
+                portfolio_value,
+                states_by_symbol.get(symbol),
+            )
+            for symbol in symbols
+        ]
+    finally:
+        # Don't wait on hung fetches; their threads finish in the background
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def get_stock_analysis_many(
+    tickers: list[str],
+    bucket: str | None = None,
+) -> list[AnalysisInput]:
+    """Assemble analysis inputs for many tickers in one pass.
+
+    Used to warm analysis for a whole portfolio: a 40-symbol bucket costs a
+    handful of grouped queries instead of six round trips per ticker. See
+    _assemble_inputs_many for the data-source breakdown.
+    """
+    return [analysis_input for analysis_input, _ in _assemble_inputs_many(tickers, bucket)]
 
 
 async def _run_agents(
@@ -365,9 +783,10 @@ async def _run_consensus(
     ticker: str,
     signals: list[AnalystSignal],
     data_sources: list[str],
+    use_llm: bool = True,
 ) -> dict:
     """Run consensus aggregator and return serialized report."""
-    report = await consensus_run(ticker, signals, data_sources)
+    report = await consensus_run(ticker, signals, data_sources, use_llm=use_llm)
     return report.model_dump(mode="json")
 
 
@@ -379,14 +798,19 @@ def _cache_result(
     model_used: str,
     data_sources: list[str],
     bucket: str | None = None,
+    ttl_hours: float | None = None,
+    viewed: bool = True,
 ) -> None:
     """Upsert result into stock_analysis_cache.
 
     Cache key is (ticker, analysis_type, bucket). Bucket defaults to 'all'
     for portfolio-wide analyses so toggling the bucket switcher doesn't
-    blow away the unfiltered cache entry.
+    blow away the unfiltered cache entry. ``ttl_hours`` overrides the
+    equity/crypto TTL (the nightly warmup keeps LLM-narrated equity entries
+    until morning). ``viewed=False`` (warmup) leaves last_viewed_at as is.
     """
-    ttl_hours = CRYPTO_TTL_HOURS if _is_crypto(ticker) else EQUITY_TTL_HOURS
+    if ttl_hours is None:
+        ttl_hours = CRYPTO_TTL_HOURS if _is_crypto(ticker) else EQUITY_TTL_HOURS
     expires_at = datetime.now(tz=timezone.utc) + timedelta(hours=ttl_hours)
     cache_bucket = bucket if bucket else "all"
 
@@ -394,17 +818,19 @@ def _cache_result(
         """
         INSERT INTO stock_analysis_cache
             (ticker, analysis_type, bucket, result, agent_signals,
-             model_used, data_sources, computed_at, expires_at)
+             model_used, data_sources, computed_at, expires_at, last_viewed_at)
         VALUES
             (:ticker, :analysis_type, :bucket, :result, :agent_signals,
-             :model_used, :data_sources, NOW(), :expires_at)
+             :model_used, :data_sources, NOW(), :expires_at,
+             CASE WHEN :viewed THEN NOW() END)
         ON CONFLICT (ticker, analysis_type, bucket) DO UPDATE SET
             result = EXCLUDED.result,
             agent_signals = EXCLUDED.agent_signals,
             model_used = EXCLUDED.model_used,
             data_sources = EXCLUDED.data_sources,
             computed_at = NOW(),
-            expires_at = EXCLUDED.expires_at
+            expires_at = EXCLUDED.expires_at,
+            last_viewed_at = COALESCE(EXCLUDED.last_viewed_at, stock_analysis_cache.last_viewed_at)
         """,
         params={
             "ticker": ticker.upper(),
@@ -415,8 +841,10 @@ def _cache_result(
             "model_used": model_used,
             "data_sources": data_sources,
             "expires_at": expires_at,
+            "viewed": viewed,
         },
     )
+    _analysis_memory.put((ticker.upper(), analysis_type, cache_bucket), result, expires_at)
 
 
 async def get_stock_analysis(
@@ -442,18 +870,30 @@ async def get_stock_analysis(
     """
     analysis_type = "full" if not agents else ",".join(sorted(agents))
 
+    # One computation per (ticker, analysis_type, bucket) at a time; concurrent
+    # stale reads and cold misses join the in-flight run.
+    flight_key = (ticker.upper(), analysis_type, bucket or "all")
+
     if not refresh:
         cached = _check_cache(ticker, analysis_type, bucket=bucket)
         if cached:
             if cached["is_fresh"]:
                 return cached["result"]
             # Stale-while-revalidate: return stale, trigger background refresh
-            asyncio.create_task(
-                _refresh_analysis(ticker, analysis_type, agents, bucket=bucket)
+            _analysis_flights.run(
+                flight_key,
+                lambda: _refresh_analysis(ticker, analysis_type, agents, bucket=bucket),
             )
             return cached["result"]
 
-    return await _compute_analysis(ticker, analysis_type, agents, bucket=bucket)
+    result = await _analysis_flights.await_(
+        flight_key,
+        lambda: _compute_analysis(ticker, analysis_type, agents, bucket=bucket),
+    )
+    if result is None:
+        # Joined a background refresh that failed; compute (and raise) here
+        result = await _compute_analysis(ticker, analysis_type, agents, bucket=bucket)
+    return result
 
 
 async def _refresh_analysis(
@@ -461,12 +901,16 @@ async def _refresh_analysis(
     analysis_type: str,
     agents: list[str] | None,
     bucket: str | None = None,
-) -> None:
-    """Background refresh task for stale-while-revalidate."""
+) -> dict | None:
+    """Background refresh task for stale-while-revalidate.
+
+    Returns the fresh result, or None if the refresh failed.
+    """
     try:
-        await _compute_analysis(ticker, analysis_type, agents, bucket=bucket)
+        return await _compute_analysis(ticker, analysis_type, agents, bucket=bucket)
     except Exception:
         logger.warning("Background refresh failed for %s", ticker, exc_info=True)
+        return None
 
 
 async def _compute_analysis(
@@ -477,17 +921,38 @@ async def _compute_analysis(
 ) -> dict:
     """Run the full analysis pipeline."""
     # Assemble input (position/portfolio_value scoped to bucket if provided)
-    input_data, data_sources = _assemble_input(ticker, bucket=bucket)
+    input_data, data_sources = await _assemble_input(ticker, bucket=bucket)
+
+    return await _analyze_input(
+        ticker, analysis_type, agents, input_data, data_sources, bucket=bucket
+    )
+
 
+async def _analyze_input(
+    ticker: str,
+    analysis_type: str,
+    agents: list[str] | None,
+    input_data: AnalysisInput,
+    data_sources: list[str],
+    bucket: str | None = None,
+    use_llm: bool = True,
+    ttl_hours: float | None = None,
+    viewed: bool = True,
+) -> dict:
+    """Agents + consensus + cache write for an already assembled input.
+
+    ``viewed=False`` for precomputation nobody asked for (nightly warmup).
+    """
     # Run agents
     signals = await _run_agents(input_data, agents)
 
     # Run consensus
-    result = await _run_consensus(ticker, signals, data_sources)
+    result = await _run_consensus(ticker, signals, data_sources, use_llm=use_llm)
 
-    # Cache (keyed by ticker + analysis_type + bucket)
+    # Cache (keyed by ticker + analysis_type + bucket); synchronous DB write
     agent_signal_dicts = [s.model_dump(mode="json") for s in signals]
-    _cache_result(
+    await asyncio.to_thread(
+        _cache_result,
         ticker=ticker,
         analysis_type=analysis_type,
         result=result,
@@ -495,6 +960,8 @@ async def _compute_analysis(
         model_used=result.get("model_used", "unknown"),
         data_sources=data_sources,
         bucket=bucket,
+        ttl_hours=ttl_hours,
+        viewed=viewed,
     )
 
     return result
@@ -506,7 +973,7 @@ async def get_portfolio_risk(
 ) -> dict:
     """Compute portfolio-wide risk metrics.
 
-    Fetches positions, gets OHLCV for top 15 holdings by market value,
+    Fetches every holding, loads their closes as one date-aligned panel,
     then runs portfolio risk analysis. When ``bucket`` is provided, the
     computation is scoped to accounts in that bucket (long_term, swing,
     day, retirement, other). Result is cached per bucket — passing None
@@ -515,8 +982,12 @@ async def get_portfolio_risk(
     # Cache key uses 'all' to represent the unfiltered (portfolio-wide) entry.
     cache_bucket = bucket if bucket else "all"
 
-    # Check cache
+    # Check cache (memory tier first, then portfolio_risk_cache)
     if not refresh:
+        cached = _portfolio_risk_memory.get((cache_bucket,))
+        if cached is not None and cached["is_fresh"]:
+            return cached["result"]
+
         rows = execute_sql(
             """
             SELECT result, expires_at
@@ -537,14 +1008,31 @@ async def get_portfolio_risk(
                 result = m["result"]
                 if isinstance(result, str):
                     result = json.loads(result)
+                _portfolio_risk_memory.put((cache_bucket,), result, expires_at)
                 return result
 
-    # Fetch top 15 positions by market value. Filter to:
+    # Concurrent misses for the same bucket share one computation
+    return await _portfolio_risk_flights.await_(
+        (cache_bucket,), lambda: _compute_portfolio_risk(bucket)
+    )
+
+
+async def _compute_portfolio_risk(
+    bucket: str | None = None,
+    ttl_hours: float | None = None,
+) -> dict:
+    """Compute and cache portfolio risk for a bucket (None = portfolio-wide)."""
+    cache_bucket = bucket if bucket else "all"
+
+    # One row per holding (a symbol held in several accounts is one holding),
+    # every holding — not just the largest few. Filter to:
     # - non-zero quantity
     # - accounts not flagged as deleted (orphaned re-links)
     # - the requested bucket (if any)
-    pos_sql = """
-        SELECT p.symbol, p.quantity, p.market_value
+    pos_sql = f"""
+        SELECT UPPER(p.symbol) AS symbol,
+               SUM(p.quantity) AS quantity,
+               SUM(p.quantity * COALESCE(p.current_price, p.price, 0)) AS market_value
         FROM positions p
         WHERE p.quantity > 0
           AND NOT EXISTS (
@@ -552,21 +1040,14 @@ async def get_portfolio_risk(
               WHERE a.id = p.account_id
                 AND a.connection_status = 'deleted'
           )
+          {"AND EXISTS (SELECT 1 FROM accounts ab WHERE ab.id = p.account_id AND ab.bucket = :bucket)" if bucket else ""}
+        GROUP BY UPPER(p.symbol)
+        ORDER BY market_value DESC
     """
-    pos_params: dict[str, str] = {}
-    if bucket:
-        pos_sql += (
-            " AND EXISTS ("
-            "   SELECT 1 FROM accounts ab"
-            "   WHERE ab.id = p.account_id AND ab.bucket = :bucket"
-            " )"
-        )
-        pos_params["bucket"] = bucket
-    pos_sql += " ORDER BY p.market_value DESC NULLS LAST LIMIT 15"
 
     pos_rows = execute_sql(
         pos_sql,
-        params=pos_params if pos_params else None,
+        params={"bucket": bucket} if bucket else None,
         fetch_results=True,
     )
 
@@ -584,89 +1065,63 @@ async def get_portfolio_risk(
         )
         return empty_report.model_dump(mode="json")
 
-    # Collect OHLCV returns and weights
-    import numpy as np
-
-    returns_data: dict[str, np.ndarray] = {}
-    weights: dict[str, float] = {}
-    sector_map: dict[str, str] = {}
-    total_market_value = 0.0
+    holdings = {
+        str(m["symbol"]).strip(): float(m.get("market_value", 0) or 0)
+        for m in (_row_mapping(row) for row in pos_rows)
+    }
+    symbols = list(holdings)
+    total_market_value = sum(holdings.values())
+    weights = {
+        s: mv / total_market_value if total_market_value > 0 else 0.0
+        for s, mv in holdings.items()
+    }
 
-    for row in pos_rows:
-        m = row._mapping if hasattr(row, "_mapping") else row
-        mv = float(m.get("market_value", 0) or 0)
-        total_market_value += mv
+    from datetime import date
 
-    for row in pos_rows:
-        m = row._mapping if hasattr(row, "_mapping") else row
-        symbol = m["symbol"]
-        mv = float(m.get("market_value", 0) or 0)
-        weights[symbol] = mv / total_market_value if total_market_value > 0 else 0.0
+    from src.market_data_service import get_company_info
+    from src.price_service import get_price_panel
 
-        # Get OHLCV returns (same get_ohlcv signature/column fix as above).
+    def _sector(symbol: str) -> str:
         try:
-            from datetime import date, timedelta
-
-            from src.price_service import get_ohlcv
-
-            df = get_ohlcv(symbol, date.today() - timedelta(days=400), date.today())
-            if df is not None and not df.empty and len(df) > 10:
-                returns = df["Close"].pct_change().dropna().values
-                returns_data[symbol] = returns
+            info = get_company_info(symbol)
         except Exception:
-            logger.warning("Failed to fetch OHLCV for portfolio risk: %s", symbol, exc_info=True)
+            return "Unknown"
+        return info["sector"] if info and info.get("sector") else "Unknown"
 
-        # Get sector
-        try:
-            from src.market_data_service import get_company_info
+    # Sector lookups hit yfinance (cached 24h) — overlap them with the price query.
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(ASSEMBLY_MAX_WORKERS, len(symbols))),
+        thread_name_prefix="risk-sector",
+    ) as pool:
+        sector_futures = {s: pool.submit(_sector, s) for s in symbols}
 
-            info = get_company_info(symbol)
-            if info and "sector" in info:
-                sector_map[symbol] = info["sector"]
-            else:
-                sector_map[symbol] = "Unknown"
+        # Every holding's closes in one query, aligned on trade date.
+        try:
+            panel = get_price_panel(
+                symbols,
+                date.today() - timedelta(days=OHLCV_LOOKBACK_DAYS),
+                date.today(),
+            )
         except Exception:
-            sector_map[symbol] = "Unknown"
+            logger.warning("Failed to fetch price panel for portfolio risk", exc_info=True)
+            panel = None
 
-    # Only include tickers that have returns data
-    valid_weights = {t: w for t, w in weights.items() if t in returns_data}
+        sector_map = {s: f.result() for s, f in sector_futures.items()}
 
     # Get total portfolio value — scoped to the requested bucket when set.
-    try:
-        # Positions equity (account_balances has no total_value column).
-        bucket_clause = " AND acc.bucket = :bucket " if bucket else ""
-        params = {"bucket": bucket} if bucket else None
-        bal_rows = execute_sql(
-            f"""
-            SELECT COALESCE(SUM(p.quantity * COALESCE(p.current_price, p.price)), 0) AS total
-            FROM positions p
-            LEFT JOIN accounts acc ON acc.id = p.account_id
-            WHERE p.quantity > 0
-              AND COALESCE(acc.connection_status, 'connected') != 'deleted'
-              {bucket_clause}
-            """,
-            params=params,
-            fetch_results=True,
-        )
-        if bal_rows:
-            bm = bal_rows[0]._mapping if hasattr(bal_rows[0], "_mapping") else bal_rows[0]
-            total_value = float(bm.get("total", 0) or 0) or total_market_value
-        else:
-            total_value = total_market_value
-    except Exception:
-        total_value = total_market_value
+    total_value = _fetch_portfolio_value(bucket) or total_market_value
 
-    report = compute_portfolio_risk(
-        returns_data=returns_data,
-        weights=valid_weights,
-        sector_map=sector_map,
-        total_value=total_value,
-    )
+    if panel is None:
+        report = compute_portfolio_risk({}, weights, sector_map, total_value)
+    else:
+        report = compute_portfolio_risk_from_panel(panel, weights, sector_map, total_value)
 
     result = report.model_dump(mode="json")
 
     # Cache result, keyed by (portfolio_id, bucket).
-    expires_at = datetime.now(tz=timezone.utc) + timedelta(hours=PORTFOLIO_RISK_TTL_HOURS)
+    expires_at = datetime.now(tz=timezone.utc) + timedelta(
+        hours=PORTFOLIO_RISK_TTL_HOURS if ttl_hours is None else ttl_hours
+    )
     execute_sql(
         """
         INSERT INTO portfolio_risk_cache (portfolio_id, bucket, result, computed_at, expires_at)
@@ -682,5 +1137,6 @@ async def get_portfolio_risk(
             "expires_at": expires_at,
         },
     )
+    _portfolio_risk_memory.put((cache_bucket,), result, expires_at)
 
     return result
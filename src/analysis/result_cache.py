@@ -0,0 +1,111 @@
+"""In-process tier in front of stock_analysis_cache / portfolio_risk_cache.
+
+Hot tickers are viewed many times a minute; without this every view runs a
+Postgres query and JSON-decodes the stored report. Entries hold the decoded
+result dict plus the DB row's ``expires_at``, keyed exactly like the table
+(``(ticker, analysis_type, bucket)`` / ``(bucket,)``).
+
+Freshness still follows ``expires_at`` (stale entries are served stale, so
+stale-while-revalidate behaves as before). Separately, an entry is only
+trusted for ``ttl_seconds`` after it was loaded or written; past that the
+next read goes back to Postgres. That bounds how long this process can miss
+a change made by another process (e.g. the nightly pipeline expiring rows).
+
+Cached dicts are shared between callers — treat them as read-only.
+
+Environment:
+    ANALYSIS_MEMORY_CACHE_ENTRIES       LRU capacity per cache (default 512, 0 disables)
+    ANALYSIS_MEMORY_CACHE_TTL_SECONDS   max age of an entry before re-reading the DB (default 300)
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+ANALYSIS_MEMORY_CACHE_ENTRIES = int(os.getenv("ANALYSIS_MEMORY_CACHE_ENTRIES", "512"))
+ANALYSIS_MEMORY_CACHE_TTL_SECONDS = float(os.getenv("ANALYSIS_MEMORY_CACHE_TTL_SECONDS", "300"))
+
+
+class ResultMemoryCache:
+    """Thread-safe TTL + LRU cache of decoded analysis results."""
+
+    def __init__(
+        self,
+        max_entries: int = ANALYSIS_MEMORY_CACHE_ENTRIES,
+        ttl_seconds: float = ANALYSIS_MEMORY_CACHE_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        # key -> (result, expires_at, loaded_at)
+        self._entries: OrderedDict[tuple, tuple[dict, datetime, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key: tuple) -> dict[str, Any] | None:
+        """Return ``{"result", "is_fresh"}`` like _check_cache, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            result, expires_at, loaded_at = entry
+            if self._clock() - loaded_at >= self.ttl_seconds:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return {"result": result, "is_fresh": datetime.now(tz=timezone.utc) < expires_at}
+
+    def put(self, key: tuple, result: dict, expires_at: datetime) -> None:
+        if self.max_entries <= 0:
+            return
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        with self._lock:
+            self._entries[key] = (result, expires_at, self._clock())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, match: Callable[[tuple], bool] | None = None) -> int:
+        """Drop entries whose key satisfies ``match`` (all when None). Returns count."""
+        with self._lock:
+            if match is None:
+                dropped = len(self._entries)
+                self._entries.clear()
+            else:
+                keys = [key for key in self._entries if match(key)]
+                for key in keys:
+                    del self._entries[key]
+                dropped = len(keys)
+            self.invalidations += dropped
+            return dropped
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+            }
@@ -9,13 +9,21 @@ Data source: Databento OHLCV via price_service, positions, account_balances
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from typing import TYPE_CHECKING
 
 import numpy as np
 import pandas as pd
 
 from src.analysis.models import AnalysisInput, AnalystSignal, PortfolioRiskReport
 
+if TYPE_CHECKING:
+    from src.price_service import PricePanel
+
 MIN_BARS = 30  # Minimum bars for risk calculations
+MIN_PORTFOLIO_OBSERVATIONS = 10  # Minimum daily returns for a holding to enter portfolio risk
+VAR_95_Z = 1.6448536269514722  # one-sided 95% normal quantile
+FFILL_LIMIT = 5  # Max consecutive missing bars carried forward before a holding counts as stale
+CORRELATION_MATRIX_MAX_HOLDINGS = 15  # Emitted correlation matrix covers the top-weighted holdings only
 
 
 async def run(input: AnalysisInput) -> AnalystSignal:
@@ -137,7 +145,11 @@ def compute_portfolio_risk(
     sector_map: dict[str, str],
     total_value: float,
 ) -> PortfolioRiskReport:
-    """Compute portfolio-wide risk metrics.
+    """Compute portfolio-wide risk metrics from per-ticker return arrays.
+
+    The arrays carry no dates, so they are aligned on their most recent
+    ``min(len)`` observations. Prefer compute_portfolio_risk_from_panel, which
+    aligns on the actual trade dates.
 
     Args:
         returns_data: {ticker: array of daily returns}
@@ -153,21 +165,105 @@ def compute_portfolio_risk(
     if not tickers:
         return _empty_portfolio_risk_report()
 
-    # Align returns to same length (use shortest). If any series is empty the
-    # shortest length is 0, which makes np.percentile([]) raise and the
-    # DataFrame construction fail on ragged arrays — bail to a neutral report.
+    # If any series is empty the shortest length is 0, which makes
+    # np.percentile([]) raise — bail to a neutral report.
     min_len = min(len(r) for r in returns_data.values())
     if min_len == 0:
         return _empty_portfolio_risk_report()
-    aligned = {t: r[-min_len:] for t, r in returns_data.items()}
+    returns = np.column_stack([np.asarray(returns_data[t], dtype=float)[-min_len:] for t in tickers])
+
+    return compute_portfolio_risk_matrix(
+        returns,
+        tickers,
+        np.array([weights.get(t, 0.0) for t in tickers], dtype=float),
+        sector_map,
+        total_value,
+    )
+
+
+def compute_portfolio_risk_from_panel(
+    panel: PricePanel,
+    weights: dict[str, float],
+    sector_map: dict[str, str],
+    total_value: float,
+    min_observations: int = MIN_PORTFOLIO_OBSERVATIONS,
+) -> PortfolioRiskReport:
+    """Compute portfolio risk from a date-aligned close matrix (PricePanel).
+
+    Closes are forward-filled across gaps of up to FFILL_LIMIT bars (halts,
+    holiday mismatches) so a missing bar yields a 0 return followed by the
+    catch-up move, rather than losing both days. Holdings with fewer than
+    ``min_observations`` returns (fresh listings, no OHLCV) or whose last
+    close is more than FFILL_LIMIT bars old (stale, delisted) are left out
+    and the remaining weights renormalised; the matrix is then restricted to
+    dates where every remaining holding has a return.
+
+    Args:
+        panel: price_service.get_price_panel() result for the holdings
+        weights: {ticker: portfolio weight (0-1)}
+        sector_map: {ticker: sector_name}
+        total_value: Total portfolio value in dollars
+    """
+    close = np.asarray(panel.close, dtype=float)
+    tickers = panel.symbols
+    if close.ndim != 2 or close.shape[0] < 2 or not tickers:
+        return _empty_portfolio_risk_report()
+
+    # Forward-fill each column: index of the last non-NaN row at or before t,
+    # but never across more than FFILL_LIMIT missing bars
+    rows = np.arange(close.shape[0])[:, None]
+    last_valid = np.maximum.accumulate(np.where(np.isnan(close), 0, rows), axis=0)
+    filled = close[last_valid, np.arange(close.shape[1])]
+    filled[rows - last_valid > FFILL_LIMIT] = np.nan
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = filled[1:] / filled[:-1] - 1.0
+
+    valid = np.isfinite(returns)
+    fresh = (close.shape[0] - 1 - last_valid[-1]) <= FFILL_LIMIT
+    keep = (valid.sum(axis=0) >= min_observations) & fresh
+    if not keep.any():
+        return _empty_portfolio_risk_report()
+    returns = returns[:, keep]
+    returns = returns[np.isfinite(returns).all(axis=1)]
+    if len(returns) == 0:
+        return _empty_portfolio_risk_report()
+
+    kept = [t for t, k in zip(tickers, keep, strict=True) if k]
+    return compute_portfolio_risk_matrix(
+        returns,
+        kept,
+        np.array([weights.get(t, 0.0) for t in kept], dtype=float),
+        sector_map,
+        total_value,
+    )
+
+
+def compute_portfolio_risk_matrix(
+    returns: np.ndarray,
+    tickers: list[str],
+    weights: np.ndarray,
+    sector_map: dict[str, str],
+    total_value: float,
+) -> PortfolioRiskReport:
+    """Risk metrics on an aligned (T days x N holdings) return matrix.
+
+    Everything is computed on the matrix: historical 1-day VaR 95%, parametric
+    component VaR (Euler allocation, sums to the parametric portfolio VaR),
+    HHI concentration, the correlation matrix and the diversification ratio.
+    All holdings enter the computation; the emitted correlation matrix is
+    limited to the CORRELATION_MATRIX_MAX_HOLDINGS largest weights to keep
+    cached and API payloads small.
+    """
+    returns = np.asarray(returns, dtype=float)
+    if returns.size == 0:
+        return _empty_portfolio_risk_report()
 
-    # Build returns DataFrame
-    returns_df = pd.DataFrame(aligned)
+    total_weight = weights.sum()
+    weight_array = weights / total_weight if total_weight > 0 else weights
 
     # Portfolio returns (weighted)
-    weight_array = np.array([weights.get(t, 0.0) for t in tickers])
-    weight_array = weight_array / weight_array.sum() if weight_array.sum() > 0 else weight_array
-    portfolio_returns = returns_df.values @ weight_array
+    portfolio_returns = returns @ weight_array
 
     # VaR 95% (historical simulation)
     var_95_1d_pct = float(np.percentile(portfolio_returns, 5))
@@ -179,38 +275,63 @@ def compute_portfolio_risk(
     # Concentration HHI (Herfindahl-Hirschman Index)
     hhi = float(np.sum(weight_array**2))
 
-    # Correlation matrix
-    corr_matrix = returns_df.corr()
-    correlation_dict: dict[str, dict[str, float]] = {}
-    for t1 in tickers:
-        correlation_dict[t1] = {}
-        for t2 in tickers:
-            val = corr_matrix.loc[t1, t2] if t1 in corr_matrix.index and t2 in corr_matrix.columns else 0.0
-            correlation_dict[t1][t2] = round(float(val), 4) if not pd.isna(val) else 0.0
+    # Covariance / correlation (sample, ddof=1; a single observation has none)
+    if len(returns) > 1:
+        cov = np.atleast_2d(np.cov(returns, rowvar=False))
+    else:
+        cov = np.zeros((len(tickers), len(tickers)))
+    stds = np.sqrt(np.clip(np.diag(cov), 0.0, None))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        corr = cov / np.outer(stds, stds)
+    # Constant series have no defined correlation — report 0 (as before)
+    corr = np.where(np.isfinite(corr), np.round(corr, 4), 0.0)
+    top = np.sort(np.argsort(-weight_array, kind="stable")[:CORRELATION_MATRIX_MAX_HOLDINGS])
+    top_tickers = [tickers[i] for i in top]
+    correlation_dict = {
+        t: dict(zip(top_tickers, row, strict=True))
+        for t, row in zip(top_tickers, corr[np.ix_(top, top)].tolist(), strict=True)
+    }
 
     # Diversification ratio: weighted avg individual vol / portfolio vol
-    individual_vols = returns_df.std() * np.sqrt(252)
-    weighted_avg_vol = float(np.sum(weight_array * individual_vols.values))
+    individual_vols = stds * np.sqrt(252)
+    weighted_avg_vol = float(weight_array @ individual_vols)
     portfolio_vol = float(np.std(portfolio_returns) * np.sqrt(252))
     diversification_ratio = weighted_avg_vol / portfolio_vol if portfolio_vol > 0 else 1.0
 
-    # Top risk contributors (marginal VaR contribution)
-    top_risk = []
-    for i, t in enumerate(tickers):
-        contribution = float(weight_array[i] * individual_vols.iloc[i])
-        top_risk.append({
+    # Top risk contributors: parametric component VaR_i = w_i * (Σw)_i / σ_p * z
+    portfolio_sigma = float(np.sqrt(max(weight_array @ cov @ weight_array, 0.0)))
+    if portfolio_sigma > 0:
+        component_var = weight_array * (cov @ weight_array) / portfolio_sigma * VAR_95_Z * total_value
+    else:
+        component_var = np.zeros(len(tickers))
+    total_component = float(component_var.sum())
+    contribution_pct = (
+        component_var / total_component * 100 if total_component > 0 else np.zeros(len(tickers))
+    )
+    top_risk = [
+        {
             "ticker": t,
-            "weight_pct": round(float(weight_array[i]) * 100, 2),
-            "annualized_vol": round(float(individual_vols.iloc[i]), 4),
-            "contribution_pct": round(contribution / weighted_avg_vol * 100, 2) if weighted_avg_vol > 0 else 0.0,
-        })
+            "weight_pct": round(w * 100, 2),
+            "annualized_vol": round(vol, 4),
+            "component_var_95_1d": round(cvar, 2),
+            "contribution_pct": round(pct, 2),
+        }
+        for t, w, vol, cvar, pct in zip(
+            tickers,
+            weight_array.tolist(),
+            individual_vols.tolist(),
+            component_var.tolist(),
+            contribution_pct.tolist(),
+            strict=True,
+        )
+    ]
     top_risk.sort(key=lambda x: x["contribution_pct"], reverse=True)
 
     # Sector exposure
     sector_exposure: dict[str, float] = {}
-    for i, t in enumerate(tickers):
+    for t, w in zip(tickers, weight_array.tolist(), strict=True):
         sector = sector_map.get(t, "Unknown")
-        sector_exposure[sector] = sector_exposure.get(sector, 0.0) + float(weight_array[i])
+        sector_exposure[sector] = sector_exposure.get(sector, 0.0) + w
     sector_exposure = {k: round(v, 4) for k, v in sector_exposure.items()}
 
     now = datetime.now(tz=timezone.utc)
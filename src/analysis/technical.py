@@ -5,6 +5,11 @@ Entirely deterministic (no LLM calls). Uses OHLCV data from Databento
 via price_service. Adapted from ai-hedge-fund technicals.py.
 
 Data source: Databento OHLCV via price_service.get_ohlcv()
+
+The recursive indicators (EMA, RSI, MACD, ATR, ADX) come from the symbol's
+stored IndicatorState when the orchestrator supplies one that lines up with
+the bars (see indicator_state.py), and are recomputed over the full series
+otherwise.
 """
 
 from __future__ import annotations
@@ -14,6 +19,7 @@ import logging
 import numpy as np
 import pandas as pd
 
+from src.analysis.indicator_state import IndicatorState
 from src.analysis.indicators import (
     calculate_adx,
     calculate_atr,
@@ -40,29 +46,82 @@ STRATEGY_WEIGHTS: dict[str, float] = {
 MIN_BARS = 20  # Minimum bars needed for any analysis
 
 
+# ---------------------------------------------------------------------------
+# Recursive indicators (incremental or full recompute)
+# ---------------------------------------------------------------------------
+
+
+def _last(series: pd.Series) -> float:
+    return float(series.iloc[-1])
+
+
+def _recursive_indicators(df: pd.DataFrame) -> dict[str, float]:
+    """Latest EMA/RSI/MACD/ATR/ADX values, recomputed over the full series.
+
+    Same keys as IndicatorState.indicators(); the full-recompute fallback.
+    """
+    close, high, low = df["close"], df["high"], df["low"]
+    macd_line, signal_line, histogram = calculate_macd(close)
+    return {
+        "ema_8": _last(calculate_ema(close, 8)),
+        "ema_21": _last(calculate_ema(close, 21)),
+        "ema_55": _last(calculate_ema(close, 55)),
+        "rsi_14": _last(calculate_rsi(close, 14)),
+        "rsi_28": _last(calculate_rsi(close, 28)),
+        "macd": _last(macd_line),
+        "macd_signal": _last(signal_line),
+        "macd_histogram": _last(histogram),
+        "atr": _last(calculate_atr(high, low, close, 14)),
+        "adx": _last(calculate_adx(high, low, close, 14)),
+    }
+
+
+def _incremental_indicators(input: AnalysisInput) -> dict[str, float] | None:
+    """Read the recursive indicators off the stored state, if it fits the bars.
+
+    The state is usable when it already includes the last bar, or stops one
+    bar short (today's bar arrived after the nightly refresh) — then that one
+    bar is folded in. Anything else (stale state, restated history, another
+    STATE_VERSION) returns None and the caller recomputes.
+    """
+    if not input.indicator_state:
+        return None
+    try:
+        state = IndicatorState.from_dict(input.indicator_state)
+    except (KeyError, TypeError, ValueError):
+        logger.warning("Unreadable indicator state for %s", input.ticker, exc_info=True)
+        return None
+    if state is None or state.as_of is None:
+        return None
+
+    bars = sorted(input.ohlcv, key=lambda bar: bar.date)
+    last = bars[-1]
+    if state.as_of == last.date[:10] and np.isclose(state.close, last.close):
+        return state.indicators()
+    if len(bars) >= 2:
+        prev = bars[-2]
+        if state.as_of == prev.date[:10] and np.isclose(state.close, prev.close):
+            state.update(last.date[:10], last.high, last.low, last.close)
+            return state.indicators()
+    return None
+
+
 # ---------------------------------------------------------------------------
 # Individual strategy implementations
 # ---------------------------------------------------------------------------
 
 
-def _trend_following(df: pd.DataFrame) -> tuple[str, float, dict]:
+def _trend_following(df: pd.DataFrame, indicators: dict[str, float]) -> tuple[str, float, dict]:
     """EMA alignment + ADX trend strength.
 
     Requires >= 55 bars. Returns (signal, confidence, metrics).
     """
-    close = df["close"]
-    ema_8 = calculate_ema(close, 8)
-    ema_21 = calculate_ema(close, 21)
-    ema_55 = calculate_ema(close, 55)
-    adx = calculate_adx(df["high"], df["low"], close, 14)
+    e8 = indicators["ema_8"]
+    e21 = indicators["ema_21"]
+    e55 = indicators["ema_55"]
 
-    e8 = float(ema_8.iloc[-1])
-    e21 = float(ema_21.iloc[-1])
-    e55 = float(ema_55.iloc[-1])
-
-    # Last valid ADX
-    adx_valid = adx.dropna()
-    adx_val = float(adx_valid.iloc[-1]) if len(adx_valid) > 0 else 0.0
+    # ADX is NaN until its smoothing window fills
+    adx_val = indicators["adx"] if not np.isnan(indicators["adx"]) else 0.0
 
     # EMA alignment
     if e8 > e21 > e55:
@@ -83,7 +142,7 @@ def _trend_following(df: pd.DataFrame) -> tuple[str, float, dict]:
     return signal, confidence, metrics
 
 
-def _mean_reversion(df: pd.DataFrame) -> tuple[str, float, dict]:
+def _mean_reversion(df: pd.DataFrame, indicators: dict[str, float]) -> tuple[str, float, dict]:
     """Z-score + Bollinger Band position + RSI.
 
     Requires >= 50 bars. Returns (signal, confidence, metrics).
@@ -105,10 +164,8 @@ def _mean_reversion(df: pd.DataFrame) -> tuple[str, float, dict]:
         bb_position = 0.5
 
     # RSI
-    rsi_14 = calculate_rsi(close, 14)
-    rsi_28 = calculate_rsi(close, 28)
-    rsi_14_val = float(rsi_14.iloc[-1]) if not pd.isna(rsi_14.iloc[-1]) else 50.0
-    rsi_28_val = float(rsi_28.iloc[-1]) if not pd.isna(rsi_28.iloc[-1]) else 50.0
+    rsi_14_val = indicators["rsi_14"] if not np.isnan(indicators["rsi_14"]) else 50.0
+    rsi_28_val = indicators["rsi_28"] if not np.isnan(indicators["rsi_28"]) else 50.0
 
     # Signal logic
     if z_score < -2 and bb_position < 0.2:
@@ -185,7 +242,7 @@ def _momentum(df: pd.DataFrame) -> tuple[str, float, dict]:
     return signal, confidence, metrics
 
 
-def _volatility_analysis(df: pd.DataFrame) -> tuple[str, float, dict]:
+def _volatility_analysis(df: pd.DataFrame, indicators: dict[str, float]) -> tuple[str, float, dict]:
     """Historical volatility regime analysis with ATR.
 
     Requires >= 21 bars. Returns (signal, confidence, metrics).
@@ -217,9 +274,7 @@ def _volatility_analysis(df: pd.DataFrame) -> tuple[str, float, dict]:
     vol_z_score = ((hv_current - hv_ma_val) / hv_std_val) if hv_std_val > 0 else 0.0
 
     # ATR ratio = ATR(14) / close price
-    atr = calculate_atr(df["high"], df["low"], close, 14)
-    atr_valid = atr.dropna()
-    atr_val = float(atr_valid.iloc[-1]) if len(atr_valid) > 0 else 0.0
+    atr_val = indicators["atr"] if not np.isnan(indicators["atr"]) else 0.0
     atr_ratio = atr_val / float(close.iloc[-1]) if float(close.iloc[-1]) > 0 else 0.0
 
     # Signal logic
@@ -336,18 +391,23 @@ async def run(input: AnalysisInput) -> AnalystSignal:
     df["date"] = pd.to_datetime(df["date"])
     df = df.sort_values("date").reset_index(drop=True)
 
+    # Recursive indicators: O(1) from the stored state, else full recompute
+    indicators = _incremental_indicators(input)
+    if indicators is None:
+        indicators = _recursive_indicators(df)
+
     # Run strategies (skip those without enough data)
     strategies: dict[str, tuple[str, float, dict]] = {}
     n = len(df)
 
     if n >= 55:
-        strategies["trend"] = _trend_following(df)
+        strategies["trend"] = _trend_following(df, indicators)
     if n >= 50:
-        strategies["mean_reversion"] = _mean_reversion(df)
+        strategies["mean_reversion"] = _mean_reversion(df, indicators)
     if n >= 21:
         strategies["momentum"] = _momentum(df)
     if n >= 21:
-        strategies["volatility"] = _volatility_analysis(df)
+        strategies["volatility"] = _volatility_analysis(df, indicators)
     if n >= 63:
         strategies["stat_arb"] = _statistical_arbitrage(df)
 
@@ -386,9 +446,9 @@ async def run(input: AnalysisInput) -> AnalystSignal:
         all_metrics["hurst_exponent"] = sa_metrics.get("hurst_exponent")
 
     # Add MACD for convenience
-    macd_line, signal_line, histogram = calculate_macd(df["close"])
-    all_metrics["macd_histogram"] = float(histogram.iloc[-1]) if not pd.isna(histogram.iloc[-1]) else 0.0
-    all_metrics["macd_signal"] = float(signal_line.iloc[-1]) if not pd.isna(signal_line.iloc[-1]) else 0.0
+    histogram, signal_line = indicators["macd_histogram"], indicators["macd_signal"]
+    all_metrics["macd_histogram"] = histogram if not np.isnan(histogram) else 0.0
+    all_metrics["macd_signal"] = signal_line if not np.isnan(signal_line) else 0.0
 
     reasoning_parts = []
     for name, (sig, conf, _) in strategies.items():
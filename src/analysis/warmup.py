@@ -0,0 +1,204 @@
+"""Nightly precomputation of stock analyses and portfolio risk.
+
+Analyses are otherwise computed on first view, so the first dashboard load
+after the cache expires pays for every agent plus the consensus OpenAI call.
+The nightly pipeline calls warm_analysis_cache() right after the OHLCV
+backfill to recompute, in priority order:
+
+1. every held ticker (portfolio-wide, largest positions first)
+2. ANALYSIS_WARMUP_TICKERS — the server-side watchlist (the dashboard
+   watchlist lives in the browser, so it is configured here)
+3. every (ticker, bucket) analysis viewed in the last
+   ANALYSIS_WARMUP_RECENT_DAYS days (stock_analysis_cache.last_viewed_at,
+   migration 083; warmup writes don't count as views)
+
+plus portfolio risk for 'all' and every account bucket. Inputs are assembled
+per bucket with the batch path (_assemble_inputs_many), agents + consensus
+run with bounded concurrency, and only the first ANALYSIS_WARMUP_LLM_BUDGET
+analyses get an LLM narrative — the rest use the deterministic summary.
+LLM-narrated equity analyses and portfolio risk are written with
+ANALYSIS_WARMUP_TTL_HOURS so they are still fresh for morning loads;
+template-narrated and crypto analyses keep their normal TTL, so the first
+view after it lapses recomputes them.
+
+Environment:
+    ANALYSIS_WARMUP_TICKERS        comma-separated extra tickers to warm
+    ANALYSIS_WARMUP_CONCURRENCY    analyses computed at once (default 4)
+    ANALYSIS_WARMUP_LLM_BUDGET     max consensus LLM calls per run (default 50)
+    ANALYSIS_WARMUP_TTL_HOURS      cache lifetime of LLM-narrated equity entries (default 12)
+    ANALYSIS_WARMUP_RECENT_DAYS    look-back for recently viewed analyses (default 7)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any
+
+from src.db import execute_sql
+
+logger = logging.getLogger(__name__)
+
+ANALYSIS_WARMUP_TICKERS = os.getenv("ANALYSIS_WARMUP_TICKERS", "")
+ANALYSIS_WARMUP_CONCURRENCY = int(os.getenv("ANALYSIS_WARMUP_CONCURRENCY", "4"))
+ANALYSIS_WARMUP_LLM_BUDGET = int(os.getenv("ANALYSIS_WARMUP_LLM_BUDGET", "50"))
+ANALYSIS_WARMUP_TTL_HOURS = float(os.getenv("ANALYSIS_WARMUP_TTL_HOURS", "12"))
+ANALYSIS_WARMUP_RECENT_DAYS = int(os.getenv("ANALYSIS_WARMUP_RECENT_DAYS", "7"))
+
+
+def _mapping(row):
+    return row._mapping if hasattr(row, "_mapping") else row
+
+
+def warmup_targets(
+    extra_tickers: str = ANALYSIS_WARMUP_TICKERS,
+    recent_days: int = ANALYSIS_WARMUP_RECENT_DAYS,
+) -> tuple[list[tuple[str, str | None]], list[str]]:
+    """Analyses and portfolio-risk buckets to precompute.
+
+    Returns ``(analysis_keys, risk_buckets)``: ``(ticker, bucket)`` pairs in
+    priority order (bucket None = portfolio-wide) and the account buckets.
+    """
+    held = execute_sql(
+        """
+        SELECT UPPER(p.symbol) AS ticker
+        FROM positions p
+        LEFT JOIN accounts acc ON acc.id = p.account_id
+        WHERE p.quantity > 0
+          AND COALESCE(acc.connection_status, 'connected') != 'deleted'
+        GROUP BY UPPER(p.symbol)
+        ORDER BY SUM(p.quantity * COALESCE(p.current_price, p.price)) DESC
+        """,
+        fetch_results=True,
+    )
+    recent = execute_sql(
+        """
+        SELECT c.ticker, c.bucket
+        FROM stock_analysis_cache c
+        WHERE c.analysis_type = 'full'
+          AND c.last_viewed_at > NOW() - make_interval(days => :days)
+        ORDER BY c.last_viewed_at DESC
+        """,
+        params={"days": recent_days},
+        fetch_results=True,
+    )
+    buckets = execute_sql(
+        """
+        SELECT DISTINCT acc.bucket
+        FROM accounts acc
+        WHERE acc.bucket IS NOT NULL
+          AND COALESCE(acc.connection_status, 'connected') != 'deleted'
+        ORDER BY acc.bucket
+        """,
+        fetch_results=True,
+    )
+
+    keys: dict[tuple[str, str | None], None] = {}
+    for row in held or []:
+        keys.setdefault((_mapping(row)["ticker"], None), None)
+    for ticker in extra_tickers.split(","):
+        if ticker.strip():
+            keys.setdefault((ticker.strip().upper(), None), None)
+    for row in recent or []:
+        m = _mapping(row)
+        bucket = m["bucket"] if m["bucket"] and m["bucket"] != "all" else None
+        keys.setdefault((m["ticker"].upper(), bucket), None)
+
+    return list(keys), [_mapping(row)["bucket"] for row in buckets or []]
+
+
+async def warm_analysis_cache(
+    concurrency: int = ANALYSIS_WARMUP_CONCURRENCY,
+    llm_budget: int = ANALYSIS_WARMUP_LLM_BUDGET,
+    ttl_hours: float = ANALYSIS_WARMUP_TTL_HOURS,
+) -> dict[str, Any]:
+    """Precompute analyses and portfolio risk into the caches.
+
+    Individual failures are logged and counted, never raised.
+
+    Returns:
+        Counters: targets, analyses, failed, llm_calls (narratives actually
+        produced by the LLM), llm_fallbacks, risk, risk_failed, seconds.
+    """
+    from src.analysis import orchestrator
+
+    started = time.perf_counter()
+    keys, risk_buckets = await asyncio.to_thread(warmup_targets)
+    stats = {
+        "targets": len(keys),
+        "analyses": 0,
+        "failed": 0,
+        "llm_calls": 0,
+        "llm_fallbacks": 0,
+        "risk": 0,
+        "risk_failed": 0,
+    }
+
+    # The LLM budget goes to the highest-priority keys
+    use_llm = {key: i < llm_budget for i, key in enumerate(keys)}
+    by_bucket: dict[str | None, list[str]] = {}
+    for ticker, bucket in keys:
+        by_bucket.setdefault(bucket, []).append(ticker)
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def analyze(analysis_input, data_sources, bucket: str | None) -> None:
+        key = (analysis_input.ticker, bucket)
+        llm = use_llm.get(key, False)
+        # Template narratives and crypto (1h TTL) must not be pinned for the night
+        extended = llm and not orchestrator._is_crypto(analysis_input.ticker)
+        async with semaphore:
+            try:
+                result = await orchestrator._analyze_input(
+                    analysis_input.ticker,
+                    "full",
+                    None,
+                    analysis_input,
+                    data_sources,
+                    bucket=bucket,
+                    use_llm=llm,
+                    ttl_hours=ttl_hours if extended else None,
+                    viewed=False,
+                )
+            except Exception:
+                stats["failed"] += 1
+                logger.warning("Warmup analysis failed for %s (bucket=%s)", key[0], bucket, exc_info=True)
+                return
+        stats["analyses"] += 1
+        if llm:
+            if str((result or {}).get("model_used", "")).endswith("-fallback"):
+                stats["llm_fallbacks"] += 1
+            else:
+                stats["llm_calls"] += 1
+
+    for bucket, tickers in by_bucket.items():
+        try:
+            assembled = await asyncio.to_thread(orchestrator._assemble_inputs_many, tickers, bucket)
+        except Exception:
+            stats["failed"] += len(tickers)
+            logger.warning("Warmup input assembly failed for bucket=%s", bucket, exc_info=True)
+            continue
+        await asyncio.gather(*(analyze(inp, sources, bucket) for inp, sources in assembled))
+
+    for bucket in [None, *risk_buckets]:
+        try:
+            await orchestrator._compute_portfolio_risk(bucket, ttl_hours=ttl_hours)
+            stats["risk"] += 1
+        except Exception:
+            stats["risk_failed"] += 1
+            logger.warning("Warmup portfolio risk failed for bucket=%s", bucket, exc_info=True)
+
+    stats["seconds"] = round(time.perf_counter() - started, 1)
+    logger.info(
+        "Analysis warmup: %d/%d analyses (%d LLM, %d LLM fallbacks, %d failed), %d portfolio risk in %.1fs",
+        stats["analyses"],
+        stats["targets"],
+        stats["llm_calls"],
+        stats["llm_fallbacks"],
+        stats["failed"],
+        stats["risk"],
+        stats["seconds"],
+    )
+    return stats
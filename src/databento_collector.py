@@ -8,22 +8,25 @@ All data is stored in Supabase PostgreSQL (ohlcv_daily table) via upsert
 keyed on (symbol, date).
 
 Environment Variables:
-    DATABENTO_API_KEY   - Required. Databento API key.
-    DATABASE_URL        - Supabase PostgreSQL connection URL.
-    REQUIRE_DATABENTO   - If '1' pipeline aborts on failure. Default '1' (critical).
+    DATABENTO_API_KEY        - Required. Databento API key.
+    DATABASE_URL             - Supabase PostgreSQL connection URL.
+    REQUIRE_DATABENTO        - If '1' pipeline aborts on failure. Default '1' (critical).
+    OHLCV_UPSERT_CHUNK_SIZE  - Rows per COPY + merge transaction. Default 5000.
 """
 
 from __future__ import annotations
 
+import io
 import logging
 import os
+import time
 from datetime import date, datetime, timedelta
 from typing import TYPE_CHECKING
 
 import pandas as pd
 from dotenv import load_dotenv
 
-from src.db import execute_sql
+from src.db import execute_sql, get_sync_engine
 from src.retry_utils import hardened_retry
 
 if TYPE_CHECKING:
@@ -42,6 +45,46 @@ DATASET_CUTOFF = date(2024, 7, 1)
 DATASET_HISTORICAL = "EQUS.MINI"
 DATASET_CURRENT = "EQUS.SUMMARY"
 
+# Bulk upsert: rows streamed per COPY into the staging table, merged with a
+# single INSERT ... SELECT ... ON CONFLICT per chunk (one transaction each).
+UPSERT_CHUNK_SIZE = int(os.environ.get("OHLCV_UPSERT_CHUNK_SIZE", "5000"))
+
+OHLCV_COLUMNS = ["symbol", "date", "open", "high", "low", "close", "volume"]
+
+# ON COMMIT DROP keeps the staging table scoped to one chunk's transaction,
+# which is also safe behind the Supabase transaction pooler.
+_STAGING_DDL = """
+    CREATE TEMP TABLE ohlcv_daily_staging (
+        symbol text NOT NULL,
+        date date NOT NULL,
+        open numeric(18,6),
+        high numeric(18,6),
+        low numeric(18,6),
+        close numeric(18,6),
+        volume bigint
+    ) ON COMMIT DROP
+"""
+
+_STAGING_COPY = (
+    "COPY ohlcv_daily_staging (symbol, date, open, high, low, close, volume) "
+    "FROM STDIN WITH (FORMAT csv)"
+)
+
+_STAGING_MERGE = """
+    INSERT INTO ohlcv_daily (symbol, date, open, high, low, close, volume, source)
+    SELECT symbol, date, open, high, low, close, volume, 'databento'
+    FROM ohlcv_daily_staging
+    ON CONFLICT (symbol, date)
+    DO UPDATE SET
+        open = EXCLUDED.open,
+        high = EXCLUDED.high,
+        low = EXCLUDED.low,
+        close = EXCLUDED.close,
+        volume = EXCLUDED.volume,
+        source = EXCLUDED.source,
+        updated_at = now()
+"""
+
 
 class DatabentoCollector:
     """Collect OHLCV daily bars from Databento Historical API."""
@@ -49,17 +92,26 @@ class DatabentoCollector:
     def __init__(
         self,
         api_key: str | None = None,
+        upsert_chunk_size: int | None = None,
     ):
         """
         Initialize the collector.
 
         Args:
             api_key: Databento API key (defaults to DATABENTO_API_KEY env var)
+            upsert_chunk_size: Rows per bulk upsert transaction
+                (defaults to OHLCV_UPSERT_CHUNK_SIZE env var, 5000)
         """
         self.api_key = api_key or os.getenv("DATABENTO_API_KEY")
         if not self.api_key:
             raise ValueError("DATABENTO_API_KEY not set")
 
+        self.upsert_chunk_size = (
+            UPSERT_CHUNK_SIZE if upsert_chunk_size is None else upsert_chunk_size
+        )
+        if self.upsert_chunk_size < 1:
+            raise ValueError("upsert_chunk_size must be >= 1")
+
         # Lazy-loaded Databento client
         self._db_client = None
 
@@ -449,64 +501,119 @@ class DatabentoCollector:
         logger.info(f"Total fetched: {len(result)} OHLCV records")
         return result
 
-    def save_to_supabase(self, df: pd.DataFrame) -> int:
+    def save_to_supabase(self, df: pd.DataFrame, chunk_size: int | None = None) -> int:
         """
         Save OHLCV data to Supabase PostgreSQL with upsert keyed on (symbol, date).
 
+        Streams the frame in chunks: each chunk is COPY'd into a temp staging
+        table and merged into ohlcv_daily with one set-based upsert, all in a
+        single transaction. A failed chunk is rolled back and skipped; the
+        remaining chunks still load. Per-chunk timings and rows/sec are logged.
+        Symbols with committed rows are dropped from this process's OHLCV bar
+        cache (price_service) so reads after the update see the new bars.
+
         Args:
             df: DataFrame with OHLCV data
+            chunk_size: Rows per COPY + merge transaction
+                (defaults to the collector's upsert_chunk_size)
 
         Returns:
             Number of rows upserted
         """
+        if chunk_size is None:
+            chunk_size = self.upsert_chunk_size
+        elif chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
+
         if df.empty:
             logger.warning("No data to save to Supabase")
             return 0
 
-        # Batch upsert for better performance
+        frame = self._prepare_upsert_frame(df)
+        total = len(frame)
+        n_chunks = (total + chunk_size - 1) // chunk_size
+
         rows_affected = 0
         errors = 0
-        for _, row in df.iterrows():
-            try:
-                execute_sql(
-                    """
-                    INSERT INTO ohlcv_daily (symbol, date, open, high, low, close, volume, source)
-                    VALUES (:symbol, :date, :open, :high, :low, :close, :volume, 'databento')
-                    ON CONFLICT (symbol, date)
-                    DO UPDATE SET
-                        open = EXCLUDED.open,
-                        high = EXCLUDED.high,
-                        low = EXCLUDED.low,
-                        close = EXCLUDED.close,
-                        volume = EXCLUDED.volume,
-                        source = EXCLUDED.source,
-                        updated_at = now()
-                    """,
-                    params={
-                        "symbol": row["symbol"],
-                        "date": row["date"],
-                        "open": float(row["open"]) if pd.notna(row["open"]) else None,
-                        "high": float(row["high"]) if pd.notna(row["high"]) else None,
-                        "low": float(row["low"]) if pd.notna(row["low"]) else None,
-                        "close": (
-                            float(row["close"]) if pd.notna(row["close"]) else None
-                        ),
-                        "volume": (
-                            int(row["volume"]) if pd.notna(row["volume"]) else None
-                        ),
-                    },
-                    fetch_results=False,
-                )
-                rows_affected += 1
-            except Exception as e:
-                errors += 1
-                logger.warning(
-                    f"Error upserting row for {row['symbol']} on {row['date']}: {e}"
+        touched: set[str] = set()
+        started = time.perf_counter()
+
+        raw_conn = get_sync_engine().raw_connection()
+        try:
+            for chunk_no, offset in enumerate(range(0, total, chunk_size), start=1):
+                chunk = frame.iloc[offset : offset + chunk_size]
+                chunk_started = time.perf_counter()
+                try:
+                    upserted = self._copy_upsert_chunk(raw_conn, chunk)
+                    raw_conn.commit()
+                except Exception as e:
+                    raw_conn.rollback()
+                    errors += len(chunk)
+                    logger.warning(
+                        f"OHLCV chunk {chunk_no}/{n_chunks} failed ({len(chunk)} rows rolled back): {e}"
+                    )
+                    continue
+
+                rows_affected += upserted
+                touched.update(chunk["symbol"])
+                elapsed = time.perf_counter() - chunk_started
+                logger.info(
+                    f"OHLCV chunk {chunk_no}/{n_chunks}: {upserted} rows in {elapsed:.2f}s "
+                    f"({upserted / elapsed if elapsed > 0 else 0:,.0f} rows/s)"
                 )
+        finally:
+            raw_conn.close()
+
+        if touched:
+            from src.price_service import invalidate_ohlcv_cache
+
+            for symbol in touched:
+                invalidate_ohlcv_cache(symbol)
 
-        logger.info(f"Saved {rows_affected} rows to Supabase ({errors} errors)")
+        elapsed = time.perf_counter() - started
+        logger.info(
+            f"Saved {rows_affected} rows to Supabase in {elapsed:.2f}s "
+            f"({rows_affected / elapsed if elapsed > 0 else 0:,.0f} rows/s, {errors} errors)"
+        )
         return rows_affected
 
+    @staticmethod
+    def _prepare_upsert_frame(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Normalize an OHLCV frame for COPY.
+
+        Drops rows without a key, dedupes on (symbol, date) so a single merge
+        never touches the same row twice, and casts volume to a nullable int
+        so it serializes as a bigint literal rather than ``123.0``.
+        """
+        frame = df[OHLCV_COLUMNS].dropna(subset=["symbol", "date"])
+        frame = frame.drop_duplicates(subset=["symbol", "date"], keep="last").copy()
+        for col in ("open", "high", "low", "close"):
+            frame[col] = pd.to_numeric(frame[col], errors="coerce")
+        frame["volume"] = pd.to_numeric(frame["volume"], errors="coerce").round().astype("Int64")
+        return frame.reset_index(drop=True)
+
+    @staticmethod
+    def _copy_upsert_chunk(raw_conn, chunk: pd.DataFrame) -> int:
+        """
+        COPY one chunk into the staging table and merge it into ohlcv_daily.
+
+        Runs on a raw psycopg2 connection; the caller owns commit/rollback.
+
+        Returns:
+            Rows inserted or updated by the merge
+        """
+        buf = io.StringIO()
+        # Empty unquoted CSV fields load as NULL
+        chunk.to_csv(buf, index=False, header=False, na_rep="")
+        buf.seek(0)
+
+        with raw_conn.cursor() as cur:
+            cur.execute(_STAGING_DDL)
+            cur.copy_expert(_STAGING_COPY, buf)
+            cur.execute(_STAGING_MERGE)
+            return cur.rowcount
+
     def run_backfill(
         self,
         start: str | date,
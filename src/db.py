@@ -8,6 +8,7 @@ import logging
 import time
 from functools import wraps
 from pathlib import Path
+from uuid import uuid4
 
 from sqlalchemy import create_engine, event, text
 from sqlalchemy.exc import DisconnectionError, SQLAlchemyError
@@ -110,14 +111,34 @@ async def get_async_engine() -> AsyncEngine:
                 "Creating async SQLAlchemy engine for PostgreSQL database connection"
             )
 
+            # asyncpg spells libpq's sslmode query parameter as "ssl"
+            async_url = async_url.replace("sslmode=", "ssl=")
+
             is_pooler = ":6543" in async_url
 
-            # Async PostgreSQL configuration
-            connect_args = {}
+            # Async PostgreSQL configuration — mirror the sync engine's
+            # per-connection settings via asyncpg server_settings
+            connect_args: Dict[str, Any] = {
+                "timeout": 10,
+                "server_settings": {
+                    "timezone": "utc",
+                    "statement_timeout": "30s",
+                    "lock_timeout": "10s",
+                    "application_name": (
+                        "trading-api-pooler" if is_pooler else "trading-api-direct"
+                    ),
+                },
+            }
 
             if is_pooler:
                 logger.info(
-                    "🔧 Async engine: Detected Supabase pooler - using asyncpg dialect"
+                    "🔧 Async engine: Detected Supabase pooler - disabling asyncpg statement cache"
+                )
+                # Transaction pooling hands each statement to an arbitrary
+                # backend, so named prepared statements must not be reused.
+                connect_args["statement_cache_size"] = 0
+                connect_args["prepared_statement_name_func"] = (
+                    lambda: f"__asyncpg_{uuid4()}__"
                 )
 
             _async_engine = create_async_engine(
@@ -126,6 +147,7 @@ async def get_async_engine() -> AsyncEngine:
                 max_overflow=2,
                 pool_pre_ping=True,
                 pool_recycle=3600,
+                pool_timeout=30,
                 echo=getattr(settings(), "DEBUG", False),
                 future=True,
                 connect_args=connect_args,
@@ -464,6 +486,16 @@ def ensure_tz_aware(dt):
     return dt
 
 
+def _needs_commit(query) -> bool:
+    """Return True for statements that must run inside a committed transaction (DDL + DML writes)."""
+    query_str = str(query).upper().strip()
+    is_ddl = any(query_str.startswith(ddl) for ddl in ["CREATE", "DROP", "ALTER"])
+    is_dml_write = any(
+        query_str.startswith(dml) for dml in ["INSERT", "UPDATE", "DELETE", "MERGE"]
+    )
+    return is_ddl or is_dml_write
+
+
 @retry_on_connection_error(max_retries=3, delay=1)
 def _execute_query(query, params=None):
     """
@@ -479,14 +511,7 @@ def _execute_query(query, params=None):
     """
     engine = get_sync_engine()
 
-    # Check if this is a statement that needs transaction commit (DDL + DML writes)
-    query_str = str(query).upper().strip()
-    is_ddl = any(query_str.startswith(ddl) for ddl in ["CREATE", "DROP", "ALTER"])
-    is_dml_write = any(
-        query_str.startswith(dml) for dml in ["INSERT", "UPDATE", "DELETE", "MERGE"]
-    )
-
-    if is_ddl or is_dml_write:
+    if _needs_commit(query):
         # Use begin() for DDL statements and DML writes to ensure they are committed
         with engine.begin() as conn:
             if isinstance(query, str):
@@ -624,6 +649,24 @@ def close_engines():
             _async_engine = None
 
 
+async def close_async_engine():
+    """
+    Dispose the async engine from inside a running event loop.
+    FastAPI's lifespan shutdown should await this so pooled asyncpg
+    connections are closed cleanly instead of via a fire-and-forget task.
+    """
+    global _async_engine
+
+    if _async_engine:
+        try:
+            await _async_engine.dispose()
+            logger.info("Async database engine closed successfully")
+        except Exception as e:
+            logger.error(f"Error closing async database engine: {e}")
+        finally:
+            _async_engine = None
+
+
 # Legacy compatibility function
 def close_engine():
     """Legacy compatibility function - use close_engines() instead."""
@@ -703,6 +746,32 @@ def validate_timezone_aware(params):
                     check_datetime_param(f"[{i}].{key}", value)
 
 
+def _validate_params(params) -> None:
+    """
+    Validate parameter types for SQLAlchemy 2.0 compatibility.
+
+    Shared by execute_sql() and async_execute_sql() so both paths enforce
+    the same dict-only params contract and timezone rules.
+
+    Raises:
+        TypeError: If params aren't dict or list of dicts
+        ValueError: If naive datetime found for timestamptz fields
+    """
+    if params is None:
+        return
+    if not isinstance(params, (dict, list)):
+        raise TypeError(
+            f"params must be dict or list of dicts, got {type(params).__name__}. "
+            "Use df.to_dict('records') for DataFrames."
+        )
+    if isinstance(params, list):
+        if not all(isinstance(p, dict) for p in params):
+            raise TypeError("All items in params list must be dictionaries")
+
+    # Validate timezone-aware datetimes for timestamptz fields
+    validate_timezone_aware(params)
+
+
 @overload
 def execute_sql(
     query: str,
@@ -748,19 +817,7 @@ def execute_sql(
         ValueError: If naive datetime found for timestamptz fields
         SQLAlchemyError: For database errors (after logging)
     """
-    # Validate parameter types for SQLAlchemy 2.0 compatibility
-    if params is not None:
-        if not isinstance(params, (dict, list)):
-            raise TypeError(
-                f"params must be dict or list of dicts, got {type(params).__name__}. "
-                "Use df.to_dict('records') for DataFrames."
-            )
-        if isinstance(params, list):
-            if not all(isinstance(p, dict) for p in params):
-                raise TypeError("All items in params list must be dictionaries")
-
-        # Validate timezone-aware datetimes for timestamptz fields
-        validate_timezone_aware(params)
+    _validate_params(params)
 
     try:
         if isinstance(params, list):
@@ -782,6 +839,129 @@ def execute_sql(
         raise  # Always re-raise for proper error surfacing
 
 
+async def _async_execute_query(
+    query,
+    params=None,
+    fetch_results: bool = False,
+    max_retries: int = 3,
+    delay: float = 1,
+):
+    """
+    INTERNAL: Execute a query on the asyncpg engine with retry on connection errors.
+    External callers should use async_execute_sql() instead.
+
+    Mirrors _execute_query(): writes run in engine.begin() so they commit,
+    reads use a plain connection. Rows are fetched before the connection is
+    returned to the pool. Backoff uses asyncio.sleep so a flaky connection
+    never stalls the event loop.
+    """
+    global _async_engine
+
+    last_exception = None
+    for attempt in range(max_retries):
+        try:
+            engine = await get_async_engine()
+            if isinstance(params, list) or _needs_commit(query):
+                ctx = engine.begin()
+            else:
+                ctx = engine.connect()
+            async with ctx as conn:
+                result = await conn.execute(query, params) if params else await conn.execute(query)
+                if fetch_results:
+                    return result.fetchall()
+                return result
+        except (DisconnectionError, SQLAlchemyError) as e:
+            last_exception = e
+            if attempt < max_retries - 1:
+                logger.warning(
+                    f"Async database operation failed (attempt {attempt + 1}/{max_retries}): {e}"
+                )
+                await asyncio.sleep(delay * (2**attempt))  # Exponential backoff
+                if _async_engine and "connection" in str(e).lower():
+                    try:
+                        await _async_engine.dispose()  # Dispose connections, but keep engine
+                        logger.debug("Disposed async engine connections for retry")
+                    except Exception:
+                        pass
+            else:
+                logger.error(
+                    f"Async database operation failed after {max_retries} attempts: {e}"
+                )
+                raise last_exception from e
+
+    return None
+
+
+@overload
+async def async_execute_sql(
+    query: str,
+    params: Optional[Union[Dict[str, Any], List[Dict[str, Any]]]] = None,
+    fetch_results: Literal[True] = ...,
+) -> List[Row[Any]]: ...
+
+
+@overload
+async def async_execute_sql(
+    query: str,
+    params: Optional[Union[Dict[str, Any], List[Dict[str, Any]]]] = None,
+    fetch_results: Literal[False] = ...,
+) -> CursorResult[Any]: ...
+
+
+@overload
+async def async_execute_sql(
+    query: str,
+    params: Optional[Union[Dict[str, Any], List[Dict[str, Any]]]] = None,
+    fetch_results: bool = False,
+) -> Union[List[Row[Any]], CursorResult[Any]]: ...
+
+
+async def async_execute_sql(
+    query: str,
+    params: Optional[Union[Dict[str, Any], List[Dict[str, Any]]]] = None,
+    fetch_results: bool = False,
+) -> Union[List[Row[Any]], CursorResult[Any]]:
+    """
+    Async counterpart of execute_sql() backed by the asyncpg engine.
+
+    Use this from ``async def`` FastAPI handlers so a slow query yields to
+    the event loop instead of stalling every other in-flight request.
+    Accepts the same named-placeholder SQL and dict params as execute_sql().
+
+    Note: asyncpg binds parameters with server-side types, so values must
+    match their column type — pass ``date``/``datetime`` objects (not ISO
+    strings) for date and timestamptz comparisons.
+
+    Args:
+        query: SQL query with named placeholders (:param_name)
+        params: Dict or list of dicts for parameters. No tuples allowed.
+        fetch_results: Whether to return query results
+
+    Returns:
+        Query results if fetch_results=True, otherwise execution result
+
+    Raises:
+        TypeError: If params aren't dict or list of dicts
+        ValueError: If naive datetime found for timestamptz fields
+        SQLAlchemyError: For database errors (after logging)
+    """
+    _validate_params(params)
+
+    try:
+        return await _async_execute_query(text(query), params, fetch_results)
+    except Exception as e:
+        logger.error(f"Supabase async query failed: {e}")
+        raise  # Always re-raise for proper error surfacing
+
+
+async def async_fetch(
+    query: str,
+    params: Optional[Dict[str, Any]] = None,
+) -> List[Row[Any]]:
+    """Shorthand for ``await async_execute_sql(query, params, fetch_results=True)``."""
+    return await async_execute_sql(query, params, fetch_results=True)
+
+
 def df_to_records(df, utc_columns=None):
     """
     Convert DataFrame to list of dicts with proper UTC timestamp handling.
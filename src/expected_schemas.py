@@ -536,6 +536,31 @@ EXPECTED_SCHEMAS: Dict[str, Dict[str, Any]] = {
         "primary_keys": ["id"],
         "description": "Video research saved quote excerpts from YouTube (migration 074)",
     },
+    "llm_parse_cache": {
+        "required_fields": {
+            "call_type": "text",
+            "content_hash": "text",
+            "prompt_version": "text",
+            "model": "text",
+            "model_used": "text",
+            "result": "json",
+            "hit_count": "integer",
+            "created_at": "timestamptz",
+            "last_hit_at": "timestamptz",
+        },
+        "primary_keys": ["call_type", "content_hash", "prompt_version", "model"],
+        "description": "Content-hash keyed LLM triage/parse result cache (migration 080)",
+    },
+    "technical_indicator_state": {
+        "required_fields": {
+            "symbol": "text",
+            "as_of": "date",
+            "state": "json",
+            "updated_at": "timestamptz",
+        },
+        "primary_keys": ["symbol"],
+        "description": "Per-symbol recursive indicator state for the technical agent (migration 082)",
+    },
 }
 
 # Schema metadata for reference
@@ -7,10 +7,13 @@ sentiment analysis, and deduplication. Supports both Parquet and database output
 
 import json
 import logging
+import os
 import re
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union, Literal
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union, Literal
 
 import pandas as pd
 from src.nlp.sentiment import sentiment_score
@@ -19,6 +22,45 @@ from src.nlp.sentiment import sentiment_score
 logger = logging.getLogger(__name__)
 
 
+# Sentiment scoring fans out to a process pool once a batch has this many
+# unique cleaned texts (channel history backfills); smaller batches stay serial.
+SENTIMENT_POOL_MIN_TEXTS = int(os.environ.get("SENTIMENT_POOL_MIN_TEXTS", "20000"))
+SENTIMENT_POOL_WORKERS = int(os.environ.get("SENTIMENT_POOL_WORKERS", "0"))  # 0 = cpu_count
+
+# ========== PRECOMPILED PATTERNS ==========
+# $TICKER with optional class share suffix (.A, .B, etc.), matched on upper-cased text
+_TICKER_RE = re.compile(r"\$[A-Z]{1,6}(?:\.[A-Z]+)?")
+_TWEET_URL_RE = re.compile(r"https?://(?:twitter\.com|x\.com)/\w+/status/\d+")
+
+# clean_text passes, in order. Each runs only if its trigger substring is in the
+# (partially cleaned) text, so a typical message skips most regex passes while
+# the output stays identical to applying every pass. The passes are kept
+# separate rather than merged into one alternation because they interact
+# (nested emphasis, inline code before code blocks).
+# Note: dash is escaped (\-) to prevent [$-_] being interpreted as a character range
+_CLEAN_STEPS: Tuple[Tuple[str, "re.Pattern[str]", str], ...] = (
+    # URLs
+    (
+        "http",
+        re.compile(
+            r"http[s]?://(?:[a-zA-Z]|[0-9]|[$\-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+"
+        ),
+        "",
+    ),
+    # Discord mentions and channels
+    ("<@", re.compile(r"<@!?\d+>"), ""),
+    ("<#", re.compile(r"<#\d+>"), ""),
+    # Markdown, preserving the text content
+    ("**", re.compile(r"\*\*(.+?)\*\*"), r"\1"),  # Bold
+    ("__", re.compile(r"__(.+?)__"), r"\1"),
+    ("*", re.compile(r"\*([^*]+)\*"), r"\1"),  # Italic
+    ("_", re.compile(r"_([^_]+)_"), r"\1"),
+    ("~~", re.compile(r"~~(.+?)~~"), r"\1"),  # Strikethrough
+    ("`", re.compile(r"`([^`]+)`"), r"\1"),  # Inline code
+    ("```", re.compile(r"```[\s\S]*?```"), ""),  # Code blocks
+)
+
+
 # Centralized table mapping for channel types
 # Note: "general" redirects to trading as the default behavior
 CHANNEL_TYPE_TO_TABLE = {
@@ -69,22 +111,9 @@ def extract_ticker_symbols(text: str | None) -> List[str]:
     if not text:
         return []
 
-    # Pattern matches $TICKER format with optional class share suffix (.A, .B, etc.)
-    # - \$ matches literal dollar sign
-    # - [A-Z]{1,6} matches 1-6 uppercase letters (ticker symbol)
-    # - (?:\.[A-Z]+)? optionally matches period + uppercase letters (class shares like BRK.B)
-    pattern = r"\$[A-Z]{1,6}(?:\.[A-Z]+)?"
-    matches = re.findall(
-        pattern, text.upper()
-    )  # Convert to uppercase for case-insensitive matching
-
-    # Remove duplicates while preserving order
-    unique_tickers = []
-    for ticker in matches:
-        if ticker not in unique_tickers:
-            unique_tickers.append(ticker)
-
-    return unique_tickers
+    # Convert to uppercase for case-insensitive matching; dict.fromkeys
+    # removes duplicates while preserving order
+    return list(dict.fromkeys(_TICKER_RE.findall(text.upper())))
 
 
 def extract_unprefixed_tickers(
@@ -652,36 +681,12 @@ def clean_text(text: str) -> str:
     if not isinstance(text, str):
         return ""
 
-    # Remove URLs
-    # Note: dash is escaped (\-) to prevent [$-_] being interpreted as a character range
-    text = re.sub(
-        r"http[s]?://(?:[a-zA-Z]|[0-9]|[$\-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+",
-        "",
-        text,
-    )
-
-    # Remove Discord mentions and channels
-    text = re.sub(r"<@!?\d+>", "", text)
-    text = re.sub(r"<#\d+>", "", text)
-
-    # Remove markdown formatting while preserving the text content
-    # Bold: **text** or __text__
-    text = re.sub(r"\*\*(.+?)\*\*", r"\1", text)
-    text = re.sub(r"__(.+?)__", r"\1", text)
-    # Italic: *text* or _text_
-    text = re.sub(r"\*([^*]+)\*", r"\1", text)
-    text = re.sub(r"_([^_]+)_", r"\1", text)
-    # Strikethrough: ~~text~~
-    text = re.sub(r"~~(.+?)~~", r"\1", text)
-    # Inline code: `text`
-    text = re.sub(r"`([^`]+)`", r"\1", text)
-    # Code blocks: ```text```
-    text = re.sub(r"```[\s\S]*?```", "", text)
+    for trigger, pattern, replacement in _CLEAN_STEPS:
+        if trigger in text:
+            text = pattern.sub(replacement, text)
 
     # Remove extra whitespace but preserve question/exclamation marks
-    text = " ".join(text.split())
-
-    return text.strip()
+    return " ".join(text.split())
 
 
 def calculate_sentiment(text: str) -> float:
@@ -715,10 +720,52 @@ def extract_tweet_urls(text: str) -> List[str]:
     if not isinstance(text, str):
         return []
 
-    # Pattern for Twitter/X URLs
-    twitter_pattern = r"https?://(?:twitter\.com|x\.com)/\w+/status/\d+"
-    urls = re.findall(twitter_pattern, text)
-    return urls
+    return _TWEET_URL_RE.findall(text)
+
+
+def _score_sentiment_chunk(texts: List[str]) -> List[float]:
+    """Process-pool worker: score a chunk of texts."""
+    return [calculate_sentiment(text) for text in texts]
+
+
+def score_sentiments(
+    texts: Sequence[str],
+    workers: Optional[int] = None,
+    min_pool_texts: int = SENTIMENT_POOL_MIN_TEXTS,
+) -> List[float]:
+    """Score many texts with VADER, deduplicating and parallelising large batches.
+
+    Identical texts are scored once. When the number of unique texts reaches
+    ``min_pool_texts`` the work is split across a process pool (VADER is pure
+    Python and CPU-bound, so threads would not help). Falls back to serial
+    scoring if the pool cannot be started.
+
+    Args:
+        texts: Texts to score (typically cleaned_content)
+        workers: Pool size (default: SENTIMENT_POOL_WORKERS or cpu_count)
+        min_pool_texts: Unique-text threshold for using the pool
+
+    Returns:
+        One score per input text, in input order
+    """
+    unique = list(dict.fromkeys(texts))
+    workers = workers or SENTIMENT_POOL_WORKERS or os.cpu_count() or 1
+
+    scores: Optional[List[float]] = None
+    if workers > 1 and len(unique) >= min_pool_texts:
+        # ~4 chunks per worker keeps the pool busy without per-text IPC
+        chunk_size = max(1, -(-len(unique) // (workers * 4)))
+        chunks = [unique[i : i + chunk_size] for i in range(0, len(unique), chunk_size)]
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                scores = [score for part in pool.map(_score_sentiment_chunk, chunks) for score in part]
+        except Exception as e:
+            logger.warning(f"Sentiment process pool failed ({e}); scoring serially")
+    if scores is None:
+        scores = _score_sentiment_chunk(unique)
+
+    by_text = dict(zip(unique, scores, strict=True))
+    return [by_text[text] for text in texts]
 
 
 def clean_messages(
@@ -906,32 +953,48 @@ def clean_messages(
         logger.warning(f"Error parsing timestamps: {e}")
         df["timestamp"] = pd.Timestamp.now(tz="UTC")
 
-    # Text cleaning
-    df["cleaned_content"] = df["content"].fillna("").astype(str).apply(clean_text)
+    # Normalise content once; every feature below reads this Series
+    content = df["content"].fillna("").astype(str)
+    started = time.perf_counter()
+
+    # Text cleaning (gated single-scan passes, see _CLEAN_STEPS)
+    df["cleaned_content"] = [clean_text(text) for text in content]
+    cleaned_at = time.perf_counter()
 
-    # Sentiment analysis
-    df["sentiment"] = df["cleaned_content"].apply(calculate_sentiment)
+    # Sentiment analysis (deduplicated; process pool for large batches)
+    df["sentiment"] = score_sentiments(df["cleaned_content"].tolist())
+    scored_at = time.perf_counter()
 
-    # Ticker symbol extraction
-    df["tickers"] = df["content"].fillna("").astype(str).apply(extract_ticker_symbols)
-    df["tickers_str"] = df["tickers"].apply(lambda x: ", ".join(x) if x else "")
+    # Ticker symbol extraction (order-preserving dedupe)
+    df["tickers"] = [
+        list(dict.fromkeys(found))
+        for found in content.str.upper().str.findall(_TICKER_RE)
+    ]
+    df["tickers_str"] = df["tickers"].str.join(", ")
 
     # Tweet URL extraction
-    df["tweet_urls"] = df["content"].fillna("").astype(str).apply(extract_tweet_urls)
-    df["tweet_urls_str"] = df["tweet_urls"].apply(lambda x: ", ".join(x) if x else "")
+    df["tweet_urls"] = content.str.findall(_TWEET_URL_RE)
+    df["tweet_urls_str"] = df["tweet_urls"].str.join(", ")
 
     # Additional features
-    df["char_len"] = df["content"].fillna("").astype(str).str.len()
-    df["word_len"] = df["content"].fillna("").astype(str).str.split().str.len()
-    df["is_command"] = (
-        df["content"].fillna("").astype(str).str.startswith("!", na=False)
-    )
+    df["char_len"] = content.str.len()
+    df["word_len"] = content.str.split().str.len()
+    df["is_command"] = content.str.startswith("!")
 
     # Channel-specific processing
     if channel_type.lower() == "trading":
         # Additional trading-specific features could go here
-        df["has_tickers"] = df["tickers"].apply(lambda x: len(x) > 0)
-        df["ticker_count"] = df["tickers"].apply(len)
+        df["ticker_count"] = df["tickers"].str.len()
+        df["has_tickers"] = df["ticker_count"] > 0
+
+    finished = time.perf_counter()
+    elapsed = finished - started
+    logger.info(
+        f"Cleaned {len(df)} messages in {elapsed:.2f}s "
+        f"({len(df) / elapsed if elapsed else 0:,.0f} msg/s; "
+        f"clean {cleaned_at - started:.2f}s, sentiment {scored_at - cleaned_at:.2f}s, "
+        f"features {finished - scored_at:.2f}s)"
+    )
 
     # Sort by timestamp - ensure DataFrame return
     df = df.sort_values("timestamp").copy()
@@ -0,0 +1,418 @@
+"""
+Local deterministic triage: rules + a linear model, LLM only when unsure.
+
+Every chunk that reaches openai_parser.cached_triage_message() used to cost
+a triage call (plus a retry on malformed output). Most of them are easy:
+"$NVDA adding calls at 950" is obviously actionable, "good morning!" is
+obviously noise. This module decides those locally, on the CPU, from the
+same signals the pipeline already computes (preclean.extract_candidate_tickers,
+is_noise_message, extract_price_mentions):
+
+1. Rules - clear noise (greetings, reactions, emoji-only, short chatter with
+   no tickers/numbers/trade terms) and clear trade content (a ticker plus a
+   trade term or a number) are decided immediately.
+2. Linear model - a logistic regression over bag-of-words + signal features,
+   trained by scripts/nlp/train_triage_model.py on past outcomes
+   (messages with parsed ideas = actionable, parse_status='noise' = noise).
+   Scores outside the [lower, upper] band calibrated at training time are
+   decided locally; the model never rejects a chunk with candidate tickers.
+3. Anything else (rules undecided, score inside the band, or no model file)
+   falls back to the LLM triage call.
+
+A local decision takes on the order of 100 microseconds. False accepts only
+cost a parse call (which can still return no ideas), so the reject side is
+deliberately conservative.
+
+Environment:
+    LOCAL_TRIAGE_ENABLED     "false" disables local triage (default true)
+    LOCAL_TRIAGE_MODEL_PATH  model JSON (default data/models/triage_linear.json);
+                             missing file = rules only
+"""
+
+import json
+import logging
+import math
+import os
+import re
+import threading
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.nlp.preclean import (
+    extract_candidate_tickers,
+    extract_price_mentions,
+    is_noise_message,
+    normalize_text,
+)
+from src.nlp.schemas import TriageResult
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+LOCAL_TRIAGE_ENABLED = os.getenv("LOCAL_TRIAGE_ENABLED", "true").lower() != "false"
+LOCAL_TRIAGE_MODEL_PATH = Path(
+    os.getenv("LOCAL_TRIAGE_MODEL_PATH", str(PROJECT_ROOT / "data" / "models" / "triage_linear.json"))
+)
+
+MODEL_FORMAT_VERSION = 1
+
+# Words that make a ticker mention read as trade content
+TRADE_TERMS = frozenset(
+    """
+    buy bought buying sell sold selling long longs short shorts shorting shorted
+    call calls put puts option options strike strikes expiry exp leaps spread spreads
+    trim trimmed trimming add added adding adds load loaded loading starter
+    entry entries entered exit exited exiting stop stops target targets targeting pt
+    support resistance breakout breaking breakdown broke bounce bounced reclaim
+    bullish bearish bull bear position positions shares holding hold holdings
+    earnings guidance revenue margins margin valuation eps dip rally squeeze
+    hedge hedged hedging covered scale scaled swing chart levels level upside downside
+    accumulate accumulating averaging average profit profits gains loss losses
+    """.split()
+)
+
+# Whole-message social chatter (matched after normalize_text, lowercase)
+_SOCIAL_PATTERN = re.compile(
+    r"^(?:(?:good\s+(?:morning|night|evening|afternoon|luck|stuff|call|one)|gm|gn|"
+    r"thanks?(?:\s+(?:you|man|guys|all|bro))?|thank\s+you|ty|tysm|np|"
+    r"lol|lmao|haha+|hehe|nice|wow|omg|damn|bruh|bro|yep|yeah|yes|no|nope|ok|okay|"
+    r"hi|hey|hello|welcome(?:\s+\w+)?|congrats|gg|same|agreed|true|facts|this|"
+    r"see\s+you|cya|later|brb|me\s+too|lets\s+go|let's\s+go)[\s!.?,]*)+$"
+)
+_WORD_PATTERN = re.compile(r"[a-z][a-z0-9']*")
+_NUMBER_PATTERN = re.compile(r"\d")
+_URL_PATTERN = re.compile(r"https?://", re.IGNORECASE)
+
+
+@dataclass
+class TriageSignals:
+    """Deterministic signals shared by the rules and the linear model."""
+
+    tickers: List[str]
+    explicit_ticker: bool
+    trade_terms: int
+    has_number: bool
+    has_price: bool
+    noise_heuristic: bool
+    social: bool
+    words: List[str]
+    length: int
+    has_url: bool
+    question: bool
+
+    def features(self) -> List[str]:
+        """Binary feature names for the linear model."""
+        feats = [f"w:{w}" for w in sorted(set(self.words))]
+        if self.tickers:
+            feats.append("has_ticker")
+            feats.append("tickers:many" if len(self.tickers) > 1 else "tickers:one")
+        if self.explicit_ticker:
+            feats.append("explicit_ticker")
+        if self.trade_terms:
+            feats.append("trade_terms:many" if self.trade_terms > 1 else "trade_terms:one")
+        for flag in ("has_number", "has_price", "noise_heuristic", "social", "has_url", "question"):
+            if getattr(self, flag):
+                feats.append(flag)
+        for bound in (20, 80, 300):
+            if self.length < bound:
+                feats.append(f"len:<{bound}")
+                break
+        else:
+            feats.append("len:long")
+        return feats
+
+
+def triage_signals(text: str) -> TriageSignals:
+    """Compute the local triage signals for one chunk of text."""
+    candidates = extract_candidate_tickers(text or "")
+    tickers = candidates["tickers"]
+    ticker_words = {t.lower() for t in tickers}
+    cleaned = normalize_text(text or "").lower()
+    words = [w for w in _WORD_PATTERN.findall(cleaned) if w not in ticker_words]
+    return TriageSignals(
+        tickers=tickers,
+        explicit_ticker="explicit" in candidates["sources"].values(),
+        trade_terms=sum(1 for w in words if w in TRADE_TERMS),
+        has_number=bool(_NUMBER_PATTERN.search(text or "")),
+        has_price=extract_price_mentions(text or "")["count"] > 0,
+        noise_heuristic=is_noise_message(text or ""),
+        social=bool(cleaned) and bool(_SOCIAL_PATTERN.match(cleaned)),
+        words=words,
+        length=len(text or ""),
+        has_url=bool(_URL_PATTERN.search(text or "")),
+        question="?" in (text or ""),
+    )
+
+
+# =============================================================================
+# LINEAR MODEL
+# =============================================================================
+
+
+def _sigmoid(z):
+    return 1.0 / (1.0 + np.exp(-np.clip(z, -30.0, 30.0)))
+
+
+@dataclass
+class LinearTriageModel:
+    """
+    Logistic regression over TriageSignals.features().
+
+    score() is P(actionable). Scores >= upper are accepted, scores <= lower
+    rejected; the band in between is left to the LLM.
+    """
+
+    weights: Dict[str, float]
+    bias: float
+    lower: float
+    upper: float
+    trained_on: int = 0
+    metrics: Dict[str, float] = field(default_factory=dict)
+
+    def score(self, features: Sequence[str]) -> float:
+        z = self.bias + sum(self.weights.get(f, 0.0) for f in features)
+        return 1.0 / (1.0 + math.exp(-max(-30.0, min(30.0, z))))
+
+    def to_dict(self) -> Dict:
+        return {
+            "version": MODEL_FORMAT_VERSION,
+            "bias": self.bias,
+            "lower": self.lower,
+            "upper": self.upper,
+            "trained_on": self.trained_on,
+            "metrics": self.metrics,
+            "weights": self.weights,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> Optional["LinearTriageModel"]:
+        """Rebuild a saved model; None if the format version does not match."""
+        if data.get("version") != MODEL_FORMAT_VERSION:
+            return None
+        return cls(
+            weights={k: float(v) for k, v in data["weights"].items()},
+            bias=float(data["bias"]),
+            lower=float(data["lower"]),
+            upper=float(data["upper"]),
+            trained_on=int(data.get("trained_on", 0)),
+            metrics=dict(data.get("metrics", {})),
+        )
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_text(json.dumps(self.to_dict(), indent=1, sort_keys=True))
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["LinearTriageModel"]:
+        """Load a model file; None if missing, unreadable or an old format."""
+        try:
+            data = json.loads(Path(path).read_text())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Local triage model {path} unreadable: {e}")
+            return None
+        model = cls.from_dict(data)
+        if model is None:
+            logger.warning(f"Local triage model {path} has an unsupported format, ignoring it")
+        return model
+
+
+def _calibrate_band(scores: np.ndarray, labels: np.ndarray, target_precision: float) -> Tuple[float, float]:
+    """
+    Widest accept/reject regions that keep precision >= target on held-out data.
+
+    upper: lowest score s.t. P(actionable | score >= upper) >= target.
+    lower: highest score s.t. P(noise | score <= lower) >= target.
+    Unreachable sides get a threshold no score can cross.
+    """
+    order = np.argsort(-scores, kind="stable")
+    sorted_scores, sorted_labels = scores[order], labels[order]
+    n = np.arange(1, len(scores) + 1)
+
+    accept_precision = np.cumsum(sorted_labels) / n
+    ok = np.nonzero(accept_precision >= target_precision)[0]
+    upper = float(sorted_scores[ok.max()]) if len(ok) else 1.01
+
+    reject_precision = np.cumsum(1 - sorted_labels[::-1]) / n
+    ok = np.nonzero(reject_precision >= target_precision)[0]
+    lower = float(sorted_scores[::-1][ok.max()]) if len(ok) else -0.01
+
+    if lower >= upper:  # overlapping regions: keep only the non-overlapping extremes
+        lower, upper = -0.01, 1.01
+    return lower, upper
+
+
+def train_linear_model(
+    texts: Sequence[str],
+    labels: Sequence[int],
+    min_count: int = 2,
+    epochs: int = 300,
+    learning_rate: float = 0.5,
+    l2: float = 1e-4,
+    holdout: float = 0.2,
+    target_precision: float = 0.98,
+) -> LinearTriageModel:
+    """
+    Fit the triage model (numpy only; full-batch gradient descent).
+
+    Args:
+        texts: Message texts
+        labels: 1 = actionable, 0 = noise
+        min_count: Drop word features seen in fewer training texts
+        holdout: Share of examples (by content hash) used to calibrate the band
+        target_precision: Precision required for local accept/reject decisions
+
+    Returns:
+        Trained model with lower/upper calibrated on the holdout split
+    """
+    features = [triage_signals(t).features() for t in texts]
+    y = np.asarray(labels, dtype=np.float64)
+    # Deterministic split: the same text always lands on the same side
+    is_holdout = np.array([zlib.crc32(t.encode("utf-8")) % 1000 < holdout * 1000 for t in texts], dtype=bool)
+    if is_holdout.all() or not is_holdout.any():
+        is_holdout[:] = False
+        is_holdout[::5] = True
+
+    train_idx = np.nonzero(~is_holdout)[0]
+    counts: Dict[str, int] = {}
+    for i in train_idx:
+        for f in features[i]:
+            counts[f] = counts.get(f, 0) + 1
+    kept = sorted(f for f, c in counts.items() if c >= min_count or not f.startswith("w:"))
+    vocab = {f: j for j, f in enumerate(kept)}
+
+    def encode(rows):
+        cols = [[vocab[f] for f in features[i] if f in vocab] for i in rows]
+        lengths = np.array([len(c) for c in cols], dtype=np.int64)
+        flat = np.fromiter((j for c in cols for j in c), dtype=np.int64, count=int(lengths.sum()))
+        owner = np.repeat(np.arange(len(rows)), lengths)
+        return flat, owner
+
+    flat, owner = encode(train_idx)
+    y_train = y[train_idx]
+    w = np.zeros(len(vocab))
+    b = 0.0
+    n = max(len(train_idx), 1)
+    for _ in range(epochs):
+        z = b + np.bincount(owner, weights=w[flat], minlength=len(train_idx))
+        err = _sigmoid(z) - y_train
+        grad = np.bincount(flat, weights=err[owner], minlength=len(vocab)) / n + l2 * w
+        w -= learning_rate * grad
+        b -= learning_rate * float(err.mean())
+
+    hold_idx = np.nonzero(is_holdout)[0]
+    flat, owner = encode(hold_idx)
+    hold_scores = _sigmoid(b + np.bincount(owner, weights=w[flat], minlength=len(hold_idx)))
+    lower, upper = _calibrate_band(hold_scores, y[hold_idx], target_precision)
+    decided = (hold_scores >= upper) | (hold_scores <= lower)
+
+    names = sorted(vocab, key=vocab.get)
+    return LinearTriageModel(
+        weights={f: round(float(w[vocab[f]]), 6) for f in names if abs(w[vocab[f]]) > 1e-6},
+        bias=float(b),
+        lower=lower,
+        upper=upper,
+        trained_on=len(train_idx),
+        metrics={
+            "holdout": int(len(hold_idx)),
+            "holdout_decided": round(float(decided.mean()), 4) if len(hold_idx) else 0.0,
+            "holdout_accuracy": (
+                round(float(((hold_scores[decided] >= 0.5) == y[hold_idx][decided]).mean()), 4)
+                if decided.any()
+                else 0.0
+            ),
+        },
+    )
+
+
+# =============================================================================
+# CLASSIFIER
+# =============================================================================
+
+
+@dataclass
+class LocalTriageDecision:
+    """Outcome of local triage; result is None when the LLM must decide."""
+
+    result: Optional[TriageResult]
+    source: Optional[str]  # "rule", "model" or None (deferred)
+    score: Optional[float] = None
+
+
+class LocalTriage:
+    """Rules first, then the linear model (if any), else defer to the LLM."""
+
+    def __init__(self, model: Optional[LinearTriageModel] = None):
+        self.model = model
+
+    @staticmethod
+    def _result(signals: TriageSignals, is_noise: bool, reason: str) -> TriageResult:
+        return TriageResult(
+            is_noise=is_noise,
+            has_actionable_content=not is_noise,
+            tickers_present=signals.tickers,
+            skip_reason=reason if is_noise else None,
+        )
+
+    def classify(self, text: str) -> LocalTriageDecision:
+        signals = triage_signals(text)
+
+        # Rules: clear noise
+        if not signals.tickers and not signals.trade_terms and not signals.has_number:
+            if signals.social:
+                return LocalTriageDecision(self._result(signals, True, "local:social"), "rule")
+            if signals.noise_heuristic and not signals.has_url:
+                return LocalTriageDecision(self._result(signals, True, "local:short_noise"), "rule")
+
+        # Rules: clear trade content
+        if signals.tickers and (signals.trade_terms or signals.has_price or signals.has_number):
+            return LocalTriageDecision(self._result(signals, False, ""), "rule")
+
+        if self.model is None:
+            return LocalTriageDecision(None, None)
+
+        score = self.model.score(signals.features())
+        if score >= self.model.upper:
+            return LocalTriageDecision(self._result(signals, False, ""), "model", score)
+        if score <= self.model.lower and not signals.tickers:
+            return LocalTriageDecision(self._result(signals, True, f"local:model({score:.2f})"), "model", score)
+        return LocalTriageDecision(None, None, score)
+
+
+_local_triage: Optional[LocalTriage] = None
+_local_triage_initialized = False
+_local_triage_lock = threading.Lock()
+
+
+def get_local_triage() -> Optional[LocalTriage]:
+    """Process-wide local triage, or None when LOCAL_TRIAGE_ENABLED=false."""
+    global _local_triage, _local_triage_initialized
+    if not _local_triage_initialized:
+        with _local_triage_lock:
+            if not _local_triage_initialized:
+                if LOCAL_TRIAGE_ENABLED:
+                    model = LinearTriageModel.load(LOCAL_TRIAGE_MODEL_PATH)
+                    logger.info(
+                        f"Local triage enabled ({'rules + model' if model else 'rules only'})"
+                    )
+                    _local_triage = LocalTriage(model)
+                else:
+                    _local_triage = None
+                _local_triage_initialized = True
+    return _local_triage
+
+
+def set_local_triage(triage: Optional[LocalTriage]) -> None:
+    """Install a specific local triage (or None to disable), e.g. for --no-local-triage or tests."""
+    global _local_triage, _local_triage_initialized
+    with _local_triage_lock:
+        _local_triage = triage
+        _local_triage_initialized = True
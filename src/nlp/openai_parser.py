@@ -27,10 +27,12 @@ Expected calls for typical messages:
 Version: 1.2.0 (unified models, env-based thresholds)
 """
 
+import functools
 import json
 import logging
 import os
 import re
+import threading
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any, Tuple, TypeVar, Union
 from datetime import datetime, timezone
@@ -38,6 +40,9 @@ from datetime import datetime, timezone
 from openai import OpenAI
 from openai.types.responses import Response
 
+from src.nlp.local_triage import get_local_triage
+from src.nlp.parse_cache import get_parse_cache
+from src.nlp.rate_limiter import estimate_request_tokens, rate_limited_call
 from src.nlp.schemas import (
     ParsedIdea,
     MessageParseResult,
@@ -67,53 +72,95 @@ class CallStats:
     main_calls: int = 0
     escalation_calls: int = 0
     noise_chunks: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    local_triage_accepts: int = 0
+    local_triage_rejects: int = 0
+    local_triage_deferred: int = 0
 
     @property
     def total_calls(self) -> int:
         """Total API calls made (excluding retries counted separately)."""
         return self.triage_calls + self.main_calls + self.escalation_calls
 
+    @property
+    def cache_hit_rate(self) -> float:
+        """Share of parse-cache lookups served without an API call."""
+        lookups = self.cache_hits + self.cache_misses
+        return self.cache_hits / lookups if lookups else 0.0
+
+    @property
+    def triage_calls_saved(self) -> int:
+        """Triage LLM calls avoided because local triage decided the chunk."""
+        return self.local_triage_accepts + self.local_triage_rejects
+
     def summary(self) -> str:
         """Return formatted summary for logging."""
         return (
             f"chunks={self.soft_chunks} calls_total={self.total_calls} "
             f"triage={self.triage_calls} main={self.main_calls} "
-            f"escalation={self.escalation_calls} noise={self.noise_chunks}"
+            f"escalation={self.escalation_calls} noise={self.noise_chunks} "
+            f"cache_hits={self.cache_hits}/{self.cache_hits + self.cache_misses} "
+            f"local_triage={self.triage_calls_saved}/{self.triage_calls_saved + self.local_triage_deferred}"
         )
 
 
-# Thread-local stats for current message being processed
-_current_stats: Optional[CallStats] = None
+# Thread-local stats for current message being processed. Each parse worker
+# thread (parse_messages.py --workers) tracks its own message independently.
+_stats_local = threading.local()
 
 
 def reset_call_stats() -> CallStats:
     """Reset call stats for a new message. Returns the new stats object."""
-    global _current_stats
-    _current_stats = CallStats()
-    return _current_stats
+    _stats_local.stats = CallStats()
+    return _stats_local.stats
 
 
 def get_call_stats() -> Optional[CallStats]:
     """Get current call stats (or None if not tracking)."""
-    return _current_stats
+    return getattr(_stats_local, "stats", None)
 
 
 def _track_triage_call(is_retry: bool = False) -> None:
     """Increment triage call counter."""
-    if _current_stats is not None:
+    stats = get_call_stats()
+    if stats is not None:
         if is_retry:
-            _current_stats.triage_retries += 1
+            stats.triage_retries += 1
         else:
-            _current_stats.triage_calls += 1
+            stats.triage_calls += 1
+
+
+def _track_cache_lookup(hit: bool) -> None:
+    """Increment parse-cache hit/miss counters."""
+    stats = get_call_stats()
+    if stats is not None:
+        if hit:
+            stats.cache_hits += 1
+        else:
+            stats.cache_misses += 1
+
+
+def _track_local_triage(decision: Optional[bool]) -> None:
+    """Count a local triage outcome: True = actionable, False = noise, None = deferred to the LLM."""
+    stats = get_call_stats()
+    if stats is not None:
+        if decision is None:
+            stats.local_triage_deferred += 1
+        elif decision:
+            stats.local_triage_accepts += 1
+        else:
+            stats.local_triage_rejects += 1
 
 
 def _track_parse_call(is_escalation: bool = False) -> None:
     """Increment parse call counter."""
-    if _current_stats is not None:
+    stats = get_call_stats()
+    if stats is not None:
         if is_escalation:
-            _current_stats.escalation_calls += 1
+            stats.escalation_calls += 1
         else:
-            _current_stats.main_calls += 1
+            stats.main_calls += 1
 
 
 # Module-level debug flag (set by CLI --debug-openai)
@@ -550,7 +597,12 @@ def _get_label_description(label: str) -> str:
 
 
 def _build_parser_system_prompt() -> str:
-    """Build the parser system prompt with label descriptions."""
+    """Parser system prompt for the current prompt version (built once)."""
+    return get_parser_artifact().system_prompt
+
+
+def _render_parser_system_prompt() -> str:
+    """Render the parser system prompt with label descriptions."""
     label_list = "\n".join(
         f"- {label}: {_get_label_description(label)}" for label in TRADING_LABELS
     )
@@ -742,7 +794,10 @@ def get_client() -> OpenAI:
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise ValueError("OPENAI_API_KEY environment variable not set")
-        _client = OpenAI(api_key=api_key)
+        # 429s, connection errors, timeouts and 5xx are retried by
+        # rate_limiter.call_with_backoff; SDK retries on top would multiply
+        # every throttled request
+        _client = OpenAI(api_key=api_key, max_retries=0)
     return _client
 
 
@@ -924,13 +979,18 @@ def _triage_attempt(
     _track_triage_call(is_retry=is_retry)
 
     try:
-        response = client.responses.parse(
-            model=MODEL_TRIAGE,
-            input=[
-                {"role": "system", "content": TRIAGE_SYSTEM_PROMPT},
-                {"role": "user", "content": text},
-            ],
-            text_format=TriageResult,
+        response = rate_limited_call(
+            lambda: client.responses.parse(
+                model=MODEL_TRIAGE,
+                input=[
+                    {"role": "system", "content": TRIAGE_SYSTEM_PROMPT},
+                    {"role": "user", "content": text},
+                ],
+                text_format=TriageResult,
+            ),
+            est_tokens=estimate_request_tokens(
+                TRIAGE_SYSTEM_PROMPT, text, max_output_tokens=100
+            ),
         )
         return _extract_parsed_result(response, TriageResult)
     except Exception as e:
@@ -1002,6 +1062,44 @@ def triage_message(text: str, allow_retry: bool = True) -> TriageResult:
 # =============================================================================
 
 
+def _prepare_parse_input(text: str) -> Tuple[str, List[str], str]:
+    """
+    Alias-map ``text`` and build the user message parse_message() sends.
+
+    Also used by cached_parse_message() so the cache key is the exact content
+    sent (alias map and ticker hint included).
+
+    Returns:
+        Tuple of (alias-mapped text, candidate tickers, user content)
+    """
+    from src.nlp.preclean import apply_alias_mapping, extract_candidate_tickers
+
+    # Step 1: Extract candidate tickers BEFORE alias mapping
+    # This gives us the "ground truth" tickers from the original text
+    candidates = extract_candidate_tickers(text, include_context_check=True)
+    candidate_tickers = candidates["tickers"]
+    logger.debug(f"Candidate tickers: {candidate_tickers}")
+
+    # Step 2: Apply alias mapping to normalize company names → tickers
+    text = apply_alias_mapping(text)
+    logger.debug(f"Parse input (after alias mapping): {text[:100]}...")
+
+    # Step 3: Re-extract after alias mapping to catch new tickers
+    post_alias = extract_candidate_tickers(text, include_context_check=False)
+    for ticker in post_alias["tickers"]:
+        if ticker not in candidate_tickers:
+            candidate_tickers.append(ticker)
+
+    logger.debug(f"Final candidate tickers: {candidate_tickers}")
+
+    # Build user prompt with candidate tickers hint (helps constrain LLM)
+    user_content = f"Parse this trading message:\n\n{text}"
+    if candidate_tickers:
+        user_content += f"\n\n[HINT: Candidate tickers detected: {', '.join(candidate_tickers)}. Only use these tickers unless you're very confident about others.]"
+
+    return text, candidate_tickers, user_content
+
+
 def parse_message(
     text: str, escalate: bool = False, long_context: bool = False
 ) -> Tuple[MessageParseResult, str]:
@@ -1031,29 +1129,7 @@ def parse_message(
     Raises:
         ParseFailure: If parsing fails after escalation
     """
-    from src.nlp.preclean import (
-        apply_alias_mapping,
-        extract_candidate_tickers,
-        validate_llm_tickers,
-    )
-
-    # Step 1: Extract candidate tickers BEFORE alias mapping
-    # This gives us the "ground truth" tickers from the original text
-    candidates = extract_candidate_tickers(text, include_context_check=True)
-    candidate_tickers = candidates["tickers"]
-    logger.debug(f"Candidate tickers: {candidate_tickers}")
-
-    # Step 2: Apply alias mapping to normalize company names → tickers
-    text = apply_alias_mapping(text)
-    logger.debug(f"Parse input (after alias mapping): {text[:100]}...")
-
-    # Step 3: Re-extract after alias mapping to catch new tickers
-    post_alias = extract_candidate_tickers(text, include_context_check=False)
-    for ticker in post_alias["tickers"]:
-        if ticker not in candidate_tickers:
-            candidate_tickers.append(ticker)
-
-    logger.debug(f"Final candidate tickers: {candidate_tickers}")
+    text, _, user_content = _prepare_parse_input(text)
 
     client = get_client()
 
@@ -1080,19 +1156,18 @@ def parse_message(
         f"Using model {model} for parsing (len={text_len}, escalate={escalate})"
     )
 
-    # Build user prompt with candidate tickers hint (helps constrain LLM)
-    user_content = f"Parse this trading message:\n\n{text}"
-    if candidate_tickers:
-        user_content += f"\n\n[HINT: Candidate tickers detected: {', '.join(candidate_tickers)}. Only use these tickers unless you're very confident about others.]"
-
     try:
-        response = client.responses.parse(
-            model=model,
-            input=[
-                {"role": "system", "content": _build_parser_system_prompt()},
-                {"role": "user", "content": user_content},
-            ],
-            text_format=MessageParseResult,
+        system_prompt = _build_parser_system_prompt()
+        response = rate_limited_call(
+            lambda: client.responses.parse(
+                model=model,
+                input=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_content},
+                ],
+                text_format=MessageParseResult,
+            ),
+            est_tokens=estimate_request_tokens(system_prompt, user_content),
         )
 
         # Extract parsed result using type-safe helper
@@ -1147,6 +1222,92 @@ def parse_message(
         ) from e
 
 
+# =============================================================================
+# PARSE CACHE (content-hash keyed, see src/nlp/parse_cache.py)
+# =============================================================================
+
+
+def cached_triage_message(text: str) -> TriageResult:
+    """
+    triage_message() behind local triage and the parse cache.
+
+    Chunks the local classifier (src/nlp/local_triage.py) decides never reach
+    the LLM; the rest go through the parse cache keyed on MODEL_TRIAGE and
+    the alias-mapped text triage_message() actually sends.
+    """
+    from src.nlp.preclean import apply_alias_mapping
+
+    local = get_local_triage()
+    if local is not None:
+        decision = local.classify(text)
+        _track_local_triage(None if decision.result is None else not decision.result.is_noise)
+        if decision.result is not None:
+            return decision.result
+
+    cache = get_parse_cache()
+    if cache is not None:
+        sent = apply_alias_mapping(text)
+        hit = cache.get("triage", sent, CURRENT_PROMPT_VERSION, MODEL_TRIAGE)
+        _track_cache_lookup(hit is not None)
+        if hit is not None:
+            return TriageResult.model_validate(hit.payload)
+
+    result = triage_message(text)
+    if cache is not None:
+        cache.put(
+            "triage", sent, CURRENT_PROMPT_VERSION, MODEL_TRIAGE, result.model_dump()
+        )
+    return result
+
+
+def parse_model_for(text: str, long_context: bool = False) -> str:
+    """
+    Model parse_message() starts with for this text (before any escalation).
+
+    Mirrors parse_message()'s auto-routing, which measures the text after
+    alias mapping, so cache keys match the model that is actually called.
+    """
+    from src.nlp.preclean import apply_alias_mapping
+
+    if long_context or len(apply_alias_mapping(text)) >= LONG_CONTEXT_THRESHOLD:
+        return MODEL_LONG_CONTEXT
+    return MODEL_MAIN
+
+
+def cached_parse_message(
+    text: str, long_context: bool = False
+) -> Tuple[MessageParseResult, str]:
+    """
+    parse_message() behind the parse cache.
+
+    Keyed on the user content parse_message() sends (alias-mapped text plus
+    the candidate-ticker hint, so alias map changes miss instead of replaying
+    stale answers) and parse_model_for() (main or long-context); the cached
+    entry remembers the model that actually answered, so escalated results
+    replay with the right provenance.
+    """
+    cache = get_parse_cache()
+    requested = parse_model_for(text, long_context)
+    if cache is not None:
+        _, _, sent = _prepare_parse_input(text)
+        hit = cache.get("parse", sent, CURRENT_PROMPT_VERSION, requested)
+        _track_cache_lookup(hit is not None)
+        if hit is not None:
+            return MessageParseResult.model_validate(hit.payload), hit.model_used
+
+    result, model = parse_message(text, escalate=False, long_context=long_context)
+    if cache is not None:
+        cache.put(
+            "parse",
+            sent,
+            CURRENT_PROMPT_VERSION,
+            requested,
+            result.model_dump(mode="json"),
+            model_used=model,
+        )
+    return result, model
+
+
 # =============================================================================
 # FULL PIPELINE
 # =============================================================================
@@ -1168,7 +1329,7 @@ def process_message(
     Pipeline:
     1. Prefilter check (uses should_skip_message SSOT)
     2. Soft split (deterministic)
-    3. Triage each chunk (optional, cheap)
+    3. Triage each chunk (optional; local classifier first, LLM only when unsure)
     4. Parse non-noise chunks (main model)
     5. Escalate low-confidence results
     6. Return database-ready rows
@@ -1252,7 +1413,7 @@ def process_message(
         try:
             # Sample triage on first 2000 chars of original text
             triage_sample = text[:2000] if len(text) > 2000 else text
-            whole_triage = triage_message(triage_sample)
+            whole_triage = cached_triage_message(triage_sample)
             if whole_triage.is_noise:
                 logger.info(
                     f"Whole message triaged as noise: {whole_triage.skip_reason}"
@@ -1284,7 +1445,7 @@ def process_message(
         # Step 2: Triage (optional, skipped if whole-message triage passed)
         if not skip_triage:
             try:
-                triage = triage_message(chunk.text)
+                triage = cached_triage_message(chunk.text)
                 if triage.is_noise:
                     logger.debug(f"Chunk triaged as noise: {triage.skip_reason}")
                     noise_count += 1
@@ -1305,11 +1466,9 @@ def process_message(
 
         # Step 3: Parse
         try:
-            # Use long context for very long chunks or if forced
-            use_long = force_long_context or len(chunk.text) > 3000
-
-            result, model = parse_message(
-                chunk.text, escalate=False, long_context=use_long
+            # parse_message() auto-routes chunks past LONG_CONTEXT_THRESHOLD
+            result, model = cached_parse_message(
+                chunk.text, long_context=force_long_context
             )
             models_used.add(model)
 
@@ -1602,6 +1761,86 @@ def _make_schema_strict(schema: Dict[str, Any]) -> Dict[str, Any]:
     return _make_strict(schema)
 
 
+@dataclass(frozen=True)
+class ParserArtifact:
+    """Parser system prompt and strict output schema for one prompt version.
+
+    Built once per CURRENT_PROMPT_VERSION; the JSON fields hold the
+    serialized forms so batch builds can splice them in without
+    re-encoding the prompt and schema for every request line.
+    The schema dict is shared - callers must not mutate it.
+    """
+
+    prompt_version: str
+    system_prompt: str
+    strict_schema: Dict[str, Any]
+    system_prompt_json: str
+    response_format_json: str
+
+
+@functools.cache
+def _parser_artifact(prompt_version: str) -> ParserArtifact:
+    system_prompt = _render_parser_system_prompt()
+    strict_schema = _make_schema_strict(MessageParseResult.model_json_schema())
+    response_format = {
+        "type": "json_schema",
+        "json_schema": {
+            "name": "message_parse_result",
+            "schema": strict_schema,
+            "strict": True,
+        },
+    }
+    logger.debug(f"Built parser prompt/schema artifact for prompt {prompt_version}")
+    return ParserArtifact(
+        prompt_version=prompt_version,
+        system_prompt=system_prompt,
+        strict_schema=strict_schema,
+        system_prompt_json=json.dumps(system_prompt),
+        response_format_json=json.dumps(response_format),
+    )
+
+
+def get_parser_artifact() -> ParserArtifact:
+    """Prebuilt parser prompt + strict schema for CURRENT_PROMPT_VERSION."""
+    return _parser_artifact(CURRENT_PROMPT_VERSION)
+
+
+_CUSTOM_ID_SLOT = "__custom_id__"
+_USER_CONTENT_SLOT = "__user_content__"
+
+
+@functools.lru_cache(maxsize=8)
+def _batch_line_template(prompt_version: str, model: str) -> Tuple[bytes, bytes, bytes]:
+    """Split a serialized batch request around its two per-line values.
+
+    Keyed on the model too, since validate_openai_models() may switch
+    MODEL_MAIN after import.
+    """
+    artifact = _parser_artifact(prompt_version)
+    request = {
+        "custom_id": _CUSTOM_ID_SLOT,
+        "method": "POST",
+        "url": "/v1/chat/completions",
+        "body": {
+            "model": model,
+            "messages": [
+                {"role": "system", "content": artifact.system_prompt},
+                {"role": "user", "content": _USER_CONTENT_SLOT},
+            ],
+            "response_format": json.loads(artifact.response_format_json),
+        },
+    }
+    line = json.dumps(request)
+    head, rest = line.split(json.dumps(_CUSTOM_ID_SLOT), 1)
+    middle, tail = rest.split(json.dumps(_USER_CONTENT_SLOT), 1)
+    return head.encode("utf-8"), middle.encode("utf-8"), (tail + "\n").encode("utf-8")
+
+
+def batch_user_content(text: str) -> str:
+    """User message a Batch API request sends for one chunk (no alias mapping or hint)."""
+    return f"Parse this trading message:\n\n{text}"
+
+
 def build_batch_request(
     message_id: Union[int, str], text: str, chunk_index: int = 0
 ) -> Dict[str, Any]:
@@ -1614,11 +1853,9 @@ def build_batch_request(
         chunk_index: Index of this chunk within the message
 
     Returns:
-        Dict in Batch API format
+        Dict in Batch API format (the schema is the shared prebuilt one)
     """
-    # Get Pydantic schema and make it strict-compliant for Batch API
-    raw_schema = MessageParseResult.model_json_schema()
-    strict_schema = _make_schema_strict(raw_schema)
+    artifact = get_parser_artifact()
 
     return {
         "custom_id": f"msg-{message_id}-chunk-{chunk_index}",
@@ -1627,14 +1864,14 @@ def build_batch_request(
         "body": {
             "model": MODEL_MAIN,
             "messages": [
-                {"role": "system", "content": _build_parser_system_prompt()},
-                {"role": "user", "content": f"Parse this trading message:\n\n{text}"},
+                {"role": "system", "content": artifact.system_prompt},
+                {"role": "user", "content": batch_user_content(text)},
             ],
             "response_format": {
                 "type": "json_schema",
                 "json_schema": {
                     "name": "message_parse_result",
-                    "schema": strict_schema,
+                    "schema": artifact.strict_schema,
                     "strict": True,
                 },
             },
@@ -1642,6 +1879,28 @@ def build_batch_request(
     }
 
 
+def build_batch_request_line(
+    message_id: Union[int, str], text: str, chunk_index: int = 0
+) -> bytes:
+    """
+    Build one JSONL line (UTF-8, newline-terminated) for the Batch API.
+
+    Byte-identical to ``json.dumps(build_batch_request(...)) + "\\n"`` but
+    only the custom_id and user message are serialized per call; the
+    system prompt and schema come from the prebuilt template.
+    """
+    head, middle, tail = _batch_line_template(CURRENT_PROMPT_VERSION, MODEL_MAIN)
+    return b"".join(
+        (
+            head,
+            json.dumps(f"msg-{message_id}-chunk-{chunk_index}").encode("utf-8"),
+            middle,
+            json.dumps(batch_user_content(text)).encode("utf-8"),
+            tail,
+        )
+    )
+
+
 def parse_batch_response(
     response_line: Dict[str, Any],
 ) -> Tuple[int, int, Optional[MessageParseResult]]:
@@ -0,0 +1,325 @@
+"""
+Content-hash keyed cache of LLM structured outputs.
+
+Reparses re-send identical text to OpenAI: reposted alerts, copy-pasted calls,
+/sentiment/reparse, and batch backfills after non-prompt changes. This cache
+stores triage and parse results keyed by
+
+    (call_type, content_hash, prompt_version, model)
+
+where content_hash is the SHA-256 of the exact user content sent to the
+model - after alias mapping, with parse_message()'s candidate-ticker hint -
+with no case or whitespace folding ("NOW" the ticker and "now" the word
+parse differently), and model is the model *requested* for the call
+(openai_parser.parse_model_for() for parses). Bumping
+CURRENT_PROMPT_VERSION invalidates everything by construction.
+
+Batch API results (ingest_batch.py) are stored as call_type "batch_parse",
+keyed on the batch request's own user content, so they never answer an
+interactive parse or vice versa.
+
+Two tiers:
+- In-process LRU (bounded by PARSE_CACHE_MEMORY_ENTRIES) for repeats within a run
+- Postgres table llm_parse_cache (migration 080) shared across runs/processes
+
+The DB tier fails soft: any error is logged once and the cache degrades to
+memory-only for the rest of the process, so parsing never breaks because the
+cache is unavailable. Eviction from the DB tier is age + row-cap based on
+last_hit_at (prune_parse_cache), run by parse_messages.py / ingest_batch.py.
+
+Environment:
+    PARSE_CACHE_ENABLED         "false" disables the cache (default true)
+    PARSE_CACHE_MEMORY_ENTRIES  in-process LRU size (default 5000)
+    PARSE_CACHE_MAX_AGE_DAYS    DB entries unused for longer are pruned (default 30)
+    PARSE_CACHE_MAX_ROWS        DB row cap, least recently hit pruned first (default 200000)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PARSE_CACHE_ENABLED = os.getenv("PARSE_CACHE_ENABLED", "true").lower() != "false"
+PARSE_CACHE_MEMORY_ENTRIES = int(os.getenv("PARSE_CACHE_MEMORY_ENTRIES", "5000"))
+PARSE_CACHE_MAX_AGE_DAYS = int(os.getenv("PARSE_CACHE_MAX_AGE_DAYS", "30"))
+PARSE_CACHE_MAX_ROWS = int(os.getenv("PARSE_CACHE_MAX_ROWS", "200000"))
+
+CALL_TYPES = ("triage", "parse", "batch_parse")
+
+CacheKey = Tuple[str, str, str, str]
+
+
+@dataclass
+class CachedResult:
+    """A cached structured output plus the model that actually produced it."""
+
+    payload: Dict[str, Any]
+    model_used: str
+
+
+def content_hash(text: str) -> str:
+    """SHA-256 of the text exactly as sent to the model."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class ParseCache:
+    """
+    Two-tier (memory LRU + Postgres) cache of LLM structured outputs.
+
+    Thread-safe: parse_messages.py --workers shares one instance across
+    worker threads.
+    """
+
+    def __init__(
+        self,
+        memory_entries: int = PARSE_CACHE_MEMORY_ENTRIES,
+        persist: bool = True,
+    ):
+        if memory_entries < 0:
+            raise ValueError("memory_entries must be >= 0")
+        self.memory_entries = memory_entries
+        self.persist = persist
+        self._memory: OrderedDict[CacheKey, CachedResult] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+
+    @staticmethod
+    def make_key(call_type: str, text: str, prompt_version: str, model: str) -> CacheKey:
+        if call_type not in CALL_TYPES:
+            raise ValueError(f"call_type must be one of {CALL_TYPES}")
+        return (call_type, content_hash(text), prompt_version, model)
+
+    # -------------------------------------------------------------------------
+    # Memory tier
+    # -------------------------------------------------------------------------
+
+    def _remember(self, key: CacheKey, value: CachedResult) -> None:
+        if not self.memory_entries:
+            return
+        with self._lock:
+            self._memory[key] = value
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
+
+    def _recall(self, key: CacheKey) -> Optional[CachedResult]:
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+            return value
+
+    # -------------------------------------------------------------------------
+    # DB tier
+    # -------------------------------------------------------------------------
+
+    def _disable_persistence(self, action: str, error: Exception) -> None:
+        if self.persist:
+            logger.warning(
+                f"Parse cache {action} failed ({error}); continuing memory-only"
+            )
+            self.persist = False
+
+    def _db_get(self, key: CacheKey) -> Optional[CachedResult]:
+        from src.db import execute_sql
+
+        call_type, digest, prompt_version, model = key
+        rows = execute_sql(
+            """
+            UPDATE llm_parse_cache
+            SET hit_count = hit_count + 1, last_hit_at = NOW()
+            WHERE call_type = :call_type AND content_hash = :content_hash
+              AND prompt_version = :prompt_version AND model = :model
+            RETURNING result, model_used
+            """,
+            params={
+                "call_type": call_type,
+                "content_hash": digest,
+                "prompt_version": prompt_version,
+                "model": model,
+            },
+            fetch_results=True,
+        )
+        if not rows:
+            return None
+        payload, model_used = rows[0][0], rows[0][1]
+        if isinstance(payload, str):
+            payload = json.loads(payload)
+        return CachedResult(payload=payload, model_used=model_used)
+
+    def _db_put(self, key: CacheKey, value: CachedResult) -> None:
+        from src.db import execute_sql
+
+        call_type, digest, prompt_version, model = key
+        execute_sql(
+            """
+            INSERT INTO llm_parse_cache (
+                call_type, content_hash, prompt_version, model, model_used, result
+            ) VALUES (
+                :call_type, :content_hash, :prompt_version, :model, :model_used,
+                CAST(:result AS jsonb)
+            )
+            ON CONFLICT (call_type, content_hash, prompt_version, model) DO UPDATE
+            SET result = EXCLUDED.result,
+                model_used = EXCLUDED.model_used,
+                last_hit_at = NOW()
+            """,
+            params={
+                "call_type": call_type,
+                "content_hash": digest,
+                "prompt_version": prompt_version,
+                "model": model,
+                "model_used": value.model_used,
+                "result": json.dumps(value.payload, default=str),
+            },
+        )
+
+    # -------------------------------------------------------------------------
+    # Public API
+    # -------------------------------------------------------------------------
+
+    def get(
+        self, call_type: str, text: str, prompt_version: str, model: str
+    ) -> Optional[CachedResult]:
+        """Look up a result; memory first, then Postgres (promoted on hit)."""
+        key = self.make_key(call_type, text, prompt_version, model)
+
+        value = self._recall(key)
+        if value is None and self.persist:
+            try:
+                value = self._db_get(key)
+            except Exception as e:
+                self._disable_persistence("lookup", e)
+            if value is not None:
+                self._remember(key, value)
+
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def put(
+        self,
+        call_type: str,
+        text: str,
+        prompt_version: str,
+        model: str,
+        payload: Dict[str, Any],
+        model_used: Optional[str] = None,
+    ) -> None:
+        """Store a successful structured output."""
+        key = self.make_key(call_type, text, prompt_version, model)
+        value = CachedResult(payload=payload, model_used=model_used or model)
+        self._remember(key, value)
+        if self.persist:
+            try:
+                self._db_put(key, value)
+            except Exception as e:
+                self._disable_persistence("write", e)
+        with self._lock:
+            self.writes += 1
+
+    def clear_memory(self) -> None:
+        with self._lock:
+            self._memory.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "writes": self.writes,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "memory_entries": len(self._memory),
+                "persist": self.persist,
+            }
+
+
+# =============================================================================
+# MODULE SINGLETON
+# =============================================================================
+
+_cache: Optional[ParseCache] = None
+_cache_initialized = False
+_cache_lock = threading.Lock()
+
+
+def get_parse_cache() -> Optional[ParseCache]:
+    """Process-wide cache, or None when PARSE_CACHE_ENABLED=false."""
+    global _cache, _cache_initialized
+    if not _cache_initialized:
+        with _cache_lock:
+            if not _cache_initialized:
+                _cache = ParseCache() if PARSE_CACHE_ENABLED else None
+                _cache_initialized = True
+    return _cache
+
+
+def set_parse_cache(cache: Optional[ParseCache]) -> None:
+    """Install a specific cache (or None to disable), e.g. for --no-cache or tests."""
+    global _cache, _cache_initialized
+    with _cache_lock:
+        _cache = cache
+        _cache_initialized = True
+
+
+def prune_parse_cache(
+    max_age_days: int = PARSE_CACHE_MAX_AGE_DAYS,
+    max_rows: int = PARSE_CACHE_MAX_ROWS,
+) -> int:
+    """
+    Evict stale DB entries: anything not hit for `max_age_days`, then the least
+    recently hit rows beyond `max_rows`.
+
+    Returns:
+        Number of rows deleted (0 if the table is unavailable).
+    """
+    from src.db import execute_sql
+
+    deleted = 0
+    try:
+        # Plain DELETEs (not CTEs) so execute_sql commits them
+        result = execute_sql(
+            """
+            DELETE FROM llm_parse_cache
+            WHERE last_hit_at < NOW() - make_interval(days => :days)
+            """,
+            params={"days": max_age_days},
+        )
+        deleted += max(result.rowcount or 0, 0)
+
+        result = execute_sql(
+            """
+            DELETE FROM llm_parse_cache c
+            USING (
+                SELECT call_type, content_hash, prompt_version, model
+                FROM llm_parse_cache
+                ORDER BY last_hit_at DESC
+                OFFSET :max_rows
+            ) r
+            WHERE c.call_type = r.call_type
+              AND c.content_hash = r.content_hash
+              AND c.prompt_version = r.prompt_version
+              AND c.model = r.model
+            """,
+            params={"max_rows": max_rows},
+        )
+        deleted += max(result.rowcount or 0, 0)
+    except Exception as e:
+        logger.warning(f"Parse cache prune failed: {e}")
+        return deleted
+
+    if deleted:
+        logger.info(f"Pruned {deleted} parse cache entries")
+    return deleted
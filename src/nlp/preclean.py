@@ -10,6 +10,7 @@ Provides functions to:
 
 import re
 import logging
+import threading
 from typing import Dict, Any, Optional
 
 logger = logging.getLogger(__name__)
@@ -226,12 +227,166 @@ RESERVED_SIGNAL_WORDS = {
     "vwap",
 }
 
-# Compile regex patterns for efficient matching
-# We use word boundaries to avoid partial matches (e.g., "google" in "googled")
-_ALIAS_PATTERNS = {
-    alias: re.compile(rf"\b{re.escape(alias)}\b", re.IGNORECASE)
-    for alias in ALIAS_MAP.keys()
-}
+# =============================================================================
+# ALIAS MATCHER - single-pass, precompiled
+# =============================================================================
+
+
+def _trie_to_regex(node: Dict[str, Any]) -> str:
+    """
+    Render a character trie as a regex with shared prefixes factored out.
+
+    Terminal nodes (key "") become optional suffix groups, which are greedy, so
+    at any start position the longest alias is tried first and shorter ones
+    only if the longer one fails the trailing word boundary.
+    """
+    branches = [re.escape(ch) + _trie_to_regex(child) for ch, child in sorted(node.items()) if ch]
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    if "" in node:
+        body = f"(?:{body})?"
+    return body
+
+
+class AliasMatcher:
+    """
+    One compiled regex over every alias (built from a character trie).
+
+    Replaces the per-alias regex loop: all alias hits are found in a single
+    pass over the text. Semantics match the original loop — longest alias wins
+    at a position, aliases already prefixed with "$" are left alone (a shorter
+    alias later in the skipped span can still match), matching is
+    case-insensitive on word boundaries, and reserved signal words are never
+    converted when skip_reserved=True.
+
+    Live additions (add()) mark the matcher stale; the pattern is rebuilt at
+    most once per batch of additions, on the next match, not per call.
+    """
+
+    def __init__(self, aliases: Dict[str, str]):
+        self._aliases = aliases
+        self._lock = threading.Lock()
+        self._patterns: Dict[bool, Optional[re.Pattern]] = {}
+
+    def _compile(self, skip_reserved: bool) -> Optional[re.Pattern]:
+        trie: Dict[str, Any] = {}
+        for alias in self._aliases:
+            if skip_reserved and alias in RESERVED_SIGNAL_WORDS:
+                continue
+            node = trie
+            for ch in alias:
+                node = node.setdefault(ch, {})
+            node[""] = {}
+        if not trie:
+            return None
+        return re.compile(rf"(?<!\$)\b{_trie_to_regex(trie)}\b", re.IGNORECASE)
+
+    def pattern(self, skip_reserved: bool = True) -> Optional[re.Pattern]:
+        patterns = self._patterns
+        if skip_reserved not in patterns:
+            with self._lock:
+                if skip_reserved not in self._patterns:
+                    self._patterns[skip_reserved] = self._compile(skip_reserved)
+                patterns = self._patterns
+        return patterns[skip_reserved]
+
+    def add(self, alias: str, ticker: str) -> bool:
+        """Register (or re-point) an alias. Returns True if anything changed."""
+        alias = " ".join(alias.lower().split())
+        ticker = ticker.upper().strip().lstrip("$")
+        if not alias or not ticker or self._aliases.get(alias) == ticker:
+            return False
+        with self._lock:
+            self._aliases[alias] = ticker
+            _ALIAS_TICKERS.add(ticker)
+            self._patterns = {}  # Rebuilt lazily on next use
+        return True
+
+    def replace(self, text: str, skip_reserved: bool = True) -> str:
+        pattern = self.pattern(skip_reserved)
+        if pattern is None:
+            return text
+        aliases = self._aliases
+
+        def _sub(match: re.Match) -> str:
+            matched_text = match.group(0)
+            ticker = aliases[matched_text.lower()]
+            logger.debug(f"Alias mapping: '{matched_text}' → '${ticker}'")
+            return f"${ticker}"
+
+        return pattern.sub(_sub, text)
+
+
+# Set of mapped tickers for O(1) membership checks (kept in sync by register_alias)
+_ALIAS_TICKERS = set(ALIAS_MAP.values())
+_alias_matcher = AliasMatcher(ALIAS_MAP)
+
+# symbol_aliases rows newer than this have not been loaded yet
+_alias_db_watermark: Optional[Any] = None
+
+# Only hand-curated, name-like aliases feed text replacement; discord/snaptrade
+# rows are mostly "$AAPL"-style ticker variants.
+_SYMBOL_ALIAS_NAME = re.compile(r"^[a-z][a-z0-9&.' -]{2,}$")
+
+
+def register_alias(alias: str, ticker: str) -> bool:
+    """
+    Add a live alias → ticker mapping used by apply_alias_mapping().
+
+    Returns:
+        True if the mapping was new or changed
+    """
+    return _alias_matcher.add(alias, ticker)
+
+
+def load_symbol_aliases() -> int:
+    """
+    Pull manual aliases from the symbol_aliases table into the matcher.
+
+    Incremental: only rows updated since the previous call are fetched, and
+    the combined pattern is rebuilt once (lazily) if anything changed. Safe to
+    call periodically from long-running workers; DB errors are logged and
+    leave the current aliases in place.
+
+    Returns:
+        Number of aliases added or re-pointed
+    """
+    global _alias_db_watermark
+    try:
+        from src.db import execute_sql
+
+        rows = execute_sql(
+            """
+            SELECT alias, ticker, updated_at
+            FROM symbol_aliases
+            WHERE source = 'manual'
+              AND (CAST(:since AS timestamptz) IS NULL OR updated_at > :since)
+            ORDER BY updated_at
+            """,
+            params={"since": _alias_db_watermark},
+            fetch_results=True,
+        )
+    except Exception as e:
+        logger.warning(f"Could not load symbol_aliases: {e}")
+        return 0
+
+    added = 0
+    for alias, ticker, updated_at in rows or []:
+        normalized = " ".join(str(alias).lower().split())
+        if (
+            _SYMBOL_ALIAS_NAME.match(normalized)
+            and normalized != str(ticker).lower()
+            and normalized not in RESERVED_SIGNAL_WORDS
+            and register_alias(normalized, str(ticker))
+        ):
+            added += 1
+        if updated_at is not None:
+            _alias_db_watermark = updated_at
+
+    if added:
+        logger.info(f"Loaded {added} aliases from symbol_aliases")
+    return added
 
 
 def is_reserved_signal_word(word: str) -> bool:
@@ -254,8 +409,9 @@ def apply_alias_mapping(text: str, skip_reserved: bool = True) -> str:
     """
     Replace company names and aliases with $TICKER symbols.
 
-    Uses word-boundary regex to avoid partial replacements.
-    Case-insensitive matching. Only replaces if not already a ticker format.
+    Single pass over the text with the precompiled AliasMatcher; longest alias
+    wins. Word-boundary, case-insensitive matching. Only replaces if not
+    already a ticker format.
 
     By default, skips reserved signal words (tgt, pt, target, etc.) to avoid
     false positives where trading terminology is mistaken for tickers.
@@ -280,43 +436,7 @@ def apply_alias_mapping(text: str, skip_reserved: bool = True) -> str:
     if not text:
         return text
 
-    result = text
-
-    # Sort aliases by length descending to match longer phrases first
-    # e.g., "taiwan semiconductor" before "taiwan"
-    sorted_aliases = sorted(ALIAS_MAP.keys(), key=len, reverse=True)
-
-    for alias in sorted_aliases:
-        # Skip reserved signal words if enabled
-        if skip_reserved and is_reserved_signal_word(alias):
-            continue
-
-        pattern = _ALIAS_PATTERNS[alias]
-        ticker = ALIAS_MAP[alias]
-
-        # Find all matches
-        matches = list(pattern.finditer(result))
-        if not matches:
-            continue
-
-        # Replace from end to preserve indices
-        for match in reversed(matches):
-            start, end = match.start(), match.end()
-            matched_text = result[start:end]
-
-            # Check if already prefixed with $ (already a ticker)
-            if start > 0 and result[start - 1] == "$":
-                continue
-
-            # Skip if the matched text itself is a reserved signal word
-            if skip_reserved and is_reserved_signal_word(matched_text):
-                continue
-
-            # Replace with $TICKER
-            result = result[:start] + f"${ticker}" + result[end:]
-            logger.debug(f"Alias mapping: '{matched_text}' → '${ticker}'")
-
-    return result
+    return _alias_matcher.replace(text, skip_reserved=skip_reserved)
 
 
 def extract_tickers_from_text(text: str) -> list:
@@ -403,7 +523,7 @@ def extract_candidate_tickers(text: str, include_context_check: bool = True) ->
             # Validate context
             if has_ticker_context(text, pos, potential):
                 # Also verify it's in our known alias map values
-                if potential in ALIAS_MAP.values():
+                if potential in _ALIAS_TICKERS:
                     tickers[potential] = "contextual"
 
     # Calculate confidence based on extraction sources
@@ -680,7 +800,7 @@ def has_ticker_context(text: str, position: int, ticker: str) -> bool:
             return True
 
     # Check if ticker is in known alias map (high confidence)
-    if ticker.lower() in ALIAS_MAP or ticker_upper in ALIAS_MAP.values():
+    if ticker.lower() in ALIAS_MAP or ticker_upper in _ALIAS_TICKERS:
         return True
 
     # Default: require $ prefix for unknown tickers
@@ -839,7 +959,7 @@ def is_valid_short_action(text: str) -> bool:
     words = text_stripped.split()
     for word in words[1:]:  # Skip the action verb
         word_clean = word.strip("$,.!?:;()").upper()
-        if word_clean in ALIAS_MAP.values():
+        if word_clean in _ALIAS_TICKERS:
             return True
         if word_clean.lower() in ALIAS_MAP:
             return True
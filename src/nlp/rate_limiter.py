@@ -0,0 +1,253 @@
+"""
+OpenAI rate limiting for concurrent parsing.
+
+Two pieces, both thread-safe so a pool of parse workers can share them:
+
+- TokenBucketLimiter: client-side RPM/TPM budget. Every request reserves one
+  request slot plus its estimated token cost before it is sent, so N workers
+  never burst past the account limits and trigger a 429 storm.
+- call_with_backoff: retries a call that raised openai.RateLimitError or a
+  transient failure (connection error, timeout, 5xx), honouring Retry-After
+  when the server sends one and otherwise backing off exponentially with
+  jitter. Any other exception - including the insufficient_quota 429, which
+  never clears by waiting - is re-raised immediately. Clients used with it
+  should set max_retries=0 so the SDK's own retries don't multiply these.
+
+The limiter is opt-in: nothing is throttled until configure_rate_limits() is
+called (parse_messages.py does this when --workers > 1 or the env limits are set).
+
+Environment:
+    OPENAI_RPM_LIMIT        requests/minute budget (0 = unlimited)
+    OPENAI_TPM_LIMIT        tokens/minute budget (0 = unlimited)
+    OPENAI_429_MAX_RETRIES  retries on 429/transient errors before giving up (default 5)
+"""
+
+import logging
+import os
+import random
+import threading
+import time
+from typing import Callable, Optional, TypeVar
+
+from openai import APIConnectionError, InternalServerError, RateLimitError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+OPENAI_RPM_LIMIT = int(os.getenv("OPENAI_RPM_LIMIT", "0"))
+OPENAI_TPM_LIMIT = int(os.getenv("OPENAI_TPM_LIMIT", "0"))
+OPENAI_429_MAX_RETRIES = int(os.getenv("OPENAI_429_MAX_RETRIES", "5"))
+
+# Backoff bounds for 429s without a Retry-After header (seconds)
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_MAX_SECONDS = 60.0
+
+
+# =============================================================================
+# TOKEN BUCKET
+# =============================================================================
+
+
+class TokenBucketLimiter:
+    """
+    Combined requests-per-minute / tokens-per-minute token bucket.
+
+    Both buckets start full and refill continuously at limit/60 per second.
+    acquire() blocks until one request and `tokens` tokens are available and
+    then takes them; a limit of 0 disables that bucket. A request larger than
+    the whole TPM budget is let through once the bucket is full rather than
+    blocking forever.
+    """
+
+    def __init__(
+        self,
+        rpm: int = 0,
+        tpm: int = 0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if rpm < 0 or tpm < 0:
+            raise ValueError("rpm and tpm must be >= 0")
+        self.rpm = rpm
+        self.tpm = tpm
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._requests = float(rpm)
+        self._tokens = float(tpm)
+        self._updated = clock()
+        self.waited_seconds = 0.0
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated)
+        self._updated = now
+        if self.rpm:
+            self._requests = min(self.rpm, self._requests + elapsed * self.rpm / 60.0)
+        if self.tpm:
+            self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60.0)
+
+    def _wait_time(self, tokens: int) -> float:
+        """Seconds until the request fits (0 if it fits now). Caller holds the lock."""
+        wait = 0.0
+        if self.rpm and self._requests < 1:
+            wait = max(wait, (1 - self._requests) * 60.0 / self.rpm)
+        if self.tpm:
+            needed = min(tokens, self.tpm)
+            if self._tokens < needed:
+                wait = max(wait, (needed - self._tokens) * 60.0 / self.tpm)
+        return wait
+
+    def acquire(self, tokens: int = 0) -> float:
+        """
+        Block until a request costing `tokens` fits the budget, then reserve it.
+
+        Returns:
+            Seconds spent waiting.
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill(self._clock())
+                wait = self._wait_time(tokens)
+                if wait <= 0:
+                    if self.rpm:
+                        self._requests -= 1
+                    if self.tpm:
+                        # May go negative for oversize requests; later callers wait it off
+                        self._tokens -= tokens
+                    self.waited_seconds += waited
+                    return waited
+            self._sleep(wait)
+            waited += wait
+
+    def settle(self, estimated: int, actual: int) -> None:
+        """Correct the TPM bucket once the real usage of a request is known."""
+        if not self.tpm or actual is None:
+            return
+        with self._lock:
+            self._tokens = min(self.tpm, self._tokens + estimated - actual)
+
+
+_limiter: Optional[TokenBucketLimiter] = None
+
+
+def configure_rate_limits(rpm: int = 0, tpm: int = 0) -> Optional[TokenBucketLimiter]:
+    """
+    Install the process-wide limiter (or remove it when both limits are 0).
+
+    Returns:
+        The active limiter, or None if throttling is disabled.
+    """
+    global _limiter
+    _limiter = TokenBucketLimiter(rpm=rpm, tpm=tpm) if (rpm or tpm) else None
+    if _limiter is not None:
+        logger.info(f"OpenAI rate limiter enabled: rpm={rpm or 'unlimited'} tpm={tpm or 'unlimited'}")
+    return _limiter
+
+
+def get_rate_limiter() -> Optional[TokenBucketLimiter]:
+    """Get the active limiter (None when throttling is disabled)."""
+    return _limiter
+
+
+def estimate_request_tokens(*texts: str, max_output_tokens: int = 500) -> int:
+    """Rough request cost for the TPM bucket (4 chars/token, as in estimate_cost)."""
+    return sum(len(t) for t in texts) // 4 + max_output_tokens
+
+
+# =============================================================================
+# 429 / TRANSIENT ERROR BACKOFF
+# =============================================================================
+
+
+def is_rate_limit_error(exc: BaseException) -> bool:
+    """True for retryable OpenAI 429s (RateLimitError other than insufficient_quota)."""
+    return isinstance(exc, RateLimitError) and getattr(exc, "code", None) != "insufficient_quota"
+
+
+def is_retryable_error(exc: BaseException) -> bool:
+    """
+    True for errors worth waiting out: retryable 429s, connection errors,
+    timeouts (APITimeoutError is an APIConnectionError) and 5xx responses.
+
+    These are what the SDK would have retried itself before get_client()
+    turned its retries off.
+    """
+    return is_rate_limit_error(exc) or isinstance(exc, (APIConnectionError, InternalServerError))
+
+
+def _retry_after_seconds(exc: BaseException) -> Optional[float]:
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    for header in ("retry-after-ms", "retry-after"):
+        value = headers.get(header)
+        if value is None:
+            continue
+        try:
+            seconds = float(value)
+        except (TypeError, ValueError):
+            continue
+        return seconds / 1000.0 if header.endswith("-ms") else seconds
+    return None
+
+
+def call_with_backoff(
+    fn: Callable[[], T],
+    max_retries: Optional[int] = None,
+    sleep: Callable[[float], None] = time.sleep,
+) -> T:
+    """
+    Run fn(), retrying on 429s and transient errors (see is_retryable_error).
+
+    Waits Retry-After when the server provides it, otherwise
+    BACKOFF_BASE_SECONDS * 2**attempt with full jitter, capped at
+    BACKOFF_MAX_SECONDS. Other exceptions propagate unchanged so callers
+    keep their existing escalation/fallback behaviour.
+    """
+    retries = OPENAI_429_MAX_RETRIES if max_retries is None else max_retries
+    attempt = 0
+    while True:
+        try:
+            return fn()
+        except Exception as e:
+            if not is_retryable_error(e) or attempt >= retries:
+                raise
+            delay = _retry_after_seconds(e)
+            if delay is None:
+                delay = random.uniform(
+                    0, min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2**attempt)
+                )
+            attempt += 1
+            reason = "rate limited" if is_rate_limit_error(e) else f"transient error ({type(e).__name__})"
+            logger.warning(
+                f"OpenAI {reason} (attempt {attempt}/{retries}), "
+                f"sleeping {delay:.1f}s"
+            )
+            sleep(delay)
+
+
+def rate_limited_call(fn: Callable[[], T], est_tokens: int) -> T:
+    """
+    Reserve budget on the active limiter, then run fn() with 429/transient backoff.
+
+    Every retry re-acquires budget, so a throttled worker doesn't immediately
+    hammer the API again. If the response reports usage, the TPM bucket is
+    corrected to the real token count.
+    """
+
+    def _attempt() -> T:
+        limiter = _limiter
+        if limiter is not None:
+            limiter.acquire(est_tokens)
+        result = fn()
+        if limiter is not None:
+            usage = getattr(result, "usage", None)
+            actual = getattr(usage, "total_tokens", None)
+            if isinstance(actual, int):
+                limiter.settle(est_tokens, actual)
+        return result
+
+    return call_with_backoff(_attempt)
@@ -13,8 +13,15 @@ Usage:
     # Get latest closing price
     price = get_latest_close("AAPL")
 
+    # Many symbols in one round trip
+    frames = get_ohlcv_batch(["AAPL", "MSFT"], date(2024, 1, 1), date(2024, 12, 31))
+    panel = get_price_panel(["AAPL", "MSFT"], date(2024, 1, 1), date(2024, 12, 31))
+
 Environment Variables:
-    DATABASE_URL   - Supabase PostgreSQL connection URL
+    DATABASE_URL                  - Supabase PostgreSQL connection URL
+    OHLCV_CACHE_ENABLED           - '0' disables the in-process bar cache. Default '1'.
+    OHLCV_CACHE_MAX_MB            - Bar cache memory cap before LRU eviction. Default 64.
+    OHLCV_CACHE_REFRESH_SECONDS   - Min seconds between tail refreshes per symbol. Default 300.
 
 Note:
     This module does NOT use yfinance or any external market data API.
@@ -24,9 +31,15 @@ Note:
 from __future__ import annotations
 
 import logging
-from datetime import date
-from typing import Optional
-
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any, Optional
+
+import numpy as np
 import pandas as pd
 
 from src.db import execute_sql, healthcheck
@@ -35,6 +48,290 @@ from src.retry_utils import hardened_retry
 
 logger = logging.getLogger(__name__)
 
+_OHLC_COLUMNS = ["Open", "High", "Low", "Close"]
+
+OHLCV_CACHE_ENABLED = os.environ.get("OHLCV_CACHE_ENABLED", "1") == "1"
+OHLCV_CACHE_MAX_MB = float(os.environ.get("OHLCV_CACHE_MAX_MB", "64"))
+OHLCV_CACHE_REFRESH_SECONDS = float(os.environ.get("OHLCV_CACHE_REFRESH_SECONDS", "300"))
+
+# The daily Databento update (DatabentoCollector.run_daily_update) rewrites
+# this many days before the newest bar, so cached rows in that window may be stale
+OHLCV_REVISION_LOOKBACK_DAYS = 5
+
+
+@dataclass(frozen=True)
+class PricePanel:
+    """
+    Wide date x symbol close/volume (and high/low) matrices for a set of symbols.
+
+    ``close``, ``volume``, ``high`` and ``low`` have shape
+    ``(len(dates), len(symbols))`` with columns in the requested symbol order.
+    Cells are NaN where a symbol has no bar on that date (holiday mismatches,
+    late listings, missing data).
+    """
+
+    dates: np.ndarray  # datetime64[D], ascending
+    symbols: list[str]
+    close: np.ndarray  # float64
+    volume: np.ndarray  # float64 (NaN where missing)
+    high: np.ndarray | None = None  # float64; None for hand-built close-only panels
+    low: np.ndarray | None = None
+
+    def column(self, symbol: str) -> int:
+        """Column index for a symbol (raises KeyError if not in the panel)."""
+        try:
+            return self.symbols.index(symbol.upper().strip())
+        except ValueError:
+            raise KeyError(symbol) from None
+
+    def close_series(self, symbol: str) -> dict[str, float]:
+        """Non-missing closes for one symbol as ``{"YYYY-MM-DD": close}``."""
+        col = self.close[:, self.column(symbol)]
+        mask = ~np.isnan(col)
+        return dict(
+            zip(
+                np.datetime_as_string(self.dates[mask], unit="D").tolist(),
+                col[mask].tolist(),
+                strict=True,
+            )
+        )
+
+    def to_frame(self, field: str = "close") -> pd.DataFrame:
+        """Panel field as a DataFrame (DatetimeIndex x symbol columns)."""
+        values = {"close": self.close, "volume": self.volume, "high": self.high, "low": self.low}[field]
+        return pd.DataFrame(
+            values, index=pd.DatetimeIndex(self.dates, name="Date"), columns=self.symbols
+        )
+
+
+def _normalize_symbols(symbols: list[str]) -> list[str]:
+    """Uppercase, dedupe (order-preserving) and drop crypto tickers."""
+    seen: dict[str, None] = {}
+    for s in symbols:
+        sym = s.upper().strip()
+        if sym and sym not in _CRYPTO_SYMBOLS:
+            seen.setdefault(sym, None)
+    return list(seen)
+
+
+def _query_ohlcv_frame(symbols: list[str], start: date, end: date) -> pd.DataFrame:
+    """
+    Fetch bars for many symbols in one ``symbol = ANY(:symbols)`` query.
+
+    Returns a long-format DataFrame (Symbol, Date, Open, High, Low, Close,
+    Volume) sorted by symbol then date. Type conversion is column-wise; no
+    per-row Python work happens after the fetch.
+    """
+    columns = ["Symbol", "Date", *_OHLC_COLUMNS, "Volume"]
+    rows = execute_sql(
+        """
+        SELECT
+            symbol,
+            date,
+            open,
+            high,
+            low,
+            close,
+            volume
+        FROM ohlcv_daily
+        WHERE symbol = ANY(:symbols)
+          AND date >= :start_date
+          AND date <= :end_date
+        ORDER BY symbol, date ASC
+        """,
+        params={"symbols": symbols, "start_date": start, "end_date": end},
+        fetch_results=True,
+    )
+    if not rows:
+        return pd.DataFrame(columns=columns)
+
+    df = pd.DataFrame.from_records(rows, columns=columns)
+    df["Date"] = pd.to_datetime(df["Date"])
+    for col in _OHLC_COLUMNS:
+        df[col] = pd.to_numeric(df[col], errors="coerce")
+    df["Volume"] = pd.to_numeric(df["Volume"], errors="coerce").fillna(0).astype("int64")
+    return df.dropna(subset=_OHLC_COLUMNS)
+
+
+_fetch_ohlcv_frame = hardened_retry(max_retries=3, delay=1)(_query_ohlcv_frame)
+
+
+@dataclass
+class _SymbolBars:
+    """Compact column arrays for one symbol, covering [covered_from, today]."""
+
+    dates: np.ndarray  # datetime64[D], ascending
+    ohlc: np.ndarray  # float64, shape (n, 4)
+    volume: np.ndarray  # int64
+    covered_from: date
+    refreshed_at: float  # time.monotonic() of the last DB read
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, covered_from: date) -> _SymbolBars:
+        return cls(
+            dates=df["Date"].to_numpy(dtype="datetime64[D]"),
+            ohlc=df[_OHLC_COLUMNS].to_numpy(dtype=np.float64),
+            volume=df["Volume"].to_numpy(dtype=np.int64),
+            covered_from=covered_from,
+            refreshed_at=time.monotonic(),
+        )
+
+    @property
+    def nbytes(self) -> int:
+        return self.dates.nbytes + self.ohlc.nbytes + self.volume.nbytes
+
+    @property
+    def high_water(self) -> Optional[date]:
+        return self.dates[-1].astype(date) if len(self.dates) else None
+
+    def slice(self, start: date, end: date) -> pd.DataFrame:
+        i = int(np.searchsorted(self.dates, np.datetime64(start, "D"), side="left"))
+        j = int(np.searchsorted(self.dates, np.datetime64(end, "D"), side="right"))
+        if i >= j:
+            return pd.DataFrame()
+        ohlc = self.ohlc[i:j]
+        return pd.DataFrame(
+            {
+                "Open": ohlc[:, 0],
+                "High": ohlc[:, 1],
+                "Low": ohlc[:, 2],
+                "Close": ohlc[:, 3],
+                "Volume": self.volume[i:j],
+            },
+            index=pd.DatetimeIndex(self.dates[i:j].astype("datetime64[ns]"), name="Date"),
+        )
+
+
+class OHLCVBarCache:
+    """
+    Symbol-keyed, in-process cache of daily bars.
+
+    ohlcv_daily only changes once a day (nightly Databento run), so repeated
+    chart/analysis reads for the same symbol are served from NumPy arrays.
+    A request reaching past the cached high-water date triggers a tail
+    refresh (rows from ``OHLCV_REVISION_LOOKBACK_DAYS`` before the last
+    cached bar, so bars revised by the daily update's lookback are picked
+    up), throttled to once per ``refresh_seconds`` per symbol. The OHLCV
+    writer also calls invalidate_ohlcv_cache() for the symbols it touched.
+    Requests starting before the cached window reload the symbol.
+    Memory is capped by LRU eviction on total array bytes.
+    """
+
+    def __init__(self, max_bytes: int, refresh_seconds: float):
+        self.max_bytes = max_bytes
+        self.refresh_seconds = refresh_seconds
+        self._entries: OrderedDict[str, _SymbolBars] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.tail_refreshes = 0
+        self.evictions = 0
+
+    def get(self, symbol: str, start: date, end: date) -> pd.DataFrame:
+        """Serve ``[start, end]`` bars for an already-normalized symbol."""
+        with self._lock:
+            entry = self._entries.get(symbol)
+            if entry is not None and start >= entry.covered_from:
+                self._entries.move_to_end(symbol)
+                self.hits += 1
+            else:
+                entry = None
+                self.misses += 1
+
+        if entry is None:
+            entry = self._load(symbol, start)
+        elif self._tail_due(entry, end):
+            entry = self._refresh_tail(symbol, entry)
+        return entry.slice(start, end)
+
+    def _tail_due(self, entry: _SymbolBars, end: date) -> bool:
+        high_water = entry.high_water
+        if high_water is not None and end <= high_water:
+            return False
+        return time.monotonic() - entry.refreshed_at >= self.refresh_seconds
+
+    def _load(self, symbol: str, start: date) -> _SymbolBars:
+        df = _query_ohlcv_frame([symbol], start, date.today())
+        entry = _SymbolBars.from_frame(df, covered_from=start)
+        self._store(symbol, entry)
+        return entry
+
+    def _refresh_tail(self, symbol: str, entry: _SymbolBars) -> _SymbolBars:
+        high_water = entry.high_water
+        since = entry.covered_from
+        if high_water is not None:
+            since = max(since, high_water - timedelta(days=OHLCV_REVISION_LOOKBACK_DAYS))
+        tail = _SymbolBars.from_frame(
+            _query_ohlcv_frame([symbol], since, date.today()), covered_from=since
+        )
+        keep = entry.dates < np.datetime64(since, "D")
+        merged = _SymbolBars(
+            dates=np.concatenate([entry.dates[keep], tail.dates]),
+            ohlc=np.concatenate([entry.ohlc[keep], tail.ohlc]),
+            volume=np.concatenate([entry.volume[keep], tail.volume]),
+            covered_from=entry.covered_from,
+            refreshed_at=tail.refreshed_at,
+        )
+        with self._lock:
+            self.tail_refreshes += 1
+        self._store(symbol, merged)
+        return merged
+
+    def _store(self, symbol: str, entry: _SymbolBars) -> None:
+        with self._lock:
+            old = self._entries.pop(symbol, None)
+            if old is not None:
+                self._bytes -= old.nbytes
+            self._entries[symbol] = entry
+            self._bytes += entry.nbytes
+            # Always keep the entry just stored, even if it alone exceeds the cap
+            while self._bytes > self.max_bytes and len(self._entries) > 1:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.nbytes
+                self.evictions += 1
+
+    def invalidate(self, symbol: Optional[str] = None) -> None:
+        """Drop one symbol (or everything) so the next read goes to the DB."""
+        with self._lock:
+            if symbol is None:
+                self._entries.clear()
+                self._bytes = 0
+                return
+            old = self._entries.pop(symbol.upper().strip(), None)
+            if old is not None:
+                self._bytes -= old.nbytes
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "tail_refreshes": self.tail_refreshes,
+                "evictions": self.evictions,
+                "symbols": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+_bar_cache = OHLCVBarCache(
+    max_bytes=int(OHLCV_CACHE_MAX_MB * 1024 * 1024),
+    refresh_seconds=OHLCV_CACHE_REFRESH_SECONDS,
+)
+
+
+def get_ohlcv_cache_stats() -> dict[str, Any]:
+    """Hit/miss/eviction counters and memory use of the OHLCV bar cache."""
+    return {"enabled": OHLCV_CACHE_ENABLED, **_bar_cache.stats()}
+
+
+def invalidate_ohlcv_cache(symbol: Optional[str] = None) -> None:
+    """Drop cached bars for one symbol, or all symbols when omitted."""
+    _bar_cache.invalidate(symbol)
+
 
 @hardened_retry(max_retries=3, delay=1)
 def get_ohlcv(
@@ -45,7 +342,8 @@ def get_ohlcv(
     """
     Fetch OHLCV daily bars for a symbol within a date range.
 
-    Data is sourced from the Supabase ohlcv_daily table (Databento).
+    Data is sourced from the Supabase ohlcv_daily table (Databento) and
+    served from the in-process bar cache unless OHLCV_CACHE_ENABLED=0.
 
     Args:
         symbol: Stock ticker symbol (e.g., "AAPL", "MSFT")
@@ -58,7 +356,7 @@ def get_ohlcv(
         Returns empty DataFrame if no data found.
 
     Example:
-        >>> from datetime import date
+        >>> from datetime import date, timedelta
         >>> df = get_ohlcv("AAPL", date(2024, 1, 1), date(2024, 12, 31))
         >>> df.head()
                       Open    High     Low   Close    Volume
@@ -71,6 +369,16 @@ def get_ohlcv(
     if symbol in _CRYPTO_SYMBOLS:
         return pd.DataFrame()
 
+    if OHLCV_CACHE_ENABLED:
+        try:
+            df = _bar_cache.get(symbol, start, end)
+        except Exception as e:
+            logger.error(f"Error fetching OHLCV for {symbol}: {e}")
+            raise
+        if df.empty:
+            logger.info(f"No OHLCV data for {symbol} from {start} to {end}")
+        return df
+
     try:
         rows = execute_sql(
             """
@@ -126,6 +434,63 @@ def get_ohlcv(
         raise
 
 
+def ohlcv_to_columns(df: pd.DataFrame, decimals: Optional[int] = None) -> dict[str, list]:
+    """
+    Convert a get_ohlcv() frame into parallel JSON-ready arrays.
+
+    Column-wise NumPy conversion (no iterrows / per-bar models), sorted by
+    date ascending. Missing volume becomes 0.
+
+    Args:
+        df: DataFrame with a DatetimeIndex and Open/High/Low/Close/Volume
+        decimals: Round prices to this many places (None = unrounded)
+
+    Returns:
+        {"dates": ["YYYY-MM-DD", ...], "open": [...], "high": [...],
+         "low": [...], "close": [...], "volume": [...]}
+    """
+    if df is None or df.empty:
+        return {"dates": [], "open": [], "high": [], "low": [], "close": [], "volume": []}
+
+    df = df.rename(columns=str.capitalize).sort_index()
+    columns: dict[str, list] = {
+        "dates": np.datetime_as_string(
+            pd.DatetimeIndex(df.index).to_numpy(dtype="datetime64[D]"), unit="D"
+        ).tolist()
+    }
+    for col in _OHLC_COLUMNS:
+        values = df[col].to_numpy(dtype=np.float64)
+        if decimals is not None:
+            values = np.round(values, decimals)
+        columns[col.lower()] = values.tolist()
+    columns["volume"] = (
+        pd.to_numeric(df["Volume"], errors="coerce").fillna(0).to_numpy(dtype=np.int64).tolist()
+    )
+    return columns
+
+
+def ohlcv_to_records(df: pd.DataFrame, decimals: Optional[int] = None) -> list[dict[str, Any]]:
+    """
+    Convert a get_ohlcv() frame into ``[{"date", "open", ..., "volume"}]`` bars.
+
+    Built by zipping the ohlcv_to_columns() arrays, so the cost is one pass
+    of dict construction rather than a pandas row + model per bar.
+    """
+    cols = ohlcv_to_columns(df, decimals=decimals)
+    return [
+        {"date": d, "open": o, "high": h, "low": lo, "close": c, "volume": v}
+        for d, o, h, lo, c, v in zip(
+            cols["dates"],
+            cols["open"],
+            cols["high"],
+            cols["low"],
+            cols["close"],
+            cols["volume"],
+            strict=True,
+        )
+    ]
+
+
 def get_latest_closes_batch(symbols: list[str]) -> dict[str, float]:
     """
     Get the most recent closing prices for multiple symbols in a single query.
@@ -330,7 +695,7 @@ def get_previous_close(
         Previous closing price as float, or None if not found.
 
     Example:
-        >>> from datetime import date
+        >>> from datetime import date, timedelta
         >>> prev = get_previous_close("AAPL", date(2024, 1, 15))
         >>> print(f"AAPL previous close: ${prev:.2f}")
     """
@@ -377,7 +742,7 @@ def get_ohlcv_batch(
     end: date,
 ) -> dict[str, pd.DataFrame]:
     """
-    Fetch OHLCV data for multiple symbols (batch operation).
+    Fetch OHLCV data for multiple symbols in a single query.
 
     Args:
         symbols: List of ticker symbols
@@ -385,19 +750,101 @@ def get_ohlcv_batch(
         end: End date (inclusive)
 
     Returns:
-        Dict mapping symbol -> DataFrame with OHLCV data
+        Dict mapping symbol -> DataFrame shaped like get_ohlcv() output.
+        Symbols without data (and crypto tickers) are omitted.
     """
-    results = {}
-    for symbol in symbols:
-        try:
-            df = get_ohlcv(symbol, start, end)
-            if not df.empty:
-                results[symbol.upper()] = df
-        except Exception as e:
-            logger.warning(f"Failed to fetch OHLCV for {symbol}: {e}")
+    clean_symbols = _normalize_symbols(symbols)
+    if not clean_symbols:
+        return {}
+
+    try:
+        df = _fetch_ohlcv_frame(clean_symbols, start, end)
+    except Exception as e:
+        logger.warning(f"Failed to fetch batch OHLCV for {len(clean_symbols)} symbols: {e}")
+        return {}
+
+    results = {
+        str(symbol): group.drop(columns="Symbol").set_index("Date")
+        for symbol, group in df.groupby("Symbol", sort=False)
+    }
+    logger.debug(f"Fetched OHLCV for {len(results)}/{len(clean_symbols)} symbols")
     return results
 
 
+def get_ohlcv_long(
+    symbols: list[str],
+    start: date,
+    end: date,
+) -> pd.DataFrame:
+    """
+    Fetch long-format bars for many symbols in a single query.
+
+    Suited to vectorized ``groupby("Symbol")`` math across a universe.
+
+    Returns:
+        DataFrame with columns Symbol, Date, Open, High, Low, Close, Volume,
+        sorted by symbol then date. Raises on database errors (after retries).
+    """
+    clean_symbols = _normalize_symbols(symbols)
+    if not clean_symbols:
+        return pd.DataFrame(columns=["Symbol", "Date", *_OHLC_COLUMNS, "Volume"])
+    return _fetch_ohlcv_frame(clean_symbols, start, end)
+
+
+def get_price_panel(
+    symbols: list[str],
+    start: date,
+    end: date,
+) -> PricePanel:
+    """
+    Fetch a wide date x symbol close/volume panel in a single query.
+
+    The panel is scattered straight from the result columns with NumPy, so
+    building it costs the same whether there are 2 symbols or 200.
+
+    Args:
+        symbols: List of ticker symbols (crypto tickers are dropped)
+        start: Start date (inclusive)
+        end: End date (inclusive)
+
+    Returns:
+        PricePanel with one column per requested equity symbol. Raises on
+        database errors (after retries), like get_ohlcv().
+    """
+    clean_symbols = _normalize_symbols(symbols)
+    if not clean_symbols:
+        return PricePanel(
+            dates=np.array([], dtype="datetime64[D]"),
+            symbols=[],
+            close=np.empty((0, 0)),
+            volume=np.empty((0, 0)),
+            high=np.empty((0, 0)),
+            low=np.empty((0, 0)),
+        )
+
+    df = _fetch_ohlcv_frame(clean_symbols, start, end)
+
+    dates, date_codes = np.unique(
+        df["Date"].to_numpy(dtype="datetime64[D]"), return_inverse=True
+    )
+    sym_codes = pd.Index(clean_symbols).get_indexer(df["Symbol"])
+
+    shape = (len(dates), len(clean_symbols))
+    def scatter(column: str) -> np.ndarray:
+        matrix = np.full(shape, np.nan)
+        matrix[date_codes, sym_codes] = df[column].to_numpy(dtype=float)
+        return matrix
+
+    return PricePanel(
+        dates=dates,
+        symbols=clean_symbols,
+        close=scatter("Close"),
+        volume=scatter("Volume"),
+        high=scatter("High"),
+        low=scatter("Low"),
+    )
+
+
 def get_latest_close_batch(symbols: list[str]) -> dict[str, float]:
     """
     Get latest closing prices for multiple symbols (batch operation).
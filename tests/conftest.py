@@ -27,6 +27,53 @@ def anyio_backend():
     return "asyncio"
 
 
+@pytest.fixture(autouse=True)
+def _no_parse_cache():
+    """Disable the LLM parse cache so mocked OpenAI calls are never short-circuited
+    by results cached in another test. Cache tests install their own ParseCache."""
+    from src.nlp.parse_cache import set_parse_cache
+
+    set_parse_cache(None)
+    yield
+    set_parse_cache(None)
+
+
+@pytest.fixture(autouse=True)
+def _no_local_triage():
+    """Disable local triage so mocked triage_message() calls are exercised.
+    Local triage tests install their own LocalTriage."""
+    from src.nlp.local_triage import set_local_triage
+
+    set_local_triage(None)
+    yield
+    set_local_triage(None)
+
+
+@pytest.fixture(autouse=True)
+def _clear_analysis_memory_cache():
+    """Start every test with empty in-process analysis/risk caches so a result
+    cached by one test never satisfies another test's mocked DB reads."""
+    import sys
+
+    yield
+    orchestrator = sys.modules.get("src.analysis.orchestrator")
+    if orchestrator is not None:
+        orchestrator._analysis_memory.invalidate()
+        orchestrator._portfolio_risk_memory.invalidate()
+
+
+@pytest.fixture(autouse=True)
+def _clear_ohlcv_bar_cache():
+    """Drop in-process OHLCV bars cached by one test so results never depend
+    on test order."""
+    import sys
+
+    yield
+    price_service = sys.modules.get("src.price_service")
+    if price_service is not None:
+        price_service.invalidate_ohlcv_cache()
+
+
 # =============================================================================
 # PYTEST MARKERS CONFIGURATION
 # =============================================================================
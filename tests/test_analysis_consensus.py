@@ -116,6 +116,17 @@ async def test_consensus_full_run(bullish_signals: list[AnalystSignal]) -> None:
     assert report.model_used.startswith("gpt-")
 
 
+@pytest.mark.anyio
+async def test_consensus_without_llm_skips_openai(bullish_signals: list[AnalystSignal]) -> None:
+    """use_llm=False (warmup past its LLM budget) never builds an OpenAI client."""
+    with patch("src.analysis.consensus.OpenAI") as mock_openai:
+        report = await run(ticker="AAPL", signals=bullish_signals, data_sources=[], use_llm=False)
+
+    mock_openai.assert_not_called()
+    assert report.model_used == "deterministic"
+    assert report.summary.startswith("AAPL consensus: ")
+
+
 # ---------------------------------------------------------------------------
 # Regression: coverage damping — a verdict is only as strong as its evidence.
 # ---------------------------------------------------------------------------
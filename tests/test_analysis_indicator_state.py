@@ -0,0 +1,197 @@
+"""Tests for incremental technical indicator state (src/analysis/indicator_state.py)."""
+
+from __future__ import annotations
+
+import json
+import math
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analysis import indicator_state as ist
+from src.analysis import technical
+from src.analysis.indicators import (
+    calculate_adx,
+    calculate_atr,
+    calculate_ema,
+    calculate_hurst_exponent,
+    calculate_macd,
+    calculate_rsi,
+)
+from src.analysis.models import AnalysisInput, OHLCVBar
+
+
+@pytest.fixture
+def sample_ohlcv() -> pd.DataFrame:
+    """300 days of synthetic OHLCV with a flat stretch (zero moves)."""
+    rng = np.random.default_rng(11)
+    n = 300
+    close = 100 * np.cumprod(1 + rng.normal(0, 0.02, n))
+    close[100:106] = close[99]  # no movement: RSI/DM edge cases
+    high = close * (1 + rng.random(n) * 0.02)
+    low = close * (1 - rng.random(n) * 0.02)
+    high[100:106] = low[100:106] = close[100:106]
+    dates = pd.bdate_range("2024-01-01", periods=n).strftime("%Y-%m-%d")
+    return pd.DataFrame(
+        {"date": dates, "open": close, "high": high, "low": low, "close": close, "volume": 1e6}
+    )
+
+
+def _reference(df: pd.DataFrame) -> dict[str, float]:
+    close, high, low = df["close"], df["high"], df["low"]
+    macd_line, signal_line, histogram = calculate_macd(close)
+    return {
+        "ema_8": calculate_ema(close, 8).iloc[-1],
+        "ema_21": calculate_ema(close, 21).iloc[-1],
+        "ema_55": calculate_ema(close, 55).iloc[-1],
+        "rsi_14": calculate_rsi(close, 14).iloc[-1],
+        "rsi_28": calculate_rsi(close, 28).iloc[-1],
+        "macd": macd_line.iloc[-1],
+        "macd_signal": signal_line.iloc[-1],
+        "macd_histogram": histogram.iloc[-1],
+        "atr": calculate_atr(high, low, close, 14).iloc[-1],
+        "adx": calculate_adx(high, low, close, 14).iloc[-1],
+    }
+
+
+@pytest.mark.parametrize("n_bars", [1, 10, 14, 15, 30, 104, 300])
+def test_incremental_state_matches_full_recompute(sample_ohlcv: pd.DataFrame, n_bars: int) -> None:
+    """Folding bars one at a time equals indicators.py over the whole series."""
+    df = sample_ohlcv.iloc[:n_bars]
+    state = ist.seed_state(df["date"], df["high"], df["low"], df["close"])
+
+    values = state.indicators()
+    for name, expected in _reference(df).items():
+        if math.isnan(expected):
+            assert math.isnan(values[name]), name
+        else:
+            assert values[name] == pytest.approx(expected, rel=1e-9, abs=1e-12), name
+
+
+def test_state_survives_persistence_and_advances(sample_ohlcv: pd.DataFrame) -> None:
+    """A stored state advanced by new bars equals a state built in one pass."""
+    df = sample_ohlcv
+    stored = ist.seed_state(df["date"][:250], df["high"][:250], df["low"][:250], df["close"][:250])
+    restored = ist.IndicatorState.from_dict(json.loads(ist._json_safe(stored)))
+
+    # Bars already folded in are skipped, so overlapping windows are safe
+    ist.advance_state(restored, df["date"][200:], df["high"][200:], df["low"][200:], df["close"][200:])
+    full = ist.seed_state(df["date"], df["high"], df["low"], df["close"])
+
+    assert restored.as_of == df["date"].iloc[-1]
+    assert restored.bars == len(df)
+    assert restored.indicators() == pytest.approx(full.indicators(), rel=1e-12)
+    assert ist.IndicatorState.from_dict({**stored.to_dict(), "version": 0}) is None
+
+
+def _input(df: pd.DataFrame, state: ist.IndicatorState | None = None) -> AnalysisInput:
+    bars = [OHLCVBar(**row) for row in df.to_dict("records")]
+    return AnalysisInput(
+        ticker="TEST",
+        ohlcv=bars,
+        indicator_state=state.to_dict() if state else None,
+    )
+
+
+@pytest.mark.anyio
+async def test_technical_run_uses_state_and_falls_back(sample_ohlcv: pd.DataFrame) -> None:
+    """Same signal from the stored state (current or one bar behind) as from bars."""
+    df = sample_ohlcv
+    recomputed = await technical.run(_input(df))
+
+    current = ist.seed_state(df["date"], df["high"], df["low"], df["close"])
+    behind = ist.seed_state(df["date"][:-1], df["high"][:-1], df["low"][:-1], df["close"][:-1])
+    stale = ist.seed_state(df["date"][:-5], df["high"][:-5], df["low"][:-5], df["close"][:-5])
+
+    with patch.object(technical, "_recursive_indicators") as full_recompute:
+        from_current = await technical.run(_input(df, current))
+        from_behind = await technical.run(_input(df, behind))
+    full_recompute.assert_not_called()
+
+    with patch.object(
+        technical, "_recursive_indicators", wraps=technical._recursive_indicators
+    ) as full_recompute:
+        from_stale = await technical.run(_input(df, stale))
+    full_recompute.assert_called_once()
+
+    for signal in (from_current, from_behind, from_stale):
+        assert signal.signal == recomputed.signal
+        assert signal.confidence == pytest.approx(recomputed.confidence)
+        assert signal.metrics["strategies"] == recomputed.metrics["strategies"]
+        assert signal.metrics["macd_histogram"] == pytest.approx(recomputed.metrics["macd_histogram"])
+
+
+def _price_panel(df_by_symbol: dict[str, pd.DataFrame]):
+    from src.price_service import PricePanel
+
+    dates = sorted(set().union(*(df["date"] for df in df_by_symbol.values())))
+    shape = (len(dates), len(df_by_symbol))
+    matrices = {field: np.full(shape, np.nan) for field in ("high", "low", "close")}
+    for j, df in enumerate(df_by_symbol.values()):
+        rows = np.searchsorted(dates, df["date"])
+        for field, matrix in matrices.items():
+            matrix[rows, j] = df[field]
+    return PricePanel(
+        dates=np.array(dates, dtype="datetime64[D]"),
+        symbols=list(df_by_symbol),
+        volume=np.ones(shape),
+        **matrices,
+    )
+
+
+def test_indicator_panel_matches_per_symbol_states(sample_ohlcv: pd.DataFrame) -> None:
+    """Missing bars (late listing, halt) leave a column exactly as if absent."""
+    frames = {
+        "FULL": sample_ohlcv,
+        "LATE": sample_ohlcv.iloc[120:],
+        "HALT": sample_ohlcv.drop(index=range(150, 155)),
+    }
+    panel = _price_panel(frames)
+
+    values = ist.compute_indicator_panel(panel)
+
+    for j, (symbol, df) in enumerate(frames.items()):
+        expected = ist.seed_state(df["date"], df["high"], df["low"], df["close"]).indicators()
+        for name, value in expected.items():
+            assert values[name][j] == pytest.approx(value, rel=1e-12), (symbol, name)
+        assert values["hurst_exponent"][j] == calculate_hurst_exponent(df["close"])
+
+
+def test_refresh_indicator_states_advances_and_reseeds(sample_ohlcv: pd.DataFrame) -> None:
+    """Nightly refresh: valid states advance, restated/missing ones reseed."""
+    df = sample_ohlcv
+    head = df.iloc[:-3]
+    ok = ist.seed_state(head["date"], head["high"], head["low"], head["close"])
+    restated = ist.seed_state(head["date"], head["high"], head["low"], head["close"] * 1.01)
+    stored = {"AAA": ok.to_dict(), "BBB": restated.to_dict()}
+    panel = _price_panel({"AAA": df, "BBB": df, "CCC": df})
+
+    def fake_panel(symbols, start, end):
+        columns = [panel.symbols.index(s) for s in symbols]
+        return type(panel)(
+            dates=panel.dates,
+            symbols=list(symbols),
+            close=panel.close[:, columns],
+            volume=panel.volume[:, columns],
+            high=panel.high[:, columns],
+            low=panel.low[:, columns],
+        )
+
+    with (
+        patch.object(ist, "load_indicator_states", return_value=stored),
+        patch("src.price_service.get_price_panel", side_effect=fake_panel) as mock_panel,
+        patch.object(ist, "save_indicator_states", side_effect=len) as mock_save,
+    ):
+        written = ist.refresh_indicator_states(["aaa", "BBB", "CCC"])
+
+    assert written == 3
+    assert mock_panel.call_count == 2  # one advance job, one reseed job
+    assert mock_panel.call_args_list[0].args[0] == ["AAA", "BBB"]
+    assert mock_panel.call_args_list[1].args[0] == ["BBB", "CCC"]
+    saved = mock_save.call_args.args[0]
+    full = ist.seed_state(df["date"], df["high"], df["low"], df["close"]).indicators()
+    for symbol in ("AAA", "BBB", "CCC"):
+        assert saved[symbol].as_of == df["date"].iloc[-1]
+        assert saved[symbol].indicators() == pytest.approx(full, rel=1e-12)
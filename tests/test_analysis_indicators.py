@@ -12,6 +12,7 @@ from src.analysis.indicators import (
     calculate_bollinger_bands,
     calculate_ema,
     calculate_hurst_exponent,
+    calculate_hurst_exponent_panel,
     calculate_macd,
     calculate_rsi,
     calculate_sma,
@@ -156,3 +157,41 @@ class TestHurstExponent:
         short_series = pd.Series([1.0, 2.0, 3.0])
         result = calculate_hurst_exponent(short_series, max_lag=20)
         assert result == 0.5
+
+    def test_hurst_matches_chunk_loop(self) -> None:
+        """Reshaped implementation equals the per-chunk R/S loop."""
+
+        def reference(vals: np.ndarray, max_lag: int = 20) -> float:
+            lags = range(2, max_lag + 1)
+            rs_values = []
+            for lag in lags:
+                rs = []
+                for i in range(0, len(vals) - lag + 1, lag):
+                    chunk = vals[i : i + lag]
+                    cumulative = np.cumsum(chunk - chunk.mean())
+                    s = np.std(chunk, ddof=1)
+                    if s > 0:
+                        rs.append((cumulative.max() - cumulative.min()) / s)
+                rs_values.append(np.mean(rs) if rs else np.nan)
+            log_lags, log_rs = np.log(np.array(list(lags), dtype=float)), np.log(rs_values)
+            valid = np.isfinite(log_rs)
+            slope, _ = np.polyfit(log_lags[valid], log_rs[valid], 1)
+            return float(np.clip(slope, 0.0, 1.0))
+
+        rng = np.random.default_rng(5)
+        for n in (22, 41, 137, 400):
+            vals = 100 * np.cumprod(1 + rng.normal(0, 0.02, n))
+            vals[5:12] = vals[4]  # flat chunks (s == 0) are skipped
+            assert calculate_hurst_exponent(pd.Series(vals)) == pytest.approx(reference(vals), abs=1e-12)
+
+    def test_hurst_panel_matches_per_column(self, sample_ohlcv: pd.DataFrame) -> None:
+        """Panel version drops each column's NaNs like the Series version."""
+        close = sample_ohlcv["close"]
+        frame = pd.DataFrame({"A": close, "B": close.shift(60), "C": close.where(close.index % 7 != 0)})
+        frame["D"] = np.nan
+
+        result = calculate_hurst_exponent_panel(frame)
+
+        for col in "ABC":
+            assert result[col] == pytest.approx(calculate_hurst_exponent(frame[col]), abs=1e-12)
+        assert result["D"] == 0.5
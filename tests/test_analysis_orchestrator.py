@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -57,7 +58,7 @@ async def test_orchestrator_cache_miss_runs_agents() -> None:
 
     with (
         patch("src.analysis.orchestrator.execute_sql", return_value=[]),
-        patch("src.analysis.orchestrator._assemble_input") as mock_assemble,
+        patch("src.analysis.orchestrator._assemble_input", new_callable=AsyncMock) as mock_assemble,
         patch(
             "src.analysis.orchestrator._run_agents",
             new_callable=AsyncMock,
@@ -104,7 +105,7 @@ async def test_orchestrator_refresh_bypasses_cache() -> None:
 
     with (
         patch("src.analysis.orchestrator.execute_sql"),
-        patch("src.analysis.orchestrator._assemble_input") as mock_assemble,
+        patch("src.analysis.orchestrator._assemble_input", new_callable=AsyncMock) as mock_assemble,
         patch(
             "src.analysis.orchestrator._run_agents",
             new_callable=AsyncMock,
@@ -281,3 +282,210 @@ def test_is_crypto() -> None:
         assert _is_crypto("BTC") is True
         assert _is_crypto("btc") is True
         assert _is_crypto("AAPL") is False
+
+
+def test_assemble_many_uses_grouped_queries() -> None:
+    """Batch assembly issues one query per source, not one per ticker."""
+    import pandas as pd
+
+    from src.analysis import orchestrator
+
+    def fake_sql(query, params=None, fetch_results=False):
+        if "discord_parsed_ideas" in query:
+            assert params["tickers"] == ["AAPL", "MSFT", "NVDA"]
+            return [
+                {"ticker": "AAPL", "direction": "bullish", "confidence": 0.8, "idea_text": "long"},
+                {"ticker": "AAPL", "direction": "bearish", "confidence": 0.6, "idea_text": "trim"},
+            ]
+        if "GROUP BY UPPER(p.symbol)" in query:
+            assert params["bucket"] == "swing"
+            return [{"ticker": "MSFT", "quantity": 10, "avg_cost": 100, "current_price": 110, "market_value": 1100}]
+        return [{"total": 5000}]
+
+    frame = pd.DataFrame(
+        {"Open": [1.0], "High": [2.0], "Low": [0.5], "Close": [1.5], "Volume": [100]},
+        index=pd.DatetimeIndex(["2024-01-02"], name="Date"),
+    )
+
+    with (
+        patch.object(orchestrator, "execute_sql", side_effect=fake_sql) as mock_sql,
+        patch.object(orchestrator, "_is_crypto", return_value=False),
+        patch("src.price_service.get_ohlcv_batch", return_value={"NVDA": frame}) as mock_ohlcv,
+        patch("src.openbb_service.get_fundamentals", side_effect=lambda t: {"symbol": t}),
+        patch("src.openbb_service.get_company_news", return_value=[]),
+        patch.object(orchestrator, "load_indicator_states", return_value={"NVDA": {"as_of": "2024-01-02"}}),
+    ):
+        inputs = orchestrator.get_stock_analysis_many(["aapl", "MSFT", "nvda", "AAPL"], bucket="swing")
+
+    assert [i.ticker for i in inputs] == ["AAPL", "MSFT", "NVDA"]
+    assert mock_sql.call_count == 3  # ideas, positions, portfolio value
+    mock_ohlcv.assert_called_once()
+    assert [i.direction for i in inputs[0].ideas] == ["bullish", "bearish"]
+    assert inputs[1].position.unrealized_pnl == 100
+    assert inputs[0].position is None
+    assert len(inputs[2].ohlcv) == 1
+    assert all(i.portfolio_value == 5000 for i in inputs)
+    assert inputs[2].fundamentals == {"symbol": "NVDA"}
+    assert inputs[2].indicator_state == {"as_of": "2024-01-02"}
+    assert inputs[0].indicator_state is None
+
+
+@pytest.mark.anyio
+async def test_assemble_input_fetches_sources_concurrently() -> None:
+    """Sources overlap, and a source past its deadline is dropped, not awaited."""
+    import threading
+    import time
+
+    from src.analysis import orchestrator
+
+    threads = set()
+
+    def slow(value, seconds):
+        def fetch(*args):
+            threads.add(threading.current_thread().name)
+            time.sleep(seconds)
+            return value
+
+        return fetch
+
+    with (
+        patch.object(orchestrator, "ANALYSIS_EXTERNAL_TIMEOUT", 0.5),
+        patch.object(orchestrator, "_fetch_ohlcv", side_effect=slow([], 0.3)),
+        patch.object(orchestrator, "_fetch_fundamentals", side_effect=slow({"pe": 10}, 2.0)),
+        patch.object(orchestrator, "_fetch_news", side_effect=slow([], 0.3)),
+        patch.object(orchestrator, "_fetch_ideas", side_effect=slow([], 0.3)),
+        patch.object(orchestrator, "_fetch_position", side_effect=slow(None, 0.3)),
+        patch.object(orchestrator, "_fetch_portfolio_value", side_effect=slow(2500.0, 0.3)),
+        patch.object(orchestrator, "_fetch_indicator_state", side_effect=slow(None, 0.3)),
+    ):
+        started = time.perf_counter()
+        analysis_input, data_sources = await orchestrator._assemble_input("aapl")
+        elapsed = time.perf_counter() - started
+
+    assert elapsed < 1.0  # ~max(0.3, timeout 0.5), not the 3.5s sum
+    assert analysis_input.ticker == "AAPL"
+    assert analysis_input.fundamentals is None
+    assert analysis_input.portfolio_value == 2500.0
+    assert "OpenBB/FMP fundamentals" not in data_sources
+    # Fetches (including the hung one) run on the dedicated pool, not the default executor
+    assert threads and all(name.startswith("analysis-fetch") for name in threads)
+
+
+@pytest.mark.anyio
+async def test_concurrent_misses_share_one_computation() -> None:
+    """Ten concurrent cold requests for one key run the pipeline once."""
+    from src.analysis import orchestrator
+
+    calls = 0
+
+    async def fake_compute(ticker, analysis_type, agents, bucket=None):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return {"ticker": ticker, "summary": "fresh"}
+
+    before = orchestrator.get_singleflight_stats()["stock_analysis"]
+    with (
+        patch.object(orchestrator, "_check_cache", return_value=None),
+        patch.object(orchestrator, "_compute_analysis", side_effect=fake_compute),
+    ):
+        results = await asyncio.gather(
+            *(orchestrator.get_stock_analysis("NVDA") for _ in range(10)),
+            orchestrator.get_stock_analysis("NVDA", bucket="day"),
+        )
+    after = orchestrator.get_singleflight_stats()["stock_analysis"]
+
+    assert calls == 2  # one per (ticker, analysis_type, bucket)
+    assert all(r["summary"] == "fresh" for r in results)
+    assert after["coalesced"] - before["coalesced"] == 9
+    assert after["in_flight"] == 0
+
+
+@pytest.mark.anyio
+async def test_stale_reads_schedule_one_refresh() -> None:
+    """Stale cache hits coalesce onto a single background refresh."""
+    from src.analysis import orchestrator
+
+    release = asyncio.Event()
+    refreshes = 0
+
+    async def fake_refresh(ticker, analysis_type, agents, bucket=None):
+        nonlocal refreshes
+        refreshes += 1
+        await release.wait()
+        return {"summary": "fresh"}
+
+    stale = {"result": {"summary": "stale"}, "is_fresh": False}
+    with (
+        patch.object(orchestrator, "_check_cache", return_value=stale),
+        patch.object(orchestrator, "_refresh_analysis", side_effect=fake_refresh),
+    ):
+        results = [await orchestrator.get_stock_analysis("AMD") for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.sleep(0.01)
+
+    assert [r["summary"] for r in results] == ["stale"] * 5
+    assert refreshes == 1
+
+
+@pytest.mark.anyio
+async def test_compute_portfolio_risk_uses_every_holding_and_one_panel() -> None:
+    """No top-15 cap: all holdings go into one price panel query."""
+    import numpy as np
+
+    from src.analysis import orchestrator
+    from src.price_service import PricePanel
+
+    symbols = [f"S{i:02d}" for i in range(20)]
+
+    def fake_sql(query, params=None, fetch_results=False):
+        if "GROUP BY UPPER(p.symbol)" in query:
+            assert "LIMIT" not in query
+            return [{"symbol": s, "quantity": 1, "market_value": 100.0 + i} for i, s in enumerate(symbols)]
+        if "SUM(p.quantity * COALESCE" in query:
+            return [{"total": 50_000}]
+        return None
+
+    rng = np.random.default_rng(3)
+    close = 100 * np.cumprod(1 + rng.normal(0, 0.01, size=(40, len(symbols))), axis=0)
+    panel = PricePanel(
+        dates=np.arange(40).astype("datetime64[D]"), symbols=symbols, close=close, volume=close
+    )
+
+    with (
+        patch.object(orchestrator, "execute_sql", side_effect=fake_sql),
+        patch("src.price_service.get_price_panel", return_value=panel) as mock_panel,
+        patch("src.market_data_service.get_company_info", return_value={"sector": "Technology"}) as mock_info,
+    ):
+        result = await orchestrator._compute_portfolio_risk()
+
+    mock_panel.assert_called_once()
+    assert mock_panel.call_args.args[0] == symbols
+    assert mock_info.call_count == len(symbols)
+    assert len(result["top_risk_contributors"]) == len(symbols)
+    assert result["sector_exposure"] == {"Technology": 1.0}
+    assert result["var_95_1d"] > 0
+
+
+def test_ohlcv_bars_drop_null_prices() -> None:
+    """Bars are built without validation, so NULL (NaN) OHLC rows are filtered first."""
+    import pandas as pd
+
+    from src.analysis.orchestrator import _ohlcv_bars
+
+    df = pd.DataFrame(
+        {
+            "Open": [10.0, float("nan"), 12.0],
+            "High": [11.0, 12.0, 13.0],
+            "Low": [9.0, 10.0, 11.0],
+            "Close": [10.5, 11.5, float("nan")],
+            "Volume": [100, 200, 300],
+        },
+        index=pd.DatetimeIndex(["2025-01-02", "2025-01-03", "2025-01-06"], name="Date"),
+    )
+
+    bars = _ohlcv_bars(df)
+
+    assert [b.date for b in bars] == ["2025-01-02"]
+    assert bars[0].close == 10.5
@@ -0,0 +1,95 @@
+"""Tests for the in-process analysis result tier (src/analysis/result_cache.py)."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+from src.analysis.result_cache import ResultMemoryCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _expires(hours):
+    return datetime.now(timezone.utc) + timedelta(hours=hours)
+
+
+def test_entries_follow_db_freshness_and_memory_ttl():
+    clock = FakeClock()
+    cache = ResultMemoryCache(max_entries=10, ttl_seconds=60, clock=clock)
+    cache.put(("AAPL", "full", "all"), {"summary": "fresh"}, _expires(1))
+    cache.put(("MSFT", "full", "all"), {"summary": "old"}, _expires(-1))
+
+    assert cache.get(("AAPL", "full", "all")) == {"result": {"summary": "fresh"}, "is_fresh": True}
+    assert cache.get(("MSFT", "full", "all"))["is_fresh"] is False
+
+    clock.now = 61  # past the memory TTL: go back to the DB
+    assert cache.get(("AAPL", "full", "all")) is None
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["expirations"]) == (2, 1, 1)
+
+
+def test_lru_eviction_and_invalidation():
+    cache = ResultMemoryCache(max_entries=2, ttl_seconds=60)
+    cache.put(("A", "full", "all"), {}, _expires(1))
+    cache.put(("B", "full", "all"), {}, _expires(1))
+    cache.get(("A", "full", "all"))
+    cache.put(("C", "full", "day"), {}, _expires(1))
+
+    assert cache.get(("B", "full", "all")) is None
+    assert cache.stats()["evictions"] == 1
+    assert cache.invalidate(lambda key: key[0] == "C") == 1
+    assert cache.get(("A", "full", "all")) is not None
+
+
+def test_check_cache_serves_repeat_reads_from_memory():
+    from src.analysis import orchestrator
+
+    row = MagicMock()
+    row._mapping = {"result": '{"ticker": "AAPL"}', "agent_signals": [], "expires_at": _expires(2)}
+
+    with patch.object(orchestrator, "execute_sql", return_value=[row]) as mock_sql:
+        first = orchestrator._check_cache("aapl")
+        second = orchestrator._check_cache("AAPL")
+        orchestrator._check_cache("AAPL", bucket="day")
+
+    assert first == second == {"result": {"ticker": "AAPL"}, "is_fresh": True}
+    assert mock_sql.call_count == 2  # second read was a memory hit; bucket is part of the key
+
+
+def test_invalidation_drops_memory_and_expires_db_rows():
+    from src.analysis import orchestrator
+
+    with patch.object(orchestrator, "execute_sql") as mock_sql:
+        orchestrator._cache_result("AAPL", "full", {"ticker": "AAPL"}, [], "m", [])
+        orchestrator._cache_result("MSFT", "full", {"ticker": "MSFT"}, [], "m", [])
+        dropped = orchestrator.invalidate_analysis_cache(["aapl"])
+
+    assert dropped == 1
+    sql, params = mock_sql.call_args.args[0], mock_sql.call_args.kwargs["params"]
+    assert "UPDATE stock_analysis_cache SET expires_at = NOW()" in sql
+    assert params == {"tickers": ["AAPL"]}
+    assert orchestrator._analysis_memory.get(("MSFT", "full", "all")) is not None
+
+
+def test_reads_and_user_writes_record_views_warmup_writes_do_not():
+    from src.analysis import orchestrator
+
+    row = MagicMock()
+    row._mapping = {"result": '{"ticker": "AAPL"}', "agent_signals": [], "expires_at": _expires(2)}
+
+    with patch.object(orchestrator, "execute_sql", return_value=[row]) as mock_sql:
+        orchestrator._check_cache("AAPL")
+        read_sql = mock_sql.call_args.args[0]
+        orchestrator._cache_result("AAPL", "full", {}, [], "m", [])
+        user_params = mock_sql.call_args.kwargs["params"]
+        orchestrator._cache_result("AAPL", "full", {}, [], "m", [], viewed=False)
+        warmup_params = mock_sql.call_args.kwargs["params"]
+
+    assert "SET last_viewed_at = NOW()" in read_sql
+    assert user_params["viewed"] is True
+    assert warmup_params["viewed"] is False
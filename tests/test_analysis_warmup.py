@@ -0,0 +1,184 @@
+"""Tests for the nightly analysis cache warmup (src/analysis/warmup.py)."""
+
+from __future__ import annotations
+
+import asyncio
+import re
+import threading
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.analysis import consensus, orchestrator, warmup
+from src.analysis.models import AnalysisInput, AnalystSignal
+
+
+def test_warmup_targets_priority_and_dedup() -> None:
+    """Holdings first (by value), then configured tickers, then recent views."""
+    held = [{"ticker": "MSFT"}, {"ticker": "AAPL"}]
+    recent = [
+        {"ticker": "aapl", "bucket": "all"},  # already a holding
+        {"ticker": "NVDA", "bucket": "day"},
+        {"ticker": "TSLA", "bucket": "all"},
+    ]
+    buckets = [{"bucket": "day"}, {"bucket": "swing"}]
+
+    with patch.object(warmup, "execute_sql", side_effect=[held, recent, buckets]):
+        keys, risk_buckets = warmup.warmup_targets(extra_tickers=" spy, msft ,")
+
+    assert keys == [("MSFT", None), ("AAPL", None), ("SPY", None), ("NVDA", "day"), ("TSLA", None)]
+    assert risk_buckets == ["day", "swing"]
+
+
+SCHEMA_DIR = Path(__file__).parent.parent / "schema"
+_TABLE_ALIASES = {"p": "positions", "acc": "accounts", "c": "stock_analysis_cache"}
+
+
+def _schema_columns() -> dict[str, set[str]]:
+    """Columns per table from schema/*.sql (CREATE TABLE + ALTER TABLE ADD COLUMN)."""
+    columns: dict[str, set[str]] = {}
+    for path in sorted(SCHEMA_DIR.glob("*.sql")):
+        sql = re.sub(r"--.*$", "", path.read_text(encoding="utf-8"), flags=re.MULTILINE)
+        for match in re.finditer(r"CREATE TABLE (?:IF NOT EXISTS )?(?:public\.)?(\w+) \(", sql, re.IGNORECASE):
+            depth, start = 1, match.end()
+            end = start
+            while depth and end < len(sql):
+                depth += {"(": 1, ")": -1}.get(sql[end], 0)
+                end += 1
+            body, parts, depth = sql[start : end - 1], [""], 0
+            for ch in body:  # split on top-level commas
+                depth += {"(": 1, ")": -1}.get(ch, 0)
+                if ch == "," and depth == 0:
+                    parts.append("")
+                else:
+                    parts[-1] += ch
+            names = {part.split()[0].strip('"') for part in parts if part.strip()}
+            columns.setdefault(match.group(1), set()).update(names)
+        for match in re.finditer(
+            r"ALTER TABLE (?:IF EXISTS )?(?:ONLY )?(?:public\.)?(\w+)\s+ADD COLUMN (?:IF NOT EXISTS )?(\w+)",
+            sql,
+            re.IGNORECASE,
+        ):
+            columns.setdefault(match.group(1), set()).add(match.group(2))
+    return columns
+
+
+def test_warmup_target_queries_match_schema() -> None:
+    """Every aliased column in the target queries exists in the migrations."""
+    queries: list[str] = []
+
+    def capture(query, params=None, fetch_results=False):
+        queries.append(query)
+        return []
+
+    with patch.object(warmup, "execute_sql", side_effect=capture):
+        warmup.warmup_targets(extra_tickers="")
+
+    assert "c.last_viewed_at" in queries[1] and "computed_at" not in queries[1]
+    schema = _schema_columns()
+    refs = {(alias, column) for query in queries for alias, column in re.findall(r"\b(p|acc|c)\.(\w+)", query)}
+    assert refs
+    missing = sorted(f"{_TABLE_ALIASES[a]}.{col}" for a, col in refs if col not in schema[_TABLE_ALIASES[a]])
+    assert missing == []
+
+
+@pytest.mark.anyio
+async def test_warm_analysis_cache_budget_concurrency_and_ttl() -> None:
+    """LLM budget goes to the first keys; analyses run at most `concurrency` at once."""
+    keys = [(f"T{i}", None) for i in range(6)] + [("T0", "day")]
+    running = 0
+    peak = 0
+
+    async def fake_analyze(ticker, analysis_type, agents, input_data, data_sources, **kwargs):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        if ticker == "T5":
+            raise RuntimeError("agent blew up")
+        return {"model_used": "gpt-5-mini-fallback" if ticker == "T2" else "gpt-5-mini"}
+
+    def fake_assemble(tickers, bucket):
+        return [(AnalysisInput(ticker=t), ["Databento OHLCV"]) for t in tickers]
+
+    with (
+        patch.object(warmup, "warmup_targets", return_value=(keys, ["day"])),
+        patch.object(orchestrator, "_assemble_inputs_many", side_effect=fake_assemble) as mock_assemble,
+        patch.object(orchestrator, "_analyze_input", side_effect=fake_analyze) as mock_analyze,
+        patch.object(orchestrator, "_compute_portfolio_risk", new_callable=AsyncMock) as mock_risk,
+    ):
+        stats = await warmup.warm_analysis_cache(concurrency=2, llm_budget=3, ttl_hours=12)
+
+    # One batch assembly per bucket
+    assert [c.args for c in mock_assemble.call_args_list] == [
+        (["T0", "T1", "T2", "T3", "T4", "T5"], None),
+        (["T0"], "day"),
+    ]
+    assert peak == 2
+
+    calls = {(c.args[0], c.kwargs["bucket"]): c.kwargs for c in mock_analyze.call_args_list}
+    assert [key for key, kw in calls.items() if kw["use_llm"]] == [("T0", None), ("T1", None), ("T2", None)]
+    # Warmup writes are not views, so they can't keep a ticker in the recent set
+    assert all(kw["viewed"] is False for kw in calls.values())
+    # Only LLM-narrated entries are kept for the night; the rest use the normal TTL
+    assert {key: kw["ttl_hours"] for key, kw in calls.items()} == {
+        ("T0", None): 12,
+        ("T1", None): 12,
+        ("T2", None): 12,
+        ("T3", None): None,
+        ("T4", None): None,
+        ("T5", None): None,
+        ("T0", "day"): None,
+    }
+
+    assert [c.args for c in mock_risk.call_args_list] == [(None,), ("day",)]
+    assert all(c.kwargs["ttl_hours"] == 12 for c in mock_risk.call_args_list)
+
+    assert stats["targets"] == 7
+    assert stats["analyses"] == 6
+    assert stats["failed"] == 1
+    assert stats["llm_calls"] == 2
+    assert stats["llm_fallbacks"] == 1
+    assert stats["risk"] == 2
+
+
+@pytest.mark.anyio
+async def test_warmup_overlaps_blocking_narrative_and_cache_writes() -> None:
+    """The OpenAI narrative and the cache upsert block; they must run off the event loop."""
+    keys = [(f"T{i}", None) for i in range(4)]
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+
+    def blocking(*args, **kwargs):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+        return "narrative", "gpt-5-mini"
+
+    signals = [AnalystSignal(agent_id="technical", signal="bullish", confidence=0.8, reasoning="up")]
+
+    with (
+        patch.object(warmup, "warmup_targets", return_value=(keys, [])),
+        patch.object(
+            orchestrator,
+            "_assemble_inputs_many",
+            side_effect=lambda tickers, bucket: [(AnalysisInput(ticker=t), []) for t in tickers],
+        ),
+        patch.object(orchestrator, "_run_agents", new_callable=AsyncMock, return_value=signals),
+        patch.object(consensus, "_generate_narrative", side_effect=blocking),
+        patch.object(orchestrator, "_cache_result", side_effect=blocking) as mock_cache,
+        patch.object(orchestrator, "_compute_portfolio_risk", new_callable=AsyncMock),
+    ):
+        stats = await warmup.warm_analysis_cache(concurrency=4, llm_budget=4, ttl_hours=12)
+
+    assert stats["analyses"] == 4 and stats["llm_calls"] == 4
+    assert mock_cache.call_count == 4
+    assert peak > 1
@@ -0,0 +1,72 @@
+"""Tests for the asyncpg-backed data-access helpers in src/db.py."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+
+def _fake_engine(rows: list | None = None):
+    """Build a fake AsyncEngine whose connect()/begin() record usage."""
+    result = MagicMock()
+    result.fetchall.return_value = rows or []
+
+    conn = MagicMock()
+    conn.execute = AsyncMock(return_value=result)
+
+    def _ctx():
+        cm = MagicMock()
+        cm.__aenter__ = AsyncMock(return_value=conn)
+        cm.__aexit__ = AsyncMock(return_value=False)
+        return cm
+
+    engine = MagicMock()
+    engine.connect = MagicMock(side_effect=lambda: _ctx())
+    engine.begin = MagicMock(side_effect=lambda: _ctx())
+    return engine, conn
+
+
+@pytest.mark.anyio
+async def test_async_execute_sql_rejects_tuple_params() -> None:
+    from src.db import async_execute_sql
+
+    with pytest.raises(TypeError):
+        await async_execute_sql("SELECT 1", ("a",))  # type: ignore[arg-type]
+
+
+@pytest.mark.anyio
+async def test_async_execute_sql_rejects_naive_datetime() -> None:
+    from src.db import async_execute_sql
+
+    with pytest.raises(ValueError):
+        await async_execute_sql(
+            "SELECT 1 WHERE :ts IS NOT NULL", {"ts": datetime(2026, 1, 1)}
+        )
+
+
+@pytest.mark.anyio
+async def test_async_select_uses_plain_connection_and_fetches() -> None:
+    from src.db import async_fetch
+
+    engine, conn = _fake_engine(rows=[("AAPL",)])
+    with patch("src.db.get_async_engine", AsyncMock(return_value=engine)):
+        rows = await async_fetch("SELECT symbol FROM positions WHERE symbol = :s", {"s": "AAPL"})
+
+    assert rows == [("AAPL",)]
+    engine.connect.assert_called_once()
+    engine.begin.assert_not_called()
+    assert conn.execute.await_args.args[1] == {"s": "AAPL"}
+
+
+@pytest.mark.anyio
+async def test_async_write_runs_in_transaction() -> None:
+    from src.db import async_execute_sql
+
+    engine, _conn = _fake_engine()
+    with patch("src.db.get_async_engine", AsyncMock(return_value=engine)):
+        await async_execute_sql("UPDATE accounts SET bucket = :b", {"b": "core"})
+
+    engine.begin.assert_called_once()
+    engine.connect.assert_not_called()
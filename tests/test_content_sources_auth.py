@@ -282,7 +282,7 @@ def test_import_messages_creates_imessage_ideas(mock_sql, _mock_hash, client):
     assert params["thread_key"] == "friends-market-chat"
 
 
-@patch("app.routes.ideas.execute_sql")
+@patch("app.routes.ideas.async_execute_sql")
 def test_timeline_orders_by_source_created_at(mock_sql, client):
     mock_sql.return_value = [_row(_idea_row())]
 
@@ -177,7 +177,7 @@ def _parsed_row(**overrides):
     return base
 
 
-@patch("app.routes.ideas.execute_sql")
+@patch("app.routes.ideas.async_execute_sql")
 def test_list_parsed_ideas_for_review(mock_sql, client):
     mock_sql.side_effect = [
         [(1,)],  # count
@@ -167,6 +167,110 @@ class TestDatabentoCollector:
         # Should be unique and sorted
         assert symbols == ["AAPL", "GOOGL", "MSFT"]
 
+    @staticmethod
+    def _mock_raw_connection(rowcount: int | None = None):
+        """Raw DB-API connection whose cursor captures COPY payloads."""
+        copied: list[str] = []
+        cursor = MagicMock()
+        cursor.__enter__.return_value = cursor
+        cursor.copy_expert.side_effect = lambda sql, buf: copied.append(buf.read())
+        if rowcount is not None:
+            cursor.rowcount = rowcount
+        raw_conn = MagicMock()
+        raw_conn.cursor.return_value = cursor
+        return raw_conn, cursor, copied
+
+    def test_save_to_supabase_copies_in_chunks(self, collector):
+        """Each chunk is COPY'd to staging and merged in its own transaction."""
+        df = pd.DataFrame(
+            {
+                "symbol": ["AAPL", "AAPL", "MSFT", "MSFT", "NVDA"],
+                "date": [date(2024, 1, d) for d in (2, 3, 2, 3, 2)],
+                "open": [185.0, 186.0, 370.0, 371.0, 480.0],
+                "high": [187.0, 188.0, 372.0, 373.0, 490.0],
+                "low": [184.0, 185.0, 368.0, 369.0, 475.0],
+                "close": [186.0, 187.0, 371.0, 372.0, 485.0],
+                "volume": [1000000.0, 1100000.0, 500.0, None, 42.0],
+            }
+        )
+        raw_conn, cursor, copied = self._mock_raw_connection(rowcount=2)
+        engine = MagicMock()
+        engine.raw_connection.return_value = raw_conn
+
+        with patch("src.databento_collector.get_sync_engine", return_value=engine):
+            saved = collector.save_to_supabase(df, chunk_size=2)
+
+        assert saved == 6  # three chunks x mocked rowcount
+        assert cursor.copy_expert.call_count == 3
+        assert raw_conn.commit.call_count == 3
+        raw_conn.close.assert_called_once()
+        # Volume serializes as a bigint literal; missing values load as NULL
+        assert copied[0].splitlines()[0] == "AAPL,2024-01-02,185.0,187.0,184.0,186.0,1000000"
+        assert copied[1].splitlines()[1] == "MSFT,2024-01-03,371.0,373.0,369.0,372.0,"
+
+    def test_save_to_supabase_rolls_back_failed_chunk(self, collector):
+        """A failing chunk is rolled back and later chunks still load."""
+        df = pd.DataFrame(
+            {
+                "symbol": ["AAPL", "MSFT"],
+                "date": [date(2024, 1, 2), date(2024, 1, 2)],
+                "open": [1.0, 2.0],
+                "high": [1.0, 2.0],
+                "low": [1.0, 2.0],
+                "close": [1.0, 2.0],
+                "volume": [10, 20],
+            }
+        )
+        raw_conn, cursor, _ = self._mock_raw_connection(rowcount=1)
+        cursor.copy_expert.side_effect = [Exception("boom"), None]
+        engine = MagicMock()
+        engine.raw_connection.return_value = raw_conn
+
+        with patch("src.databento_collector.get_sync_engine", return_value=engine), patch(
+            "src.price_service.invalidate_ohlcv_cache"
+        ) as invalidate:
+            saved = collector.save_to_supabase(df, chunk_size=1)
+
+        assert saved == 1
+        raw_conn.rollback.assert_called_once()
+        raw_conn.commit.assert_called_once()
+        # Only the committed symbol's cached bars are dropped
+        invalidate.assert_called_once_with("MSFT")
+
+    def test_save_to_supabase_rejects_empty_chunks(self, collector):
+        """A zero chunk size is an error, not a silent fallback to the default."""
+        with pytest.raises(ValueError):
+            collector.save_to_supabase(pd.DataFrame(), chunk_size=0)
+
+    def test_prepare_upsert_frame_dedupes_keys(self, collector):
+        """Duplicate (symbol, date) rows keep the last occurrence."""
+        df = pd.DataFrame(
+            {
+                "symbol": ["AAPL", "AAPL"],
+                "date": [date(2024, 1, 2), date(2024, 1, 2)],
+                "open": [1.0, 2.0],
+                "high": [1.0, 2.0],
+                "low": [1.0, 2.0],
+                "close": [1.0, 2.0],
+                "volume": [10, 20],
+            }
+        )
+
+        frame = collector._prepare_upsert_frame(df)
+
+        assert len(frame) == 1
+        assert frame["close"].iloc[0] == 2.0
+
+    def test_upsert_chunk_size_from_constructor(self, mock_env):
+        """Explicit chunk size overrides the env default."""
+        with patch("src.databento_collector.load_dotenv"):
+            from src.databento_collector import DatabentoCollector
+
+            assert DatabentoCollector(upsert_chunk_size=250).upsert_chunk_size == 250
+            for bad in (0, -1):
+                with pytest.raises(ValueError):
+                    DatabentoCollector(upsert_chunk_size=bad)
+
 
 class TestDateRangeLogic:
     """Test date range handling."""
@@ -80,3 +80,13 @@ class TestSymbolTrace:
         assert data["tv_symbol"] is None  # equities don't have crypto identity
         assert data["price_resolution"]["databento_hit"] is True
         assert data["price_resolution"]["selected_source"] == "databento"
+
+
+class TestCacheStats:
+    def test_cache_stats_reports_ohlcv_counters(self, client_with_debug):
+        response = client_with_debug.get("/debug/cache-stats")
+        assert response.status_code == 200
+        ohlcv = response.json()["ohlcv"]
+        assert {"hits", "misses", "hit_rate", "evictions", "bytes"} <= set(ohlcv)
+        flights = response.json()["singleflight"]
+        assert {"started", "coalesced", "in_flight"} <= set(flights["stock_analysis"])
@@ -1,7 +1,7 @@
 """
 Tests for app/routes/ideas.py — unified ideas CRUD + refine.
 
-All tests mock execute_sql and OpenAI — no external dependencies.
+All tests mock execute_sql/async_execute_sql and OpenAI — no external dependencies.
 """
 
 from unittest.mock import MagicMock, patch
@@ -52,7 +52,7 @@ SAMPLE_IDEA_ROW = {
 # =========================================================================
 
 class TestListIdeas:
-    @patch("app.routes.ideas.execute_sql")
+    @patch("app.routes.ideas.async_execute_sql")
     def test_list_empty(self, mock_sql, client):
         """Empty list returns zero ideas."""
         mock_sql.side_effect = [
@@ -66,7 +66,7 @@ class TestListIdeas:
         assert data["total"] == 0
         assert data["hasMore"] is False
 
-    @patch("app.routes.ideas.execute_sql")
+    @patch("app.routes.ideas.async_execute_sql")
     def test_list_with_ideas(self, mock_sql, client):
         """Returns ideas with correct structure."""
         mock_sql.side_effect = [
@@ -84,7 +84,7 @@ class TestListIdeas:
         assert idea["source"] == "manual"
         assert idea["status"] == "draft"
 
-    @patch("app.routes.ideas.execute_sql")
+    @patch("app.routes.ideas.async_execute_sql")
     def test_list_filters_symbol(self, mock_sql, client):
         """Symbol filter is applied."""
         mock_sql.side_effect = [
@@ -98,7 +98,7 @@ class TestListIdeas:
         assert "UPPER(symbol) = :symbol" in call_args[0][0]
         assert call_args[1]["params"]["symbol"] == "AAPL"
 
-    @patch("app.routes.ideas.execute_sql")
+    @patch("app.routes.ideas.async_execute_sql")
     def test_list_filters_source(self, mock_sql, client):
         """Source filter is applied."""
         mock_sql.side_effect = [
@@ -110,13 +110,13 @@ class TestListIdeas:
 
     def test_list_invalid_source(self, client):
         """Invalid source returns 400."""
-        with patch("app.routes.ideas.execute_sql"):
+        with patch("app.routes.ideas.async_execute_sql"):
             resp = client.get("/ideas?source=invalid")
             assert resp.status_code == 400
 
     def test_list_invalid_status(self, client):
         """Invalid status returns 400."""
-        with patch("app.routes.ideas.execute_sql"):
+        with patch("app.routes.ideas.async_execute_sql"):
             resp = client.get("/ideas?status=invalid")
             assert resp.status_code == 400
 
@@ -373,7 +373,7 @@ class TestRefineIdea:
 # =========================================================================
 
 class TestIdeaContext:
-    @patch("app.routes.ideas.execute_sql")
+    @patch("app.routes.ideas.async_execute_sql")
     def test_returns_context_with_surrounding_messages(self, mock_sql, client):
         """GET /ideas/{id}/context returns parent message + surrounding context."""
         idea_row = {**SAMPLE_IDEA_ROW, "origin_message_id": "msg-123"}
@@ -405,14 +405,14 @@ class TestIdeaContext:
         parent_in_context = [m for m in data["contextMessages"] if m["isParent"]]
         assert len(parent_in_context) == 1
 
-    @patch("app.routes.ideas.execute_sql")
+    @patch("app.routes.ideas.async_execute_sql")
     def test_idea_not_found_returns_404(self, mock_sql, client):
         """GET /ideas/{id}/context returns 404 for non-existent idea."""
         mock_sql.return_value = []
         response = client.get(f"/ideas/{SAMPLE_UUID}/context")
         assert response.status_code == 404
 
-    @patch("app.routes.ideas.execute_sql")
+    @patch("app.routes.ideas.async_execute_sql")
     def test_idea_without_origin_message(self, mock_sql, client):
         """Ideas without origin_message_id return empty context."""
         idea_row = {**SAMPLE_IDEA_ROW, "origin_message_id": None}
@@ -432,7 +432,7 @@ class TestIdeaContext:
 class TestMovers:
     @patch("app.routes.portfolio.get_previous_closes_batch", return_value={})
     @patch("app.routes.portfolio.get_latest_closes_batch", return_value={})
-    @patch("app.routes.portfolio.execute_sql")
+    @patch("app.routes.portfolio.async_execute_sql")
     def test_movers_empty(self, mock_sql, mock_latest, mock_prev, client):
         """No positions returns empty movers."""
         mock_sql.return_value = []
@@ -444,7 +444,7 @@ class TestMovers:
 
     @patch("app.routes.portfolio.get_previous_closes_batch")
     @patch("app.routes.portfolio.get_latest_closes_batch")
-    @patch("app.routes.portfolio.execute_sql")
+    @patch("app.routes.portfolio.async_execute_sql")
     def test_movers_with_positions(self, mock_sql, mock_latest, mock_prev, client):
         """Returns gainers and losers from positions."""
         mock_sql.return_value = [
@@ -0,0 +1,178 @@
+"""Tests for local triage (src/nlp/local_triage.py) and its use in process_message."""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from src.nlp import openai_parser
+from src.nlp.local_triage import (
+    LinearTriageModel,
+    LocalTriage,
+    _calibrate_band,
+    set_local_triage,
+    train_linear_model,
+    triage_signals,
+)
+from src.nlp.preclean import is_bot_command, is_url_only
+
+FIXTURE_PATH = Path(__file__).parent / "fixtures" / "triage_regression.jsonl"
+
+# Chunks that are neither clear noise nor clear trade content: the LLM decides
+UNCERTAIN = [
+    "what does everyone think about the fed tomorrow",
+    "AI inference costs are dropping fast",
+    "interesting read on the semiconductor cycle",
+]
+
+
+def _regression_cases():
+    cases = []
+    for line in FIXTURE_PATH.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if line and not line.startswith("#"):
+            cases.append(json.loads(line))
+    return cases
+
+
+def _corpus():
+    """Labelled synthetic corpus: 1 = actionable, 0 = noise."""
+    tickers = ["AAPL", "NVDA", "TSLA", "AMD", "MSFT", "META", "GOOGL", "AMZN"]
+    actionable = [
+        "${t} looking strong into earnings, adding on dips",
+        "Bought more ${t} today, long term hold",
+        "{t} broke resistance, next target higher",
+        "Trimming ${t} here, taking profits",
+        "semis ripping, {t} leading the sector",
+        "margins compressing across cloud names like {t}",
+        "the ai capex cycle still favors {t}",
+        "watching {t} for a pullback entry",
+    ]
+    noise = [
+        "good morning everyone",
+        "anyone watching the game tonight",
+        "haha that is hilarious",
+        "going to grab lunch brb",
+        "my cat knocked over my coffee again",
+        "happy friday folks",
+        "welcome to the server {n}",
+        "who is coming to the meetup",
+    ]
+    texts, labels = [], []
+    for i, t in enumerate(tickers):
+        for template in actionable:
+            texts.append(template.format(t=t))
+            labels.append(1)
+        for template in noise:
+            texts.append(f"{template.format(n=f'user{i}')} {'!' * (i % 3)}".strip())
+            labels.append(0)
+    return texts, labels
+
+
+class TestTriageRegressionCases:
+    """Local triage over tests/fixtures/triage_regression.jsonl (no OpenAI)."""
+
+    @pytest.mark.parametrize("case", _regression_cases(), ids=lambda c: c["text"][:30])
+    def test_rules_decide_fixture_cases_correctly(self, case):
+        # Bot commands / URL-only are prefiltered before triage (process_message)
+        if is_bot_command(case["text"]) or is_url_only(case["text"]):
+            pytest.skip("prefiltered before triage")
+
+        decision = LocalTriage().classify(case["text"])
+
+        assert decision.source == "rule"
+        assert decision.result.is_noise == case["expected_noise"]
+        assert decision.result.has_actionable_content != case["expected_noise"]
+
+    @pytest.mark.parametrize("text", UNCERTAIN)
+    def test_ambiguous_chunks_defer_to_llm(self, text):
+        decision = LocalTriage().classify(text)
+
+        assert decision.result is None and decision.source is None
+
+    def test_tickers_reported_like_llm_triage(self):
+        result = LocalTriage().classify("Trimmed my position in nvidia, adding $AMD").result
+
+        assert sorted(result.tickers_present) == ["AMD", "NVDA"]
+        assert result.skip_reason is None
+
+
+class TestLinearTriageModel:
+    def test_calibrated_band_keeps_precision(self):
+        scores = np.array([0.05, 0.1, 0.2, 0.4, 0.5, 0.6, 0.8, 0.9, 0.95])
+        labels = np.array([0, 0, 0, 1, 0, 1, 1, 1, 1])
+
+        lower, upper = _calibrate_band(scores, labels, target_precision=1.0)
+
+        assert (lower, upper) == (0.2, 0.6)
+        assert _calibrate_band(np.array([0.5, 0.5]), np.array([0, 1]), 1.0) == (-0.01, 1.01)
+
+    def test_trained_model_decides_outside_band(self, tmp_path):
+        texts, labels = _corpus()
+
+        model = train_linear_model(texts, labels, min_count=1, target_precision=0.95)
+        model.save(tmp_path / "triage.json")
+        loaded = LinearTriageModel.load(tmp_path / "triage.json")
+
+        assert 0.0 <= model.lower < model.upper <= 1.0
+        assert loaded.to_dict() == model.to_dict()
+        assert LinearTriageModel.load(tmp_path / "missing.json") is None
+        assert LinearTriageModel.from_dict({**model.to_dict(), "version": 0}) is None
+
+        triage = LocalTriage(loaded)
+        decided = 0
+        for text, label in zip(texts, labels, strict=True):
+            decision = triage.classify(text)
+            if decision.result is not None:
+                decided += 1
+                assert decision.result.is_noise == (label == 0), text
+        assert decided / len(texts) > 0.9
+
+    def test_model_never_rejects_chunks_with_tickers(self):
+        model = LinearTriageModel(weights={}, bias=-10.0, lower=0.5, upper=0.9)
+        triage = LocalTriage(model)
+
+        with_ticker = triage.classify("anyone else notice $AAPL")
+        without = triage.classify("anyone around tonight")
+
+        assert triage_signals("anyone else notice $AAPL").tickers == ["AAPL"]
+        assert with_ticker.result is None and with_ticker.score < model.lower
+        assert without.source == "model" and without.result.is_noise
+
+
+class TestProcessMessageLocalTriage:
+    @pytest.fixture(autouse=True)
+    def _local_triage(self):
+        set_local_triage(LocalTriage())
+        yield
+
+    def test_clear_chunks_skip_llm_triage(self, mock_message_parse_result):
+        with (
+            patch.object(openai_parser, "triage_message") as mock_triage,
+            patch.object(openai_parser, "parse_message", return_value=(mock_message_parse_result(), "m")),
+        ):
+            noise = openai_parser.process_message("Good morning!", message_id="1")
+            noise_stats = openai_parser.get_call_stats()
+            trade = openai_parser.process_message("$AAPL breakout over 200, adding calls", message_id="2")
+            trade_stats = openai_parser.get_call_stats()
+
+        mock_triage.assert_not_called()
+        assert noise["status"] == "noise"
+        assert noise_stats.local_triage_rejects == 1 and noise_stats.triage_calls == 0
+        assert trade["status"] == "ok"
+        assert trade_stats.local_triage_accepts == 1 and trade_stats.triage_calls_saved == 1
+        assert "local_triage=1/1" in trade["call_stats"]
+
+    def test_uncertain_chunks_fall_back_to_llm(self, mock_triage_result, mock_message_parse_result):
+        with (
+            patch.object(openai_parser, "triage_message", return_value=mock_triage_result()) as mock_triage,
+            patch.object(openai_parser, "parse_message", return_value=(mock_message_parse_result(), "m")),
+        ):
+            result = openai_parser.process_message(UNCERTAIN[1], message_id="3")
+            stats = openai_parser.get_call_stats()
+
+        mock_triage.assert_called_once()
+        assert result["status"] == "ok"
+        assert stats.local_triage_deferred == 1 and stats.triage_calls_saved == 0
@@ -0,0 +1,64 @@
+"""Tests for the vectorized message cleaning pipeline (src/message_cleaner.py)."""
+
+import pandas as pd
+import pytest
+
+import src.message_cleaner as mc
+
+
+SAMPLES = [
+    "**Bold** $aapl and $BRK.B https://example.com/x?a=1 <@!123> <#456>",
+    "check https://x.com/trader/status/123456 and https://twitter.com/a/status/9 $TSLA $tsla",
+    "```code block``` `inline` ~~gone~~ __under__ *it* _u_",
+    "plain text with no markup",
+    "!command $SPY",
+    "",
+    None,
+]
+
+
+def test_clean_text_handles_markup_and_non_strings():
+    assert mc.clean_text("**Bold** <@!123> text https://a.com") == "Bold text"
+    assert mc.clean_text("__a__ ~~b~~ `c`   *d*") == "a b c d"
+    assert mc.clean_text(None) == ""
+
+
+def test_clean_messages_matches_row_functions():
+    df = pd.DataFrame(
+        {
+            "message_id": [str(i) for i in range(len(SAMPLES))],
+            "content": SAMPLES,
+            "author": "a",
+            "channel": "c",
+            "created_at": "2024-01-01",
+        }
+    )
+
+    result = mc.clean_messages(df, channel_type="trading")
+
+    content = [s or "" for s in SAMPLES]
+    assert result["cleaned_content"].tolist() == [mc.clean_text(s) for s in content]
+    assert result["sentiment"].tolist() == [
+        mc.calculate_sentiment(mc.clean_text(s)) for s in content
+    ]
+    assert result["tickers"].tolist() == [mc.extract_ticker_symbols(s) for s in content]
+    assert result["tweet_urls"].tolist() == [mc.extract_tweet_urls(s) for s in content]
+    assert result.loc[0, "tickers_str"] == "$AAPL, $BRK.B"
+    assert result.loc[1, "ticker_count"] == 1
+    assert result["is_command"].tolist() == [False, False, False, False, True, False, False]
+
+
+def test_score_sentiments_dedupes_and_uses_pool(monkeypatch):
+    texts = ["great breakout", "terrible miss", "great breakout"]
+    serial = mc.score_sentiments(texts, workers=1)
+
+    assert serial[0] == serial[2]
+    assert serial == [mc.calculate_sentiment(t) for t in texts]
+    assert mc.score_sentiments(texts, workers=2, min_pool_texts=1) == serial
+
+    class BrokenPool:
+        def __init__(self, *args, **kwargs):
+            raise OSError("no processes here")
+
+    monkeypatch.setattr(mc, "ProcessPoolExecutor", BrokenPool)
+    assert mc.score_sentiments(texts, workers=2, min_pool_texts=1) == serial
@@ -5,9 +5,14 @@ Tests:
 1. Batch output JSONL parsing (Chat Completions format)
 2. Custom ID parsing (message_id, chunk_index extraction)
 3. Triple key (message_id, soft_chunk_index, local_idea_index) consistency
+4. Sharded, streaming batch build (scripts/nlp/build_batch.py)
 """
 
 import json
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
 import pytest
 
 from src.nlp.schemas import MessageParseResult, ParsedIdea
@@ -254,3 +259,293 @@ class TestBatchCustomIdFormats:
         parsed_id = int(parts[1])
 
         assert parsed_id == large_id
+
+
+def _backlog(n=120):
+    """Pending messages mixing parseable, bot-command and multi-chunk content."""
+    messages = []
+    for i in range(n):
+        if i % 10 == 0:
+            content = "!price AAPL"
+        elif i % 7 == 0:
+            # > soft-split threshold: one chunk per ticker section
+            section = "breaking out above resistance with strong volume, adding to the position here. " * 14
+            content = "\n\n".join(f"${t} {section}" for t in ("AAPL", "MSFT", "NVDA"))
+        else:
+            content = f"$TSLA holding {100 + i} support, watching for a bounce into earnings"
+        messages.append({"message_id": str(1380000000000000000 + i), "content": content, "author": "trader"})
+    return messages
+
+
+class TestShardedBatchBuild:
+    """Streaming builder: shards by count/bytes, one manifest per shard."""
+
+    def test_shards_match_single_file_build(self, tmp_path):
+        """Concatenated shards equal the monolithic file; caps are respected."""
+        from scripts.nlp import build_batch
+
+        messages = _backlog()
+        single = build_batch.build_batch_file(messages, tmp_path / "single.jsonl")
+        stats = build_batch.build_batch_shards(
+            iter(messages), tmp_path / "batch.jsonl", max_requests=25, workers=2
+        )
+
+        shard_lines = []
+        for shard in stats["shards"]:
+            lines = (tmp_path / shard["jsonl_file"]).read_bytes().splitlines(keepends=True)
+            manifest = json.loads((tmp_path / shard["manifest"]).read_text())
+            assert manifest["requests"] == len(lines) <= 25
+            assert manifest["bytes"] == sum(map(len, lines))
+            shard_lines.extend(lines)
+
+        assert b"".join(shard_lines) == (tmp_path / "single.jsonl").read_bytes()
+        assert len(stats["shards"]) > 1
+        assert stats["chunks_generated"] == single["chunks_generated"] == len(shard_lines)
+        assert stats["bot_commands_skipped"] == single["bot_commands_skipped"] == 12
+
+    def test_message_chunks_never_split_across_shards(self, tmp_path):
+        """A shard closes before a message that would overflow it."""
+        from scripts.nlp import build_batch
+
+        messages = _backlog()
+        assert max(len(build_batch._prepare_message(m)[1]) for m in messages) == 3
+        max_bytes = 4 * len(build_batch._request_lines("1", ["x" * 1111])[0])
+
+        stats = build_batch.build_batch_shards(messages, tmp_path / "batch.jsonl", max_bytes=max_bytes)
+
+        seen = {}
+        for shard in stats["shards"]:
+            assert shard["bytes"] <= max_bytes
+            for line in (tmp_path / shard["jsonl_file"]).read_text().splitlines():
+                message_id = json.loads(line)["custom_id"].split("-")[1]
+                assert seen.setdefault(message_id, shard["shard"]) == shard["shard"]
+        assert stats["messages_processed"] == len(seen)
+
+    def test_skipped_messages_marked_in_bulk(self, tmp_path, monkeypatch):
+        """Skipped IDs are flushed with one UPDATE per reason, not one per row."""
+        from scripts.nlp import build_batch
+
+        mock_sql = MagicMock()
+        monkeypatch.setattr(build_batch, "execute_sql", mock_sql)
+        monkeypatch.setattr(build_batch, "SKIP_FLUSH_SIZE", 5)
+
+        stats = build_batch.build_batch_shards(_backlog(), tmp_path / "batch.jsonl", mark_skipped_in_db=True)
+
+        marked = [i for call in mock_sql.call_args_list for i in call.kwargs["params"]["message_ids"]]
+        assert len(marked) == stats["messages_marked_skipped"] == 12
+        assert mock_sql.call_count == 3  # 5 + 5 + final 2
+        assert all(ids == [] for ids in stats["skipped_ids_by_reason"].values())
+
+
+class _FakeBatches:
+    """OpenAI client stand-in: each batch completes after a set number of polls."""
+
+    def __init__(self, polls_until_done):
+        self.polls_until_done = dict(polls_until_done)
+        self.created = []
+        self.retrievals = {}
+
+    def create(self, input_file_id, **kwargs):
+        batch_id = f"batch_{input_file_id}"
+        self.created.append(batch_id)
+        return SimpleNamespace(id=batch_id, status="validating")
+
+    def retrieve(self, batch_id):
+        self.retrievals[batch_id] = self.retrievals.get(batch_id, 0) + 1
+        done = self.retrievals[batch_id] >= self.polls_until_done[batch_id]
+        return SimpleNamespace(
+            id=batch_id,
+            status="completed" if done else "in_progress",
+            input_file_id=batch_id.removeprefix("batch_"),
+            output_file_id=f"out_{batch_id}" if done else None,
+            error_file_id=None,
+            request_counts=SimpleNamespace(total=2, completed=2 if done else 0, failed=0),
+            created_at=0,
+        )
+
+
+class TestShardedBatchRun:
+    """run_batch.py shard mode: concurrent polling, progressive ingest, resume."""
+
+    def _client(self, polls_until_done):
+        client = MagicMock()
+        client.batches = _FakeBatches(polls_until_done)
+        client.files.create.side_effect = lambda file, purpose: SimpleNamespace(id=f"file-{Path(file.name).stem}")
+        client.files.content.side_effect = lambda file_id: SimpleNamespace(read=lambda: file_id.encode())
+        return client
+
+    @pytest.mark.anyio
+    async def test_shards_ingest_as_each_batch_finishes(self, tmp_path, monkeypatch):
+        """The fast shard is ingested while the slow one is still running."""
+        from scripts.nlp import run_batch
+
+        inputs = []
+        for name in ("batch-000", "batch-001"):
+            (tmp_path / f"{name}.jsonl").write_text("{}\n")
+            inputs.append(tmp_path / f"{name}.jsonl")
+        # The slow batch only completes once the fast shard has been ingested
+        client = self._client({"batch_file-batch-000": 1, "batch_file-batch-001": float("inf")})
+        ingested = []
+
+        def fake_ingest(output_path, error_path=None, dry_run=False, verbose=False):
+            ingested.append(output_path.name)
+            client.batches.polls_until_done["batch_file-batch-001"] = 0
+            return {"ideas_extracted": 3}
+
+        monkeypatch.setattr(run_batch, "run_ingest", fake_ingest)
+        state_path = tmp_path / "batch.state.json"
+
+        state = await run_batch.run_shards(client, inputs, tmp_path, state_path, max_concurrent=2, poll_seconds=0)
+
+        assert ingested == ["batch-000.output.jsonl", "batch-001.output.jsonl"]
+        assert all(shard["ingested"] and shard["status"] == "completed" for shard in state["shards"].values())
+        assert json.loads(state_path.read_text())["shards"] == state["shards"]
+        assert (tmp_path / "batch-001.output.jsonl").read_bytes() == b"out_batch_file-batch-001"
+
+    @pytest.mark.anyio
+    async def test_resume_skips_ingested_and_repolls_submitted(self, tmp_path, monkeypatch):
+        """A re-run neither re-uploads nor re-ingests; it resumes existing batches."""
+        from scripts.nlp import run_batch
+
+        inputs = []
+        for name in ("batch-000", "batch-001"):
+            (tmp_path / f"{name}.jsonl").write_text("{}\n")
+            inputs.append(tmp_path / f"{name}.jsonl")
+        state_path = tmp_path / "batch.state.json"
+        run_batch.save_run_state(
+            state_path,
+            {
+                "shards": {
+                    "batch-000.jsonl": {"input": str(inputs[0]), "ingested": True, "status": "completed"},
+                    "batch-001.jsonl": {
+                        "input": str(inputs[1]),
+                        "input_file_id": "file-batch-001",
+                        "batch_id": "batch_file-batch-001",
+                        "status": "submitted",
+                    },
+                }
+            },
+        )
+        client = self._client({"batch_file-batch-001": 2})
+        ingest = MagicMock(return_value={"ideas_extracted": 1})
+        monkeypatch.setattr(run_batch, "run_ingest", ingest)
+
+        state = await run_batch.run_shards(client, inputs, tmp_path, state_path, poll_seconds=0)
+
+        client.files.create.assert_not_called()
+        assert client.batches.created == []
+        assert client.batches.retrievals == {"batch_file-batch-001": 2}
+        assert ingest.call_count == 1
+        assert state["shards"]["batch-001.jsonl"]["ingested"] is True
+
+
+def _output_line(message_id, chunk_index, symbol="AAPL", error=False):
+    """A batch output line for one chunk (SAMPLE_BATCH_OUTPUT with its own ids)."""
+    line = json.loads(json.dumps(SAMPLE_BATCH_OUTPUT))
+    line["custom_id"] = f"msg-{message_id}-chunk-{chunk_index}"
+    if error:
+        line["error"] = {"code": "server_error"}
+        line["response"] = None
+        return json.dumps(line)
+    content = json.loads(line["response"]["body"]["choices"][0]["message"]["content"])
+    content["ideas"][0]["primary_symbol"] = symbol
+    line["response"]["body"]["choices"][0]["message"]["content"] = json.dumps(content)
+    return json.dumps(line)
+
+
+def _write_output(path, n_messages=40):
+    """Output file with multi-chunk messages whose chunks arrive out of order."""
+    lines = []
+    for i in range(n_messages):
+        n_chunks = 3 if i % 4 == 0 else 1
+        lines.extend((i, c) for c in range(n_chunks))
+    # Deterministic shuffle that keeps sibling chunks a few lines apart
+    lines.sort(key=lambda item: (item[0] + 3 * item[1], item[1]))
+    text = [_output_line(1380000000000000000 + i, c, error=(i == 5)) for i, c in lines]
+    text.insert(10, "{not json")
+    path.write_text("\n".join(text) + "\n")
+
+
+class TestStreamingIngest:
+    """ingest_batch.py: lazy read, per-message grouping, windowed bulk writes."""
+
+    def test_chunks_grouped_per_message_with_bounded_buffer(self, tmp_path):
+        from scripts.nlp import ingest_batch
+
+        path = tmp_path / "out.jsonl"
+        _write_output(path)
+        stats = {}
+
+        groups = list(ingest_batch.iter_message_responses(path, stats))
+
+        assert len(groups) == 40
+        for message_id, chunks in groups:
+            expected = 3 if (int(message_id) - 1380000000000000000) % 4 == 0 else 1
+            assert sorted(c for c, _ in chunks) == list(range(expected))
+        assert 0 < stats["max_buffered_messages"] <= 10
+        assert stats["total_responses"] == 60
+
+    def test_streaming_ingest_matches_in_memory(self, tmp_path, monkeypatch):
+        """Windows + process pool write the same ideas/statuses as the one-shot path."""
+        from scripts.nlp import ingest_batch
+
+        path = tmp_path / "out.jsonl"
+        _write_output(path)
+        writes = []
+        monkeypatch.setattr(ingest_batch, "get_message_metadata", lambda ids: {})
+        monkeypatch.setattr(
+            ingest_batch,
+            "delete_and_insert_ideas_atomic",
+            lambda mids, ideas, statuses=None: writes.append((mids, ideas, statuses)) or (len(mids), len(ideas)),
+        )
+
+        streamed = ingest_batch.ingest_batch_file(path, window=7, workers=2)
+        streamed_writes, writes[:] = list(writes), []
+        loaded = ingest_batch.process_batch_output(ingest_batch.load_batch_output(path))
+
+        assert len(streamed_writes) == streamed["windows"] == 6  # ceil(40 / 7)
+        assert len(writes) == 1
+        merged = {mid: status for _, _, statuses in streamed_writes for mid, status in statuses.items()}
+        assert merged == writes[0][2]
+        assert merged["1380000000000000005"] == ("error", "All chunks failed to parse")
+        key = lambda idea: (idea["message_id"], idea["idea_index"])  # noqa: E731
+        streamed_ideas = sorted((i for _, ideas, _ in streamed_writes for i in ideas), key=key)
+        assert streamed_ideas == sorted(writes[0][1], key=key)
+        for field in ("successful", "failed", "ideas_extracted", "messages_updated"):
+            assert streamed[field] == loaded[field], field
+
+    def test_failed_window_retried_per_message(self, tmp_path, monkeypatch):
+        """One bad message costs only that message, which is marked error."""
+        from scripts.nlp import ingest_batch
+
+        path = tmp_path / "out.jsonl"
+        path.write_text("\n".join(_output_line(m, 0) for m in ("1", "2", "3")) + "\n")
+        monkeypatch.setattr(ingest_batch, "get_message_metadata", lambda ids: {})
+        calls = []
+
+        def flaky_write(mids, ideas, statuses=None):
+            calls.append(list(statuses))
+            if len(statuses) > 1 or "2" in statuses:
+                raise RuntimeError("check constraint")
+            return len(mids), len(ideas)
+
+        marked = MagicMock(return_value=1)
+        monkeypatch.setattr(ingest_batch, "delete_and_insert_ideas_atomic", flaky_write)
+        monkeypatch.setattr(ingest_batch, "update_message_statuses", marked)
+
+        stats = ingest_batch.ingest_batch_file(path)
+
+        assert calls == [["1", "2", "3"], ["1"], ["2"], ["3"]]
+        assert stats["ideas_inserted"] == 2
+        (statuses,), _ = marked.call_args
+        assert list(statuses) == ["2"] and statuses["2"][0] == "error"
+
+    def test_copy_text_escaping(self):
+        from scripts.nlp.ingest_batch import _copy_text
+
+        assert _copy_text(None) == "\\N"
+        assert _copy_text(True) == "t"
+        assert _copy_text("tab\there\nline \\ end") == "tab\\there\\nline \\\\ end"
+        # Array literal, then COPY escaping on top (backslashes doubled twice)
+        assert _copy_text(["AAPL", 'say "hi", ok', "a\\b"]) == '{"AAPL","say \\\\"hi\\\\", ok","a\\\\\\\\b"}'
+        assert _copy_text([]) == "{}"
@@ -0,0 +1,112 @@
+"""Tests for the in-process OHLCV bar cache in src/price_service.py."""
+
+from datetime import date, timedelta
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from src.price_service import OHLCV_REVISION_LOOKBACK_DAYS, OHLCVBarCache
+
+TODAY = date.today()
+
+
+def _frame(symbol: str, days: list[date], close: float = 100.0) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "Symbol": symbol,
+            "Date": pd.to_datetime(days),
+            "Open": close,
+            "High": close + 1,
+            "Low": close - 1,
+            "Close": [close + i for i in range(len(days))],
+            "Volume": 1000,
+        }
+    )
+
+
+@pytest.fixture
+def days():
+    return [TODAY - timedelta(days=n) for n in range(10, 0, -1)]
+
+
+def test_repeat_reads_hit_memory(days):
+    cache = OHLCVBarCache(max_bytes=1 << 20, refresh_seconds=3600)
+    with patch("src.price_service._query_ohlcv_frame", return_value=_frame("AAPL", days)) as q:
+        first = cache.get("AAPL", days[0], days[-1])
+        second = cache.get("AAPL", days[2], days[5])
+
+    assert q.call_count == 1
+    assert len(first) == 10
+    assert list(second.index.date) == days[2:6]
+    assert list(second.columns) == ["Open", "High", "Low", "Close", "Volume"]
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_earlier_start_reloads(days):
+    cache = OHLCVBarCache(max_bytes=1 << 20, refresh_seconds=3600)
+    with patch("src.price_service._query_ohlcv_frame", return_value=_frame("AAPL", days)) as q:
+        cache.get("AAPL", days[5], days[-1])
+        cache.get("AAPL", days[0], days[-1])
+
+    assert q.call_count == 2
+    assert q.call_args.args[1] == days[0]
+
+
+def test_tail_refresh_refetches_the_revision_lookback(days):
+    cache = OHLCVBarCache(max_bytes=1 << 20, refresh_seconds=0)
+    with patch("src.price_service._query_ohlcv_frame") as q:
+        q.return_value = _frame("AAPL", days[:-1])
+        cache.get("AAPL", days[0], days[-2])
+        # Nightly run rewrote its lookback window and added a new bar
+        since = days[-2] - timedelta(days=OHLCV_REVISION_LOOKBACK_DAYS)
+        q.return_value = _frame("AAPL", [d for d in days if d >= since], close=500.0)
+        df = cache.get("AAPL", days[0], TODAY)
+
+    assert q.call_args.args[1] == since
+    assert len(df) == 10
+    assert df["Close"].iloc[:3].tolist() == [100.0, 101.0, 102.0]
+    assert df["Close"].iloc[3:].tolist() == [500.0 + i for i in range(7)]
+    assert cache.stats()["tail_refreshes"] == 1
+
+
+def test_tail_refresh_is_throttled(days):
+    cache = OHLCVBarCache(max_bytes=1 << 20, refresh_seconds=3600)
+    with patch("src.price_service._query_ohlcv_frame", return_value=_frame("AAPL", days[:-1])) as q:
+        cache.get("AAPL", days[0], days[-2])
+        cache.get("AAPL", days[0], TODAY)
+
+    assert q.call_count == 1
+
+
+def test_lru_eviction_caps_memory(days):
+    cache = OHLCVBarCache(max_bytes=1, refresh_seconds=3600)
+    with patch(
+        "src.price_service._query_ohlcv_frame",
+        side_effect=lambda syms, start, end: _frame(syms[0], days),
+    ):
+        cache.get("AAPL", days[0], days[-1])
+        cache.get("MSFT", days[0], days[-1])
+
+    stats = cache.stats()
+    assert stats["symbols"] == 1
+    assert stats["evictions"] == 1
+
+
+def test_symbol_without_bars_returns_empty():
+    cache = OHLCVBarCache(max_bytes=1 << 20, refresh_seconds=3600)
+    empty = pd.DataFrame(columns=["Symbol", "Date", "Open", "High", "Low", "Close", "Volume"])
+    with patch("src.price_service._query_ohlcv_frame", return_value=empty):
+        assert cache.get("ZZZZ", TODAY - timedelta(days=30), TODAY).empty
+
+
+def test_invalidate_forces_reload(days):
+    cache = OHLCVBarCache(max_bytes=1 << 20, refresh_seconds=3600)
+    with patch("src.price_service._query_ohlcv_frame", return_value=_frame("AAPL", days)) as q:
+        cache.get("AAPL", days[0], days[-1])
+        cache.invalidate("aapl")
+        cache.get("AAPL", days[0], days[-1])
+
+    assert q.call_count == 2
+    assert cache.stats()["bytes"] > 0
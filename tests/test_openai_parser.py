@@ -242,3 +242,70 @@ class TestProcessMessageErrorStatus:
 
         assert result["status"] != "ok"
         assert result["status"] == "error"
+
+
+class TestParserArtifact:
+    """Prebuilt parser prompt/schema and batch request lines."""
+
+    def test_artifact_built_once_per_prompt_version(self):
+        from src.nlp import openai_parser as op
+
+        artifact = op.get_parser_artifact()
+
+        assert op.get_parser_artifact() is artifact
+        assert artifact.prompt_version == op.CURRENT_PROMPT_VERSION
+        assert op._build_parser_system_prompt() is artifact.system_prompt
+        assert artifact.system_prompt == op._render_parser_system_prompt()
+        assert artifact.strict_schema == op._make_schema_strict(op.MessageParseResult.model_json_schema())
+        assert op._parser_artifact("v-next") is not artifact
+
+    def test_request_line_matches_request_dict(self):
+        import json
+
+        from src.nlp.openai_parser import build_batch_request, build_batch_request_line
+
+        for text in ["$AAPL long 190c", 'quote " backslash \\ tab\t\nnewline', "émoji 🚀 ünïcode"]:
+            line = build_batch_request_line("1380000000000000001", text, chunk_index=2)
+            expected = json.dumps(build_batch_request("1380000000000000001", text, chunk_index=2)) + "\n"
+            assert line == expected.encode("utf-8")
+            assert json.loads(line)["body"]["messages"][1]["content"].endswith(text)
+
+    def test_request_line_follows_model_switch(self):
+        import json
+
+        from src.nlp import openai_parser as op
+
+        with patch.object(op, "MODEL_MAIN", "gpt-test"):
+            line = op.build_batch_request_line(1, "text")
+        assert json.loads(line)["body"]["model"] == "gpt-test"
+
+    def test_batch_request_build_overhead(self):
+        """Micro-benchmark: per-line cost vs re-deriving prompt + schema each time."""
+        import json
+        import time
+
+        from src.nlp import openai_parser as op
+
+        def uncached(i):
+            request = op.build_batch_request(i, "$NVDA breaking out over 950, adding calls")
+            request["body"]["messages"][0]["content"] = op._render_parser_system_prompt()
+            schema = op._make_schema_strict(op.MessageParseResult.model_json_schema())
+            request["body"]["response_format"]["json_schema"]["schema"] = schema
+            return (json.dumps(request) + "\n").encode("utf-8")
+
+        def cached(i):
+            return op.build_batch_request_line(i, "$NVDA breaking out over 950, adding calls")
+
+        def per_request(build, n=200):
+            build(0)  # warm-up
+            timings = []
+            for _ in range(3):
+                started = time.perf_counter()
+                for i in range(n):
+                    build(i)
+                timings.append((time.perf_counter() - started) / n)
+            return min(timings)
+
+        assert cached(7) == uncached(7)
+        before, after = per_request(uncached), per_request(cached)
+        assert after * 10 < before, f"cached {after * 1e6:.1f} us vs uncached {before * 1e6:.1f} us per request"
@@ -0,0 +1,170 @@
+"""Tests for the content-hash keyed LLM parse cache (src/nlp/parse_cache.py)."""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.nlp.parse_cache import ParseCache, set_parse_cache
+from src.nlp.schemas import CURRENT_PROMPT_VERSION
+
+
+@pytest.fixture
+def cache():
+    cache = ParseCache(memory_entries=10, persist=False)
+    set_parse_cache(cache)
+    return cache
+
+
+def test_key_is_exact_text(cache):
+    cache.put("parse", "Buy  $AAPL\nnow", "v1", "m", {"x": 1})
+
+    assert cache.get("parse", "Buy  $AAPL\nnow", "v1", "m").payload == {"x": 1}
+    # Prompt version and model are part of the key
+    assert cache.get("parse", "Buy  $AAPL\nnow", "v2", "m") is None
+    assert cache.get("parse", "Buy  $AAPL\nnow", "v1", "other") is None
+    assert cache.stats()["hit_rate"] == pytest.approx(1 / 3, abs=1e-3)
+
+
+def test_case_and_spacing_are_not_folded(cache):
+    cache.put("parse", "Sold NOW at 700", "v1", "m", {"ticker": "NOW"})
+
+    assert ParseCache.make_key("parse", "Sold NOW at 700", "v1", "m") != ParseCache.make_key(
+        "parse", "sold now   at 700", "v1", "m"
+    )
+    assert cache.get("parse", "sold now at 700", "v1", "m") is None
+    assert cache.get("parse", "Sold NOW  at 700", "v1", "m") is None
+
+
+def test_memory_tier_evicts_least_recently_used():
+    cache = ParseCache(memory_entries=2, persist=False)
+    cache.put("triage", "a", "v", "m", {"n": "a"})
+    cache.put("triage", "b", "v", "m", {"n": "b"})
+    cache.get("triage", "a", "v", "m")  # a is now most recent
+    cache.put("triage", "c", "v", "m", {"n": "c"})
+
+    assert cache.get("triage", "b", "v", "m") is None
+    assert cache.get("triage", "a", "v", "m") is not None
+
+
+def test_db_failure_degrades_to_memory_only():
+    cache = ParseCache(memory_entries=5, persist=True)
+    with patch("src.db.execute_sql", side_effect=Exception("no database")) as mock_sql:
+        cache.put("parse", "text", "v", "m", {"ok": True})
+        assert cache.get("parse", "text", "v", "m").payload == {"ok": True}
+        assert cache.get("parse", "other", "v", "m") is None
+
+    assert cache.persist is False
+    mock_sql.assert_called_once()  # no further DB attempts after the first failure
+
+
+def test_db_hit_is_promoted_to_memory():
+    cache = ParseCache(memory_entries=5, persist=True)
+    with patch("src.db.execute_sql", return_value=[({"ideas": []}, "gpt-5.1")]) as mock_sql:
+        first = cache.get("parse", "text", "v", "m")
+        second = cache.get("parse", "text", "v", "m")
+
+    assert first.model_used == "gpt-5.1"
+    assert second.payload == {"ideas": []}
+    mock_sql.assert_called_once()
+
+
+def test_process_message_reuses_cached_results(cache, mock_triage_result, mock_message_parse_result):
+    from src.nlp import openai_parser
+
+    triage = mock_triage_result(tickers_present=["AAPL"])
+    text = "$AAPL breakout over 200, adding calls here"
+
+    with patch.object(openai_parser, "triage_message", return_value=triage) as mock_triage, patch.object(
+        openai_parser, "parse_message", return_value=(mock_message_parse_result(), "gpt-5.1")
+    ) as mock_parse:
+        first = openai_parser.process_message(text, message_id="1")
+        first_stats = openai_parser.get_call_stats()
+        # Reposted alert: same text, different message
+        second = openai_parser.process_message(text, message_id="2")
+        second_stats = openai_parser.get_call_stats()
+
+    assert mock_triage.call_count == 1
+    assert mock_parse.call_count == 1
+    assert first_stats.cache_hits == 0 and first_stats.cache_misses == 2
+    assert second_stats.cache_hits == 2 and second_stats.cache_hit_rate == 1.0
+    assert second["status"] == "ok"
+    assert second["model"] == "gpt-5.1"  # provenance of the escalated result survives
+    assert second["ideas"][0]["message_id"] == "2"
+    assert [i["idea_text"] for i in second["ideas"]] == [i["idea_text"] for i in first["ideas"]]
+
+
+def test_parse_failures_are_not_cached(cache):
+    from src.nlp import openai_parser
+
+    with patch.object(
+        openai_parser, "parse_message", side_effect=openai_parser.ParseFailure("boom")
+    ) as mock_parse:
+        for _ in range(2):
+            result = openai_parser.process_message("$AAPL long here", message_id="1", skip_triage=True)
+            assert result["status"] == "error"
+
+    assert mock_parse.call_count == 2
+    assert cache.stats()["writes"] == 0
+
+
+def test_ingest_batch_writes_through_and_recovers_failed_chunks(cache, mock_message_parse_result):
+    import scripts.nlp.ingest_batch as ib
+    from src.nlp.openai_parser import MODEL_MAIN, batch_user_content
+    from src.nlp.soft_splitter import prepare_for_parsing
+
+    content = "$AAPL breakout over 200, adding calls here"
+    chunk_text = prepare_for_parsing(content)[0].text
+    metadata = {"10": {"content": content}, "11": {"content": content}}
+    message_chunks = {"10": [(0, mock_message_parse_result())], "11": [(0, None)]}
+
+    counts = ib.sync_parse_cache(message_chunks, metadata)
+
+    assert counts == {"cached": 1, "recovered": 1}
+    sent = batch_user_content(chunk_text)
+    assert cache.get("batch_parse", sent, CURRENT_PROMPT_VERSION, MODEL_MAIN) is not None
+    # Batch results never answer interactive parses
+    assert cache.get("parse", sent, CURRENT_PROMPT_VERSION, MODEL_MAIN) is None
+    recovered = message_chunks["11"][0][1]
+    assert recovered.ideas[0].primary_symbol == "AAPL"
+
+
+def test_cache_key_follows_long_context_routing(cache, mock_message_parse_result):
+    from src.nlp import openai_parser
+
+    long_text = "$AAPL adding calls here. " * 100  # past LONG_CONTEXT_THRESHOLD
+
+    assert openai_parser.parse_model_for("$AAPL long here") == openai_parser.MODEL_MAIN
+    assert openai_parser.parse_model_for(long_text) == openai_parser.MODEL_LONG_CONTEXT
+    assert openai_parser.parse_model_for("$AAPL", long_context=True) == openai_parser.MODEL_LONG_CONTEXT
+
+    with patch.object(
+        openai_parser, "parse_message", return_value=(mock_message_parse_result(), "gpt-5.1")
+    ):
+        openai_parser.cached_parse_message(long_text)
+
+    _, _, sent = openai_parser._prepare_parse_input(long_text)
+    assert cache.get("parse", sent, CURRENT_PROMPT_VERSION, openai_parser.MODEL_LONG_CONTEXT) is not None
+
+
+def test_parse_key_is_the_content_sent_and_follows_the_alias_map(cache, mock_message_parse_result):
+    from src.nlp import openai_parser
+
+    text = "adding zorblax calls here"
+    with patch(
+        "src.nlp.preclean.apply_alias_mapping", side_effect=lambda t: t.replace("zorblax", "$ZRBX")
+    ), patch.object(
+        openai_parser, "parse_message", return_value=(mock_message_parse_result(), "gpt-5.1")
+    ):
+        openai_parser.cached_parse_message(text)
+        _, _, sent = openai_parser._prepare_parse_input(text)
+
+    assert sent.startswith("Parse this trading message:\n\nadding $ZRBX calls here")
+    assert cache.get("parse", sent, CURRENT_PROMPT_VERSION, openai_parser.MODEL_MAIN) is not None
+    assert cache.get("parse", text, CURRENT_PROMPT_VERSION, openai_parser.MODEL_MAIN) is None
+
+    # Alias map changed (entry removed): different content sent, so no stale replay
+    with patch.object(
+        openai_parser, "parse_message", return_value=(mock_message_parse_result(), "gpt-5.1")
+    ) as mock_parse:
+        openai_parser.cached_parse_message(text)
+    mock_parse.assert_called_once()
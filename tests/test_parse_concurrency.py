@@ -0,0 +1,259 @@
+"""Tests for the concurrent parse pipeline: rate limiter, 429 backoff, batched writes."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import httpx
+import openai
+import pytest
+
+from src.nlp.rate_limiter import (
+    TokenBucketLimiter,
+    call_with_backoff,
+    is_rate_limit_error,
+    is_retryable_error,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class RateLimited(openai.RateLimitError):
+    def __init__(self, retry_after=None, code=None):
+        response = httpx.Response(
+            429,
+            headers={"retry-after": retry_after} if retry_after else {},
+            request=httpx.Request("POST", "https://api.openai.com/v1/responses"),
+        )
+        super().__init__("429 Too Many Requests", response=response, body={"code": code} if code else None)
+
+
+# =============================================================================
+# TOKEN BUCKET
+# =============================================================================
+
+
+def test_limiter_spaces_requests_by_rpm():
+    clock = FakeClock()
+    limiter = TokenBucketLimiter(rpm=60, clock=clock, sleep=clock.sleep)
+
+    for _ in range(60):  # full bucket: no waiting
+        assert limiter.acquire() == 0
+    assert limiter.acquire() == pytest.approx(1.0)  # then one per second
+    assert limiter.acquire() == pytest.approx(1.0)
+
+
+def test_limiter_blocks_on_token_budget_and_settles():
+    clock = FakeClock()
+    limiter = TokenBucketLimiter(tpm=6000, clock=clock, sleep=clock.sleep)
+
+    limiter.acquire(6000)
+    # Real usage was far lower than estimated -> budget is refunded
+    limiter.settle(estimated=6000, actual=1000)
+    assert limiter.acquire(5000) == 0
+    # Empty bucket refills at 100 tokens/s
+    assert limiter.acquire(500) == pytest.approx(5.0)
+
+
+def test_limiter_allows_oversize_request_once_full():
+    clock = FakeClock()
+    limiter = TokenBucketLimiter(tpm=1000, clock=clock, sleep=clock.sleep)
+    assert limiter.acquire(5000) == 0
+
+
+# =============================================================================
+# 429 BACKOFF
+# =============================================================================
+
+
+def test_backoff_retries_rate_limits_using_retry_after():
+    calls = []
+    sleeps = []
+
+    def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise RateLimited(retry_after="2")
+        return "ok"
+
+    assert call_with_backoff(flaky, max_retries=5, sleep=sleeps.append) == "ok"
+    assert sleeps == [2.0, 2.0]
+
+
+def test_backoff_gives_up_and_ignores_other_errors():
+    sleeps = []
+    with pytest.raises(RateLimited):
+        call_with_backoff(lambda: (_ for _ in ()).throw(RateLimited()), max_retries=2, sleep=sleeps.append)
+    assert len(sleeps) == 2
+
+    with pytest.raises(KeyError):
+        call_with_backoff(lambda: {}["x"], sleep=sleeps.append)
+    assert len(sleeps) == 2
+    assert not is_rate_limit_error(ValueError("bad schema"))
+
+
+def test_only_retryable_rate_limit_errors_are_retried():
+    assert is_rate_limit_error(RateLimited())
+    # Out of credits: waiting won't help
+    assert not is_rate_limit_error(RateLimited(code="insufficient_quota"))
+    # Error text alone is not a rate limit
+    assert not is_rate_limit_error(ValueError("order 429 hit the rate limit"))
+
+    sleeps = []
+    with pytest.raises(RateLimited):
+        call_with_backoff(
+            lambda: (_ for _ in ()).throw(RateLimited(code="insufficient_quota")), sleep=sleeps.append
+        )
+    assert sleeps == []
+
+
+def test_transient_errors_are_retried_like_rate_limits():
+    request = httpx.Request("POST", "https://api.openai.com/v1/responses")
+    server_error = openai.InternalServerError(
+        "502 Bad Gateway", response=httpx.Response(502, request=request), body=None
+    )
+    transient = [
+        openai.APIConnectionError(request=request),
+        openai.APITimeoutError(request=request),
+        server_error,
+    ]
+    for exc in transient:
+        assert is_retryable_error(exc)
+        assert not is_rate_limit_error(exc)
+    assert not is_retryable_error(RateLimited(code="insufficient_quota"))
+    bad_request = openai.BadRequestError(
+        "400", response=httpx.Response(400, request=request), body=None
+    )
+    assert not is_retryable_error(bad_request)
+
+    errors = list(transient)
+    sleeps = []
+
+    def flaky():
+        if errors:
+            raise errors.pop(0)
+        return "ok"
+
+    assert call_with_backoff(flaky, max_retries=3, sleep=sleeps.append) == "ok"
+    assert len(sleeps) == 3
+
+
+def test_call_stats_are_per_thread():
+    from src.nlp.openai_parser import _track_parse_call, get_call_stats, reset_call_stats
+
+    seen = {}
+
+    def worker(name, calls):
+        reset_call_stats()
+        for _ in range(calls):
+            _track_parse_call()
+        seen[name] = get_call_stats().main_calls
+
+    threads = [threading.Thread(target=worker, args=(f"t{i}", i)) for i in range(1, 5)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert seen == {"t1": 1, "t2": 2, "t3": 3, "t4": 4}
+
+
+# =============================================================================
+# WORKER POOL + BATCHED WRITES
+# =============================================================================
+
+
+def _messages(n):
+    return [{"message_id": str(1000 + i), "content": f"$AAPL idea number {i} looks good"} for i in range(n)]
+
+
+def _parsed(text, message_id, **kwargs):
+    return {
+        "status": "ok",
+        "ideas": [{"message_id": message_id, "idea_index": 0, "idea_text": text, "model": "m", "prompt_version": "v"}],
+        "model": "m",
+    }
+
+
+def test_pool_parses_in_parallel_and_batches_writes():
+    import scripts.nlp.parse_messages as pm
+
+    with patch.object(pm, "process_message", side_effect=_parsed), patch.object(
+        pm, "save_parsed_ideas_batch", return_value={"inserted": 2, "failed": {}}
+    ) as batch, patch.object(pm, "save_parsed_ideas_with_cleanup") as single:
+        results = pm.parse_messages_concurrently(_messages(5), workers=3, write_batch_size=2)
+
+    assert sorted(r["message_id"] for r in results) == [str(1000 + i) for i in range(5)]
+    assert all(r["status"] == "ok" and "pending_write" not in r for r in results)
+    # 5 messages, batches of 2 -> 2 full flushes + 1 remainder
+    assert [len(c.args[0]) for c in batch.call_args_list] == [2, 2, 1]
+    single.assert_not_called()
+
+
+def test_pool_marks_failed_writes_as_errors():
+    import scripts.nlp.parse_messages as pm
+
+    with patch.object(pm, "process_message", side_effect=_parsed), patch.object(
+        pm, "save_parsed_ideas_batch", return_value={"inserted": 1, "failed": {"1001": "boom"}}
+    ), patch.object(pm, "update_message_status") as status:
+        results = pm.parse_messages_concurrently(_messages(2), workers=2, write_batch_size=10)
+
+    by_id = {r["message_id"]: r for r in results}
+    assert by_id["1000"]["status"] == "ok"
+    assert by_id["1001"]["status"] == "error"
+    status.assert_called_once_with("1001", "error", "save failed: boom")
+
+
+def test_batch_write_falls_back_to_per_message_saves():
+    import scripts.nlp.parse_messages as pm
+
+    writes = [
+        {"kind": "ideas", "message_id": "1", "ideas": [], "status": "noise"},
+        {"kind": "status", "message_id": "2", "status": "error", "error_reason": "x"},
+    ]
+    with patch.object(pm, "save_parsed_ideas_batch", side_effect=Exception("conn lost")), patch.object(
+        pm, "save_parsed_ideas_with_cleanup", return_value=0
+    ) as single, patch.object(pm, "update_message_status") as status:
+        pm._flush_pending_writes(writes, {})
+
+    single.assert_called_once_with(message_id="1", ideas=[], status="noise", error_reason=None)
+    status.assert_called_once_with("2", "error", "x")
+
+
+def test_batch_write_uses_savepoint_per_message_in_lock_order():
+    import scripts.nlp.parse_messages as pm
+
+    conn = MagicMock()
+    tx = MagicMock()
+    tx.__enter__.return_value = conn
+    order = []
+
+    def fake_write(c, message_id, *args):
+        order.append(message_id)
+        if message_id == "20":
+            raise RuntimeError("insert failed")
+        return 1
+
+    writes = [
+        {"kind": "ideas", "message_id": "30", "ideas": [{}], "status": "ok"},
+        {"kind": "ideas", "message_id": "20", "ideas": [{}], "status": "ok"},
+        {"kind": "ideas", "message_id": "10", "ideas": [{}], "status": "ok"},
+    ]
+    with patch.object(pm, "transaction", return_value=tx), patch.object(
+        pm, "_write_message_ideas", side_effect=fake_write
+    ):
+        outcome = pm.save_parsed_ideas_batch(writes)
+
+    assert order == ["10", "20", "30"]
+    assert conn.begin_nested.call_count == 3
+    assert outcome == {"inserted": 2, "failed": {"20": "insert failed"}}
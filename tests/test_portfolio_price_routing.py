@@ -31,7 +31,7 @@ class TestDayChangeGuardrails:
     @patch("app.routes.portfolio.get_realtime_quotes_batch")
     @patch("app.routes.portfolio.get_previous_closes_batch")
     @patch("app.routes.portfolio.get_latest_closes_batch")
-    @patch("app.routes.portfolio.execute_sql")
+    @patch("app.routes.portfolio.async_execute_sql")
     def test_crypto_uses_provider_24h_change(
         self, mock_sql, mock_latest, mock_prev, mock_yf, client
     ):
@@ -62,7 +62,7 @@ class TestDayChangeGuardrails:
     @patch("app.routes.portfolio.get_realtime_quotes_batch")
     @patch("app.routes.portfolio.get_previous_closes_batch")
     @patch("app.routes.portfolio.get_latest_closes_batch")
-    @patch("app.routes.portfolio.execute_sql")
+    @patch("app.routes.portfolio.async_execute_sql")
     def test_equity_absurd_pct_nulled(
         self, mock_sql, mock_latest, mock_prev, mock_yf, client
     ):
@@ -91,7 +91,7 @@ class TestDayChangeGuardrails:
     @patch("app.routes.portfolio.get_realtime_quotes_batch")
     @patch("app.routes.portfolio.get_previous_closes_batch")
     @patch("app.routes.portfolio.get_latest_closes_batch")
-    @patch("app.routes.portfolio.execute_sql")
+    @patch("app.routes.portfolio.async_execute_sql")
     def test_equity_missing_prev_close_nulled(
         self, mock_sql, mock_latest, mock_prev, mock_yf, client
     ):
@@ -123,7 +123,7 @@ class TestCryptoPriceRouting:
     @patch("app.routes.portfolio.get_realtime_quotes_batch")
     @patch("app.routes.portfolio.get_previous_closes_batch")
     @patch("app.routes.portfolio.get_latest_closes_batch")
-    @patch("app.routes.portfolio.execute_sql")
+    @patch("app.routes.portfolio.async_execute_sql")
     def test_crypto_excluded_from_databento(
         self, mock_sql, mock_latest, mock_prev, mock_yf, client
     ):
@@ -175,7 +175,7 @@ class TestCryptoPriceRouting:
     @patch("app.routes.portfolio.get_realtime_quotes_batch")
     @patch("app.routes.portfolio.get_previous_closes_batch")
     @patch("app.routes.portfolio.get_latest_closes_batch")
-    @patch("app.routes.portfolio.execute_sql")
+    @patch("app.routes.portfolio.async_execute_sql")
     def test_crypto_gets_yfinance_price(
         self, mock_sql, mock_latest, mock_prev, mock_yf, client
     ):
@@ -216,7 +216,7 @@ class TestMoversEndpoint:
     @patch("app.routes.portfolio.get_realtime_quotes_batch")
     @patch("app.routes.portfolio.get_previous_closes_batch")
     @patch("app.routes.portfolio.get_latest_closes_batch")
-    @patch("app.routes.portfolio.execute_sql")
+    @patch("app.routes.portfolio.async_execute_sql")
     def test_movers_crypto_not_sent_to_databento(
         self, mock_sql, mock_latest, mock_prev, mock_yf, client
     ):
@@ -241,7 +241,7 @@ class TestMoversEndpoint:
     @patch("app.routes.portfolio.get_realtime_quotes_batch")
     @patch("app.routes.portfolio.get_previous_closes_batch")
     @patch("app.routes.portfolio.get_latest_closes_batch")
-    @patch("app.routes.portfolio.execute_sql")
+    @patch("app.routes.portfolio.async_execute_sql")
     def test_movers_absurd_equity_pct_excluded(
         self, mock_sql, mock_latest, mock_prev, mock_yf, client
     ):
@@ -270,7 +270,7 @@ class TestTvSymbol:
     @patch("app.routes.portfolio.get_realtime_quotes_batch")
     @patch("app.routes.portfolio.get_previous_closes_batch")
     @patch("app.routes.portfolio.get_latest_closes_batch")
-    @patch("app.routes.portfolio.execute_sql")
+    @patch("app.routes.portfolio.async_execute_sql")
     def test_crypto_has_canonical_tv_symbol(
         self, mock_sql, mock_latest, mock_prev, mock_yf, client
     ):
@@ -299,7 +299,7 @@ class TestTvSymbol:
     @patch("app.routes.portfolio.get_realtime_quotes_batch")
     @patch("app.routes.portfolio.get_previous_closes_batch")
     @patch("app.routes.portfolio.get_latest_closes_batch")
-    @patch("app.routes.portfolio.execute_sql")
+    @patch("app.routes.portfolio.async_execute_sql")
     def test_equity_with_exchange_has_tv_symbol(
         self, mock_sql, mock_latest, mock_prev, mock_yf, client
     ):
@@ -326,7 +326,7 @@ class TestTvSymbol:
     @patch("app.routes.portfolio.get_realtime_quotes_batch")
     @patch("app.routes.portfolio.get_previous_closes_batch")
     @patch("app.routes.portfolio.get_latest_closes_batch")
-    @patch("app.routes.portfolio.execute_sql")
+    @patch("app.routes.portfolio.async_execute_sql")
     def test_equity_without_exchange_gets_bare_symbol(
         self, mock_sql, mock_latest, mock_prev, mock_yf, client
     ):
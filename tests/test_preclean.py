@@ -134,6 +134,64 @@ class TestAliasMapping:
         tickers = extract_tickers_from_text(result)
         assert len(tickers) == 3
 
+    def test_longest_alias_wins(self):
+        """Multi-word aliases beat their prefixes in the single-pass matcher."""
+        assert apply_alias_mapping("taiwan semiconductor earnings") == "$TSM earnings"
+        assert apply_alias_mapping("taiwan semi ripping") == "$TSM ripping"
+        assert apply_alias_mapping("s&p 500 at highs") == "$SPY at highs"
+
+    def test_dollar_prefixed_alias_is_left_alone(self):
+        assert apply_alias_mapping("$nvidia and nvidia") == "$nvidia and $NVDA"
+
+
+class TestAliasRegistry:
+    """Live alias additions (register_alias / load_symbol_aliases)."""
+
+    @pytest.fixture(autouse=True)
+    def _restore_aliases(self):
+        import src.nlp.preclean as preclean
+
+        saved = dict(preclean.ALIAS_MAP)
+        watermark = preclean._alias_db_watermark
+        yield
+        preclean.ALIAS_MAP.clear()
+        preclean.ALIAS_MAP.update(saved)
+        preclean._alias_matcher._patterns = {}
+        preclean._alias_db_watermark = watermark
+
+    def test_register_alias_rebuilds_once(self):
+        import src.nlp.preclean as preclean
+
+        assert apply_alias_mapping("rocket lab launch") == "rocket lab launch"
+        assert preclean.register_alias("Rocket  Lab", "rklb")
+        assert not preclean.register_alias("rocket lab", "RKLB")  # no-op
+
+        compiled = preclean._alias_matcher.pattern()
+        assert apply_alias_mapping("rocket lab launch") == "$RKLB launch"
+        assert preclean._alias_matcher.pattern() is compiled  # not recompiled per call
+
+    def test_load_symbol_aliases_is_incremental(self):
+        from datetime import datetime, timezone
+        from unittest.mock import patch
+
+        import src.nlp.preclean as preclean
+
+        t1 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        rows = [
+            ("Palantir Technologies", "PLTR", t1),
+            ("$PLTR", "PLTR", t1),  # ticker variant, not a name
+            ("target", "TGT", t1),  # reserved signal word
+        ]
+        with patch("src.db.execute_sql", return_value=rows) as mock_sql:
+            assert preclean.load_symbol_aliases() == 1
+        assert mock_sql.call_args.kwargs["params"] == {"since": None}
+        assert apply_alias_mapping("palantir technologies contract") == "$PLTR contract"
+        assert apply_alias_mapping("price target 150") == "price target 150"
+
+        with patch("src.db.execute_sql", return_value=[]) as mock_sql:
+            assert preclean.load_symbol_aliases() == 0
+        assert mock_sql.call_args.kwargs["params"] == {"since": t1}
+
 
 # =============================================================================
 # TICKER EXTRACTION TESTS
@@ -0,0 +1,65 @@
+"""Tests for the single-query multi-symbol OHLCV helpers in src/price_service.py."""
+
+from datetime import date
+from decimal import Decimal
+from unittest.mock import patch
+
+import numpy as np
+
+from src.price_service import get_ohlcv_batch, get_price_panel
+
+START = date(2024, 1, 1)
+END = date(2024, 1, 31)
+
+# (symbol, date, open, high, low, close, volume) as returned by ohlcv_daily
+ROWS = [
+    ("AAPL", date(2024, 1, 2), Decimal("185"), Decimal("187"), Decimal("184"), Decimal("186"), 1000),
+    ("AAPL", date(2024, 1, 3), Decimal("186"), Decimal("188"), Decimal("185"), Decimal("187"), 1100),
+    ("MSFT", date(2024, 1, 3), Decimal("370"), Decimal("372"), Decimal("368"), Decimal("371"), None),
+]
+
+
+@patch("src.price_service.execute_sql", return_value=ROWS)
+def test_get_ohlcv_batch_issues_one_query(mock_sql):
+    frames = get_ohlcv_batch(["aapl", "MSFT", "NVDA"], START, END)
+
+    mock_sql.assert_called_once()
+    assert "ANY(:symbols)" in mock_sql.call_args.args[0]
+    assert mock_sql.call_args.kwargs["params"]["symbols"] == ["AAPL", "MSFT", "NVDA"]
+
+    # Same shape as get_ohlcv(); symbols without bars are omitted
+    assert set(frames) == {"AAPL", "MSFT"}
+    assert list(frames["AAPL"].columns) == ["Open", "High", "Low", "Close", "Volume"]
+    assert frames["AAPL"].index.name == "Date"
+    assert frames["AAPL"]["Close"].tolist() == [186.0, 187.0]
+    assert frames["MSFT"]["Volume"].iloc[0] == 0
+
+
+@patch("src.price_service.execute_sql")
+def test_get_ohlcv_batch_skips_crypto_without_querying(mock_sql):
+    assert get_ohlcv_batch(["BTC", "eth"], START, END) == {}
+    mock_sql.assert_not_called()
+
+
+@patch("src.price_service.execute_sql", return_value=ROWS)
+def test_get_price_panel_aligns_dates_and_symbols(mock_sql):
+    panel = get_price_panel(["MSFT", "AAPL", "MSFT"], START, END)
+
+    assert panel.symbols == ["MSFT", "AAPL"]
+    assert panel.dates.tolist() == [date(2024, 1, 2), date(2024, 1, 3)]
+    # MSFT has no bar on Jan 2 -> NaN cell, not a dropped row
+    assert np.isnan(panel.close[0, 0])
+    np.testing.assert_array_equal(panel.close[:, 1], [186.0, 187.0])
+    np.testing.assert_array_equal(panel.volume[1], [0.0, 1100.0])
+    np.testing.assert_array_equal(panel.high[:, 1], [187.0, 188.0])
+    np.testing.assert_array_equal(panel.low[1], [368.0, 185.0])
+    assert panel.close_series("msft") == {"2024-01-03": 371.0}
+
+
+@patch("src.price_service.execute_sql", return_value=[])
+def test_get_price_panel_no_rows(mock_sql):
+    panel = get_price_panel(["AAPL"], START, END)
+
+    assert panel.symbols == ["AAPL"]
+    assert panel.close.shape == (0, 1)
+    assert panel.close_series("AAPL") == {}
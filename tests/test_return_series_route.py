@@ -1,8 +1,10 @@
 from unittest.mock import MagicMock, patch
 
-import pandas as pd
+import numpy as np
 import pytest
 
+from src.price_service import PricePanel
+
 
 @pytest.fixture
 def client():
@@ -21,18 +23,16 @@ def _mock_row(data: dict):
 
 
 @patch("app.routes.portfolio.get_crypto_price_series")
-@patch("app.routes.portfolio.get_ohlcv")
-@patch("app.routes.portfolio.execute_sql")
-def test_return_series_equity_only(mock_sql, mock_ohlcv, mock_crypto, client):
+@patch("app.routes.portfolio.get_price_panel")
+@patch("app.routes.portfolio.async_execute_sql")
+def test_return_series_equity_only(mock_sql, mock_panel, mock_crypto, client):
     mock_sql.return_value = [_mock_row({"symbol": "AAPL", "quantity": 10})]
-    df = pd.DataFrame(
-        {
-            "Open": [100.0, 110.0], "High": [100.0, 110.0], "Low": [100.0, 110.0],
-            "Close": [100.0, 110.0], "Volume": [1, 1],
-        },
-        index=pd.to_datetime(["2026-05-01", "2026-05-02"]),
+    mock_panel.return_value = PricePanel(
+        dates=np.array(["2026-05-01", "2026-05-02"], dtype="datetime64[D]"),
+        symbols=["AAPL"],
+        close=np.array([[100.0], [110.0]]),
+        volume=np.array([[1.0], [1.0]]),
     )
-    mock_ohlcv.return_value = df
     mock_crypto.return_value = {}
 
     resp = client.get("/portfolio/return-series?period=1M")
@@ -45,11 +45,10 @@ def test_return_series_equity_only(mock_sql, mock_ohlcv, mock_crypto, client):
 
 
 @patch("app.routes.portfolio.get_crypto_price_series")
-@patch("app.routes.portfolio.get_ohlcv")
-@patch("app.routes.portfolio.execute_sql")
-def test_return_series_routes_crypto(mock_sql, mock_ohlcv, mock_crypto, client):
+@patch("app.routes.portfolio.get_price_panel")
+@patch("app.routes.portfolio.async_execute_sql")
+def test_return_series_routes_crypto(mock_sql, mock_panel, mock_crypto, client):
     mock_sql.return_value = [_mock_row({"symbol": "BTC", "quantity": 2})]
-    mock_ohlcv.return_value = pd.DataFrame()
     mock_crypto.return_value = {"2026-05-01": 100.0, "2026-05-02": 120.0}
 
     resp = client.get("/portfolio/return-series?period=1W")
@@ -57,13 +56,13 @@ def test_return_series_routes_crypto(mock_sql, mock_ohlcv, mock_crypto, client):
     data = resp.json()
     assert data["periodReturnPct"] == 20.0
     mock_crypto.assert_called_once()
-    mock_ohlcv.assert_not_called()  # crypto symbol must not hit Databento OHLCV
+    mock_panel.assert_not_called()  # crypto symbol must not hit Databento OHLCV
 
 
 @patch("app.routes.portfolio.get_crypto_price_series")
-@patch("app.routes.portfolio.get_ohlcv")
-@patch("app.routes.portfolio.execute_sql")
-def test_return_series_empty_portfolio(mock_sql, mock_ohlcv, mock_crypto, client):
+@patch("app.routes.portfolio.get_price_panel")
+@patch("app.routes.portfolio.async_execute_sql")
+def test_return_series_empty_portfolio(mock_sql, mock_panel, mock_crypto, client):
     mock_sql.return_value = []
     resp = client.get("/portfolio/return-series?period=3M")
     assert resp.status_code == 200
@@ -33,7 +33,7 @@ def test_sentiment_summary_per_ticker_isolation():
             return [_make_summary_row(5, 1, 3, 1)]
         return [_make_summary_row(0, 0, 0, 0)]
 
-    with patch("app.routes.sentiment.execute_sql", side_effect=mock_execute_sql):
+    with patch("app.routes.sentiment.async_execute_sql", side_effect=mock_execute_sql):
         nvda = asyncio.run(get_sentiment_summary(ticker="NVDA", window="30d"))
         msft = asyncio.run(get_sentiment_summary(ticker="MSFT", window="30d"))
 
@@ -65,7 +65,7 @@ def test_sentiment_summary_empty_ticker():
     def mock_execute_sql(query, params=None, fetch_results=False):
         return [_make_summary_row(0, 0, 0, 0)]
 
-    with patch("app.routes.sentiment.execute_sql", side_effect=mock_execute_sql):
+    with patch("app.routes.sentiment.async_execute_sql", side_effect=mock_execute_sql):
         result = asyncio.run(get_sentiment_summary(ticker="ZZZZ", window="30d"))
 
     assert result.ticker == "ZZZZ"
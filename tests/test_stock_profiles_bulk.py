@@ -0,0 +1,156 @@
+"""Tests for the bulk stock-profile refresh engine in scripts/backfill_stock_profiles.py."""
+
+from datetime import date
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import scripts.backfill_stock_profiles as bsp
+
+
+def _long_frame() -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    frames = []
+    # Enough bars for every window, a short history, and a 2-bar listing
+    for symbol, n in (("AAPL", 260), ("MSFT", 45), ("NEWCO", 2)):
+        days = pd.bdate_range(end=pd.Timestamp(date.today()), periods=n)
+        close = 100 * np.cumprod(1 + rng.normal(0, 0.01, n))
+        frames.append(
+            pd.DataFrame(
+                {
+                    "Symbol": symbol,
+                    "Date": days,
+                    "Open": close,
+                    "High": close * 1.01,
+                    "Low": close * 0.99,
+                    "Close": close,
+                    "Volume": rng.integers(1_000, 10_000, n),
+                }
+            )
+        )
+    # Shuffle to prove the engine sorts by (symbol, date) itself
+    return pd.concat(frames).sample(frac=1, random_state=1).reset_index(drop=True)
+
+
+def test_bulk_price_metrics_match_per_ticker_path():
+    long_df = _long_frame()
+
+    with patch.object(bsp, "ohlcv_available", return_value=True), patch.object(
+        bsp, "get_ohlcv_long", return_value=long_df
+    ):
+        bulk = bsp.compute_price_metrics_bulk(["AAPL", "MSFT", "NEWCO"])
+
+    for symbol, group in long_df.groupby("Symbol"):
+        single_df = group.drop(columns="Symbol").set_index("Date")
+        expected = bsp.get_price_metrics(symbol, df=single_df)
+        got = bulk[symbol]
+        for key, value in expected.items():
+            if value is None:
+                assert got[key] is None, (symbol, key)
+            else:
+                assert got[key] == pytest.approx(value), (symbol, key)
+
+
+def test_bulk_price_metrics_none_when_unavailable():
+    with patch.object(bsp, "ohlcv_available", return_value=False):
+        assert bsp.compute_price_metrics_bulk(["AAPL"]) is None
+
+
+def test_build_profiles_bulk_issues_one_query_per_family():
+    def fake_sql(query, params=None, fetch_results=False):
+        if "FROM positions" in query:
+            return [("AAPL", 10, 1500.0, 120.0, 300.0, 25.0)]
+        if "FROM orders" in query:
+            return [("AAPL", 4, 3, 1, 5.0, date(2025, 1, 2), date(2025, 6, 1))]
+        if "FROM discord_parsed_ideas" in query:
+            return [("MSFT", 2, 1, 0, 0.8, 2, 0, 0, None, None, 0, 0, 0, 0, 0)]
+        raise AssertionError(query)
+
+    with patch.object(bsp, "execute_sql", side_effect=fake_sql) as mock_sql, patch.object(
+        bsp, "compute_price_metrics_bulk", return_value={"AAPL": {"latest_close_price": 150.0}}
+    ):
+        profiles = bsp.build_stock_profiles_bulk(["AAPL", "MSFT"])
+
+    assert mock_sql.call_count == 3
+    aapl, msft = profiles
+    assert aapl["latest_close_price"] == 150.0
+    assert aapl["current_position_qty"] == 10.0
+    assert aapl["total_orders_count"] == 4
+    assert aapl["total_mention_count"] == 0
+    assert msft["bullish_mention_pct"] == 100.0
+    assert msft["total_orders_count"] == 0
+    assert "current_position_qty" not in msft
+
+
+def test_bulk_upsert_fills_missing_columns_and_runs_once():
+    profiles = [
+        {"ticker": "AAPL", "latest_close_price": 150.0, "current_position_qty": 10.0},
+        {"ticker": "MSFT", "latest_close_price": 400.0},
+    ]
+    with patch.object(bsp, "execute_sql") as mock_sql:
+        written = bsp.upsert_stock_profiles_current_bulk(profiles)
+
+    assert written == 2
+    mock_sql.assert_called_once()
+    rows = mock_sql.call_args.kwargs["params"]
+    assert rows[1]["current_position_qty"] is None  # closed position is cleared
+
+
+def test_bulk_upsert_keeps_prices_for_tickers_without_bars():
+    profiles = [
+        {"ticker": "AAPL", "latest_close_price": 150.0, "total_orders_count": 3},
+        {"ticker": "DELISTED", "total_orders_count": 1},
+    ]
+    with patch.object(bsp, "execute_sql") as mock_sql:
+        written = bsp.upsert_stock_profiles_current_bulk(profiles)
+
+    assert written == 2
+    assert mock_sql.call_count == 2
+    priced_sql, unpriced_sql = (c.args[0] for c in mock_sql.call_args_list)
+    assert "latest_close_price" in priced_sql
+    # No bars: the price columns aren't written at all, so existing values stay
+    assert "latest_close_price" not in unpriced_sql
+    assert mock_sql.call_args.kwargs["params"] == [{"ticker": "DELISTED", "total_orders_count": 1}]
+
+
+def test_bulk_upsert_falls_back_per_ticker():
+    profiles = [{"ticker": "AAPL"}, {"ticker": "TOO_LONG_TICKER"}]
+    with patch.object(bsp, "execute_sql", side_effect=Exception("batch failed")), patch.object(
+        bsp, "upsert_stock_profile_current", side_effect=[True, False]
+    ):
+        assert bsp.upsert_stock_profiles_current_bulk(profiles) == 1
+
+
+def test_refresh_skips_unchanged_and_snapshots_them():
+    with patch.object(bsp, "get_stale_tickers", return_value=["AAPL"]), patch.object(
+        bsp, "build_stock_profiles_bulk", return_value=[{"ticker": "AAPL"}]
+    ) as build, patch.object(
+        bsp, "upsert_stock_profiles_current_bulk", return_value=1
+    ), patch.object(
+        bsp, "append_stock_profile_history_bulk", return_value=1
+    ), patch.object(
+        bsp, "copy_current_to_history", return_value=1
+    ) as copy:
+        results = bsp.refresh_stock_profiles(tickers=["AAPL", "MSFT"])
+
+    build.assert_called_once_with(["AAPL"])
+    assert copy.call_args.args[0] == ["MSFT"]
+    assert results == {
+        "current_success": 1,
+        "current_failed": 0,
+        "history_success": 2,
+        "history_failed": 0,
+        "skipped": 1,
+    }
+
+
+def test_refresh_force_ignores_staleness():
+    with patch.object(bsp, "get_stale_tickers") as stale, patch.object(
+        bsp, "build_stock_profiles_bulk", return_value=[]
+    ) as build:
+        bsp.refresh_stock_profiles(tickers=["AAPL"], update_history=False, force=True)
+
+    stale.assert_not_called()
+    build.assert_called_once_with(["AAPL"])
@@ -0,0 +1,97 @@
+"""Tests for GET /stocks/{ticker}/ohlcv and the columnar OHLCV serializers."""
+
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.price_service import ohlcv_to_columns, ohlcv_to_records
+
+
+@pytest.fixture
+def client():
+    with patch.dict("os.environ", {"DISABLE_AUTH": "true"}):
+        from fastapi.testclient import TestClient
+
+        from app.main import app
+        with TestClient(app) as c:
+            yield c
+
+
+def _mock_row(data: dict):
+    row = MagicMock()
+    row._mapping = data
+    return row
+
+
+def _ohlcv_df() -> pd.DataFrame:
+    # Deliberately out of order to check ascending output
+    return pd.DataFrame(
+        {
+            "Open": [101.234, 100.0],
+            "High": [102.0, 101.0],
+            "Low": [100.5, 99.0],
+            "Close": [101.999, 100.5],
+            "Volume": [2000, np.nan],
+        },
+        index=pd.DatetimeIndex(pd.to_datetime(["2026-05-04", "2026-05-01"]), name="Date"),
+    )
+
+
+def test_ohlcv_to_columns_sorts_and_rounds():
+    cols = ohlcv_to_columns(_ohlcv_df(), decimals=2)
+
+    assert cols["dates"] == ["2026-05-01", "2026-05-04"]
+    assert cols["open"] == [100.0, 101.23]
+    assert cols["close"] == [100.5, 102.0]
+    assert cols["volume"] == [0, 2000]
+    assert all(type(v) is int for v in cols["volume"])
+
+
+def test_ohlcv_to_records_empty_frame():
+    assert ohlcv_to_records(pd.DataFrame()) == []
+
+
+@patch("app.routes.stocks.async_execute_sql")
+@patch("app.routes.stocks.get_ohlcv")
+def test_ohlcv_route_bars(mock_ohlcv, mock_sql, client):
+    mock_ohlcv.return_value = _ohlcv_df()
+    mock_sql.return_value = [
+        _mock_row({"date": "2026-05-01", "side": "buy", "price": 100.25, "quantity": 3})
+    ]
+
+    resp = client.get("/stocks/AAPL/ohlcv?period=1M")
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["ticker"] == "AAPL"
+    assert data["data"][0] == {
+        "date": "2026-05-01", "open": 100.0, "high": 101.0, "low": 99.0,
+        "close": 100.5, "volume": 0,
+    }
+    assert [b["date"] for b in data["data"]] == ["2026-05-01", "2026-05-04"]
+    assert data["orders"][0]["action"] == "BUY"
+
+
+@patch("app.routes.stocks.async_execute_sql")
+@patch("app.routes.stocks.get_ohlcv")
+def test_ohlcv_route_compact(mock_ohlcv, mock_sql, client):
+    mock_ohlcv.return_value = _ohlcv_df()
+    mock_sql.return_value = []
+
+    resp = client.get("/stocks/AAPL/ohlcv?period=1M&format=compact")
+    assert resp.status_code == 200
+    data = resp.json()
+    assert "data" not in data
+    assert data["dates"] == ["2026-05-01", "2026-05-04"]
+    assert data["high"] == [101.0, 102.0]
+    assert data["volume"] == [0, 2000]
+    assert data["orders"] == []
+
+
+@patch("app.routes.stocks.async_execute_sql")
+@patch("app.routes.stocks.get_ohlcv")
+def test_ohlcv_route_rejects_unknown_format(mock_ohlcv, mock_sql, client):
+    resp = client.get("/stocks/AAPL/ohlcv?format=csv")
+    assert resp.status_code == 422
+    mock_ohlcv.assert_not_called()
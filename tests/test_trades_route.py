@@ -109,7 +109,7 @@ def client():
 class TestGetStockTrades:
     """Tests for the per-stock trade history endpoint."""
 
-    @patch("app.routes.trades.execute_sql")
+    @patch("app.routes.trades.async_execute_sql")
     def test_returns_activities_as_enriched_trades(self, mock_sql, client):
         """Activities are returned as enriched trades with position data."""
         mock_sql.side_effect = [
@@ -152,7 +152,7 @@ class TestGetStockTrades:
         # because it tells the user how *this specific lot* has performed.
         assert trade["unrealizedPnl"] == (155.0 - 150.0) * 10.0
 
-    @patch("app.routes.trades.execute_sql")
+    @patch("app.routes.trades.async_execute_sql")
     def test_returns_orders_when_no_activities(self, mock_sql, client):
         """Orders are returned when no activities exist for the symbol."""
         mock_sql.side_effect = [
@@ -181,7 +181,7 @@ class TestGetStockTrades:
         assert trade["price"] == 200.0
         assert trade["fee"] == 0  # orders don't have fee data
 
-    @patch("app.routes.trades.execute_sql")
+    @patch("app.routes.trades.async_execute_sql")
     def test_deduplication_prefers_activity(self, mock_sql, client):
         """When both sources have same trade, activity is kept (has fee data)."""
         # Same symbol, same minute, same amount => dedup
@@ -215,7 +215,7 @@ class TestGetStockTrades:
         assert trade["source"] == "activity"
         assert trade["fee"] == 1.5
 
-    @patch("app.routes.trades.execute_sql")
+    @patch("app.routes.trades.async_execute_sql")
     def test_different_times_not_deduplicated(self, mock_sql, client):
         """Trades at different times are not deduplicated."""
         mock_sql.side_effect = [
@@ -243,7 +243,7 @@ class TestGetStockTrades:
         assert data["total"] == 2
         assert len(data["trades"]) == 2
 
-    @patch("app.routes.trades.execute_sql")
+    @patch("app.routes.trades.async_execute_sql")
     def test_sell_trade_has_realized_pnl(self, mock_sql, client):
         """SELL trades get realizedPnl calculation."""
         mock_sql.side_effect = [
@@ -272,7 +272,7 @@ class TestGetStockTrades:
         assert trade["realizedPnlPct"] == pytest.approx(10.34, abs=0.01)
         assert trade["unrealizedPnl"] is None
 
-    @patch("app.routes.trades.execute_sql")
+    @patch("app.routes.trades.async_execute_sql")
     def test_empty_result(self, mock_sql, client):
         """No trades returns empty list."""
         mock_sql.side_effect = [
@@ -289,7 +289,7 @@ class TestGetStockTrades:
         assert data["trades"] == []
         assert data["total"] == 0
 
-    @patch("app.routes.trades.execute_sql")
+    @patch("app.routes.trades.async_execute_sql")
     def test_error_returns_empty_gracefully(self, mock_sql, client):
         """Database errors return empty response, not 500."""
         mock_sql.side_effect = Exception("DB connection failed")
@@ -308,7 +308,7 @@ class TestGetStockTrades:
 class TestGetRecentTrades:
     """Tests for the dashboard recent trades endpoint."""
 
-    @patch("app.routes.trades.execute_sql")
+    @patch("app.routes.trades.async_execute_sql")
     def test_recent_trades_returns_results(self, mock_sql, client):
         """Recent trades endpoint returns enriched trades."""
         mock_sql.side_effect = [
@@ -339,7 +339,7 @@ class TestGetRecentTrades:
         assert data["trades"][0]["symbol"] == "AAPL"
         assert data["trades"][1]["symbol"] == "TSLA"
 
-    @patch("app.routes.trades.execute_sql")
+    @patch("app.routes.trades.async_execute_sql")
     def test_recent_trades_deduplicates(self, mock_sql, client):
         """Recent trades also deduplicates across sources."""
         mock_sql.side_effect = [
@@ -366,7 +366,7 @@ class TestGetRecentTrades:
         assert data["total"] == 1
         assert data["trades"][0]["source"] == "activity"
 
-    @patch("app.routes.trades.execute_sql")
+    @patch("app.routes.trades.async_execute_sql")
     def test_recent_trades_empty(self, mock_sql, client):
         """No recent trades returns empty list."""
         mock_sql.side_effect = [
@@ -383,7 +383,7 @@ class TestGetRecentTrades:
         assert data["trades"] == []
         assert data["total"] == 0
 
-    @patch("app.routes.trades.execute_sql")
+    @patch("app.routes.trades.async_execute_sql")
     def test_recent_trades_limit_param(self, mock_sql, client):
         """Limit parameter controls number of returned trades."""
         # Create 5 activities with different times
@@ -410,7 +410,7 @@ class TestGetRecentTrades:
         assert len(data["trades"]) == 3
         assert data["total"] == 5  # total before limiting
 
-    @patch("app.routes.trades.execute_sql")
+    @patch("app.routes.trades.async_execute_sql")
     def test_recent_trades_error_returns_empty(self, mock_sql, client):
         """Database errors return empty response, not 500."""
         mock_sql.side_effect = Exception("DB connection failed")
@@ -65,3 +65,42 @@ class TestVerificationScript:
             or "PERFORMANCE" in output
             or result.returncode in [0, 1, 2]
         ), f"Script should run (got output: {output[:200]}...)"
+
+
+def test_find_seq_scans_reports_only_hot_tables():
+    """Nested plan nodes are walked; seq scans on unrelated tables are ignored."""
+    from scripts.verify_database import HOT_QUERY_TABLES, find_seq_scans
+
+    plan = {
+        "Node Type": "Nested Loop",
+        "Plans": [
+            {"Node Type": "Bitmap Heap Scan", "Relation Name": "orders"},
+            {
+                "Node Type": "Hash",
+                "Plans": [
+                    {"Node Type": "Seq Scan", "Relation Name": "positions"},
+                    {"Node Type": "Seq Scan", "Relation Name": "accounts"},
+                ],
+            },
+        ],
+    }
+
+    assert find_seq_scans(plan, HOT_QUERY_TABLES) == ["positions"]
+    assert find_seq_scans({"Node Type": "Index Scan", "Relation Name": "orders"}, HOT_QUERY_TABLES) == []
+
+
+def test_verify_query_plans_records_explain_errors_as_failed():
+    """A hot query that can't be EXPLAINed (missing table/index) must not pass."""
+    from unittest.mock import MagicMock, patch
+
+    from scripts.verify_database import HOT_SYMBOL_QUERIES, DatabaseSchemaVerifier
+
+    verifier = DatabaseSchemaVerifier(database_url="postgresql://unused")
+    verifier.engine = MagicMock()
+    verifier.engine.begin.side_effect = Exception('relation "ohlcv_daily" does not exist')
+
+    with patch.object(verifier, "get_actual_tables", return_value=[]):
+        plans = verifier.verify_query_plans()
+
+    assert set(plans) == set(HOT_SYMBOL_QUERIES)
+    assert all(plan["failed"] and "does not exist" in plan["error"] for plan in plans.values())